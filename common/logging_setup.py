@@ -1,16 +1,167 @@
+import atexit
 import logging
+import logging.handlers
+import os
+import queue
 import sys
+import threading
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, List, Mapping, Optional, Tuple, Union
 from config.config import DATA_DIR
 
+# forum_bot.log is rotated so it never grows without bound (the log viewer
+# follows it by position and notices the rotation).
+LOG_MAX_BYTES = 10 * 1024 * 1024
+LOG_BACKUP_COUNT = 5
 
-def setup_logging() -> logging.Logger:
+# At most RATE_LIMIT_BURST records per call site (file + line) are let through
+# every RATE_LIMIT_WINDOW seconds; WARNING and above are never dropped.
+RATE_LIMIT_BURST = 20
+RATE_LIMIT_WINDOW = 10.0
+
+# "downloaders.jdownloader=INFO,gui=WARNING" – per-module levels from the
+# environment (LOG_LEVELS in .env reaches the config as ``log_levels``).
+LOG_LEVELS_ENV = "LOG_LEVELS"
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+def parse_module_levels(spec: Union[str, Mapping[str, Union[str, int]], None]) -> Dict[str, int]:
+    """Turn ``"a.b=INFO,c=WARNING"`` (or a mapping) into ``{name: levelno}``."""
+    if not spec:
+        return {}
+    if isinstance(spec, str):
+        pairs = []
+        for part in spec.replace(";", ",").split(","):
+            name, sep, level = part.partition("=")
+            if sep:
+                pairs.append((name.strip(), level.strip()))
+    else:
+        pairs = list(spec.items())
+    levels: Dict[str, int] = {}
+    for name, level in pairs:
+        levelno = level if isinstance(level, int) else logging.getLevelName(str(level).upper())
+        if name and isinstance(levelno, int):
+            levels[name] = levelno
+    return levels
+
+
+class ModuleLevelFilter(logging.Filter):
+    """Per-module minimum levels, including records sent to the root logger.
+
+    Most modules log through ``logging.info(...)``, so their records carry the
+    logger name ``root``; for those the module is derived from the source
+    path (``downloaders/jdownloader.py`` -> ``downloaders.jdownloader``).
+    The most specific dotted prefix wins.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.levels: Dict[str, int] = {}
+        self._modules: Dict[str, str] = {}
+
+    def _module_of(self, record: logging.LogRecord) -> str:
+        if record.name != "root":
+            return record.name
+        path = record.pathname
+        module = self._modules.get(path)
+        if module is None:
+            try:
+                rel = Path(path).resolve().relative_to(_PROJECT_ROOT)
+                module = ".".join(rel.with_suffix("").parts)
+            except (ValueError, OSError):
+                module = record.module
+            self._modules[path] = module
+        return module
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not self.levels:
+            return True
+        name = self._module_of(record)
+        while name:
+            level = self.levels.get(name)
+            if level is not None:
+                return record.levelno >= level
+            name = name.rpartition(".")[0]
+        return True
+
+
+class RateLimitFilter(logging.Filter):
+    """Drop repeats from one call site beyond *burst* records per *window* seconds.
+
+    The first record let through after a window in which records were dropped
+    says how many were suppressed.
+    """
+
+    def __init__(self, burst: int = RATE_LIMIT_BURST, window: float = RATE_LIMIT_WINDOW,
+                 exempt_level: int = logging.WARNING) -> None:
+        super().__init__()
+        self.burst = burst
+        self.window = window
+        self.exempt_level = exempt_level
+        self.suppressed = 0
+        self._sites: Dict[Tuple[str, int], List[float]] = {}  # [window start, passed, dropped]
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if self.burst <= 0 or record.levelno >= self.exempt_level:
+            return True
+        key = (record.pathname, record.lineno)
+        with self._lock:
+            site = self._sites.get(key)
+            if site is None or record.created - site[0] >= self.window:
+                dropped = int(site[2]) if site else 0
+                self._sites[key] = [record.created, 1, 0]
+            elif site[1] < self.burst:
+                site[1] += 1
+                return True
+            else:
+                site[2] += 1
+                self.suppressed += 1
+                return False
+        if dropped:
+            record.msg = f"{record.getMessage()} (+{dropped} similar messages suppressed)"
+            record.args = None
+        return True
+
+
+def apply_module_levels(levels: Union[str, Mapping[str, Union[str, int]], None]) -> Dict[str, int]:
+    """Set per-module levels on top of the ones given to :func:`setup_logging`.
+
+    Named loggers get ``setLevel`` (so ``isEnabledFor`` guards skip the work
+    entirely); root-logger records are filtered by source module.
+    """
+    parsed = parse_module_levels(levels)
+    for name, levelno in parsed.items():
+        logging.getLogger(name).setLevel(levelno)
+    module_filter = getattr(setup_logging, "_module_filter", None)
+    if module_filter is not None:
+        module_filter.levels.update(parsed)
+    return parsed
+
+
+def stop_logging() -> None:
+    """Flush and stop the background log listener (idempotent)."""
+    listener = getattr(setup_logging, "_listener", None)
+    if listener is not None:
+        setup_logging._listener = None
+        listener.stop()
+
+
+def setup_logging(max_bytes: int = LOG_MAX_BYTES, backup_count: int = LOG_BACKUP_COUNT,
+                  module_levels: Optional[Mapping[str, Union[str, int]]] = None,
+                  rate_limit: Optional[Tuple[int, float]] = (RATE_LIMIT_BURST, RATE_LIMIT_WINDOW)) -> logging.Logger:
     """Configure application wide logging.
 
     The configuration is applied only once. Subsequent calls return immediately
     leaving the existing configuration untouched. Handlers are cleared before
     being attached to avoid duplication during hot reloads or re‑runs.
+
+    Callers only enqueue records: a ``QueueHandler`` on the root logger hands
+    them to a ``QueueListener`` thread that does the formatting and the
+    console/file I/O.  ``module_levels`` (plus ``LOG_LEVELS`` from the
+    environment) and ``rate_limit`` (``(burst, window)`` or ``None``) are
+    applied on the calling thread before a record is queued.
     """
     if getattr(setup_logging, "_configured", False):
         return logging.getLogger()
@@ -31,16 +182,36 @@ def setup_logging() -> logging.Logger:
 
     log_file = Path(DATA_DIR) / "forum_bot.log"
     log_file.parent.mkdir(parents=True, exist_ok=True)
-    file_handler = logging.FileHandler(log_file, encoding="utf-8")
+    file_handler = logging.handlers.RotatingFileHandler(
+        log_file, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8"
+    )
     file_handler.setFormatter(fmt)
     file_handler.name = "file"
 
-    logger.addHandler(console)
-    logger.addHandler(file_handler)
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.name = "queue"
+    module_filter = ModuleLevelFilter()
+    queue_handler.addFilter(module_filter)
+    if rate_limit:
+        queue_handler.addFilter(RateLimitFilter(*rate_limit))
+    listener = logging.handlers.QueueListener(
+        log_queue, console, file_handler, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(stop_logging)
+
+    logger.addHandler(queue_handler)
 
     setup_logging._configured = True
+    setup_logging._listener = listener
+    setup_logging._module_filter = module_filter
+    levels = dict(parse_module_levels(os.getenv(LOG_LEVELS_ENV)))
+    levels.update(parse_module_levels(module_levels))
+    apply_module_levels(levels)
+
     handler_info: List[Tuple[str, str]] = [
-        (h.name or "<unnamed>", h.__class__.__name__) for h in logger.handlers
+        (h.name or "<unnamed>", h.__class__.__name__) for h in (queue_handler,) + listener.handlers
     ]
     logger.debug("Logging handlers: %s", handler_info)
-    return logger
\ No newline at end of file
+    return logger
@@ -8,9 +8,10 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 import re
 from urllib.parse import urljoin, urlparse
-import json
 import os
 
+from core.write_behind import get_write_behind, read_json
+
 class CategoryManager:
     def __init__(self, forum_section_url, driver, username, user_manager=None):
         self.forum_section_url = forum_section_url.rstrip('/')
@@ -133,10 +134,9 @@ class CategoryManager:
         return False
 
     def load_categories(self):
-        if os.path.exists(self.categories_file):
+        if os.path.exists(self.categories_file) or get_write_behind().pending(self.categories_file):
             try:
-                with open(self.categories_file, 'r', encoding='utf-8') as f:
-                    self.categories = json.load(f)
+                self.categories = read_json(self.categories_file, default={})
                 logging.info("Loaded categories from file.")
             except Exception as e:
                 logging.error(f"Error loading categories from file: {e}", exc_info=True)
@@ -146,9 +146,8 @@ class CategoryManager:
 
     def save_categories(self):
         try:
-            with open(self.categories_file, 'w', encoding='utf-8') as f:
-                json.dump(self.categories, f, ensure_ascii=False, indent=4)
-            logging.info("Saved categories to file.")
+            get_write_behind().submit(self.categories_file, self.categories, indent=4)
+            logging.debug("Queued categories file for saving.")
         except Exception as e:
             logging.error(f"Error saving categories to file: {e}", exc_info=True)
 
@@ -0,0 +1,87 @@
+"""Helpers for streaming vBulletin category listing pages.
+
+``ForumBotSelenium.iter_category_threads`` walks ``page_from..page_to`` of a
+category while the next listing pages are already being downloaded (see
+``ThreadPageFetcher.fetch_ahead``).  The functions here are the browser-free
+pieces of that pipeline: building listing URLs and turning a listing page into
+:class:`ThreadRow` records that can be date-matched as soon as the page lands.
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import date
+from typing import Callable, Iterable, List, NamedTuple, Optional
+
+from core.html_backend import extract_listing_rows
+
+logger = logging.getLogger(__name__)
+
+
+class ThreadRow(NamedTuple):
+    """A single thread entry from a category listing page."""
+
+    thread_id: str
+    title: str
+    url: str
+    date_text: str
+
+
+def listing_page_url(category_url: str, page_number: int) -> str:
+    """Return the URL of listing page *page_number* for *category_url*.
+
+    MyGully paginates categories as ``/377-ebooks/`` -> ``/377-ebooks-2/`` ->
+    ``/377-ebooks-3/``.
+    """
+    if page_number <= 1:
+        return category_url
+    return f"{category_url.rstrip('/')}-{page_number}/"
+
+
+def absolute_thread_url(href: str, base_url: str) -> str:
+    """Resolve a relative ``showthread.php``/``/...`` link against *base_url*."""
+    if href.startswith('/'):
+        return base_url + href
+    if href.startswith('showthread.php'):
+        return base_url + '/' + href
+    return href
+
+
+def parse_thread_rows(html: str, base_url: str) -> List[ThreadRow]:
+    """Parse every thread title link and its date from a listing page.
+
+    Rows whose date cell cannot be located are skipped with a warning, the
+    same way ``extract_threads`` always treated them.
+    """
+    rows: List[ThreadRow] = []
+    for title, href, date_text in extract_listing_rows(html):
+        if date_text is None:
+            logger.warning(f"⚠️ Could not find date for thread '{title}'. Skipping.")
+            continue
+        url = absolute_thread_url(href, base_url)
+        rows.append(ThreadRow(url.split('=')[-1], title, url, date_text))
+    return rows
+
+
+def page_is_older_than(
+    rows: Iterable[ThreadRow],
+    earliest: Optional[date],
+    parse_date: Callable[[str], Optional[date]],
+) -> bool:
+    """Return ``True`` if every dated row on a page is before *earliest*.
+
+    Listings are sorted newest first, so once a whole page predates every
+    requested range no later page can match either.  Pages with no parsable
+    dates are never considered old.
+    """
+    if earliest is None:
+        return False
+    seen = False
+    for row in rows:
+        thread_date = parse_date(row.date_text)
+        if thread_date is None:
+            continue
+        if thread_date >= earliest:
+            return False
+        seen = True
+    return seen
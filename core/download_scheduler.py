@@ -0,0 +1,274 @@
+"""Per-link download scheduling for :class:`workers.download_worker.DownloadWorker`.
+
+``DownloadWorker`` used to push every primary link into one FIFO queue and
+pop from it while fewer than ``limit`` downloads were active.  That starves
+later threads behind a long first thread and ignores how many premium
+connections each host allows.  :class:`DownloadScheduler` replaces the FIFO:
+
+* a global cap plus optional per-host caps (``rapidgator.net=4``,
+  ``katfile.com=2`` ...);
+* round-robin across threads so every selected thread makes progress;
+* failed links are re-queued with their next ``fallback_links`` entry
+  instead of retrying every fallback inline in the same job;
+* a per-thread completion callback once every link of a thread is done;
+* aggregate byte counters/throughput for the status reporter.
+
+The scheduler is plain Python and thread-safe; it never starts downloads
+itself.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Any, Callable, Deque, Dict, List, Mapping, Optional, Tuple, Union
+
+from utils.host_classifier import canonical_host, url_hostname
+
+logger = logging.getLogger(__name__)
+
+ThreadCallback = Callable[[str, Dict[str, Any]], None]
+
+
+def parse_host_limits(value: Union[None, str, Mapping[str, Any]]) -> Dict[str, int]:
+    """Parse ``"rapidgator.net=4, katfile.com=2"`` (or a mapping) into a dict.
+
+    Host names are canonicalised (``rg.to`` -> ``rapidgator.net``, short
+    names like ``katfile`` -> ``katfile.com``).  Invalid entries are ignored.
+    """
+    if not value:
+        return {}
+    if isinstance(value, str):
+        pairs = []
+        for part in value.replace(";", ",").split(","):
+            if "=" in part:
+                host, _, limit = part.partition("=")
+                pairs.append((host, limit))
+    else:
+        pairs = list(value.items())
+    limits: Dict[str, int] = {}
+    for host, limit in pairs:
+        host = canonical_host(str(host).strip())
+        try:
+            limit = int(str(limit).strip())
+        except ValueError:
+            logger.warning(f"⚠️ Ignoring invalid download limit for {host!r}: {limit!r}")
+            continue
+        if host and limit > 0:
+            limits[host] = limit
+    return limits
+
+
+class DownloadScheduler:
+    """Hand out queued link items while respecting global and per-host caps.
+
+    Items are the dicts ``DownloadWorker.initialize_download_queue`` builds
+    (``link_id``, ``thread_id``, ``link``, ``fallback_links`` ...).
+    """
+
+    def __init__(
+        self,
+        global_limit: int = 4,
+        host_limits: Optional[Mapping[str, int]] = None,
+        on_thread_complete: Optional[ThreadCallback] = None,
+    ) -> None:
+        self.global_limit = max(1, int(global_limit))
+        self.host_limits: Dict[str, int] = dict(host_limits or {})
+        self.on_thread_complete = on_thread_complete
+
+        self._lock = threading.RLock()
+        self._queues: "OrderedDict[str, Deque[Dict[str, Any]]]" = OrderedDict()
+        self._threads: Dict[str, Dict[str, Any]] = {}
+        self._active: Dict[str, Dict[str, Any]] = {}
+        self._active_per_host: Dict[str, int] = {}
+
+        # Aggregate transfer counters
+        self._progress: Dict[str, Tuple[int, int]] = {}
+        self._finished_bytes = 0
+        self._finished_total = 0
+        self._speed = 0.0
+        self._speed_sample: Optional[Tuple[float, int]] = None
+
+    # ------------------------------------------------------------------
+    # Configuration
+    # ------------------------------------------------------------------
+    def set_limits(self, global_limit: int, host_limits: Optional[Mapping[str, int]] = None) -> None:
+        with self._lock:
+            self.global_limit = max(1, int(global_limit))
+            if host_limits is not None:
+                self.host_limits = dict(host_limits)
+
+    @staticmethod
+    def host_of(item: Mapping[str, Any]) -> str:
+        return canonical_host(url_hostname(item.get("link", ""))) or "-"
+
+    # ------------------------------------------------------------------
+    # Queueing
+    # ------------------------------------------------------------------
+    def add_thread(self, thread_id: str, items: List[Dict[str, Any]], **meta: Any) -> None:
+        """Register *thread_id* with its primary link *items*."""
+        with self._lock:
+            state = self._threads.setdefault(
+                thread_id,
+                {"total_links": 0, "done_count": 0, "failed": [], "completed": False},
+            )
+            state.update(meta)
+            state["total_links"] += len(items)
+            queue = self._queues.setdefault(thread_id, deque())
+            queue.extend(items)
+
+    def _can_start(self, host: str) -> bool:
+        limit = self.host_limits.get(host)
+        return limit is None or self._active_per_host.get(host, 0) < limit
+
+    def next_ready(self) -> Optional[Dict[str, Any]]:
+        """Return the next item that may start now, or ``None``.
+
+        Threads are served round-robin; inside a thread the first link whose
+        host is below its cap is taken, so one saturated host does not block
+        a thread's links on other hosts.
+        """
+        with self._lock:
+            if len(self._active) >= self.global_limit:
+                return None
+            for thread_id in list(self._queues):
+                queue = self._queues[thread_id]
+                for idx, item in enumerate(queue):
+                    host = self.host_of(item)
+                    if not self._can_start(host):
+                        continue
+                    del queue[idx]
+                    # Move the thread to the back: round-robin fairness.
+                    self._queues.move_to_end(thread_id)
+                    if not queue:
+                        del self._queues[thread_id]
+                    item["host"] = host
+                    self._active[item["link_id"]] = item
+                    self._active_per_host[host] = self._active_per_host.get(host, 0) + 1
+                    return item
+            return None
+
+    def drain_ready(self) -> List[Dict[str, Any]]:
+        """Return every item that may start now."""
+        ready = []
+        while True:
+            item = self.next_ready()
+            if item is None:
+                return ready
+            ready.append(item)
+
+    # ------------------------------------------------------------------
+    # Completion
+    # ------------------------------------------------------------------
+    def _release(self, item: Dict[str, Any]) -> None:
+        self._active.pop(item["link_id"], None)
+        host = item.get("host") or self.host_of(item)
+        left = self._active_per_host.get(host, 0) - 1
+        if left > 0:
+            self._active_per_host[host] = left
+        else:
+            self._active_per_host.pop(host, None)
+        cur, tot = self._progress.pop(item["link_id"], (0, 0))
+        self._finished_bytes += cur
+        self._finished_total += tot
+
+    def complete(self, item: Dict[str, Any], success: bool) -> Optional[Dict[str, Any]]:
+        """Mark *item* finished.
+
+        A failed item with remaining ``fallback_links`` is re-queued at the
+        front of its thread with the next fallback promoted to ``link``; that
+        new item is returned.  Otherwise the link counts as done and, once all
+        of a thread's links are done, ``on_thread_complete`` is called.
+        """
+        callback_args = None
+        promoted = None
+        with self._lock:
+            self._release(item)
+            thread_id = item["thread_id"]
+            fallbacks = list(item.get("fallback_links") or [])
+            if not success and fallbacks:
+                promoted = dict(item)
+                promoted["failed_links"] = list(item.get("failed_links", [])) + [item["link"]]
+                promoted["link"] = fallbacks[0]
+                promoted["fallback_links"] = fallbacks[1:]
+                promoted["completed"] = False
+                promoted.pop("host", None)
+                self._queues.setdefault(thread_id, deque()).appendleft(promoted)
+                self._queues.move_to_end(thread_id, last=False)
+                logger.info(f"🔁 Promoting fallback link for thread {thread_id}: {promoted['link']}")
+            else:
+                state = self._threads.get(thread_id)
+                if state is not None:
+                    state["done_count"] += 1
+                    if not success:
+                        state["failed"].append(item["link"])
+                    if state["done_count"] >= state["total_links"] and not state["completed"]:
+                        state["completed"] = True
+                        callback_args = (thread_id, state)
+        if callback_args and self.on_thread_complete:
+            try:
+                self.on_thread_complete(*callback_args)
+            except Exception as e:
+                logger.error(f"❌ Thread completion callback failed for {callback_args[0]}: {e}", exc_info=True)
+        return promoted
+
+    def cancel(self) -> None:
+        """Drop every queued item (active items finish on their own)."""
+        with self._lock:
+            self._queues.clear()
+
+    # ------------------------------------------------------------------
+    # State
+    # ------------------------------------------------------------------
+    @property
+    def active_count(self) -> int:
+        with self._lock:
+            return len(self._active)
+
+    @property
+    def pending_count(self) -> int:
+        with self._lock:
+            return sum(len(q) for q in self._queues.values())
+
+    def is_idle(self) -> bool:
+        with self._lock:
+            return not self._active and not self._queues
+
+    def active_per_host(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._active_per_host)
+
+    def thread_state(self, thread_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._threads.get(thread_id)
+
+    # ------------------------------------------------------------------
+    # Throughput
+    # ------------------------------------------------------------------
+    def record_progress(self, link_id: str, current: int, total: int) -> None:
+        with self._lock:
+            if link_id in self._active:
+                self._progress[link_id] = (int(current or 0), int(total or 0))
+
+    def throughput(self, now: Optional[float] = None) -> Tuple[int, int, float]:
+        """Return ``(bytes_done, bytes_total, bytes_per_second)`` for the batch.
+
+        Speed is a smoothed rate over successive calls.
+        """
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            done = self._finished_bytes + sum(c for c, _ in self._progress.values())
+            total = self._finished_total + sum(t for _, t in self._progress.values())
+            if self._speed_sample is not None:
+                last_time, last_done = self._speed_sample
+                elapsed = now - last_time
+                if elapsed > 0:
+                    rate = max(0, done - last_done) / elapsed
+                    self._speed = rate if not self._speed else 0.7 * self._speed + 0.3 * rate
+            self._speed_sample = (now, done)
+            return done, total, self._speed
+
+
+__all__ = ["DownloadScheduler", "parse_host_limits"]
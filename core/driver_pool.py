@@ -0,0 +1,427 @@
+"""Pool of logged-in Selenium sessions leased per task.
+
+Category tracking, megathread checks, reply posting and template image
+uploads all drove the one ``ForumBotSelenium`` Chrome session behind a global
+``bot_lock`` (``tryLock(10000)`` or ``QMutexLocker``), so they queued behind
+each other and a tracking run over many categories used a single core.
+
+:class:`DriverPool` hands out bot instances instead:
+
+* the application's main bot is the first session; up to ``size - 1`` more
+  are created on demand by a factory, and :func:`share_session` logs them in
+  with the cookies the main bot wrote through ``save_cookies`` (falling back
+  to a normal login);
+* :meth:`~DriverPool.lease` is a context manager giving one task exclusive
+  use of a bot; the main bot is preferred while it is idle, and
+  ``primary=True`` waits for it specifically (e.g. for the visible window);
+* a session is health-checked before it is handed out and after a task
+  failed with an exception; a dead extra session is closed and replaced, a
+  dead main session gets a new driver in place;
+* sessions that cannot be started (or a main session that stays dead after
+  its restart) are retried with an exponential backoff, so a lease times out
+  with :class:`DriverPoolTimeout` instead of getting a dead driver and the
+  configured size is kept;
+* :meth:`~DriverPool.invalidate` retires the extra sessions (e.g. after a
+  user switch) once they are returned;
+* :meth:`~DriverPool.stats` reports leases, timeouts, recycles and the time
+  tasks waited for a session.
+
+:func:`lease_bot` lets workers accept either a pool or a plain mutex as their
+``bot_lock``.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LEASE_TIMEOUT = 120.0
+SLOW_LEASE_WAIT = 1.0
+RETRY_BACKOFF = 5.0
+RETRY_BACKOFF_MAX = 300.0
+
+BotFactory = Callable[[], Any]
+HealthCheck = Callable[[Any], bool]
+
+
+class DriverPoolTimeout(TimeoutError):
+    """No session became free within the lease timeout."""
+
+
+def default_pool_size() -> int:
+    """Sessions to run when the config does not say: about one per two cores, at most 4."""
+    return max(1, min(4, (os.cpu_count() or 2) // 2))
+
+
+def _backoff(failures: int) -> float:
+    return min(RETRY_BACKOFF * 2 ** min(max(0, failures - 1), 16), RETRY_BACKOFF_MAX)
+
+
+def driver_alive(bot: Any) -> bool:
+    """``True`` if *bot*'s WebDriver answers a trivial command."""
+    driver = getattr(bot, "driver", None)
+    if driver is None:
+        return False
+    try:
+        driver.current_url
+        return bool(driver.window_handles)
+    except Exception as e:
+        logger.debug(f"WebDriver health check failed: {e}")
+        return False
+
+
+def share_session(primary: Any, bot: Any) -> None:
+    """Log *bot* in with *primary*'s saved cookies and share its per-user state."""
+    bot.cookies_file = primary.cookies_file
+    bot.processed_thread_ids = primary.processed_thread_ids
+    bot.use_backup_rg = getattr(primary, "use_backup_rg", False)
+    bot.is_logged_in = False
+    if bot.load_cookies():
+        bot.driver.refresh()
+        bot.is_logged_in = bool(bot.check_login_status())
+    if not bot.is_logged_in and getattr(primary, "is_logged_in", False):
+        logger.info("🍪 Shared cookies did not log the pooled session in, logging in")
+        bot.login()
+
+
+class _Slot:
+    __slots__ = ("bot", "generation", "primary")
+
+    def __init__(self, bot: Any, generation: int, primary: bool = False) -> None:
+        self.bot = bot
+        self.generation = generation
+        self.primary = primary
+
+
+class DriverPool:
+    """Leases up to ``size`` bot sessions to concurrent tasks."""
+
+    def __init__(
+        self,
+        primary: Any = None,
+        factory: Optional[BotFactory] = None,
+        size: int = 1,
+        prepare: Optional[Callable[[Any, Any], None]] = share_session,
+        health_check: HealthCheck = driver_alive,
+        lease_timeout: float = DEFAULT_LEASE_TIMEOUT,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.factory = factory
+        self.prepare = prepare
+        self.health_check = health_check
+        self.lease_timeout = lease_timeout
+        self._clock = clock
+        self._cond = threading.Condition()
+        self._generation = 0
+        self._primary: Optional[_Slot] = _Slot(primary, 0, primary=True) if primary is not None else None
+        self._idle: List[_Slot] = [self._primary] if self._primary else []
+        self._busy: Dict[int, _Slot] = {}
+        self._pending = 0  # sessions being created
+        self._closed = False
+        # Backoff after failed session starts / main session restarts
+        self._create_failures = 0
+        self._create_after = 0.0
+        self._primary_failures = 0
+        self._primary_after = 0.0
+        self.size = 1
+        self.resize(size)
+        self._stats = {"leases": 0, "timeouts": 0, "created": 0, "recycled": 0, "create_errors": 0}
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+
+    # ------------------------------------------------------------------
+    # Sizing
+    # ------------------------------------------------------------------
+    @property
+    def primary(self) -> Any:
+        return self._primary.bot if self._primary else None
+
+    def resize(self, size: int) -> None:
+        """Allow *size* sessions (extra idle sessions above it are closed)."""
+        with self._cond:
+            self.size = max(1, int(size or 1))
+            surplus = []
+            while self._count() > self.size:
+                extra = next((s for s in self._idle if not s.primary), None)
+                if extra is None:
+                    break  # the rest are closed as they come back
+                self._idle.remove(extra)
+                surplus.append(extra)
+            self._cond.notify_all()
+        for slot in surplus:
+            self._close(slot)
+
+    def _count(self) -> int:
+        return len(self._idle) + len(self._busy) + self._pending
+
+    # ------------------------------------------------------------------
+    # Leasing
+    # ------------------------------------------------------------------
+    def acquire(self, timeout: Optional[float] = None, primary: bool = False) -> Any:
+        """A healthy bot for exclusive use; give it back with :meth:`release`.
+
+        Raises :class:`DriverPoolTimeout` if none is free within *timeout*
+        seconds (default :attr:`lease_timeout`).
+        """
+        timeout = self.lease_timeout if timeout is None else timeout
+        started = self._clock()
+        deadline = started + timeout
+        while True:
+            slot, create = self._take(deadline, primary)
+            if create:
+                slot = self._create()
+                if slot is None:
+                    continue
+            elif not self._healthy(slot):
+                slot = self._recycle(slot)
+                if slot is None:
+                    continue
+            break
+        waited = self._clock() - started
+        with self._cond:
+            self._stats["leases"] += 1
+            self._wait_total += waited
+            self._wait_max = max(self._wait_max, waited)
+        if waited >= SLOW_LEASE_WAIT:
+            logger.info(f"⏳ Waited {waited:.1f}s for a browser session")
+        return slot.bot
+
+    def _take(self, deadline: float, primary: bool):
+        """``(slot, False)`` for an idle session or ``(None, True)`` to create one."""
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise DriverPoolTimeout("Driver pool is closed")
+                now = self._clock()
+                slot = self._pick(primary, now)
+                if slot is not None:
+                    self._idle.remove(slot)
+                    self._busy[id(slot.bot)] = slot
+                    return slot, False
+                if (
+                    not primary
+                    and self.factory is not None
+                    and self._count() < self.size
+                    and now >= self._create_after
+                ):
+                    self._pending += 1
+                    return None, True
+                remaining = deadline - now
+                if remaining <= 0:
+                    self._stats["timeouts"] += 1
+                    raise DriverPoolTimeout(f"No browser session became free ({len(self._busy)} busy)")
+                self._cond.wait(min(remaining, 1.0))
+
+    def _pick(self, primary: bool, now: float) -> Optional[_Slot]:
+        if self._primary in self._idle and now >= self._primary_after:
+            return self._primary
+        if primary:
+            return None
+        current = [s for s in self._idle if not s.primary and s.generation == self._generation]
+        return current[-1] if current else None
+
+    def release(self, bot: Any, broken: bool = False) -> None:
+        """Return *bot*; *broken* health-checks it and recycles it if it is dead."""
+        with self._cond:
+            slot = self._busy.get(id(bot))
+        if slot is None:
+            logger.warning("Released a browser session that was not leased from the pool")
+            return
+        if broken and not self._healthy(slot):
+            slot = self._recycle(slot, leased=True)
+            if slot is None:
+                return
+        with self._cond:
+            self._busy.pop(id(bot), None)
+            retire = not slot.primary and (
+                self._closed or slot.generation != self._generation or self._count() >= self.size
+            )
+            if not retire:
+                self._idle.append(slot)
+            self._cond.notify_all()
+        if retire:
+            self._close(slot)
+
+    @contextmanager
+    def lease(self, timeout: Optional[float] = None, primary: bool = False) -> Iterator[Any]:
+        """``with pool.lease() as bot:`` — exclusive use of one session."""
+        bot = self.acquire(timeout, primary=primary)
+        broken = False
+        try:
+            yield bot
+        except BaseException:
+            broken = True
+            raise
+        finally:
+            self.release(bot, broken=broken)
+
+    # ------------------------------------------------------------------
+    # Session lifecycle
+    # ------------------------------------------------------------------
+    def _healthy(self, slot: _Slot) -> bool:
+        try:
+            return bool(self.health_check(slot.bot))
+        except Exception:
+            return False
+
+    def _create(self) -> Optional[_Slot]:
+        """Start a new session (pending slot already reserved); ``None`` on failure."""
+        with self._cond:
+            generation = self._generation
+        bot = None
+        try:
+            bot = self.factory()
+            if self.prepare is not None and self.primary is not None:
+                self.prepare(self.primary, bot)
+        except Exception as e:
+            logger.error(f"❌ Could not start a pooled browser session: {e}", exc_info=True)
+            if bot is not None:
+                self._quit(bot)
+            with self._cond:
+                self._pending -= 1
+                self._stats["create_errors"] += 1
+                self._create_failures += 1
+                delay = _backoff(self._create_failures)
+                self._create_after = self._clock() + delay
+                self._cond.notify_all()
+            logger.warning(f"⏳ Next pooled browser session start in {delay:.0f}s")
+            return None
+        slot = _Slot(bot, generation)
+        with self._cond:
+            self._pending -= 1
+            self._create_failures = 0
+            self._create_after = 0.0
+            self._busy[id(bot)] = slot
+            self._stats["created"] += 1
+        logger.info(f"🌐 Started pooled browser session {self._count()}/{self.size}")
+        return slot
+
+    def _recycle(self, slot: _Slot, leased: bool = False) -> Optional[_Slot]:
+        """Replace a dead session; the main bot gets a new driver in place.
+
+        Returns the slot to use (still marked busy) or ``None`` if it was
+        dropped.  A main bot whose restart did not bring it back is returned
+        to the idle list and skipped until its backoff expires.
+        """
+        with self._cond:
+            self._stats["recycled"] += 1
+        if slot.primary:
+            logger.warning("♻️ Main browser session is not responding, restarting its driver")
+            bot = slot.bot
+            self._quit(bot)
+            restarted = False
+            try:
+                restarted = bool(bot.initialize_driver_with_retries())
+                if restarted and bot.load_cookies():
+                    bot.driver.refresh()
+            except Exception as e:
+                logger.error(f"❌ Restarting the main browser session failed: {e}")
+            if restarted and self._healthy(slot):
+                with self._cond:
+                    self._primary_failures = 0
+                    self._primary_after = 0.0
+                return slot
+            with self._cond:
+                self._primary_failures += 1
+                delay = _backoff(self._primary_failures)
+                self._primary_after = self._clock() + delay
+                self._busy.pop(id(bot), None)
+                self._idle.append(slot)
+                self._cond.notify_all()
+            logger.error(f"❌ Main browser session is still down, next restart in {delay:.0f}s")
+            return None
+        logger.warning("♻️ Pooled browser session is not responding, replacing it")
+        with self._cond:
+            self._busy.pop(id(slot.bot), None)
+            self._cond.notify_all()
+        self._quit(slot.bot)
+        return None
+
+    @staticmethod
+    def _quit(bot: Any) -> None:
+        try:
+            bot.close()
+        except Exception as e:
+            logger.debug(f"Closing a browser session failed: {e}")
+
+    def _close(self, slot: _Slot) -> None:
+        self._quit(slot.bot)
+        logger.info("🌐 Closed a pooled browser session")
+
+    def invalidate(self) -> None:
+        """Retire every extra session (idle ones now, leased ones on release)."""
+        with self._cond:
+            self._generation += 1
+            stale = [s for s in self._idle if not s.primary]
+            self._idle = [s for s in self._idle if s.primary]
+            self._cond.notify_all()
+        for slot in stale:
+            self._close(slot)
+
+    def close(self) -> None:
+        """Close the extra sessions; the main bot is left to its owner."""
+        with self._cond:
+            self._closed = True
+            extras = [s for s in self._idle if not s.primary]
+            self._idle = [s for s in self._idle if s.primary]
+            self._cond.notify_all()
+        for slot in extras:
+            self._close(slot)
+
+    # ------------------------------------------------------------------
+    # Metrics
+    # ------------------------------------------------------------------
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            leases = self._stats["leases"]
+            return dict(
+                self._stats,
+                size=self.size,
+                sessions=len(self._idle) + len(self._busy),
+                busy=len(self._busy),
+                idle=len(self._idle),
+                wait_total=round(self._wait_total, 3),
+                wait_avg=round(self._wait_total / leases, 3) if leases else 0.0,
+                wait_max=round(self._wait_max, 3),
+            )
+
+
+@contextmanager
+def lease_bot(bot: Any, bot_lock: Any, timeout: Optional[float] = None) -> Iterator[Any]:
+    """The bot a task should drive: a lease from a :class:`DriverPool`, or
+    *bot* itself under a plain mutex (``QMutex``) or no lock at all.
+
+    Raises :class:`DriverPoolTimeout` when nothing is free within *timeout*.
+    """
+    if isinstance(bot_lock, DriverPool):
+        with bot_lock.lease(timeout) as leased:
+            yield leased
+        return
+    if bot_lock is None:
+        yield bot
+        return
+    if timeout is None:
+        bot_lock.lock()
+    elif not bot_lock.tryLock(int(timeout * 1000)):
+        raise DriverPoolTimeout(f"bot_lock not acquired within {timeout:.0f}s")
+    try:
+        yield bot
+    finally:
+        bot_lock.unlock()
+
+
+__all__ = [
+    "DriverPool",
+    "DriverPoolTimeout",
+    "default_pool_size",
+    "driver_alive",
+    "lease_bot",
+    "share_session",
+    "DEFAULT_LEASE_TIMEOUT",
+]
@@ -1,7 +1,8 @@
-import hashlib
 import logging
 import os
 
+from core.hash_cache import get_hash_cache
+
 
 class FileMonitor:
     def __init__(self):
@@ -51,13 +52,9 @@ class FileMonitor:
 
     @staticmethod
     def calculate_file_hash(file_path: str, chunk_size: int = 8192) -> str:
-        """Calculate MD5 hash of file."""
-        md5 = hashlib.md5()
+        """Calculate MD5 hash of file (served from the shared hash cache)."""
         try:
-            with open(file_path, 'rb') as f:
-                for chunk in iter(lambda: f.read(chunk_size), b''):
-                    md5.update(chunk)
-            return md5.hexdigest()
+            return get_hash_cache().md5(file_path)
         except Exception as e:
             logging.error(f"Error calculating hash for {file_path}: {str(e)}")
             return ''
\ No newline at end of file
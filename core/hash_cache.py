@@ -0,0 +1,250 @@
+"""Persistent content-hash cache for upload and dedup checks.
+
+The same release used to be hashed several times: Rapidgator's upload
+handler on every attempt (retries included), ``ForumBotSelenium.calculate_md5``,
+the main window's duplicate check and ``FileMonitor``, all with 4–64 KB
+reads.  :class:`FileHashCache` hashes a file once:
+
+* entries are keyed by the file's real path and validated against
+  ``(size, mtime_ns, inode)``, so any change to the file invalidates them;
+* every requested digest (``md5``, ``sha1``, ``sha256`` ...) is computed in
+  the same read, with large buffers (hashlib releases the GIL on big
+  updates, so the worker pool hashes in parallel);
+* concurrent requests for the same file share one in-flight computation;
+* the table is persisted as JSON per user (``file_hashes.json`` in the user
+  folder, falling back to ``DATA_DIR``).
+
+Use :func:`get_hash_cache` for the shared instance.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Iterable, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+HASH_CACHE_FILENAME = "file_hashes.json"
+DEFAULT_BUFFER_SIZE = 8 * 1024 * 1024
+
+FileKey = Tuple[int, int, int]
+
+
+def _file_key(path: str) -> Tuple[str, FileKey]:
+    real = os.path.realpath(path)
+    st = os.stat(real)
+    return real, (st.st_size, st.st_mtime_ns, st.st_ino)
+
+
+def hash_file(path: str, algorithms: Sequence[str] = ("md5",),
+              buffer_size: int = DEFAULT_BUFFER_SIZE) -> Dict[str, str]:
+    """Compute every digest in *algorithms* for *path* in a single read."""
+    hashers = {name: hashlib.new(name) for name in algorithms}
+    buf = bytearray(buffer_size)
+    view = memoryview(buf)
+    try:
+        with open(path, "rb", buffering=0) as f:
+            while True:
+                n = f.readinto(buf)
+                if not n:
+                    break
+                chunk = view[:n]
+                for h in hashers.values():
+                    h.update(chunk)
+                chunk.release()
+    finally:
+        view.release()
+    return {name: h.hexdigest() for name, h in hashers.items()}
+
+
+class FileHashCache:
+    """Thread-safe ``path -> digests`` cache with JSON persistence."""
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        max_workers: int = 2,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        max_entries: int = 20_000,
+    ) -> None:
+        self.path = path
+        self.buffer_size = buffer_size
+        self.max_entries = max_entries
+        self._lock = threading.RLock()
+        self._entries: Dict[str, dict] = {}
+        self._inflight: Dict[Tuple[str, FileKey], Future] = {}
+        self._pool = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="filehash")
+        self.hits = 0
+        self.misses = 0
+        self._load()
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+    def _load(self) -> None:
+        self._entries = {}
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                self._entries = {k: v for k, v in data.items() if isinstance(v, dict)}
+            logger.debug(f"Loaded {len(self._entries)} cached file hashes from {self.path}")
+        except Exception as e:
+            logger.warning(f"⚠️ Could not load hash cache {self.path}: {e}")
+
+    def save(self) -> None:
+        if not self.path:
+            return
+        with self._lock:
+            data = dict(self._entries)
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            tmp = self.path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp, self.path)
+        except Exception as e:
+            logger.warning(f"⚠️ Could not save hash cache {self.path}: {e}")
+
+    def set_path(self, path: Optional[str]) -> None:
+        """Switch to another user's cache file (reloads the table)."""
+        with self._lock:
+            if path == self.path:
+                return
+            self.path = path
+            self._load()
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+    def _cached(self, real: str, key: FileKey, algorithms: Sequence[str]) -> Optional[Dict[str, str]]:
+        entry = self._entries.get(real)
+        if not entry or tuple(entry.get("key", ())) != key:
+            return None
+        digests = entry.get("digests", {})
+        if all(a in digests for a in algorithms):
+            return {a: digests[a] for a in algorithms}
+        return None
+
+    def peek(self, path: str, algorithm: str = "md5") -> Optional[str]:
+        """Return a cached digest without hashing (``None`` if unknown/stale)."""
+        try:
+            real, key = _file_key(path)
+        except OSError:
+            return None
+        with self._lock:
+            cached = self._cached(real, key, (algorithm,))
+        return cached[algorithm] if cached else None
+
+    def submit(self, path: str, algorithms: Sequence[str] = ("md5",)) -> Future:
+        """Return a future for the digests of *path*, hashing in the pool if needed."""
+        algorithms = tuple(algorithms)
+        real, key = _file_key(path)
+        with self._lock:
+            cached = self._cached(real, key, algorithms)
+            if cached is not None:
+                self.hits += 1
+                done: Future = Future()
+                done.set_result(cached)
+                return done
+            inflight = self._inflight.get((real, key))
+            if inflight is not None:
+                return inflight
+            self.misses += 1
+            # Hash whatever is missing together with what is already known.
+            entry = self._entries.get(real)
+            known = entry.get("digests", {}) if entry and tuple(entry.get("key", ())) == key else {}
+            wanted = tuple(dict.fromkeys(tuple(known) + algorithms))
+            fut = self._pool.submit(self._compute, real, key, wanted)
+            self._inflight[(real, key)] = fut
+            return fut
+
+    def _compute(self, real: str, key: FileKey, algorithms: Sequence[str]) -> Dict[str, str]:
+        started = time.monotonic()
+        try:
+            digests = hash_file(real, algorithms, self.buffer_size)
+            try:
+                if _file_key(real)[1] != key:
+                    logger.warning(f"⚠️ {real} changed while hashing; not caching")
+                    return digests
+            except OSError:
+                return digests
+            with self._lock:
+                if len(self._entries) >= self.max_entries and real not in self._entries:
+                    # Drop the oldest half; dicts keep insertion order.
+                    for stale in list(self._entries)[: self.max_entries // 2]:
+                        del self._entries[stale]
+                self._entries.pop(real, None)
+                self._entries[real] = {"key": list(key), "digests": digests}
+            self.save()
+            elapsed = time.monotonic() - started
+            size_mb = key[0] / (1024 * 1024)
+            logger.debug(f"Hashed {os.path.basename(real)} ({size_mb:.1f} MB) in {elapsed:.2f}s")
+            return digests
+        finally:
+            with self._lock:
+                self._inflight.pop((real, key), None)
+
+    def digests(self, path: str, algorithms: Sequence[str] = ("md5",)) -> Dict[str, str]:
+        """Return ``{algorithm: hexdigest}`` for *path*, hashing at most once."""
+        return self.submit(path, algorithms).result()
+
+    def md5(self, path: str) -> str:
+        return self.digests(path, ("md5",))["md5"]
+
+    def prefetch(self, paths: Iterable[str], algorithms: Sequence[str] = ("md5",)) -> None:
+        """Start hashing *paths* in the background."""
+        for p in paths:
+            try:
+                self.submit(str(p), algorithms)
+            except OSError as e:
+                logger.debug(f"Skipping hash prefetch for {p}: {e}")
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=False)
+
+
+_cache: Optional[FileHashCache] = None
+_cache_lock = threading.Lock()
+
+
+def _user_cache_path() -> str:
+    try:
+        from core.user_manager import get_user_manager
+
+        manager = get_user_manager()
+        if manager and manager.get_current_user():
+            return manager.get_user_data_path(HASH_CACHE_FILENAME)
+    except Exception:
+        logger.debug("No user folder for hash cache", exc_info=True)
+    from config.config import DATA_DIR
+
+    return os.path.join(DATA_DIR, HASH_CACHE_FILENAME)
+
+
+def get_hash_cache() -> FileHashCache:
+    """Return the process-wide cache, persisted in the current user's folder."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = FileHashCache(_user_cache_path())
+            try:
+                from core.user_manager import get_user_manager
+
+                get_user_manager().register_login_listener(
+                    lambda _user: _cache.set_path(_user_cache_path())
+                )
+            except Exception:
+                logger.debug("Hash cache login listener not registered", exc_info=True)
+        return _cache
+
+
+__all__ = ["FileHashCache", "HASH_CACHE_FILENAME", "get_hash_cache", "hash_file"]
@@ -0,0 +1,240 @@
+"""Pluggable HTML parsing backend for forum pages.
+
+Most of the bot works on BeautifulSoup trees built with the pure-Python
+``html.parser``.  This module centralises that choice:
+
+* :func:`make_soup` builds a BeautifulSoup tree with the fastest available
+  tree builder (``lxml`` when installed, ``html.parser`` otherwise).
+* :func:`extract_thread_posts` and :func:`extract_listing_rows` are one-pass
+  extractors for the hot paths (thread pages and category listings).  With
+  lxml they run precompiled XPath expressions directly on the lxml tree and
+  return plain data, skipping BeautifulSoup entirely; without lxml they fall
+  back to a single CSS ``select`` pass over a BeautifulSoup tree.
+
+The backend can be forced with :func:`set_backend` (``"lxml"``,
+``"html.parser"`` or ``"auto"``), which ``ForumBotSelenium`` wires to the
+``html_parser_backend`` config key.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from typing import List, NamedTuple, Optional
+
+from bs4 import BeautifulSoup
+
+try:  # pragma: no cover - optional dependency
+    import lxml.html as _lxml_html
+    from lxml import etree as _etree
+    LXML_AVAILABLE = True
+except Exception:  # pragma: no cover
+    _lxml_html = None
+    _etree = None
+    LXML_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+BACKEND_LXML = "lxml"
+BACKEND_HTML_PARSER = "html.parser"
+
+_backend = BACKEND_LXML if LXML_AVAILABLE else BACKEND_HTML_PARSER
+
+_POST_ID_RE = re.compile(r"post_message_\d+")
+# lxml refuses str input carrying an encoding declaration
+_XML_DECL_RE = re.compile(r"^\s*<\?xml[^>]*\?>")
+
+
+def set_backend(name: Optional[str]) -> str:
+    """Select the parser backend and return the one actually in use."""
+    global _backend
+    name = (name or "auto").strip().lower()
+    if name in ("auto", BACKEND_LXML):
+        if LXML_AVAILABLE:
+            _backend = BACKEND_LXML
+        else:
+            if name == BACKEND_LXML:
+                logger.warning("⚠️ lxml is not installed; falling back to html.parser")
+            _backend = BACKEND_HTML_PARSER
+    elif name == BACKEND_HTML_PARSER:
+        _backend = BACKEND_HTML_PARSER
+    else:
+        logger.warning(f"⚠️ Unknown HTML parser backend '{name}', keeping {_backend}")
+    return _backend
+
+
+def get_backend() -> str:
+    return _backend
+
+
+def make_soup(html: str) -> BeautifulSoup:
+    """Build a BeautifulSoup tree using the configured tree builder."""
+    return BeautifulSoup(html or "", _backend)
+
+
+class PostContent(NamedTuple):
+    """Link-bearing parts of a single ``div#post_message_N``."""
+
+    post_id: str
+    hrefs: List[str]
+    pre_texts: List[str]
+    quote_texts: List[str]
+    code_texts: List[str]
+
+
+class ListingRow(NamedTuple):
+    """Raw thread link data from a category listing page."""
+
+    title: str
+    href: str
+    date_text: Optional[str]
+
+
+# ---------------------------------------------------------------------------
+# BeautifulSoup helpers (also used for elements callers already hold)
+# ---------------------------------------------------------------------------
+def post_content_from_tag(post) -> PostContent:
+    """Collect the link-bearing parts of a BeautifulSoup post element."""
+    return PostContent(
+        post_id=post.get("id", "") if hasattr(post, "get") else "",
+        hrefs=[a["href"] for a in post.find_all("a", href=True)],
+        pre_texts=[pre.get_text(separator="\n") for pre in post.find_all("pre", class_="alt2")],
+        quote_texts=[q.get_text(separator="\n") for q in post.find_all("quote")],
+        code_texts=[c.get_text(separator="") for c in post.select("div.alt2 code code")],
+    )
+
+
+def _soup_thread_posts(html: str):
+    soup = make_soup(html)
+    author_elem = soup.select_one("td.alt2 a.bigusername span")
+    author = author_elem.get_text(strip=True) if author_elem else ""
+    posts = []
+    last_post = None
+    # Document-order pass: every td.thead closes the post message before it.
+    for el in soup.select('td.thead, div[id^="post_message_"]'):
+        if el.name == "div":
+            if _POST_ID_RE.search(el.get("id", "")):
+                last_post = el
+        elif last_post is not None:
+            posts.append(post_content_from_tag(last_post))
+    return author, posts
+
+
+def _soup_listing_rows(html: str) -> List[ListingRow]:
+    soup = make_soup(html)
+    rows = []
+    for thread in soup.select('a[id^="thread_title_"]'):
+        date_text = None
+        parent_td = thread.find_parent("td")
+        if parent_td:
+            date_div = parent_td.find_next("div", class_="smallfont")
+            if date_div and not date_div.has_attr("style"):
+                date_text = date_div.get_text(separator=",").split(",")[-1].strip()
+        rows.append(ListingRow(thread.text.strip(), thread.get("href", ""), date_text))
+    return rows
+
+
+# ---------------------------------------------------------------------------
+# lxml fast path
+# ---------------------------------------------------------------------------
+def _has_class(name: str) -> str:
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+if LXML_AVAILABLE:
+    _X_AUTHOR = _etree.XPath(
+        f"(//td[{_has_class('alt2')}]//a[{_has_class('bigusername')}]//span)[1]"
+    )
+    _X_POSTS_AND_HEADERS = _etree.XPath(
+        f"//td[{_has_class('thead')}] | //div[starts-with(@id, 'post_message_')]"
+    )
+    _X_HREFS = _etree.XPath(".//a/@href")
+    _X_PRE = _etree.XPath(f".//pre[{_has_class('alt2')}]")
+    _X_QUOTE = _etree.XPath(".//quote")
+    _X_NESTED_CODE = _etree.XPath(f".//div[{_has_class('alt2')}]//code//code")
+    _X_THREAD_LINKS = _etree.XPath("//a[starts-with(@id, 'thread_title_')]")
+    _X_LISTING_DATE = _etree.XPath(
+        f"(ancestor::td[1]/descendant::div[{_has_class('smallfont')}]"
+        f" | ancestor::td[1]/following::div[{_has_class('smallfont')}])[1]"
+    )
+
+
+def _lxml_root(html: str):
+    if not html or not html.strip():
+        return None
+    if isinstance(html, str):
+        html = _XML_DECL_RE.sub("", html, count=1)
+    try:
+        return _lxml_html.document_fromstring(html)
+    except (_etree.ParserError, ValueError):
+        return None
+
+
+def _text(el, separator: str) -> str:
+    return separator.join(el.itertext())
+
+
+def _lxml_post_content(el) -> PostContent:
+    return PostContent(
+        post_id=el.get("id", ""),
+        hrefs=[str(h) for h in _X_HREFS(el) if h],
+        pre_texts=[_text(p, "\n") for p in _X_PRE(el)],
+        quote_texts=[_text(q, "\n") for q in _X_QUOTE(el)],
+        code_texts=[_text(c, "") for c in _X_NESTED_CODE(el)],
+    )
+
+
+def _lxml_thread_posts(html: str):
+    root = _lxml_root(html)
+    if root is None:
+        return "", []
+    author_nodes = _X_AUTHOR(root)
+    author = "".join(s.strip() for s in author_nodes[0].itertext()) if author_nodes else ""
+    posts = []
+    last_post = None
+    for el in _X_POSTS_AND_HEADERS(root):
+        if el.tag == "div":
+            if _POST_ID_RE.search(el.get("id", "")):
+                last_post = el
+        elif last_post is not None:
+            posts.append(_lxml_post_content(last_post))
+    return author, posts
+
+
+def _lxml_listing_rows(html: str) -> List[ListingRow]:
+    root = _lxml_root(html)
+    if root is None:
+        return []
+    rows = []
+    for link in _X_THREAD_LINKS(root):
+        date_text = None
+        date_nodes = _X_LISTING_DATE(link)
+        if date_nodes and date_nodes[0].get("style") is None:
+            date_text = _text(date_nodes[0], ",").split(",")[-1].strip()
+        rows.append(ListingRow(link.text_content().strip(), link.get("href", ""), date_text))
+    return rows
+
+
+# ---------------------------------------------------------------------------
+# Public one-pass extractors
+# ---------------------------------------------------------------------------
+def extract_thread_posts(html: str):
+    """Return ``(author, [PostContent, ...])`` for a showthread page.
+
+    Posts are the ``div#post_message_N`` elements that precede each
+    ``td.thead`` header, in page order, matching the historic
+    ``find_all(thead) + find_previous(post_message)`` traversal.
+    """
+    if _backend == BACKEND_LXML:
+        return _lxml_thread_posts(html)
+    return _soup_thread_posts(html)
+
+
+def extract_listing_rows(html: str) -> List[ListingRow]:
+    """Return every ``a#thread_title_N`` on a listing page with its date text.
+
+    ``date_text`` is ``None`` when the row has no usable ``div.smallfont``.
+    """
+    if _backend == BACKEND_LXML:
+        return _lxml_listing_rows(html)
+    return _soup_listing_rows(html)
@@ -14,7 +14,6 @@ emits :class:`OperationStatus` updates so that the UI can remain responsive.
 
 from __future__ import annotations
 
-import json
 import logging
 import shutil
 from dataclasses import dataclass, field
@@ -48,6 +47,7 @@ from concurrent.futures import Future, ThreadPoolExecutor
 from threading import Semaphore
 
 from config.config import DATA_DIR
+from core.write_behind import get_write_behind, read_json
 from models.job_model import AutoProcessJob
 from models.operation_status import OpStage, OpType, OperationStatus
 
@@ -70,23 +70,18 @@ class JobManager:
         self.load()
 
     def load(self) -> None:
-        if self.path.exists():
-            try:
-                data = json.load(open(self.path, "r", encoding="utf-8"))
-                self.jobs = {
-                    jid: AutoProcessJob.from_dict(j) for jid, j in data.items()
-                }
-            except Exception as e:  # pragma: no cover - log but ignore
-                logging.error("Failed to load jobs: %s", e)
-                self.jobs = {}
-        else:
+        try:
+            data = read_json(str(self.path), default={}) or {}
+            self.jobs = {
+                jid: AutoProcessJob.from_dict(j) for jid, j in data.items()
+            }
+        except Exception as e:  # pragma: no cover - log but ignore
+            logging.error("Failed to load jobs: %s", e)
             self.jobs = {}
 
     def save(self) -> None:
         tmp = {jid: job.to_dict() for jid, job in self.jobs.items()}
-        self.path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.path, "w", encoding="utf-8") as f:
-            json.dump(tmp, f, indent=2)
+        get_write_behind().submit(str(self.path), tmp, indent=2, ensure_ascii=True)
 
     def add_job(self, job: AutoProcessJob) -> None:
         self.jobs[job.job_id] = job
@@ -258,7 +253,7 @@ class QueueOrchestrator(QObject):
                 "working_dir": state.working_dir,
             }
         try:  # pragma: no cover - persistence best effort
-            self.user_manager.save_user_data(self.snapshot_file, data)
+            self.user_manager.save_user_data(self.snapshot_file, data, defer=True)
         except Exception:  # pragma: no cover
             logging.debug("Queue snapshot save failed", exc_info=True)
 
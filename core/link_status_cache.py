@@ -0,0 +1,148 @@
+"""Persistent per-URL link-status cache with time-to-live.
+
+Link checks are slow (one Rapidgator API call or a JDownloader round-trip
+per URL), but a link that was alive an hour ago almost certainly still is.
+:class:`LinkStatusCache` remembers the last result per URL:
+
+* entries are ``{"status": ..., "checked_at": <unix time>, ...}`` keyed by
+  the URL exactly as it appears in the thread data;
+* an entry is *fresh* while it is younger than the TTL of its status
+  (``ttl`` is one number of seconds or a ``{status: seconds}`` mapping with
+  an optional ``"*"`` default), so e.g. offline results can be re-checked
+  sooner than online ones;
+* :meth:`~LinkStatusCache.split` separates the fresh entries from the URLs
+  that have to be checked and counts cache hits/misses;
+* the table is saved through the write-behind queue and lives in the
+  current user's folder.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+from core.write_behind import get_write_behind, read_json
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL = 23 * 3600
+
+TTL = Union[float, Mapping[str, float]]
+
+
+class LinkStatusCache:
+    """Thread-safe ``url -> {"status", "checked_at", ...}`` table."""
+
+    def __init__(self, path: Optional[str] = None, ttl: TTL = DEFAULT_TTL,
+                 clock: Callable[[], float] = time.time) -> None:
+        self.path = path
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.RLock()
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+        self._load()
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+    def _load(self) -> None:
+        self._entries = {}
+        if not self.path:
+            return
+        try:
+            data = read_json(self.path, default={}) or {}
+            if isinstance(data, dict):
+                self._entries = {k: v for k, v in data.items() if isinstance(v, dict)}
+            logger.debug(f"Loaded {len(self._entries)} cached link statuses from {self.path}")
+        except Exception as e:
+            logger.warning(f"⚠️ Could not load link-status cache {self.path}: {e}")
+
+    def save(self) -> None:
+        """Queue the table for writing (coalesced by the write-behind queue)."""
+        if not self.path:
+            return
+        with self._lock:
+            data = {url: dict(entry) for url, entry in self._entries.items()}
+        get_write_behind().submit(self.path, data, indent=None)
+
+    def set_path(self, path: Optional[str]) -> None:
+        """Switch to another user's cache file (reloads the table)."""
+        with self._lock:
+            if path == self.path:
+                return
+            self.path = path
+            self._load()
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+    def ttl_for(self, status: Optional[str]) -> float:
+        if isinstance(self.ttl, Mapping):
+            key = str(status or "").lower()
+            return float(self.ttl.get(key, self.ttl.get("*", 0)))
+        return float(self.ttl)
+
+    def is_fresh(self, entry: Optional[Mapping[str, Any]], now: Optional[float] = None) -> bool:
+        if not entry:
+            return False
+        try:
+            age = (self._clock() if now is None else now) - float(entry.get("checked_at") or 0)
+        except (TypeError, ValueError):
+            return False
+        return 0 <= age < self.ttl_for(entry.get("status"))
+
+    def peek(self, url: str) -> Optional[Dict[str, Any]]:
+        """The stored entry for *url*, fresh or not (no hit/miss accounting)."""
+        with self._lock:
+            entry = self._entries.get(url)
+            return dict(entry) if entry else None
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """The entry for *url* if it is still fresh."""
+        fresh, _ = self.split([url])
+        return fresh.get(url)
+
+    def split(self, urls: Iterable[str], force: bool = False) -> Tuple[Dict[str, Dict[str, Any]], List[str]]:
+        """``(fresh entries, urls to check)``; *force* treats everything as stale."""
+        fresh: Dict[str, Dict[str, Any]] = {}
+        stale: List[str] = []
+        now = self._clock()
+        with self._lock:
+            for url in dict.fromkeys(urls):
+                entry = None if force else self._entries.get(url)
+                if self.is_fresh(entry, now):
+                    fresh[url] = dict(entry)
+                else:
+                    stale.append(url)
+            self.hits += len(fresh)
+            self.misses += len(stale)
+        return fresh, stale
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+    def put(self, url: str, status: str, checked_at: Optional[float] = None, **extra: Any) -> Dict[str, Any]:
+        entry = dict(extra, status=status, checked_at=int(self._clock() if checked_at is None else checked_at))
+        with self._lock:
+            self._entries[url] = entry
+        return dict(entry)
+
+    def discard(self, urls: Iterable[str]) -> None:
+        with self._lock:
+            for url in urls:
+                self._entries.pop(url, None)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+__all__ = ["LinkStatusCache", "DEFAULT_TTL"]
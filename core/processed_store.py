@@ -0,0 +1,251 @@
+"""Append-only store for processed forum thread IDs.
+
+The bot used to re-pickle the whole ``processed_thread_ids`` set after every
+thread, which is O(n) per insert.  :class:`ProcessedThreadStore` keeps the IDs
+in memory as a plain ``set`` and persists every change as one line appended to
+a per-user journal (``+<id>`` / ``-<id>``), fsynced immediately so a crash
+loses at most the entry being written.  When removals and duplicates make the
+journal noticeably larger than the live set, it is rewritten as a snapshot on
+a background thread.
+
+The class is a :class:`collections.abc.MutableSet`, so existing code that
+calls ``add``/``discard``/``in`` on ``bot.processed_thread_ids`` keeps working.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import pickle
+import threading
+from collections.abc import MutableSet
+from typing import Iterable, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_FILENAME = "processed_threads.journal"
+LEGACY_PICKLE_FILENAME = "processed_threads.pkl"
+
+
+class ProcessedThreadStore(MutableSet):
+    """Set of processed thread IDs backed by an append-only journal.
+
+    Parameters
+    ----------
+    path:
+        Journal file location, normally ``<user folder>/processed_threads.journal``.
+    legacy_pickle:
+        Optional path of the old ``processed_threads.pkl``.  If it exists and
+        no journal exists yet, its contents are migrated once and the pickle
+        is renamed to ``*.migrated``.
+    fsync:
+        Flush each append to disk.  Disable only in tests.
+    compact_min_records:
+        Do not compact journals smaller than this many records.
+    compact_ratio:
+        Compact when the journal holds more than ``compact_ratio`` records per
+        live ID.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        legacy_pickle: Optional[str] = None,
+        fsync: bool = True,
+        compact_min_records: int = 10_000,
+        compact_ratio: float = 2.0,
+    ) -> None:
+        self.path = path
+        self.fsync = fsync
+        self.compact_min_records = compact_min_records
+        self.compact_ratio = compact_ratio
+        self._ids: set = set()
+        self._records = 0
+        self._lock = threading.RLock()
+        self._compacting = False
+        self._generation = 0
+        self._pending: Optional[List[str]] = None
+        self._compact_thread: Optional[threading.Thread] = None
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if not os.path.exists(path) and legacy_pickle and os.path.exists(legacy_pickle):
+            self._migrate_pickle(legacy_pickle)
+        else:
+            self._load()
+        self._fh = open(self.path, "a", encoding="utf-8", newline="\n")
+
+    # ------------------------------------------------------------------
+    # Loading / migration
+    # ------------------------------------------------------------------
+    def _load(self) -> None:
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "rb") as fh:
+            data = fh.read()
+        complete, _sep, torn = data.rpartition(b"\n")
+        if torn:
+            # A crash mid-append leaves a record without its newline – drop it.
+            logger.warning(f"⚠️ Ignoring incomplete last record in {self.path}")
+            with open(self.path, "r+b") as fh:
+                fh.truncate(len(data) - len(torn))
+        for line in complete.decode("utf-8", errors="replace").split("\n"):
+            # Journals written in text mode on Windows end records with "\r\n"
+            line = line.rstrip("\r")
+            if not line:
+                continue
+            op, thread_id = line[0], line[1:]
+            if op == "+":
+                self._ids.add(thread_id)
+            elif op == "-":
+                self._ids.discard(thread_id)
+            self._records += 1
+
+    def _migrate_pickle(self, legacy_pickle: str) -> None:
+        try:
+            with open(legacy_pickle, "rb") as fh:
+                ids = pickle.load(fh) or set()
+        except Exception as e:
+            logger.error(f"❌ Could not read legacy processed threads file {legacy_pickle}: {e}")
+            return
+        self._ids = {str(i) for i in ids}
+        self._write_snapshot(self.path, self._ids)
+        self._records = len(self._ids)
+        try:
+            os.replace(legacy_pickle, legacy_pickle + ".migrated")
+        except OSError:
+            pass
+        logger.info(f"📦 Migrated {len(self._ids)} processed thread IDs from {legacy_pickle}")
+
+    def _write_snapshot(self, path: str, ids: Iterable[str]) -> None:
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8", newline="\n") as fh:
+            fh.writelines(f"+{i}\n" for i in ids)
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp, path)
+
+    # ------------------------------------------------------------------
+    # MutableSet interface
+    # ------------------------------------------------------------------
+    def __contains__(self, thread_id) -> bool:
+        return str(thread_id) in self._ids
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._ids))
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def add(self, thread_id) -> None:
+        thread_id = str(thread_id)
+        with self._lock:
+            if thread_id in self._ids:
+                return
+            self._ids.add(thread_id)
+            self._append(f"+{thread_id}\n")
+
+    def discard(self, thread_id) -> None:
+        thread_id = str(thread_id)
+        with self._lock:
+            if thread_id not in self._ids:
+                return
+            self._ids.discard(thread_id)
+            self._append(f"-{thread_id}\n")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._ids.clear()
+            self._fh.close()
+            self._fh = open(self.path, "w", encoding="utf-8", newline="\n")
+            self._records = 0
+
+    def replace(self, ids: Iterable) -> None:
+        """Replace the whole contents with *ids* (rewrites the journal)."""
+        with self._lock:
+            self._generation += 1
+            self._ids = {str(i) for i in ids}
+            self._fh.close()
+            self._write_snapshot(self.path, self._ids)
+            self._records = len(self._ids)
+            self._fh = open(self.path, "a", encoding="utf-8", newline="\n")
+
+    # ------------------------------------------------------------------
+    # Journal maintenance
+    # ------------------------------------------------------------------
+    def _append(self, record: str) -> None:
+        self._fh.write(record)
+        self._fh.flush()
+        if self.fsync:
+            os.fsync(self._fh.fileno())
+        self._records += 1
+        if self._pending is not None:
+            self._pending.append(record)
+
+    def needs_compaction(self) -> bool:
+        return (
+            self._records >= self.compact_min_records
+            and self._records > self.compact_ratio * max(1, len(self._ids))
+        )
+
+    def maybe_compact(self) -> bool:
+        """Start a background compaction if the journal has grown too large."""
+        with self._lock:
+            if self._compacting or not self.needs_compaction():
+                return False
+            self._compacting = True
+            self._pending = []
+            snapshot = set(self._ids)
+            generation = self._generation
+        self._compact_thread = threading.Thread(
+            target=self._compact, args=(snapshot, generation), name="processed-threads-compact", daemon=True
+        )
+        self._compact_thread.start()
+        return True
+
+    def _compact(self, snapshot: set, generation: int) -> None:
+        tmp = self.path + ".compact"
+        try:
+            # The bulk of the snapshot is written without holding the lock.
+            with open(tmp, "w", encoding="utf-8", newline="\n") as fh:
+                fh.writelines(f"+{i}\n" for i in snapshot)
+            with self._lock:
+                if generation != self._generation:
+                    # clear()/replace() rewrote the journal meanwhile.
+                    os.remove(tmp)
+                    return
+                pending = self._pending or []
+                with open(tmp, "a", encoding="utf-8", newline="\n") as fh:
+                    fh.writelines(pending)
+                    fh.flush()
+                    os.fsync(fh.fileno())
+                self._fh.close()
+                os.replace(tmp, self.path)
+                self._fh = open(self.path, "a", encoding="utf-8", newline="\n")
+                self._records = len(snapshot) + len(pending)
+            logger.info(f"🧹 Compacted processed threads journal to {self._records} records")
+        except Exception as e:
+            logger.error(f"❌ Processed threads journal compaction failed: {e}")
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+        finally:
+            with self._lock:
+                self._pending = None
+                self._compacting = False
+
+    def wait_for_compaction(self, timeout: Optional[float] = None) -> None:
+        thread = self._compact_thread
+        if thread is not None and thread.is_alive() and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    def close(self) -> None:
+        self.wait_for_compaction()
+        with self._lock:
+            try:
+                self._fh.close()
+            except Exception:
+                pass
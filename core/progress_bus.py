@@ -0,0 +1,129 @@
+"""Coalescing progress bus between workers and the status widget.
+
+Workers emit an :class:`~models.operation_status.OperationStatus` from every
+progress callback.  Forwarding each of them through a queued signal means
+one cross-thread event, one ``StatusManager.update_operation`` and one row
+repaint per callback; with several hosts uploading dozens of files that is
+thousands of events per second for a table that cannot show more than a few
+frames per second anyway.
+
+:class:`ProgressBus` sits in between:
+
+* :meth:`ProgressBus.publish` may be called from any thread (connect worker
+  signals with ``Qt.DirectConnection``); it stores the status in a
+  latest-value slot per operation key and returns immediately;
+* a timer on the bus's thread flushes all slots at a fixed frame rate
+  (10 Hz by default) as one ``batch_ready(list)`` signal;
+* stage transitions (queued → running → finished/error) bypass the slots
+  and are emitted at once via ``status_ready``, replacing any stale
+  progress still waiting for the key, so the UI never shows ``RUNNING``
+  after ``FINISHED``;
+* :meth:`ProgressBus.stats` reports published/coalesced/dropped counters.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Any, Dict, Hashable, List, Optional
+
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FPS = 10
+
+
+def _stage_name(status: Any) -> str:
+    stage = getattr(status, "stage", None)
+    return str(getattr(stage, "name", stage) or "").upper()
+
+
+def default_key(status: Any) -> Hashable:
+    """One slot per operation row and host (uploads report per host)."""
+    op_type = getattr(status, "op_type", None)
+    return (
+        getattr(status, "section", ""),
+        getattr(status, "item", ""),
+        getattr(op_type, "name", op_type),
+        getattr(status, "host", ""),
+    )
+
+
+class ProgressBus(QObject):
+    """Latest-value-per-operation buffer flushed at a fixed frame rate."""
+
+    status_ready = pyqtSignal(object)  # single status, delivered immediately
+    batch_ready = pyqtSignal(list)  # coalesced statuses, once per frame
+
+    def __init__(self, fps: int = DEFAULT_FPS, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._lock = threading.Lock()
+        self._slots: Dict[Hashable, Any] = {}
+        self._stages: Dict[Hashable, str] = {}
+        self._counters = {
+            "published": 0,
+            "coalesced": 0,
+            "dropped": 0,
+            "immediate": 0,
+            "delivered": 0,
+            "batches": 0,
+        }
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self.flush)
+        self.set_fps(fps)
+
+    # ------------------------------------------------------------------
+    def set_fps(self, fps: int) -> None:
+        fps = max(1, int(fps or DEFAULT_FPS))
+        self._timer.start(max(1, int(1000 / fps)))
+
+    def key_for(self, status: Any) -> Hashable:
+        return default_key(status)
+
+    def publish(self, status: Any) -> None:
+        """Queue *status*; thread-safe and non-blocking."""
+        key = self.key_for(status)
+        stage = _stage_name(status)
+        with self._lock:
+            self._counters["published"] += 1
+            previous = self._stages.get(key)
+            self._stages[key] = stage
+            transition = stage != "RUNNING" or previous != stage
+            if not transition:
+                if key in self._slots:
+                    self._counters["coalesced"] += 1
+                self._slots[key] = status
+                return
+            if self._slots.pop(key, None) is not None:
+                # Superseded by the transition itself
+                self._counters["dropped"] += 1
+            if stage in ("FINISHED", "ERROR"):
+                self._stages.pop(key, None)
+            self._counters["immediate"] += 1
+            self._counters["delivered"] += 1
+        self.status_ready.emit(status)
+
+    def flush(self) -> None:
+        """Emit every pending status as one batch (runs on the bus's thread)."""
+        with self._lock:
+            if not self._slots:
+                return
+            batch: List[Any] = list(self._slots.values())
+            self._slots.clear()
+            self._counters["delivered"] += len(batch)
+            self._counters["batches"] += 1
+        self.batch_ready.emit(batch)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            stats = dict(self._counters)
+            stats["pending"] = len(self._slots)
+        return stats
+
+    def stop(self) -> None:
+        self._timer.stop()
+        self.flush()
+
+
+__all__ = ["ProgressBus", "default_key", "DEFAULT_FPS"]
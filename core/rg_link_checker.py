@@ -0,0 +1,306 @@
+"""Batched Rapidgator link-status service.
+
+The backup-thread check used to call ``ForumBotSelenium.check_rapidgator_link_status``
+once per link: a fresh ``requests.get`` (no connection reuse), the token
+resolved again on every call, and a fixed sleep between links — several
+seconds per thread, hours for a few thousand backup threads.
+
+:class:`RGLinkChecker` replaces that loop:
+
+* ``/file/check_link`` is called with up to ``batch_size`` comma-separated
+  URLs per request over one keep-alive session;
+* requests are paced by a :class:`TokenBucket` shared by every caller, so
+  concurrent workers together stay under ``rate_per_min``;
+* the token comes from a provider callable, resolved once and refreshed only
+  when the API rejects it;
+* results go into a :class:`~core.link_status_cache.LinkStatusCache`
+  (``rg_link_status.json`` in the user folder) and URLs with a fresh result
+  are not sent at all;
+* ``on_batch`` receives the results of each request as it completes.
+
+Statuses are ``"alive"``/``"dead"``; a URL whose request failed maps to
+``None`` and is not cached.  Use :func:`get_rg_link_checker` for the shared
+instance.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import re
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import requests
+
+from core.link_status_cache import DEFAULT_TTL, LinkStatusCache
+
+logger = logging.getLogger(__name__)
+
+API_ROOT = "https://rapidgator.net/api/v2"
+RG_LINK_STATUS_FILENAME = "rg_link_status.json"
+DEFAULT_BATCH_SIZE = 25
+
+ALIVE = "alive"
+DEAD = "dead"
+
+_FILE_ID_RE = re.compile(r"/file/([0-9a-f]{32})", re.I)
+
+# token_provider(refresh) -> token; refresh=True asks for a new login
+TokenProvider = Callable[[bool], Optional[str]]
+# fetch(token, urls) -> (api status, items); status 401 means "token rejected"
+FetchFunc = Callable[[str, List[str]], Tuple[int, List[Dict[str, Any]]]]
+Result = Optional[Dict[str, Any]]
+
+
+class TokenExpired(Exception):
+    """The API rejected the token."""
+
+
+class TokenBucket:
+    """Thread-safe token bucket: ``rate`` tokens per second, at most ``capacity`` banked."""
+
+    def __init__(self, rate: float, capacity: float = 1.0, clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep) -> None:
+        self.rate = max(rate, 1e-6)
+        self.capacity = max(capacity, 1.0)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.capacity
+        self._stamp = clock()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take a token (possibly going negative); seconds to wait before using it."""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._stamp) * self.rate)
+            self._stamp = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def acquire(self, cancelled: Optional[Callable[[], bool]] = None) -> bool:
+        """Block until a token is available; ``False`` if *cancelled* became true."""
+        wait = self._reserve()
+        while wait > 0:
+            if cancelled and cancelled():
+                return False
+            step = min(wait, 0.25)
+            self._sleep(step)
+            wait -= step
+        return not (cancelled and cancelled())
+
+
+def link_key(url: str) -> str:
+    """Match key of a Rapidgator URL (file id if present)."""
+    m = _FILE_ID_RE.search(url or "")
+    if m:
+        return m.group(1).lower()
+    return (url or "").strip().lower().rstrip("/")
+
+
+class RGLinkChecker:
+    """Checks Rapidgator links in batches with a shared rate limit and cache."""
+
+    def __init__(
+        self,
+        token_provider: Optional[TokenProvider] = None,
+        cache: Optional[LinkStatusCache] = None,
+        rate_per_min: float = 60,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        fetch: Optional[FetchFunc] = None,
+        base_url: str = API_ROOT,
+    ) -> None:
+        self.token_provider = token_provider
+        self.cache = cache if cache is not None else LinkStatusCache()
+        self.batch_size = max(1, int(batch_size))
+        self.base_url = base_url
+        self.bucket = TokenBucket(1.0, 1.0)
+        self.set_rate(rate_per_min)
+        self._fetch = fetch or self._fetch_check_link
+        self._session: Optional[requests.Session] = None
+        self._token: Optional[str] = None
+        self._token_lock = threading.Lock()
+        self.stats = {"requests": 0, "checked": 0, "errors": 0}
+
+    def set_rate(self, rate_per_min: float) -> None:
+        """Requests per minute for all callers together (a few may burst)."""
+        rate = max(1.0, float(rate_per_min or 60))
+        self.bucket.rate = rate / 60.0
+        self.bucket.capacity = max(1.0, min(5.0, rate / 12.0))
+
+    # ------------------------------------------------------------------
+    # Token
+    # ------------------------------------------------------------------
+    def _get_token(self, refresh: bool = False) -> Optional[str]:
+        with self._token_lock:
+            if refresh or not self._token:
+                self._token = self.token_provider(refresh) if self.token_provider else None
+            return self._token
+
+    # ------------------------------------------------------------------
+    # HTTP
+    # ------------------------------------------------------------------
+    def _fetch_check_link(self, token: str, urls: List[str]) -> Tuple[int, List[Dict[str, Any]]]:
+        if self._session is None:
+            self._session = requests.Session()
+            self._session.headers.update({"User-Agent": "Mozilla/5.0", "Accept": "application/json"})
+        r = self._session.get(
+            f"{self.base_url}/file/check_link",
+            params={"token": token, "url": ",".join(urls)},
+            timeout=20,
+        )
+        if r.status_code == 401:
+            return 401, []
+        r.raise_for_status()
+        data = r.json()
+        items = data.get("response") or []
+        if isinstance(items, dict):
+            items = [items]
+        return int(data.get("status") or 0), items
+
+    def _check_batch(
+        self, urls: List[str], cancelled: Optional[Callable[[], bool]] = None
+    ) -> Dict[str, Result]:
+        token = self._get_token()
+        if not token:
+            raise TokenExpired("Rapidgator token is not available")
+        for attempt in range(2):
+            self.stats["requests"] += 1
+            status, items = self._fetch(token, urls)
+            if status != 401:
+                break
+            token = self._get_token(refresh=True) if attempt == 0 else None
+            if not token:
+                raise TokenExpired("Rapidgator rejected the token")
+
+        if status != 200:
+            if len(urls) > 1:
+                # One bad URL fails the whole request: fall back to single checks
+                logger.debug(f"Rapidgator check_link status {status} for a batch, re-checking singly")
+                results: Dict[str, Result] = {}
+                for url in urls:
+                    if not self.bucket.acquire(cancelled):
+                        break
+                    try:
+                        results.update(self._check_batch([url]))
+                    except TokenExpired:
+                        raise
+                    except Exception as e:
+                        # Keep what was already checked; this one is just unknown
+                        self.stats["errors"] += 1
+                        logger.warning(f"⚠️ Rapidgator link check failed for {url}: {e}")
+                        results[url] = None
+                return results
+            logger.warning(f"Link appears dead ({status}): {urls[0]}")
+            items = []
+        by_key = {link_key(str(item.get("url", ""))): item for item in items if isinstance(item, dict)}
+        results = {}
+        for url in urls:
+            item = by_key.get(link_key(url))
+            alive = bool(item and str(item.get("status", "")).upper() == "ACCESS")
+            extra = {k: item[k] for k in ("filename", "size") if item and k in item}
+            results[url] = self.cache.put(url, ALIVE if alive else DEAD, **extra)
+        return results
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    def check(
+        self,
+        urls: Iterable[str],
+        force: bool = False,
+        on_batch: Optional[Callable[[Dict[str, Result]], None]] = None,
+        cancelled: Optional[Callable[[], bool]] = None,
+    ) -> Dict[str, Result]:
+        """Status entries for *urls*; cached results are used unless *force*.
+
+        ``on_batch`` is called with the cached results first, then with each
+        request's results.
+        """
+        urls = [u.strip() for u in urls if u and u.strip()]
+        fresh, stale = self.cache.split(urls, force=force)
+        results: Dict[str, Result] = dict(fresh)
+        if fresh and on_batch:
+            on_batch(dict(fresh))
+        try:
+            for start in range(0, len(stale), self.batch_size):
+                batch = stale[start:start + self.batch_size]
+                if not self.bucket.acquire(cancelled):
+                    break
+                try:
+                    batch_results = self._check_batch(batch, cancelled)
+                except TokenExpired as e:
+                    logger.error(f"❌ {e}; stopping the link check")
+                    batch_results = {url: None for url in stale[start:]}
+                    results.update(batch_results)
+                    if on_batch:
+                        on_batch(batch_results)
+                    break
+                except Exception as e:
+                    self.stats["errors"] += 1
+                    logger.warning(f"⚠️ Rapidgator link check failed for {len(batch)} link(s): {e}")
+                    batch_results = {url: None for url in batch}
+                self.stats["checked"] += len(batch)
+                results.update(batch_results)
+                if on_batch:
+                    on_batch(batch_results)
+        finally:
+            if stale:
+                self.cache.save()
+        return results
+
+    def check_one(self, url: str, force: bool = True) -> Result:
+        return self.check([url], force=force).get(url.strip())
+
+
+def _user_cache_path() -> Optional[str]:
+    try:
+        from core.user_manager import get_user_manager
+
+        manager = get_user_manager()
+        if manager and manager.get_current_user():
+            return manager.get_user_data_path(RG_LINK_STATUS_FILENAME)
+    except Exception:
+        logger.debug("No user folder for the RG link-status cache", exc_info=True)
+    from config.config import DATA_DIR
+
+    return os.path.join(DATA_DIR, RG_LINK_STATUS_FILENAME)
+
+
+_checker: Optional[RGLinkChecker] = None
+_checker_lock = threading.Lock()
+
+
+def get_rg_link_checker(token_provider: Optional[TokenProvider] = None) -> RGLinkChecker:
+    """Return the process-wide checker; *token_provider* replaces the current one."""
+    global _checker
+    with _checker_lock:
+        if _checker is None:
+            _checker = RGLinkChecker(cache=LinkStatusCache(_user_cache_path(), ttl=DEFAULT_TTL))
+            try:
+                from core.user_manager import get_user_manager
+
+                def _on_login(_user):
+                    _checker._token = None
+                    _checker.cache.set_path(_user_cache_path())
+
+                get_user_manager().register_login_listener(_on_login)
+            except Exception:
+                logger.debug("RG link-status cache login listener not registered", exc_info=True)
+        if token_provider is not None:
+            _checker.token_provider = token_provider
+        return _checker
+
+
+__all__ = [
+    "RGLinkChecker",
+    "TokenBucket",
+    "TokenExpired",
+    "get_rg_link_checker",
+    "link_key",
+    "ALIVE",
+    "DEAD",
+    "RG_LINK_STATUS_FILENAME",
+]
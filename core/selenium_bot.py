@@ -1,9 +1,7 @@
 from config.config import DATA_DIR
 import glob
-from requests_toolbelt.multipart.encoder import MultipartEncoder, MultipartEncoderMonitor
 from collections import defaultdict
 from email.parser import HeaderParser
-import hashlib
 import logging
 import mimetypes
 import re
@@ -45,6 +43,20 @@ from PyQt5.QtCore import QThread, pyqtSignal, QTimer, Qt
 from utils import sanitize_filename
 import deathbycaptcha
 from uploaders.rapidgator_upload_handler import RapidgatorUploadHandler
+from core.thread_fetcher import ThreadPageFetcher
+from core.hash_cache import get_hash_cache
+from core.rg_link_checker import get_rg_link_checker
+from uploaders.rg_upload_poller import get_upload_poller
+from downloaders.segmented import SegmentedDownloader
+from uploaders.multipart_stream import StreamingMultipartBody
+from utils.host_classifier import HostClassifier, url_hostname
+from core.html_backend import PostContent, extract_thread_posts, make_soup, post_content_from_tag, set_backend as set_html_backend
+from core.category_pipeline import listing_page_url, page_is_older_than, parse_thread_rows
+from core.processed_store import (
+    JOURNAL_FILENAME as PROCESSED_JOURNAL_FILENAME,
+    LEGACY_PICKLE_FILENAME as LEGACY_PROCESSED_PICKLE,
+    ProcessedThreadStore,
+)
 import xml.etree.ElementTree as ET
 from urllib.parse import urlencode
 import difflib
@@ -53,6 +65,8 @@ import os
 import requests
 from urllib.parse import urlparse
 
+_TRAILING_NBSP_RE = re.compile(r'(?:&nbsp;)+$')
+
 def extract_version_title(post_element, main_thread_title):
     """
     Extracts the version title from a given post element with enhanced version detection.
@@ -157,20 +171,20 @@ class ForumBotSelenium:
                 
                 # Set user-specific file paths
                 self.cookies_file = os.path.join(user_folder, "cookies.pkl")
-                self.processed_threads_file = os.path.join(user_folder, "processed_threads.pkl")
+                self.processed_threads_file = os.path.join(user_folder, PROCESSED_JOURNAL_FILENAME)
                 self.rapidgator_token_file = os.path.join(user_folder, "rapidgator_download_token.json")
                 self.upload_rapidgator_token_file = os.path.join(user_folder, "rapidgator_upload_token.json")
                 
             except (ValueError, AttributeError):
                 # Fallback to global data folder
                 self.cookies_file = os.path.join(DATA_DIR, "cookies.pkl")
-                self.processed_threads_file = os.path.join(DATA_DIR, "processed_threads.pkl")
+                self.processed_threads_file = os.path.join(DATA_DIR, PROCESSED_JOURNAL_FILENAME)
                 self.rapidgator_token_file = os.path.join(DATA_DIR, "rapidgator_download_token.json")
                 self.upload_rapidgator_token_file = os.path.join(DATA_DIR, "rapidgator_upload_token.json")
         else:
             # Fallback to global data folder
             self.cookies_file = os.path.join(DATA_DIR, "cookies.pkl")
-            self.processed_threads_file = os.path.join(DATA_DIR, "processed_threads.pkl")
+            self.processed_threads_file = os.path.join(DATA_DIR, PROCESSED_JOURNAL_FILENAME)
             self.rapidgator_token_file = os.path.join(DATA_DIR, "rapidgator_download_token.json")
             self.upload_rapidgator_token_file = os.path.join(DATA_DIR, "rapidgator_upload_token.json")
         self.extracted_threads = {}
@@ -193,6 +207,7 @@ class ForumBotSelenium:
             # Add more known file hosts here
         ]
         self.use_backup_rg = self.config.get('use_backup_rg', False) if self.config else False
+        set_html_backend(self.config.get('html_parser_backend', 'auto') if self.config else 'auto')
 
         # Initialize download directory
         if not os.path.exists(self.download_dir):
@@ -548,7 +563,7 @@ class ForumBotSelenium:
                 self.cookies_file = os.path.join(user_folder, "cookies.pkl")
                 
                 # Update processed threads file path
-                self.processed_threads_file = os.path.join(user_folder, "processed_threads.pkl")
+                self.processed_threads_file = os.path.join(user_folder, PROCESSED_JOURNAL_FILENAME)
                 
                 # Update Rapidgator token file paths
                 self.rapidgator_token_file = os.path.join(user_folder, "rapidgator_download_token.json")
@@ -561,7 +576,7 @@ class ForumBotSelenium:
                 os.makedirs(data_dir, exist_ok=True)
                 
                 self.cookies_file = os.path.join(data_dir, "cookies.pkl")
-                self.processed_threads_file = os.path.join(data_dir, "processed_threads.pkl")
+                self.processed_threads_file = os.path.join(data_dir, PROCESSED_JOURNAL_FILENAME)
                 self.rapidgator_token_file = os.path.join(data_dir, "rapidgator_download_token.json")
                 self.upload_rapidgator_token_file = os.path.join(data_dir, "rapidgator_upload_token.json")
                 
@@ -941,8 +956,11 @@ class ForumBotSelenium:
             logging.error(f"Error sending URLs to Keeplinks: {e}", exc_info=True)
             return ''
 
-    def check_rapidgator_link_status(self, link):
-        """Check a Rapidgator link using the /file/check_link endpoint."""
+    def rapidgator_check_token(self, refresh=False):
+        """Token for Rapidgator API link checks (main account, else backup).
+
+        ``refresh`` forces a new login, used after the API rejected the token.
+        """
         # Prefer main token but fall back to backup
         account_type = None
         if self.upload_rapidgator_token:
@@ -956,41 +974,29 @@ class ForumBotSelenium:
             elif self.load_token('backup'):
                 account_type = 'backup'
 
-        if not account_type or not self.ensure_valid_token(account_type):
-            logging.error("Rapidgator token is not available.")
-            return {'status': 'DEAD'}
-
-        token = self.upload_rapidgator_token if account_type == 'main' else self.rapidgator_token
-
-        # Extract file_id from URL
-        api_url = "https://rapidgator.net/api/v2/file/check_link"
-        params = {
-            'token': token,
-            'url': link,
-        }
-
-        try:
-            response = requests.get(api_url, params=params, timeout=10)
-            if response.status_code == 200:
-                data = response.json()
-                if data.get('status') == 200:
-                    info_list = data.get('response', [])
-                    if info_list:
-                        return info_list[0]
-                    return {'status': 'DEAD'}
-                else:
-                    logging.warning("Link appears dead: %s", data.get('details'))
-                    return {'status': 'DEAD'}
-
-                return file_data
-            else:
-                logging.error("Failed to check link status. HTTP %s", response.status_code)
-                return {'status': 'DEAD'}
+        if not account_type:
+            return None
+        if refresh:
+            if not self.api_login(account_type):
+                return None
+        elif not self.ensure_valid_token(account_type):
+            return None
+        return self.upload_rapidgator_token if account_type == 'main' else self.rapidgator_token
 
-        except Exception as e:
-            logging.error(f"Exception occurred while checking Rapidgator link status: {e}")
+    def check_rapidgator_link_status(self, link, force=True):
+        """Check a Rapidgator link using the /file/check_link endpoint.
 
-            return {'status': 'DEAD'}
+        Goes through the shared batched checker (keep-alive session, rate
+        limit, status cache); ``force=False`` accepts a fresh cached result.
+        Returns ``{'status': 'ACCESS', ...}`` for live links and
+        ``{'status': 'DEAD'}`` otherwise.
+        """
+        result = get_rg_link_checker(self.rapidgator_check_token).check_one(link, force=force)
+        if result and result.get('status') == 'alive':
+            return dict(result, status='ACCESS')
+        if result is None:
+            logging.error(f"Could not check Rapidgator link status: {link}")
+        return {'status': 'DEAD'}
 
     def parse_content_disposition(self, content_disp):
             """
@@ -2717,38 +2723,36 @@ class ForumBotSelenium:
         )
 
 
+    def _download_segments(self) -> int:
+        """Concurrent range connections per direct download (``download_segments``)."""
+        try:
+            value = self.config.get('download_segments', 4) if self.config else 4
+            return max(1, int(value))
+        except (TypeError, ValueError):
+            return 4
+
     def _download_stream(self, resp_or_url, filename, dest_dir, progress_callback):
         """
-        يحمّل chunk-wise. يقبل requests.Response أو URL نصي.
+        يحمّل الملف. يقبل requests.Response أو URL نصي.
+
+        Uses ``SegmentedDownloader``: byte-range segments in parallel when the
+        host supports ``Range``, resumable from the ``.part.json`` sidecar
+        after an interruption; a single connection otherwise.
         """
-        # إذا جرى تمرير URL بدل response:
+        engine = SegmentedDownloader(
+            self.session,
+            segments=self._download_segments(),
+            headers={"User-Agent": "Mozilla/5.0"},
+        )
+        outpath = os.path.join(dest_dir, filename)
         if isinstance(resp_or_url, str):
-            r = self.session.get(resp_or_url, headers={"User-Agent":"Mozilla/5.0"},
-                                 stream=True, timeout=60)
-            r.raise_for_status()
+            ok = engine.download(resp_or_url, outpath, progress_callback, filename)
         else:
-            r = resp_or_url
-
-        outpath = os.path.join(dest_dir, filename)
-        total   = int(r.headers.get("content-length", 0)) or None
-        dl      = 0
-
-        try:
-            with open(outpath, "wb") as f:
-                for chunk in r.iter_content(8192):
-                    if not chunk: continue
-                    f.write(chunk)
-                    dl += len(chunk)
-                    if progress_callback and total:
-                        progress_callback(dl, total, filename)
-        except Exception as e:
-            logging.error("Download error %s: %s", outpath, e, exc_info=True)
-            if os.path.exists(outpath):
-                os.remove(outpath)
-            return False
-
-        logging.info("Downloaded Katfile file: %s", outpath)
-        return True
+            ok = engine.download(resp_or_url.url, outpath, progress_callback, filename,
+                                 response=resp_or_url)
+        if ok:
+            logging.info("Downloaded Katfile file: %s", outpath)
+        return ok
 
 
     def sanitize_filename(self, filename):
@@ -2867,13 +2871,6 @@ class ForumBotSelenium:
             self.handle_exception("Rapidgator authentication", e)
             return None
 
-    def calculate_md5(self, file_path, chunk_size=8192):
-        md5 = hashlib.md5()
-        with open(file_path, 'rb') as f:
-            for chunk in iter(lambda: f.read(chunk_size), b''):
-                md5.update(chunk)
-        return md5.hexdigest()
-
     def initiate_upload_session(self, file_path, folder_id=None, multipart=True, max_retries=3, delay=5):
         """
         Initiates an upload session with multiple hosts.
@@ -2919,26 +2916,13 @@ class ForumBotSelenium:
                             # Perform actual file upload
                             if self.upload_file(upload_process_url, file_path):
                                 # Check upload status and get URL
-                                for _ in range(10):  # Check status up to 10 times
-                                    status_response = requests.get(
-                                        "https://rapidgator.net/api/v2/file/upload_info",
-                                        params={
-                                            'token': self.upload_rapidgator_token,
-                                            'upload_id': upload_id
-                                        }
-                                    )
-                                    if status_response.status_code == 200:
-                                        status_data = status_response.json()
-                                        if status_data.get('status') == 200:
-                                            upload_info = status_data['response']['upload']
-                                            if upload_info['state'] == 2:  # Upload complete
-                                                rapidgator_url = upload_info['file']['url']
-                                                if rapidgator_url:
-                                                    logging.info(
-                                                        f"Rapidgator upload completed successfully: {rapidgator_url}")
-                                                    uploaded_urls.append(rapidgator_url)
-                                                    break
-                                    time.sleep(2)
+                                rapidgator_url = get_upload_poller().wait(
+                                    upload_id, self.upload_rapidgator_token, timeout=20
+                                )
+                                if rapidgator_url:
+                                    logging.info(
+                                        f"Rapidgator upload completed successfully: {rapidgator_url}")
+                                    uploaded_urls.append(rapidgator_url)
 
             # Continue with other hosts even if Rapidgator fails
             # Step 2: Nitroflare Upload
@@ -3394,6 +3378,26 @@ class ForumBotSelenium:
             logging.error(f"Error uploading file to Rapidgator: {str(e)}")
             return False
 
+    def _multipart_body(self, fields, progress_callback=None):
+        """
+        Build a ``StreamingMultipartBody`` for *fields*. ``upload_chunk_mb``
+        (1-8, default 4) sets the read size and ``upload_use_mmap`` serves file
+        parts from a memory map.
+        """
+        try:
+            chunk_mb = int(self.config.get('upload_chunk_mb', 4) if self.config else 4)
+        except (TypeError, ValueError):
+            chunk_mb = 4
+        use_mmap = self.config.get('upload_use_mmap', False) if self.config else False
+        if isinstance(use_mmap, str):
+            use_mmap = use_mmap.strip().lower() in ('1', 'true', 'yes', 'on')
+        return StreamingMultipartBody(
+            fields,
+            progress_callback=progress_callback,
+            chunk_size=chunk_mb * 1024 * 1024,
+            use_mmap=bool(use_mmap),
+        )
+
     def upload_to_nitroflare(self, file_path, progress_callback=None):
         """
         Uploads a file to Nitroflare and returns the download URL.
@@ -3410,26 +3414,23 @@ class ForumBotSelenium:
                 logging.error("Nitroflare user hash is not configured in environment variables.")
                 return None
 
-            # Step 2: Create MultipartEncoder for upload with progress tracking
+            # Step 2: Stream the multipart body with large reads and throttled progress
             total_size = os.path.getsize(file_path)
 
-            with open(file_path, 'rb') as f:
-                encoder = MultipartEncoder(
-                    fields={
-                        'files': (os.path.basename(file_path), f),
-                        'user': nitroflare_user_hash
-                    }
-                )
+            def upload_callback(bytes_sent, _body_len):
+                progress_callback(min(bytes_sent, total_size), total_size)
 
-                def upload_callback(monitor):
-                    if progress_callback:
-                        progress_callback(monitor.bytes_read, total_size)
-
-                monitor = MultipartEncoderMonitor(encoder, upload_callback)
+            body = self._multipart_body(
+                {
+                    'files': (os.path.basename(file_path), file_path),
+                    'user': nitroflare_user_hash
+                },
+                upload_callback if progress_callback else None,
+            )
 
-                # Step 3: Upload the file with progress tracking
-                headers = {'Content-Type': monitor.content_type}
-                response = requests.post(server_url, data=monitor, headers=headers)
+            # Step 3: Upload the file with progress tracking
+            headers = {'Content-Type': body.content_type}
+            response = requests.post(server_url, data=body, headers=headers)
 
             logging.debug(f"Nitroflare Response: {response.text}")
 
@@ -3548,41 +3549,38 @@ class ForumBotSelenium:
 
             last_bytes_read = 0
 
-            # Step 5: Create MultipartEncoder with bulletproof progress tracking
+            # Step 5: Stream the multipart body with bulletproof, throttled progress tracking
             try:
-                with open(file_path, 'rb') as f:
-                    encoder = MultipartEncoder(
-                        fields={
-                            'file': (os.path.basename(file_path), f),
-                            'sess_id': sess_id,
-                            'utype': 'prem'
-                        }
-                    )
+                def safe_upload_callback(bytes_sent, _body_len):
+                    nonlocal last_bytes_read
+                    try:
+                        bytes_read = min(bytes_sent, total_size)
+                        # Only update if there's actual progress
+                        if bytes_read > last_bytes_read:
+                            progress_callback(bytes_read, total_size)
+                            last_bytes_read = bytes_read
+                    except Exception as e:
+                        crash_logger.warning(f"Progress callback failed for DDownload: {e}")
+
+                body = self._multipart_body(
+                    {
+                        'file': (os.path.basename(file_path), file_path),
+                        'sess_id': sess_id,
+                        'utype': 'prem'
+                    },
+                    safe_upload_callback if progress_callback else None,
+                )
 
-                    def safe_upload_callback(monitor):
-                        nonlocal last_bytes_read
-                        try:
-                            if progress_callback and hasattr(monitor, 'bytes_read'):
-                                bytes_read = monitor.bytes_read
-                                # Only update if there's actual progress
-                                if bytes_read > last_bytes_read:
-                                    progress_callback(bytes_read, total_size)
-                                    last_bytes_read = bytes_read
-                        except Exception as e:
-                            crash_logger.warning(f"Progress callback failed for DDownload: {e}")
-
-                    monitor = MultipartEncoderMonitor(encoder, safe_upload_callback)
-
-                    # Step 6: Upload the file with bulletproof HTTP request
-                    headers = {'Content-Type': monitor.content_type}
-                    response = requests.post(
-                        upload_url,
-                        data=monitor,
-                        headers=headers,
-                        verify=False,
-                        timeout=300.0
-                    )
-                    response.raise_for_status()
+                # Step 6: Upload the file with bulletproof HTTP request
+                headers = {'Content-Type': body.content_type}
+                response = requests.post(
+                    upload_url,
+                    data=body,
+                    headers=headers,
+                    verify=False,
+                    timeout=300.0
+                )
+                response.raise_for_status()
             except (requests.RequestException, requests.Timeout, OSError, Exception) as e:
                 crash_logger.error(f"Failed to upload file to DDownload: {e}",
                                  context={'file_path': file_path, 'upload_url': upload_url})
@@ -3700,41 +3698,38 @@ class ForumBotSelenium:
 
             last_bytes_read = 0
 
-            # Step 5: Create MultipartEncoder with bulletproof progress tracking
+            # Step 5: Stream the multipart body with bulletproof, throttled progress tracking
             try:
-                with open(file_path, 'rb') as f:
-                    encoder = MultipartEncoder(
-                        fields={
-                            'file': (os.path.basename(file_path), f),
-                            'sess_id': sess_id,
-                            'utype': 'prem'  # Premium user type
-                        }
-                    )
+                def safe_upload_callback(bytes_sent, _body_len):
+                    nonlocal last_bytes_read
+                    try:
+                        bytes_read = min(bytes_sent, total_size)
+                        # Only update if there's actual progress
+                        if bytes_read > last_bytes_read:
+                            progress_callback(bytes_read, total_size)
+                            last_bytes_read = bytes_read
+                    except Exception as e:
+                        crash_logger.warning(f"Progress callback failed for KatFile: {e}")
+
+                body = self._multipart_body(
+                    {
+                        'file': (os.path.basename(file_path), file_path),
+                        'sess_id': sess_id,
+                        'utype': 'prem'  # Premium user type
+                    },
+                    safe_upload_callback if progress_callback else None,
+                )
 
-                    def safe_upload_callback(monitor):
-                        nonlocal last_bytes_read
-                        try:
-                            if progress_callback and hasattr(monitor, 'bytes_read'):
-                                bytes_read = monitor.bytes_read
-                                # Only update if there's actual progress
-                                if bytes_read > last_bytes_read:
-                                    progress_callback(bytes_read, total_size)
-                                    last_bytes_read = bytes_read
-                        except Exception as e:
-                            crash_logger.warning(f"Progress callback failed for KatFile: {e}")
-
-                    monitor = MultipartEncoderMonitor(encoder, safe_upload_callback)
-
-                    # Step 6: Upload the file with bulletproof HTTP request
-                    headers = {'Content-Type': monitor.content_type}
-                    response = requests.post(
-                        upload_url,
-                        data=monitor,
-                        headers=headers,
-                        verify=False,
-                        timeout=300.0
-                    )
-                    response.raise_for_status()
+                # Step 6: Upload the file with bulletproof HTTP request
+                headers = {'Content-Type': body.content_type}
+                response = requests.post(
+                    upload_url,
+                    data=body,
+                    headers=headers,
+                    verify=False,
+                    timeout=300.0
+                )
+                response.raise_for_status()
             except (requests.RequestException, requests.Timeout, OSError, Exception) as e:
                 crash_logger.error(f"Failed to upload file to KatFile: {e}",
                                  context={'file_path': file_path, 'upload_url': upload_url})
@@ -3845,27 +3840,10 @@ class ForumBotSelenium:
             # ------------------------------------------------------------------
             # 3) Poll the API until RG finishes processing the upload
             # ------------------------------------------------------------------
-            info_url = "https://rapidgator.net/api/v2/file/upload_info"
-            for _ in range(10):  # ~20 s total (10 × 2 s)
-                info_resp = requests.get(
-                    info_url,
-                    params={"token": self.rg_backup_token, "upload_id": upload_id},
-                    timeout=15,
-                )
-                if info_resp.status_code == 200:
-                    info = info_resp.json()
-                    if info.get("status") == 200:
-                        up = info["response"]["upload"]
-                        state = up.get("state", 0)  # 0=uploading,1=processing,2=done,3=fail
-                        if state == 2:
-                            return up["file"]["url"]
-                        if state == 3:
-                            logging.error("Rapidgator marked upload as failed.")
-                            return None
-                time.sleep(2)
-
-            logging.error("Upload did not reach 'done' state within timeout.")
-            return None
+            url = get_upload_poller().wait(upload_id, self.rg_backup_token, timeout=20)
+            if not url:
+                logging.error("Upload did not reach 'done' state within timeout.")
+            return url
 
         except Exception as exc:
             logging.exception("Rapidgator backup upload failed: %s", exc)
@@ -3908,13 +3886,8 @@ class ForumBotSelenium:
             logging.error(f"Failed to save backup data for '{thread_id}': {e}", exc_info=True)
 
     def calculate_md5(self, file_path):
-        """Calculate MD5 hash of the given file."""
-        import hashlib
-        hash_md5 = hashlib.md5()
-        with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_md5.update(chunk)
-        return hash_md5.hexdigest()
+        """Calculate MD5 hash of the given file (cached across hosts and retries)."""
+        return get_hash_cache().md5(file_path)
 
     def retrieve_rapidgator_file_url(self, upload_id, max_retries=20, retry_delay=3):
         """
@@ -3942,69 +3915,15 @@ class ForumBotSelenium:
                 logging.error("Failed to load upload token. Aborting file URL retrieval.")
                 return None
 
-            # Step 3: Retrieve file URL
-            info_url = "https://rapidgator.net/api/v2/file/upload_info"
-
-            for attempt in range(1, max_retries + 1):
-                params = {
-                    'token': self.upload_rapidgator_token,
-                    'upload_id': upload_id
-                }
-
-                logging.debug(f"Attempt {attempt}: Sending file info request to {info_url}")
-                logging.debug(f"Attempt {attempt}: Request params: {params}")
-
-                try:
-                    response = requests.get(info_url, params=params, timeout=10)
-                    logging.debug(
-                        f"Attempt {attempt}: File info response - Status: {response.status_code}, Content: {response.text}")
-                except requests.Timeout:
-                    logging.error(f"Attempt {attempt}: Request timed out. Retrying in {retry_delay} seconds...")
-                    time.sleep(retry_delay)
-                    continue
-                except Exception as e:
-                    logging.error(f"Attempt {attempt}: Exception during file info request: {e}", exc_info=True)
-                    time.sleep(retry_delay)
-                    continue
-
-                if response.status_code == 200:
-                    data = response.json()
-                    if data.get('status') == 200:
-                        upload_info = data.get('response', {}).get('upload', {})
-                        if upload_info:
-                            state = upload_info.get('state')
-                            state_label = upload_info.get('state_label')
-
-                            if state == 2:  # Upload is complete
-                                file_info = upload_info.get('file', {})
-                                if 'url' in file_info:
-                                    file_url = file_info['url']
-                                    logging.info(f"File URL retrieved successfully: {file_url}")
-                                    return file_url
-                                else:
-                                    logging.warning("File URL missing from upload info.")
-                                    return None
-                            elif state == 1:  # Processing
-                                logging.info(
-                                    f"Attempt {attempt}: File still processing. Current state: {state_label}. Retrying in {retry_delay} seconds...")
-                            else:
-                                logging.warning(
-                                    f"Attempt {attempt}: Unexpected state: {state_label}. Retrying in {retry_delay} seconds...")
-                        else:
-                            logging.warning("No 'upload' info found in response.")
-                    else:
-                        logging.error(f"Attempt {attempt}: Error in file info response: {data.get('details')}")
-                        return None
-                else:
-                    logging.error(
-                        f"Attempt {attempt}: Failed to retrieve file info. Status code: {response.status_code}")
-                    return None
-
-                if attempt < max_retries:
-                    time.sleep(retry_delay)
-
-            logging.error(f"Max retries ({max_retries}) reached. Failed to retrieve file URL.")
-            return None
+            # Step 3: Retrieve file URL (shared poller with adaptive backoff)
+            file_url = get_upload_poller().wait(
+                upload_id, self.upload_rapidgator_token, timeout=max_retries * retry_delay
+            )
+            if file_url:
+                logging.info(f"File URL retrieved successfully: {file_url}")
+            else:
+                logging.error(f"Failed to retrieve file URL for upload ID: {upload_id}")
+            return file_url
 
         except Exception as e:
 
@@ -4514,85 +4433,81 @@ class ForumBotSelenium:
     # -----------------------------------
     # 4. Process Thread ID Management
     # -----------------------------------
+    def _processed_threads_dir(self):
+        """Folder holding the processed-threads journal for the current user."""
+        # Use user-specific folder if user is logged in, otherwise fallback to global
+        if self.user_manager and self.user_manager.get_current_user():
+            try:
+                user_folder = self.user_manager.get_user_folder()
+                os.makedirs(user_folder, exist_ok=True)
+                return user_folder
+            except Exception as e:
+                logging.warning(f"⚠️ Could not get user folder, using global: {e}")
+        return DATA_DIR
+
     def load_processed_thread_ids(self):
         """
-        Loads processed thread IDs from a file if it exists.
+        Opens the processed thread IDs journal for the current user, migrating
+        a legacy ``processed_threads.pkl`` on first use.
         """
         try:
-            # Use user-specific folder if user is logged in, otherwise fallback to global
-            if self.user_manager and self.user_manager.get_current_user():
-                try:
-                    user_folder = self.user_manager.get_user_folder()
-                    os.makedirs(user_folder, exist_ok=True)
-                    filename = os.path.join(user_folder, 'processed_threads.pkl')
-                    logging.debug(f"📁 Using user-specific processed threads file: {filename}")
-                except Exception as e:
-                    logging.warning(f"⚠️ Could not get user folder, using global: {e}")
-                    filename = os.path.join(DATA_DIR, 'processed_threads.pkl')
-            else:
-                filename = os.path.join(DATA_DIR, 'processed_threads.pkl')
-                logging.debug(f"📁 Using global processed threads file: {filename}")
-            
-            if os.path.exists(filename):
-                with open(filename, 'rb') as f:
-                    self.processed_thread_ids = pickle.load(f)
-                logging.info(f"✅ Processed thread IDs loaded successfully from {filename}")
-            else:
-                logging.info(f"📄 No existing processed thread IDs file found at {filename}")
-                self.processed_thread_ids = set()
+            folder = self._processed_threads_dir()
+            filename = os.path.join(folder, PROCESSED_JOURNAL_FILENAME)
+            logging.debug(f"📁 Using processed threads journal: {filename}")
+
+            previous = getattr(self, 'processed_thread_ids', None)
+            if isinstance(previous, ProcessedThreadStore):
+                previous.close()
+
+            self.processed_thread_ids = ProcessedThreadStore(
+                filename,
+                legacy_pickle=os.path.join(folder, LEGACY_PROCESSED_PICKLE),
+            )
+            logging.info(f"✅ Loaded {len(self.processed_thread_ids)} processed thread IDs from {filename}")
         except Exception as e:
             self.handle_exception("loading processed thread IDs", e)
             self.processed_thread_ids = set()
 
     def save_processed_thread_ids(self):
         """
-        Saves processed thread IDs to a file for persistence across sessions.
+        Persists processed thread IDs. Journal-backed sets are already durable
+        after every ``add``/``discard``, so this only schedules a background
+        compaction when needed. A plain ``set`` (e.g. assigned by the GUI) is
+        written into the journal as a new snapshot.
         """
         try:
-            # Use user-specific folder if user is logged in, otherwise fallback to global
-            if self.user_manager and self.user_manager.get_current_user():
-                try:
-                    user_folder = self.user_manager.get_user_folder()
-                    # Ensure user folder exists
-                    os.makedirs(user_folder, exist_ok=True)
-                    filename = os.path.join(user_folder, 'processed_threads.pkl')
-                    logging.debug(f"📁 Saving to user-specific processed threads file: {filename}")
-                except Exception as e:
-                    logging.warning(f"⚠️ Could not get user folder, using global: {e}")
-                    filename = os.path.join(DATA_DIR, 'processed_threads.pkl')
-            else:
-                filename = os.path.join(DATA_DIR, 'processed_threads.pkl')
-                logging.debug(f"📁 Saving to global processed threads file: {filename}")
-            
-            with open(filename, 'wb') as f:
-                pickle.dump(self.processed_thread_ids, f)
-            logging.info(f"✅ Processed thread IDs saved successfully to {filename}")
+            ids = self.processed_thread_ids
+            if isinstance(ids, ProcessedThreadStore):
+                ids.maybe_compact()
+                return
+            folder = self._processed_threads_dir()
+            store = ProcessedThreadStore(
+                os.path.join(folder, PROCESSED_JOURNAL_FILENAME),
+                legacy_pickle=os.path.join(folder, LEGACY_PROCESSED_PICKLE),
+            )
+            store.replace(ids)
+            self.processed_thread_ids = store
+            logging.info(f"✅ Processed thread IDs saved successfully to {store.path}")
         except Exception as e:
             self.handle_exception("saving processed thread IDs", e)
 
     def reset_processed_thread_ids(self):
         """
-        Resets the processed thread IDs by clearing the set and deleting the pickle file.
+        Resets the processed thread IDs by clearing the journal and deleting
+        any legacy pickle file.
         """
         try:
             self.processed_thread_ids.clear()
-            
-            # Use user-specific folder if user is logged in, otherwise fallback to global
-            if self.user_manager and self.user_manager.get_current_user():
-                try:
-                    user_folder = self.user_manager.get_user_folder()
-                    filename = os.path.join(user_folder, 'processed_threads.pkl')
-                    logging.debug(f"📁 Resetting user-specific processed threads file: {filename}")
-                except Exception as e:
-                    logging.warning(f"⚠️ Could not get user folder, using global: {e}")
-                    filename = os.path.join(DATA_DIR, 'processed_threads.pkl')
-            else:
-                filename = os.path.join(DATA_DIR, 'processed_threads.pkl')
-                logging.debug(f"📁 Resetting global processed threads file: {filename}")
-            
-            if os.path.exists(filename):
-                os.remove(filename)
-                logging.info(f"🗑️ Deleted processed thread IDs file: {filename}")
+
+            folder = self._processed_threads_dir()
+            logging.debug(f"📁 Resetting processed threads in: {folder}")
+            for name in (LEGACY_PROCESSED_PICKLE, PROCESSED_JOURNAL_FILENAME):
+                filename = os.path.join(folder, name)
+                if name == PROCESSED_JOURNAL_FILENAME and isinstance(self.processed_thread_ids, ProcessedThreadStore):
+                    continue  # already truncated by clear()
+                if os.path.exists(filename):
+                    os.remove(filename)
+                    logging.info(f"🗑️ Deleted processed thread IDs file: {filename}")
             logging.info("✅ Processed thread IDs have been reset.")
         except Exception as e:
             self.handle_exception("resetting processed thread IDs", e)
@@ -4837,49 +4752,18 @@ class ForumBotSelenium:
             # Do NOT clear self.thread_links here to preserve existing links
             self.extracted_threads = {}  # Clear previous threads
 
-            for page_number in range(page_from, page_to + 1):
-                if page_number > 1:
-                    # MyGully forum uses format: /377-ebooks/ -> /377-ebooks-2/ -> /377-ebooks-3/
-                    # Remove trailing slash, add page number, then add slash back
-                    base_url = category_url.rstrip('/')
-                    page_url = f"{base_url}-{page_number}/"
-                else:
-                    # Use the original category URL for the first page
-                    page_url = category_url
-
-                logging.info(f"📄 Navigating to page {page_number}/{page_to}: {page_url}")
-                print(f"Navigating to page {page_number}/{page_to}: {page_url}")
-
-                self.driver.get(page_url)
-                time.sleep(3)  # Wait for page to load
-
-                logging.info(f"✅ Successfully loaded page {page_number}: {self.driver.current_url}")
-                print(f"[OK] Successfully loaded page {page_number}: {self.driver.current_url}")
-
-                # Check if we've been redirected to the login page
-                if "/login" in self.driver.current_url:
-                    logging.warning(f"Redirected to login page from {page_url}. Re-logging in.")
-                    self.is_logged_in = False
-                    self.login(current_url=page_url)
-                    if not self.is_logged_in:
-                        logging.error("Re-login failed. Stopping navigation.")
-                        return False
-                    else:
-                        # After re-login, try navigating again
-                        self.driver.get(page_url)
-                        time.sleep(3)
-
-                # Extract and filter threads by the provided date ranges
-                page_threads_before = len(self.extracted_threads)
-                self.extract_threads(date_ranges, thread_discovery_callback)
-                page_threads_after = len(self.extracted_threads)
-                new_threads_found = page_threads_after - page_threads_before
-                logging.info(f"📊 Page {page_number} processed: {new_threads_found} new threads found (Total: {page_threads_after})")
-                print(f"📊 Page {page_number} processed: {new_threads_found} new threads found (Total: {page_threads_after})")
+            # Threads stream in while later listing pages are still downloading
+            self._deliver_threads(
+                self.iter_category_threads(category_url, date_ranges, page_from, page_to),
+                thread_discovery_callback,
+            )
+            if not self.is_logged_in:
+                logging.error("Re-login failed. Stopping navigation.")
+                return False
 
             # Final summary
             total_threads = len(self.extracted_threads)
-            total_pages = page_to - page_from + 1
+            total_pages = self._last_listing_pages_walked
             logging.info(f"✅ Navigation completed! Processed {total_pages} pages and found {total_threads} total threads")
             print(f"[OK] Navigation completed! Processed {total_pages} pages and found {total_threads} total threads")
             return True
@@ -4888,6 +4772,89 @@ class ForumBotSelenium:
             print(f"Error navigating to URL: {e}")
             return False
 
+    def _listing_prefetch_pages(self) -> int:
+        """How many listing pages to download ahead (``listing_prefetch_pages``)."""
+        try:
+            value = self.config.get('listing_prefetch_pages', 2) if self.config else 2
+            return max(0, int(value))
+        except (TypeError, ValueError):
+            return 2
+
+    def _load_listing_page_in_browser(self, page_url):
+        """
+        Open a listing page in Selenium, re-logging in if we were redirected.
+        Returns the page HTML or ``None`` if re-login failed.
+        """
+        self.driver.get(page_url)
+        time.sleep(3)  # Wait for page to load
+        logging.info(f"✅ Successfully loaded page in browser: {self.driver.current_url}")
+
+        # Check if we've been redirected to the login page
+        if "/login" in self.driver.current_url:
+            logging.warning(f"Redirected to login page from {page_url}. Re-logging in.")
+            self.is_logged_in = False
+            self.login(current_url=page_url)
+            if not self.is_logged_in:
+                return None
+            # After re-login, try navigating again
+            self.driver.get(page_url)
+            time.sleep(3)
+        return self.driver.page_source
+
+    def iter_category_threads(self, category_url, date_ranges, page_from, page_to):
+        """
+        Stream ``(thread_id, thread_data)`` for a category's listing pages.
+
+        Listing pages are fetched over HTTP ``listing_prefetch_pages`` ahead of
+        the page being parsed; rows are date-matched as soon as each page
+        lands and the matching thread pages are pulled concurrently. Pages that
+        fail the login check are loaded in the browser instead. The walk stops
+        early once a page only holds threads older than every date range.
+        """
+        self._last_listing_pages_walked = 0
+        page_numbers = range(page_from, page_to + 1)
+        page_urls = [listing_page_url(category_url, n) for n in page_numbers]
+        earliest = self.earliest_date_in_ranges(date_ranges)
+
+        session = None
+        lookahead = self._listing_prefetch_pages()
+        if lookahead > 0:
+            try:
+                session = self.get_requests_session()
+            except Exception as e:
+                logging.warning(f"⚠️ Could not build HTTP session, using browser for listing pages: {e}")
+        if session is not None:
+            pages = ThreadPageFetcher(session).fetch_ahead(page_urls, lookahead=lookahead)
+        else:
+            pages = ((url, None) for url in page_urls)
+
+        try:
+            for page_number, (page_url, html) in zip(page_numbers, pages):
+                logging.info(f"📄 Processing page {page_number}/{page_to}: {page_url}")
+                if html is None:
+                    html = self._load_listing_page_in_browser(page_url)
+                    if html is None:
+                        return
+                self._last_listing_pages_walked += 1
+
+                base_url = page_url.split('/forum/')[0]
+                rows = parse_thread_rows(html, base_url)
+                candidates = self._select_thread_candidates(rows, date_ranges)
+                logging.info(f"📊 Page {page_number}: {len(rows)} threads, {len(candidates)} new matches")
+
+                yield from self._iter_thread_data(candidates, session=session)
+
+                if page_is_older_than(rows, earliest, self.parse_thread_date):
+                    logging.info(f"⏹️ Page {page_number} only has threads older than {earliest}; stopping early.")
+                    return
+        finally:
+            pages.close()
+            if session is not None:
+                try:
+                    session.close()
+                except Exception:
+                    pass
+
     def get_megathread_last_page(self, thread_url):
         """
         Determine if the megathread has multiple pages, and return the last page URL if so.
@@ -5222,7 +5189,7 @@ class ForumBotSelenium:
         
         # Store HTML content to avoid double visits (same as normal thread tracking)
         html_content = self.driver.page_source
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
 
         main_thread_title_el = soup.select_one('h1 > strong')
         main_thread_title = main_thread_title_el.get_text(strip=True) if main_thread_title_el else "No Title"
@@ -5771,12 +5738,11 @@ class ForumBotSelenium:
         """
         import html
         import re
-        from bs4 import BeautifulSoup
 
         if not post_element:
             return "[CENTER]No content available.[/CENTER]"
         logging.debug("convert_post_html_to_bbcode: starting conversion")
-        soup = BeautifulSoup(str(post_element), "html.parser")
+        soup = make_soup(str(post_element))
 
         # 1️⃣ Handle <a> tags that wrap images so the image src is preserved
         for a_tag in soup.find_all("a"):
@@ -5995,7 +5961,7 @@ class ForumBotSelenium:
         """
         self.driver.get(page_url)
         time.sleep(3)  # Wait for the page to load
-        soup = BeautifulSoup(self.driver.page_source, 'html.parser')
+        soup = make_soup(self.driver.page_source)
 
         posts = soup.find_all('div', id=re.compile(r'post_message_\d+'))
         return posts
@@ -6340,149 +6306,176 @@ class ForumBotSelenium:
     def extract_threads(self, date_ranges, thread_discovery_callback=None):
         """
         Extracts threads from the current page and filters them based on the date ranges.
-        TRUE SINGLE-VISIT: Process each matching thread immediately without collecting first.
+        Matching threads are fetched concurrently over HTTP (see ``_iter_thread_pages``)
+        and only pages that fail the login check are opened in the browser.
 
         Args:
             thread_discovery_callback: Optional callback called for each discovered thread.
                                      Signature: callback(thread_id, thread_data)
         """
         try:
-            logging.info("🧵 TRUE Single-Visit: Processing threads immediately when found...")
-            
+            logging.info("🧵 Collecting threads that match the date filter...")
 
             # Store the original forum page URL and base URL before any processing
             original_forum_url = self.driver.current_url
             base_url = original_forum_url.split('/forum/')[0]  # Get base domain once
             logging.debug(f"🏠 Using base URL: {base_url}")
-            
-            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-            thread_elements = soup.select('a[id^="thread_title_"]')
-            
-            logging.info(f"📊 Found {len(thread_elements)} threads to analyze...")
-            
-            threads_processed = 0
-            threads_with_hosts = 0
-            threads_for_review = 0
-            
-            # SINGLE PASS: Check date filter and process immediately if matches
-            # Use index to avoid re-parsing page after each thread
-            thread_index = 0
-            while thread_index < len(thread_elements):
-                thread = thread_elements[thread_index]
-                thread_title = thread.text.strip()
-                thread_url = thread['href']
-                
-                # CRITICAL: Increment thread_index IMMEDIATELY to prevent infinite loop
-                thread_index += 1
-                
-                # Convert relative URL to absolute URL using stored base_url
-                original_url = thread_url
-                if thread_url.startswith('/') or thread_url.startswith('showthread.php'):
-                    if thread_url.startswith('/'):
-                        thread_url = base_url + thread_url
-                    else:
-                        thread_url = base_url + '/' + thread_url
-                    logging.debug(f"🔗 Converted relative URL '{original_url}' to absolute URL '{thread_url}'")
-                
-                thread_id = thread_url.split('=')[-1]  # Extract thread ID
-            
-                # Find the correct div.smallfont next to the thread title without style attribute
+
+            rows = parse_thread_rows(self.driver.page_source, base_url)
+            logging.info(f"📊 Found {len(rows)} threads to analyze...")
+
+            candidates = self._select_thread_candidates(rows, date_ranges)
+            self._deliver_threads(
+                self._iter_thread_data(candidates, return_url=original_forum_url),
+                thread_discovery_callback,
+            )
+
+        except Exception as e:
+            self.handle_exception("extracting threads from current page", e)
+
+    def _select_thread_candidates(self, rows, date_ranges):
+        """Return the listing rows that match *date_ranges* and were not processed yet."""
+        candidates = []
+        seen_ids = set()
+        for row in rows:
+            # Check if the thread date matches any of the date ranges FIRST
+            if not self.match_date(date_ranges, row.date_text):
+                logging.debug(f"❌ Thread '{row.title}' does not match date filter. Skipping.")
+                continue
+            # Only AFTER date match, check if thread was already processed for THIS session
+            if row.thread_id in self.processed_thread_ids or row.thread_id in seen_ids:
+                logging.debug(f"⏭️ Thread '{row.title}' with ID '{row.thread_id}' already processed in this session. Skipping.")
+                continue
+            seen_ids.add(row.thread_id)
+            candidates.append(row)
+        return candidates
+
+    def _deliver_threads(self, threads, thread_discovery_callback=None):
+        """
+        Drain a ``(thread_id, thread_data)`` iterable into the discovery
+        callback and log the usual summary. Returns the number of threads.
+        """
+        threads_processed = 0
+        threads_with_hosts = 0
+        for thread_id, thread_data in threads:
+            threads_processed += 1
+            if thread_data.get('file_hosts') or thread_data.get('links'):
+                threads_with_hosts += 1
+
+            # Call live discovery callback immediately for real-time UI updates
+            if thread_discovery_callback:
                 try:
-                    parent_td = thread.find_parent('td')
-                    if parent_td:
-                        date_div = parent_td.find_next('div', class_='smallfont')
-                        if date_div and not date_div.has_attr('style'):
-                            date_text = date_div.get_text(separator=",").split(",")[
-                                -1].strip()  # Extract the date portion
-                        else:
-                            logging.warning(f"⚠️ Could not find date for thread '{thread_title}'. Skipping.")
-                            continue
+                    thread_discovery_callback(thread_id, thread_data)
+                    logging.debug(f"🔴 LIVE: Thread discovered callback called for '{thread_data.get('thread_title')}'")
+                except Exception as callback_error:
+                    logging.warning(f"Thread discovery callback failed: {callback_error}")
+
+        threads_for_review = threads_processed - threads_with_hosts
+        logging.info(f"📊 Thread page processing complete: {threads_processed} total threads ({threads_with_hosts} with known hosts, {threads_for_review} for manual review)")
+        if threads_processed == 0:
+            logging.info("📭 No matching threads found on this page.")
+        return threads_processed
+
+    def _thread_fetch_workers(self) -> int:
+        """Number of parallel HTTP thread-page fetches (``thread_fetch_workers``)."""
+        try:
+            value = self.config.get('thread_fetch_workers', 6) if self.config else 6
+            return max(0, int(value))
+        except (TypeError, ValueError):
+            return 6
+
+    def _iter_thread_pages(self, thread_urls, session=None):
+        """
+        Yield ``(thread_url, html)`` for *thread_urls* in order. ``html`` is
+        ``None`` when the page has to be loaded in the browser instead, either
+        because concurrent fetching is disabled or the HTTP response was not
+        logged in. An existing *session* is reused (and left open) if given.
+        """
+        workers = self._thread_fetch_workers()
+        if workers <= 1 or not thread_urls:
+            for url in thread_urls:
+                yield url, None
+            return
+        owns_session = session is None
+        if owns_session:
+            try:
+                # Build the session here: syncing cookies talks to the driver,
+                # which must stay on this thread.
+                session = self.get_requests_session()
+            except Exception as e:
+                logging.warning(f"⚠️ Could not build HTTP session, using browser for thread pages: {e}")
+                for url in thread_urls:
+                    yield url, None
+                return
+        fetcher = ThreadPageFetcher(session, max_workers=workers)
+        try:
+            yield from fetcher.fetch_all(thread_urls)
+        finally:
+            if owns_session:
+                fetcher.close()
+
+    def _iter_thread_data(self, candidates, return_url=None, session=None):
+        """
+        Generator yielding ``(thread_id, thread_data)`` for each ``ThreadRow``
+        candidate, pulling the pages concurrently and falling back to Selenium
+        per failed page. Each thread is stored in ``extracted_threads`` and
+        marked processed before it is yielded.
+        """
+        used_browser = False
+        pages = self._iter_thread_pages([c.url for c in candidates], session=session)
+        try:
+            for row, (_url, html) in zip(candidates, pages):
+                thread_id, thread_title, thread_url = row.thread_id, row.title, row.url
+                logging.info(f"✅ Thread '{thread_title}' matches date filter. Processing...")
+                thread_data = None
+                try:
+                    if html is not None:
+                        logging.debug(f"⚡ Parsing HTTP-fetched thread page: {thread_url}")
+                        file_hosts, links_dict, html_content, author = self.parse_thread_page(html)
                     else:
-                        logging.warning(f"⚠️ Could not find parent td for thread '{thread_title}'. Skipping.")
-                        continue
-                except Exception as e:
-                    logging.warning(f"⚠️ Error processing date for thread '{thread_title}': {e}")
-                    continue
-            
-                # Check if the thread date matches any of the date ranges FIRST
-                if self.match_date(date_ranges, date_text):
-                    # Only AFTER date match, check if thread was already processed for THIS session
-                    if thread_id in self.processed_thread_ids:
-                        logging.debug(f"⏭️ Thread '{thread_title}' with ID '{thread_id}' already processed in this session. Skipping.")
-                        continue
-                    logging.info(f"✅ Thread '{thread_title}' matches date filter. Processing IMMEDIATELY...")
-                    
-                    # IMMEDIATE PROCESSING - Extract file hosts and links RIGHT NOW
-                    try:
-                        logging.debug(f"🔍 Processing thread URL: {thread_url}")
+                        used_browser = True
                         file_hosts, links_dict, html_content, author = self.extract_file_hosts(thread_url)
-                        
-                        # Create thread data structure with HTML content to avoid double visits
-                        thread_data = {
-                            'thread_id': thread_id,
-                            'thread_title': thread_title,
-                            'thread_url': thread_url,
-                            'file_hosts': file_hosts,
-                            'links': links_dict,
-                            'has_known_hosts': bool(file_hosts),
-                            'html_content': html_content,  # Include HTML to avoid double visit
-                            'author': author
-                        }
-                        
-                        # Store in extracted_threads
-                        self.extracted_threads[thread_id] = thread_data
-                        threads_processed += 1
-
-                        # Call live discovery callback immediately for real-time UI updates
-                        if thread_discovery_callback:
-                            try:
-                                thread_discovery_callback(thread_id, thread_data)
-                                logging.debug(f"🔴 LIVE: Thread discovered callback called for '{thread_title}'")
-                            except Exception as callback_error:
-                                logging.warning(f"Thread discovery callback failed: {callback_error}")
-                        
-                        if file_hosts or links_dict:
-                            threads_with_hosts += 1
-                            logging.info(f"✅ Successfully processed thread '{thread_title}' with {len(file_hosts)} known hosts and {sum(len(v) for v in links_dict.values())} total links")
-                        else:
-                            threads_for_review += 1
-                            logging.info(f"📝 Added thread '{thread_title}' for manual review (no known hosts detected)")
-                        
-                        # Mark as processed
-                        self.processed_thread_ids.add(thread_id)
-                        # Save immediately to prevent data loss
-                        self.save_processed_thread_ids()
-                        
-                        # Return to forum page immediately after processing this thread
-                        logging.debug(f"🔙 Returning to forum page after processing '{thread_title}'")
-                        self.driver.get(original_forum_url)
-                        time.sleep(1)  # Brief pause
-                        
-                    except Exception as e:
-                        logging.error(f"❌ Error processing thread '{thread_title}': {e}", exc_info=True)
-                        # Mark as processed even if there was an error to avoid reprocessing
-                        self.processed_thread_ids.add(thread_id)
-                        # Save immediately to prevent data loss
-                        self.save_processed_thread_ids()
-                        # Return to forum page even on error
-                        try:
-                            self.driver.get(original_forum_url)
-                            time.sleep(1)
-                        except:
-                            pass
-                        
-                else:
-                    logging.debug(f"❌ Thread '{thread_title}' does not match date filter. Skipping.")
-            
-            # Log processing summary
-            logging.info(f"📊 TRUE Single-Visit complete: {threads_processed} total threads ({threads_with_hosts} with known hosts, {threads_for_review} for manual review)")
-            
-            if threads_processed == 0:
-                logging.info("📭 No matching threads found on this page.")
-                
-        except Exception as e:
-            self.handle_exception("extracting threads from current page", e)
-    
+
+                    # Create thread data structure with HTML content to avoid double visits
+                    thread_data = {
+                        'thread_id': thread_id,
+                        'thread_title': thread_title,
+                        'thread_url': thread_url,
+                        'file_hosts': file_hosts,
+                        'links': links_dict,
+                        'has_known_hosts': bool(file_hosts),
+                        'html_content': html_content,  # Include HTML to avoid double visit
+                        'author': author
+                    }
+
+                    # Store in extracted_threads
+                    self.extracted_threads[thread_id] = thread_data
+
+                    if file_hosts or links_dict:
+                        logging.info(f"✅ Successfully processed thread '{thread_title}' with {len(file_hosts)} known hosts and {sum(len(v) for v in links_dict.values())} total links")
+                    else:
+                        logging.info(f"📝 Added thread '{thread_title}' for manual review (no known hosts detected)")
+
+                except Exception as e:
+                    logging.error(f"❌ Error processing thread '{thread_title}': {e}", exc_info=True)
+
+                # Mark as processed even if there was an error to avoid reprocessing
+                self.processed_thread_ids.add(thread_id)
+                # Save immediately to prevent data loss
+                self.save_processed_thread_ids()
+
+                if thread_data is not None:
+                    yield thread_id, thread_data
+        finally:
+            pages.close()
+            # Return to the forum page only if the browser had to leave it
+            if used_browser and return_url:
+                try:
+                    self.driver.get(return_url)
+                    time.sleep(1)
+                except Exception:
+                    pass
+
     def _process_threads_batch(self, threads_list):
         """
         DEPRECATED: This method is no longer used with single-visit optimization.
@@ -6624,23 +6617,17 @@ class ForumBotSelenium:
             
         return date_ranges
 
-    def match_date(self, date_ranges, date_text):
+    def parse_thread_date(self, date_text):
         """
-        Checks if the date matches any of the given date ranges.
+        Parse a listing date such as ``24.05.2025``, ``24.05.`` or
+        ``Heute, 10:15`` into a ``date``. Returns ``None`` if unrecognized.
         """
-        logging.debug(f"Matching date for thread. date_text: '{date_text}', date_ranges: {date_ranges}")
-
-        if not date_ranges:
-            logging.debug("No date ranges provided. Skipping thread.")
-            return False
-
-        thread_date_str = date_text.strip()
+        thread_date_str = (date_text or "").strip()
         logging.debug(f"Extracted thread_date_str: '{thread_date_str}'")
 
         # Try known formats
         date_formats = ["%d.%m.%Y", "%d.%m.%y", "%d.%m.", "%d.%m"]
 
-        thread_date = None
         for fmt in date_formats:
             try:
                 if fmt in ["%d.%m.", "%d.%m"]:
@@ -6649,23 +6636,49 @@ class ForumBotSelenium:
                 else:
                     thread_date = datetime.strptime(thread_date_str, fmt).date()
                 logging.debug(f"Parsed thread date with format '{fmt}': {thread_date}")
-                break  # Successfully parsed
+                return thread_date
             except ValueError:
                 continue
 
         # If parsing didn't work, check for 'heute' or 'gestern'
+        date_text_lower = thread_date_str.lower()
+        today = datetime.now().date()
+        if 'heute' in date_text_lower:
+            return today
+        if 'gestern' in date_text_lower:
+            return today - timedelta(days=1)
+        return None
+
+    def earliest_date_in_ranges(self, date_ranges):
+        """Return the earliest date covered by *date_ranges* (``None`` if empty)."""
+        today = datetime.now().date()
+        starts = []
+        for date_range in date_ranges or []:
+            if isinstance(date_range, tuple):
+                starts.append(date_range[0])
+            elif isinstance(date_range, date):
+                starts.append(date_range)
+            elif date_range == 'heute':
+                starts.append(today)
+            elif date_range == 'gestern':
+                starts.append(today - timedelta(days=1))
+        return min(starts) if starts else None
+
+    def match_date(self, date_ranges, date_text):
+        """
+        Checks if the date matches any of the given date ranges.
+        """
+        logging.debug(f"Matching date for thread. date_text: '{date_text}', date_ranges: {date_ranges}")
+
+        if not date_ranges:
+            logging.debug("No date ranges provided. Skipping thread.")
+            return False
+
+        thread_date = self.parse_thread_date(date_text)
         if not thread_date:
-            date_text_lower = date_text.lower()
-            today = datetime.now().date()
-            yesterday = today - timedelta(days=1)
-            if 'heute' in date_text_lower:
-                thread_date = today
-            elif 'gestern' in date_text_lower:
-                thread_date = yesterday
-            else:
-                # Unrecognized date format
-                logging.warning(f"Unrecognized date format: '{date_text}'. Skipping thread.")
-                return False
+            # Unrecognized date format
+            logging.warning(f"Unrecognized date format: '{date_text}'. Skipping thread.")
+            return False
 
         # Now compare thread_date with date_ranges
         for date_range in date_ranges:
@@ -6709,44 +6722,42 @@ class ForumBotSelenium:
 
             # Store HTML content to avoid double visits
             html_content = self.driver.page_source
-            soup = BeautifulSoup(html_content, 'html.parser')
+            return self.parse_thread_page(html_content)
+
+        except Exception as e:
+            self.handle_exception(f"extracting file hosts and links from thread '{thread_url}'", e)
+            return [], {}, "", ""
 
-            # Extract thread author from the first post
-            author_elem = soup.select_one('td.alt2 a.bigusername span')
-            author = author_elem.get_text(strip=True) if author_elem else ''
+    def parse_thread_page(self, html_content):
+        """
+        Extract file hosts, links and the author from an already loaded
+        thread page. Used both for pages opened in the browser and for pages
+        fetched concurrently over HTTP by ``ThreadPageFetcher``.
+
+        Returns:
+            tuple[list[str], dict, str, str]: Same shape as ``extract_file_hosts``.
+        """
+        try:
+            # One pass over the page: author plus every post body in order
+            author, posts = extract_thread_posts(html_content)
 
             # Initialize containers
             file_hosts_found = set()
             links_dict = {}  # Dictionary to store links grouped by file host
             keeplinks_urls = set()  # Set to store unique keeplinks.org URLs
 
-            # Find all post containers separated by <td class="thead">
-            all_posts = soup.find_all(lambda tag: tag.name == 'td' and 'thead' in tag.get('class', []))
-
-            # Extract from the main post (first post)
-            if all_posts:
-                main_post = all_posts[0].find_previous('div', {'id': re.compile(r'post_message_\d+')})
-                if main_post:
-                    logging.info("Extracting links from main post.")
-                    self.extract_links_from_post(main_post, file_hosts_found, links_dict, keeplinks_urls)
-
-            # If known links are found in the main post, stop further processing
-            if file_hosts_found:
-                logging.info(f"Known links found in main post. Skipping reply and keeplinks.org processing.")
-                return list(file_hosts_found), links_dict, html_content, author
-
-            # If no known links found in main post, proceed to process replies
-            for i in range(1, len(all_posts)):
-                reply = all_posts[i].find_previous('div', {'id': re.compile(r'post_message_\d+')})
-                if reply:
-                    logging.info(f"Extracting links from reply {i}")
-                    self.extract_links_from_post(reply, file_hosts_found, links_dict, keeplinks_urls)
-
-                    # If known links are found, stop further processing
-                    if file_hosts_found:
-                        logging.info(
-                            f"Known links found in replies. Skipping remaining replies and keeplinks.org processing.")
-                        return list(file_hosts_found), links_dict, html_content, author
+            # Extract from the main post (first post); replies only if it has no known hosts
+            for i, post in enumerate(posts):
+                logging.info("Extracting links from main post." if i == 0 else f"Extracting links from reply {i}")
+                self.extract_links_from_post(post, file_hosts_found, links_dict, keeplinks_urls)
+
+                # If known links are found, stop further processing
+                if file_hosts_found:
+                    logging.info(
+                        "Known links found in %s. Skipping remaining replies and keeplinks.org processing.",
+                        "main post" if i == 0 else "replies",
+                    )
+                    return list(file_hosts_found), links_dict, html_content, author
 
             # Add keeplinks as a normal host if no other hosts found
             if not file_hosts_found and keeplinks_urls:
@@ -6760,108 +6771,89 @@ class ForumBotSelenium:
             return list(file_hosts_found), links_dict, html_content, author
 
         except Exception as e:
-            self.handle_exception(f"extracting file hosts and links from thread '{thread_url}'", e)
+            self.handle_exception("parsing file hosts and links from thread page", e)
             return [], {}, "", ""
 
     def extract_links_from_post(self, post, file_hosts_found, links_dict, keeplinks_urls):
         """
         Helper function to extract links from a given post (either main or reply).
         Updates the file_hosts_found, links_dict, and keeplinks_urls sets as needed.
+
+        ``post`` is either a BeautifulSoup post element or a ``PostContent``
+        already produced by ``core.html_backend.extract_thread_posts``.
         """
+        if not isinstance(post, PostContent):
+            post = post_content_from_tag(post)
+        classifier = self.get_host_classifier()
+
         # Extract links from <a> tags
-        a_tags = post.find_all('a', href=True)
-        logging.debug(f"Found {len(a_tags)} <a> tags with href.")
-        for link in a_tags:
-            href = link['href']
+        logging.debug(f"Found {len(post.hrefs)} <a> tags with href.")
+        for href in post.hrefs:
             if 'keeplinks.org' in href:
                 keeplinks_urls.add(href)
                 continue  # ما تبعتوش لـ process_link
-            self.process_link(href, file_hosts_found, links_dict)
-
-        # Extract links from <pre class="alt2"> blocks
-        pre_tags = post.find_all('pre', class_='alt2')
-        logging.debug(f"Found {len(pre_tags)} <pre class='alt2'> blocks.")
-        for pre in pre_tags:
-            pre_text = pre.get_text(separator="\n")
-            urls_in_pre = re.findall(r'(https?://[^\s<>]+)', pre_text)
-            logging.debug(f"Extracted {len(urls_in_pre)} URLs from <pre class='alt2'>.")
-            for url in urls_in_pre:
-                self.process_link(url, file_hosts_found, links_dict)
-                # Also collect keeplinks URLs for potential fallback
-                if 'keeplinks.org' in url:
-                    keeplinks_urls.add(url)
+            self.process_link(href, file_hosts_found, links_dict, classifier=classifier)
 
-        # Extract links from <quote> elements (optional, if applicable)
-        quote_tags = post.find_all('quote')
-        logging.debug(f"Found {len(quote_tags)} <quote> elements.")
-        for quote in quote_tags:
-            quote_text = quote.get_text(separator="\n")
-            urls_in_quote = re.findall(r'(https?://[^\s<>]+)', quote_text)
-            logging.debug(f"Extracted {len(urls_in_quote)} URLs from <quote>.")
-            for url in urls_in_quote:
+        # Classify every URL in the <pre class="alt2">, <quote> and nested
+        # 'div.alt2 code code' text blocks in one pass with the shared regex
+        logging.debug(
+            f"Scanning {len(post.pre_texts)} <pre>, {len(post.quote_texts)} <quote> "
+            f"and {len(post.code_texts)} nested <code> blocks."
+        )
+        for block, text in ([('pre', t) for t in post.pre_texts]
+                            + [('quote', t) for t in post.quote_texts]
+                            + [('code', t) for t in post.code_texts]):
+            for url, host in classifier.classify_text(text):
+                if block == 'code':
+                    # Drop trailing '&nbsp;' entities left over from the code block
+                    # (str.strip('&nbsp;') used to eat trailing 'n'/'s'/'p' too).
+                    url = _TRAILING_NBSP_RE.sub('', url.strip())
+                    host = classifier.classify(url)
                 if 'keeplinks.org' in url:
                     keeplinks_urls.add(url)
                     logging.debug(f"Added Keeplinks URL: {url}")
-                else:
-                    self.process_link(url, file_hosts_found, links_dict)
-
-        # **New Addition:** Extract links from nested 'div.alt2 code code' elements
-        nested_code_elements = post.select('div.alt2 code code')
-        logging.debug(f"Found {len(nested_code_elements)} nested <code> elements within <div class='alt2'>.")
-        for code_element in nested_code_elements:
-            # Change separator from ' ' to ''
-            inner_text = code_element.get_text(separator='')
-            # Use regex to extract URLs from the inner text
-            urls_in_code = re.findall(r'(https?://[^\s<>]+)', inner_text)
-            logging.debug(f"Extracted {len(urls_in_code)} URLs from nested <code> element.")
-            for url in urls_in_code:
-                # Clean the URL by removing any trailing non-URL characters
-                cleaned_url = url.strip().strip('&nbsp;').strip('<br>').strip()
-                if 'keeplinks.org' in cleaned_url:
-                    keeplinks_urls.add(cleaned_url)
-                    logging.debug(f"Added Keeplinks URL: {cleaned_url}")
-                else:
-                    # Identify the host and categorize accordingly
-                    parsed_url = re.findall(r'https?://([^/]+)/', cleaned_url)
-                    if parsed_url:
-                        host = parsed_url[0].lower()
-                        for known_host in self.known_file_hosts:
-                            if known_host in host:
-                                file_hosts_found.add(known_host)
-                                if known_host not in links_dict:
-                                    links_dict[known_host] = []
-                                links_dict[known_host].append(cleaned_url)
-                                logging.debug(f"Added URL '{cleaned_url}' under host '{known_host}'.")
-                                break  # Stop checking other known hosts if matched
-
-    def process_link(self, url, file_hosts_found, links_dict):
+                elif host:
+                    self._add_host_link(url, host, file_hosts_found, links_dict, classifier)
+
+    def get_host_classifier(self):
+        """Return the shared ``HostClassifier`` for ``known_file_hosts``.
+
+        Rebuilt only when the GUI adds a host to ``known_file_hosts``.
+        """
+        key = tuple(self.known_file_hosts)
+        cached = getattr(self, '_host_classifier', None)
+        if cached is None or cached[0] != key:
+            cached = (key, HostClassifier(key))
+            self._host_classifier = cached
+        return cached[1]
+
+    def _add_host_link(self, url, host, file_hosts_found, links_dict, classifier):
+        """Record *url* under canonical *host*, rewriting alias domains (rg.to)."""
+        normalized_url = classifier.normalize_url(url)
+        if normalized_url != url:
+            logging.debug(f"🔄 Normalized {url_hostname(url)} URL: {url} -> {normalized_url}")
+        file_hosts_found.add(host)
+        links_dict.setdefault(host, []).append(normalized_url)
+
+    def process_link(self, url, file_hosts_found, links_dict, classifier=None):
         """
         Process a single link, updating file_hosts_found and links_dict.
         - Normalizes rg.to -> rapidgator.net
         - Ignores keeplinks.org here (collected separately as fallback only)
         """
-        parsed = re.findall(r'https?://([^/]+)/', url)
-        if not parsed:
+        classifier = classifier or self.get_host_classifier()
+        host = url_hostname(url)
+        if not host:
             return
-        host = parsed[0].lower()
 
         # ⛔ تجاهل keeplinks هنا تمامًا (يتجمع كـ fallback فقط)
         if 'keeplinks.org' in host:
             return
 
         # باقى الهوستات المعروفة + تطبيع rg.to → rapidgator.net
-        for known_host in self.known_file_hosts:
-            if known_host in host or (known_host == 'rg.to' and host == 'rg.to'):
-                if known_host == 'rg.to' or host == 'rg.to':
-                    normalized_url = url.replace('rg.to', 'rapidgator.net')
-                    target_host = 'rapidgator.net'
-                    file_hosts_found.add(target_host)
-                    links_dict.setdefault(target_host, []).append(normalized_url)
-                    logging.info(f"🔄 Normalized rg.to URL: {url} -> {normalized_url}")
-                else:
-                    file_hosts_found.add(known_host)
-                    links_dict.setdefault(known_host, []).append(url)
-                break
+        known_host = classifier.lookup_host(host)
+        if known_host:
+            self._add_host_link(url, known_host, file_hosts_found, links_dict, classifier)
 
     def solve_captcha(self, captcha: dict):
         """
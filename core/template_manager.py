@@ -5,6 +5,7 @@ from typing import Dict, Optional, List
 
 from config.config import DATA_DIR
 from core.user_manager import UserManager, get_user_manager
+from core.write_behind import get_write_behind, read_json
 
 
 class TemplateManager:
@@ -29,21 +30,16 @@ class TemplateManager:
 
     def load(self) -> None:
         self._update_path()
-        if self.path.exists():
-            try:
-                self.templates = json.load(open(self.path, "r", encoding="utf-8"))
-            except Exception as e:
-                logging.error("Failed to load templates: %s", e)
-                self.templates = {}
-        else:
+        try:
+            self.templates = read_json(str(self.path), default={}) or {}
+        except Exception as e:
+            logging.error("Failed to load templates: %s", e)
             self.templates = {}
 
     def save(self) -> None:
         self._update_path()
         try:
-            self.path.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.path, "w", encoding="utf-8") as f:
-                json.dump(self.templates, f, ensure_ascii=False, indent=2)
+            get_write_behind().submit(str(self.path), self.templates, indent=2)
         except Exception as e:
             logging.error("Failed to save templates: %s", e)
 
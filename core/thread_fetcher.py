@@ -0,0 +1,142 @@
+"""Concurrent HTTP fetcher for forum thread pages.
+
+``ForumBotSelenium.extract_threads`` used to open every matching thread in the
+Chrome driver, wait a fixed amount of time and navigate back to the category
+page afterwards.  :class:`ThreadPageFetcher` downloads the same pages through
+the ``requests`` session that already carries the Selenium cookies, using a
+bounded pool of worker threads.  Pages that come back without a logged-in
+vBulletin session are reported as ``None`` so the caller can fall back to the
+browser for exactly those URLs.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Deque, Iterable, Iterator, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Same markers ``ForumBotSelenium.check_login_status`` looks for in the
+# browser: members get a logout link, guests get the vBulletin login form.
+_LOGGED_IN_RE = re.compile(r"login\.php\?do=logout|logout|abmelden|log out", re.I)
+_GUEST_FORM_RE = re.compile(r"name=[\"']vb_login_username[\"']", re.I)
+
+
+def is_logged_in_html(html: str) -> bool:
+    """Return ``True`` if *html* was rendered for an authenticated member."""
+    if not html or _GUEST_FORM_RE.search(html):
+        return False
+    return bool(_LOGGED_IN_RE.search(html))
+
+
+class ThreadPageFetcher:
+    """Fetch forum pages in parallel through a shared ``requests`` session.
+
+    Parameters
+    ----------
+    session:
+        A ready ``requests.Session`` (normally built by
+        ``ForumBotSelenium.get_requests_session`` on the calling thread, since
+        syncing cookies touches the Selenium driver).
+    max_workers:
+        Upper bound on concurrent HTTP requests.
+    timeout:
+        Per-request timeout in seconds.
+    login_check:
+        Predicate deciding whether a response body belongs to a logged-in
+        session.  Defaults to :func:`is_logged_in_html`.
+    """
+
+    def __init__(
+        self,
+        session,
+        max_workers: int = 6,
+        timeout: float = 30,
+        login_check: Optional[Callable[[str], bool]] = None,
+    ) -> None:
+        self.session = session
+        self.max_workers = max(1, int(max_workers or 1))
+        self.timeout = timeout
+        self.login_check = login_check or is_logged_in_html
+
+    def fetch(self, url: str) -> Optional[str]:
+        """Return the HTML for *url* or ``None`` if it needs the browser."""
+        try:
+            resp = self.session.get(url, timeout=self.timeout)
+        except Exception as e:
+            logger.warning(f"HTTP fetch failed for {url}: {e}")
+            return None
+        if getattr(resp, "status_code", 0) != 200:
+            logger.debug(f"HTTP fetch for {url} returned {getattr(resp, 'status_code', None)}")
+            return None
+        final_url = str(getattr(resp, "url", "") or "")
+        html = getattr(resp, "text", "") or ""
+        if "/login" in final_url or not self.login_check(html):
+            logger.debug(f"HTTP fetch for {url} is not logged in; needs browser fallback")
+            return None
+        return html
+
+    def fetch_all(self, urls: Iterable[str]) -> Iterator[Tuple[str, Optional[str]]]:
+        """Yield ``(url, html_or_None)`` pairs in the order of *urls*.
+
+        All requests are submitted up front so later pages download while the
+        caller is still parsing earlier ones.
+        """
+        urls = list(urls)
+        if not urls:
+            return
+        workers = min(self.max_workers, len(urls))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="thread-fetch") as pool:
+            futures = [(url, pool.submit(self.fetch, url)) for url in urls]
+            try:
+                for url, future in futures:
+                    try:
+                        html = future.result()
+                    except Exception as e:  # pragma: no cover - fetch() never raises
+                        logger.warning(f"HTTP fetch failed for {url}: {e}")
+                        html = None
+                    yield url, html
+            finally:
+                # Caller stopped early (cancel/exception): drop queued requests.
+                for _url, future in futures:
+                    future.cancel()
+
+    def fetch_ahead(self, urls: Iterable[str], lookahead: int = 2) -> Iterator[Tuple[str, Optional[str]]]:
+        """Yield ``(url, html_or_None)`` in order, keeping *lookahead* requests in flight.
+
+        Unlike :meth:`fetch_all`, *urls* is consumed lazily, so a caller that
+        stops iterating early never downloads pages it did not need.
+        """
+        lookahead = max(1, int(lookahead or 1))
+        url_iter = iter(urls)
+        pending: Deque[Tuple[str, Future]] = deque()
+        with ThreadPoolExecutor(max_workers=lookahead, thread_name_prefix="page-prefetch") as pool:
+            try:
+                while True:
+                    while len(pending) < lookahead:
+                        url = next(url_iter, None)
+                        if url is None:
+                            break
+                        pending.append((url, pool.submit(self.fetch, url)))
+                    if not pending:
+                        return
+                    url, future = pending.popleft()
+                    try:
+                        html = future.result()
+                    except Exception as e:  # pragma: no cover - fetch() never raises
+                        logger.warning(f"HTTP fetch failed for {url}: {e}")
+                        html = None
+                    yield url, html
+            finally:
+                for _url, future in pending:
+                    future.cancel()
+
+    def close(self) -> None:
+        """Close the underlying session."""
+        try:
+            self.session.close()
+        except Exception:
+            pass
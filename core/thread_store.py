@@ -0,0 +1,495 @@
+"""SQLite storage for the Process / Backup / Megathreads thread dictionaries.
+
+``save_process_threads_data`` used to ``json.dump(..., indent=4)`` the whole
+``process_threads`` dict on the GUI thread after every status flip, and the
+backup/megathreads savers did the same for their files.  :class:`ThreadStore`
+keeps the same dictionaries in one per-user SQLite database (WAL journal):
+
+* one ``threads`` row per thread and one ``versions`` row per entry of a
+  thread's ``versions`` list, keyed by ``(section, category, title)``;
+* ``thread_id``, ``status`` and ``thread_date`` are stored as indexed columns
+  so views can count and page through threads by category, status or date
+  without decoding JSON (:meth:`~ThreadStore.page_keys` feeds the lazily
+  paged thread tables);
+* :meth:`upsert` writes a single thread (microseconds), :meth:`sync` diffs a
+  whole dictionary against what was last written and only touches rows whose
+  JSON changed;
+* a legacy ``*.json`` file is imported once and renamed to
+  ``*.json.migrated``; if the section already has rows (the file appeared
+  later, e.g. copied by ``UserManager.migrate_legacy_data``) only threads
+  missing from the database are added.
+
+Sections are stored in the shape the GUI already uses: ``process`` and
+``megathreads`` are ``{category: {title: info}}``, ``backup`` is the flat
+``{title: info}`` dict (stored under the empty category).
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+DB_FILENAME = "threads.sqlite3"
+
+SECTION_PROCESS = "process"
+SECTION_BACKUP = "backup"
+SECTION_MEGATHREADS = "megathreads"
+FLAT_SECTIONS = {SECTION_BACKUP}
+
+LEGACY_FILENAMES = {
+    SECTION_PROCESS: "process_threads.json",
+    SECTION_BACKUP: "backup_threads.json",
+    SECTION_MEGATHREADS: "megathreads_process_threads.json",
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS threads (
+    section     TEXT NOT NULL,
+    category    TEXT NOT NULL,
+    title       TEXT NOT NULL,
+    thread_id   TEXT,
+    status      TEXT,
+    thread_date TEXT,
+    updated_at  REAL NOT NULL,
+    data        TEXT NOT NULL,
+    PRIMARY KEY (section, category, title)
+);
+CREATE INDEX IF NOT EXISTS idx_threads_category ON threads (section, category);
+CREATE INDEX IF NOT EXISTS idx_threads_status ON threads (section, status);
+CREATE INDEX IF NOT EXISTS idx_threads_date ON threads (section, thread_date);
+CREATE INDEX IF NOT EXISTS idx_threads_thread_id ON threads (section, thread_id);
+CREATE TABLE IF NOT EXISTS versions (
+    section  TEXT NOT NULL,
+    category TEXT NOT NULL,
+    title    TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    data     TEXT NOT NULL,
+    PRIMARY KEY (section, category, title, position)
+);
+CREATE TABLE IF NOT EXISTS migrations (
+    section     TEXT PRIMARY KEY,
+    source      TEXT,
+    migrated_at REAL NOT NULL
+);
+"""
+
+Key = Tuple[str, str]  # (category, title)
+Status = Union[str, Iterable[str]]  # one status or any of several
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def thread_status(section: str, info: Mapping[str, Any]) -> str:
+    """Indexed status column for one thread of *section*."""
+    if section == SECTION_BACKUP:
+        return str(info.get("rapidgator_status") or "")
+    if info.get("post_status"):
+        return "posted"
+    if info.get("upload_status"):
+        return "uploaded"
+    if info.get("download_status"):
+        return "downloaded"
+    return str(info.get("row_status") or "pending")
+
+
+def _last_version(info: Mapping[str, Any]) -> Mapping[str, Any]:
+    # ``versions`` is a list, or a {title: version} dict for live-added threads
+    versions = info.get("versions")
+    if isinstance(versions, dict):
+        versions = list(versions.values())
+    if isinstance(versions, list) and versions and isinstance(versions[-1], dict):
+        return versions[-1]
+    return {}
+
+
+def _thread_date(info: Mapping[str, Any]) -> str:
+    return str(info.get("thread_date") or _last_version(info).get("thread_date") or "")
+
+
+def _thread_id(info: Mapping[str, Any]) -> str:
+    return str(info.get("thread_id") or _last_version(info).get("thread_id") or "")
+
+
+class ThreadStore:
+    """Per-thread persistence of the thread dictionaries in SQLite.
+
+    Parameters
+    ----------
+    path:
+        Database file, normally ``<user folder>/threads.sqlite3``.
+    legacy_dir:
+        Folder holding the old ``process_threads.json`` & co.  Sections with
+        no migration record are imported from there once a file exists
+        (see :meth:`import_legacy`).
+    synchronous:
+        SQLite ``synchronous`` pragma; ``NORMAL`` is durable across
+        application crashes in WAL mode, ``OFF`` is meant for tests.
+    """
+
+    def __init__(self, path: str, legacy_dir: Optional[str] = None, synchronous: str = "NORMAL") -> None:
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(f"PRAGMA synchronous={synchronous}")
+        self._conn.executescript(_SCHEMA)
+        # (section, category, title) -> (hash of thread JSON, hashes of version JSON)
+        self._digests: Dict[Tuple[str, str, str], Tuple[int, Tuple[int, ...]]] = {}
+        self._loaded: set = set()  # sections whose digests were seeded from disk
+        self.rows_written = 0  # thread + version rows written by the last upsert/sync
+        self.legacy_dir = legacy_dir
+        self.import_legacy()
+
+    # ------------------------------------------------------------------
+    # Migration
+    # ------------------------------------------------------------------
+    def is_migrated(self, section: str) -> bool:
+        row = self._conn.execute("SELECT 1 FROM migrations WHERE section = ?", (section,)).fetchone()
+        return row is not None
+
+    def import_legacy(self) -> None:
+        """Import legacy JSON files of sections that were never migrated.
+
+        Cheap when there is nothing to do, so callers can run it before every
+        load to pick up files created after the store was opened.
+        """
+        if not self.legacy_dir:
+            return
+        for section, filename in LEGACY_FILENAMES.items():
+            self._migrate_json(section, os.path.join(self.legacy_dir, filename))
+
+    def _migrate_json(self, section: str, json_path: str) -> None:
+        if self.is_migrated(section) or not os.path.exists(json_path):
+            return  # no record without a file: one appearing later still gets imported
+        try:
+            with open(json_path, "r", encoding="utf-8") as fh:
+                data = json.load(fh) or {}
+        except Exception as e:
+            logger.error(f"❌ Could not read legacy thread file {json_path}: {e}")
+            return
+        with self._lock:
+            if self.count(section):
+                # The database already has (newer) rows: only add missing threads
+                data = self._merge_missing(section, self.load(section), data)
+            self.sync(section, data, _record_migration=json_path)
+        try:
+            os.replace(json_path, json_path + ".migrated")
+        except OSError:
+            pass
+        logger.info(f"📦 Migrated {section} threads from {json_path} ({self.count(section)} stored)")
+
+    @staticmethod
+    def _merge_missing(section: str, current: Dict[str, Any], legacy: Mapping[str, Any]) -> Dict[str, Any]:
+        """*current* plus the threads of *legacy* it does not have."""
+        if section in FLAT_SECTIONS:
+            return dict(legacy, **current)
+        merged = {category: dict(threads) for category, threads in current.items()}
+        for category, threads in legacy.items():
+            target = merged.setdefault(category, {})
+            for title, info in (threads or {}).items():
+                target.setdefault(title, info)
+        return merged
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+    def _rows_for(self, section: str, data: Mapping[str, Any]) -> Iterator[Tuple[str, str, Any]]:
+        if section in FLAT_SECTIONS:
+            for title, info in data.items():
+                yield "", title, info
+        else:
+            for category, threads in data.items():
+                for title, info in (threads or {}).items():
+                    yield category, title, info
+
+    def _write(self, section: str, category: str, title: str, info: Any, now: float) -> int:
+        """Write one thread if it changed; returns the number of rows written."""
+        fields = info if isinstance(info, dict) else {}
+        versions = fields.get("versions")
+        versions = versions if isinstance(versions, list) else []
+        head = {k: v for k, v in info.items() if k != "versions"} if versions else info
+        head_text = _dumps(head)
+        version_texts = [_dumps(v) for v in versions]
+        digest = (hash(head_text), tuple(hash(t) for t in version_texts))
+
+        key = (section, category, title)
+        old = self._digests.get(key)
+        if old == digest:
+            return 0
+        written = 0
+        conn = self._conn
+        if old is None or old[0] != digest[0]:
+            conn.execute(
+                "INSERT INTO threads (section, category, title, thread_id, status, thread_date, updated_at, data)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+                " ON CONFLICT (section, category, title) DO UPDATE SET"
+                " thread_id = excluded.thread_id, status = excluded.status,"
+                " thread_date = excluded.thread_date, updated_at = excluded.updated_at, data = excluded.data",
+                (section, category, title, _thread_id(fields), thread_status(section, fields),
+                 _thread_date(fields), now, head_text),
+            )
+            written += 1
+        old_versions = old[1] if old is not None else None
+        for position, text in enumerate(version_texts):
+            if old_versions is not None and position < len(old_versions) and old_versions[position] == digest[1][position]:
+                continue
+            conn.execute(
+                "INSERT OR REPLACE INTO versions (section, category, title, position, data) VALUES (?, ?, ?, ?, ?)",
+                (section, category, title, position, text),
+            )
+            written += 1
+        if old_versions is None or len(old_versions) > len(version_texts):
+            conn.execute(
+                "DELETE FROM versions WHERE section = ? AND category = ? AND title = ? AND position >= ?",
+                (section, category, title, len(version_texts)),
+            )
+        if old is not None and old[0] == digest[0] and written:
+            conn.execute(
+                "UPDATE threads SET updated_at = ?, thread_date = ?, thread_id = ?"
+                " WHERE section = ? AND category = ? AND title = ?",
+                (now, _thread_date(fields), _thread_id(fields), section, category, title),
+            )
+        self._digests[key] = digest
+        return written
+
+    def _delete(self, section: str, category: str, title: str) -> None:
+        for table in ("threads", "versions"):
+            self._conn.execute(
+                f"DELETE FROM {table} WHERE section = ? AND category = ? AND title = ?",
+                (section, category, title),
+            )
+        self._digests.pop((section, category, title), None)
+
+    def upsert(self, section: str, category: str, title: str, info: Any) -> int:
+        """Persist one thread; returns the number of rows actually written."""
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                written = self._write(section, category or "", title, info, time.time())
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            self.rows_written = written
+            return written
+
+    def delete(self, section: str, category: str, title: str) -> None:
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._delete(section, category or "", title)
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def sync(self, section: str, data: Mapping[str, Any], _record_migration: Optional[str] = None) -> int:
+        """Make *section* equal to *data*, writing only the threads that changed.
+
+        Returns the number of thread/version rows written (deletions excluded).
+        """
+        with self._lock:
+            self._ensure_digests(section)
+            now = time.time()
+            seen = set()
+            written = 0
+            self._conn.execute("BEGIN")
+            try:
+                for category, title, info in list(self._rows_for(section, data)):
+                    seen.add((section, category, title))
+                    written += self._write(section, category, title, info, now)
+                gone = [k for k in self._digests if k[0] == section and k not in seen]
+                for key in gone:
+                    self._delete(*key)
+                if _record_migration is not None:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO migrations (section, source, migrated_at) VALUES (?, ?, ?)",
+                        (section, _record_migration, now),
+                    )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                # Digests may describe rows that were rolled back
+                self._digests = {k: v for k, v in self._digests.items() if k[0] != section}
+                self._loaded.discard(section)
+                raise
+            self.rows_written = written
+            return written
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+    def _ensure_digests(self, section: str) -> None:
+        """Seed the change digests from disk so the first sync is a diff."""
+        if section not in self._loaded:
+            self.load(section)
+
+    def _versions(self, section: str, where: str = "", params: Iterable[Any] = ()) -> Dict[Key, List[str]]:
+        versions: Dict[Key, List[str]] = {}
+        for category, title, text in self._conn.execute(
+            "SELECT category, title, data FROM versions WHERE section = ?" + where
+            + " ORDER BY category, title, position",
+            (section, *params),
+        ):
+            versions.setdefault((category, title), []).append(text)
+        return versions
+
+    def _decode(self, section: str, category: str, title: str, text: str, version_texts: List[str]) -> Any:
+        info = json.loads(text)
+        if version_texts and isinstance(info, dict):
+            info["versions"] = [json.loads(t) for t in version_texts]
+        self._digests[(section, category, title)] = (hash(text), tuple(hash(t) for t in version_texts))
+        return info
+
+    def load(self, section: str) -> Dict[str, Any]:
+        """The whole section in its GUI dictionary shape."""
+        with self._lock:
+            versions = self._versions(section)
+            result: Dict[str, Any] = {}
+            for category, title, text in self._conn.execute(
+                "SELECT category, title, data FROM threads WHERE section = ? ORDER BY rowid", (section,)
+            ):
+                info = self._decode(section, category, title, text, versions.get((category, title), []))
+                if section in FLAT_SECTIONS:
+                    result[title] = info
+                else:
+                    result.setdefault(category, {})[title] = info
+            self._loaded.add(section)
+            return result
+
+    def get(self, section: str, category: str, title: str) -> Optional[Any]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM threads WHERE section = ? AND category = ? AND title = ?",
+                (section, category or "", title),
+            ).fetchone()
+            if row is None:
+                return None
+            versions = self._versions(section, " AND category = ? AND title = ?", (category or "", title))
+            return self._decode(section, category or "", title, row[0], versions.get((category or "", title), []))
+
+    def _filter(self, category: Optional[str], status: Optional[Status],
+                since: Optional[str], until: Optional[str]) -> Tuple[str, List[Any]]:
+        clauses, params = [], []
+        if category is not None:
+            clauses.append("category = ?")
+            params.append(category)
+        if isinstance(status, str):
+            clauses.append("status = ?")
+            params.append(status)
+        elif status is not None:
+            statuses = list(status)
+            clauses.append(f"status IN ({', '.join('?' * len(statuses))})")
+            params.extend(statuses)
+        if since is not None:
+            clauses.append("thread_date >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("thread_date < ?")
+            params.append(until)
+        return "".join(f" AND {c}" for c in clauses), params
+
+    def count(self, section: str, category: Optional[str] = None, status: Optional[Status] = None,
+              since: Optional[str] = None, until: Optional[str] = None) -> int:
+        where, params = self._filter(category, status, since, until)
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM threads WHERE section = ?" + where, (section, *params)
+            ).fetchone()[0]
+
+    def _page_rows(self, columns: str, section: str, offset: int, limit: Optional[int],
+                   filters: Tuple[Optional[str], Optional[Status], Optional[str], Optional[str]],
+                   newest_first: bool) -> List[Tuple[Any, ...]]:
+        where, params = self._filter(*filters)
+        order = "DESC" if newest_first else "ASC"
+        return self._conn.execute(
+            f"SELECT {columns} FROM threads WHERE section = ?" + where
+            + f" ORDER BY thread_date {order}, rowid {order} LIMIT ? OFFSET ?",
+            (section, *params, -1 if limit is None else limit, offset),
+        ).fetchall()
+
+    def page_keys(self, section: str, offset: int = 0, limit: Optional[int] = 500,
+                  category: Optional[str] = None, status: Optional[Status] = None,
+                  since: Optional[str] = None, until: Optional[str] = None,
+                  newest_first: bool = True) -> List[Key]:
+        """One page of ``(category, title)`` keys ordered by thread date.
+
+        Only the indexed columns are read, so a view can page through a large
+        section without decoding any thread; ``limit=None`` means no limit.
+        """
+        with self._lock:
+            return [
+                (category_name, title) for category_name, title in self._page_rows(
+                    "category, title", section, offset, limit, (category, status, since, until), newest_first)
+            ]
+
+    def page(self, section: str, offset: int = 0, limit: Optional[int] = 500,
+             category: Optional[str] = None, status: Optional[Status] = None,
+             since: Optional[str] = None, until: Optional[str] = None,
+             newest_first: bool = True) -> List[Tuple[str, str, Any]]:
+        """One page of ``(category, title, info)`` ordered by thread date."""
+        with self._lock:
+            result = []
+            for category_name, title, text in self._page_rows(
+                    "category, title, data", section, offset, limit, (category, status, since, until),
+                    newest_first):
+                versions = self._versions(section, " AND category = ? AND title = ?", (category_name, title))
+                result.append((category_name, title,
+                               self._decode(section, category_name, title, text,
+                                            versions.get((category_name, title), []))))
+            return result
+
+    def iter_pages(self, section: str, page_size: int = 500, **filters) -> Iterator[List[Tuple[str, str, Any]]]:
+        """Yield successive :meth:`page` results until the section is exhausted."""
+        offset = 0
+        while True:
+            rows = self.page(section, offset, page_size, **filters)
+            if not rows:
+                return
+            yield rows
+            offset += len(rows)
+
+    def close(self) -> None:
+        with self._lock:
+            try:
+                self._conn.close()
+            except Exception:
+                pass
+
+
+_stores: Dict[str, ThreadStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_thread_store(folder: str) -> ThreadStore:
+    """Shared :class:`ThreadStore` for a user/data *folder* (migrates on first open)."""
+    path = os.path.join(folder, DB_FILENAME)
+    with _stores_lock:
+        store = _stores.get(path)
+        if store is None:
+            store = _stores[path] = ThreadStore(path, legacy_dir=folder)
+        return store
+
+
+__all__ = [
+    "ThreadStore",
+    "get_thread_store",
+    "thread_status",
+    "DB_FILENAME",
+    "LEGACY_FILENAMES",
+    "SECTION_PROCESS",
+    "SECTION_BACKUP",
+    "SECTION_MEGATHREADS",
+]
@@ -19,6 +19,7 @@ from typing import Dict, Any, Optional, Set
 from utils import sanitize_filename, LINK_TEMPLATE_PRESETS
 from utils.paths import get_data_folder
 from config.config import DATA_DIR
+from core.write_behind import get_write_behind, read_json
 from utils.legacy_tls import DDownloadAdapter
 # Mapping of alternate site identifiers to canonical names
 SITE_ALIASES = {
@@ -195,19 +196,24 @@ class UserManager:
                 self._login_listeners.append(cb)
         except Exception:
             logging.debug("Failed to register login listener", exc_info=True)
-    def save_user_data(self, filename: str, data: Any) -> bool:
+    def save_user_data(self, filename: str, data: Any, defer: bool = False) -> bool:
         """
         Save data to a user-specific file.
         
         Args:
             filename: The filename (without user prefix)
             data: The data to save (will be JSON serialized)
+            defer: Hand the write to the write-behind queue instead of
+                writing now (rapid saves of the same file are coalesced)
             
         Returns:
-            bool: True if saved successfully
+            bool: True if saved (or queued) successfully
         """
         try:
             filepath = self.get_user_data_path(filename)
+            if defer:
+                get_write_behind().submit(filepath, data)
+                return True
             tmp_path = filepath + ".tmp"
             with open(tmp_path, 'w', encoding='utf-8') as f:
                 json.dump(data, f, ensure_ascii=False, indent=4)
@@ -233,13 +239,11 @@ class UserManager:
         try:
             filepath = self.get_user_data_path(filename)
             
-            if not os.path.exists(filepath):
+            data = read_json(filepath, default=None)
+            if data is None:
                 logging.debug(f"📄 User data file not found: {filepath}")
                 return default
             
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
             logging.debug(f"📂 Loaded user data from: {filepath}")
             return data
             
@@ -494,7 +498,7 @@ class UserManager:
         """Save user-specific settings to their data directory."""
         try:
             settings_file = 'user_settings.json'
-            return self.save_user_data(settings_file, self.user_settings)
+            return self.save_user_data(settings_file, self.user_settings, defer=True)
         except Exception as e:
             logging.error(f"❌ Failed to save user settings: {e}")
             return False
@@ -0,0 +1,239 @@
+"""Write-behind queue for the small per-user JSON files.
+
+Job lists, the queue snapshot, the link-status cache, templates, categories,
+user settings and the stats history used to be rewritten synchronously — on
+the GUI thread — every time one entry changed.  During a burst of status
+updates that meant dozens of full-file rewrites per second competing with
+downloads for the disk.
+
+:class:`WriteBehindQueue` replaces those eager writes:
+
+* :meth:`~WriteBehindQueue.submit` only marks the file dirty and remembers
+  the latest data; a background thread writes each dirty file once its
+  coalescing window (default 1 s from the first unsaved change) has passed,
+  so a burst of changes becomes one write per file per window;
+* the data is snapshotted by the C JSON encoder on the writer thread (plain
+  JSON types are encoded without releasing the GIL) and pretty-printed from
+  that private copy, then written to ``<file>.tmp`` and ``os.replace``-d in;
+* :func:`read_json` returns a file's pending data if it has not been written
+  yet, so readers never see an older version than the last submit;
+* :meth:`~WriteBehindQueue.flush` writes everything synchronously — called
+  from the main window's ``closeEvent`` and, for the shared queue, at
+  interpreter exit — and :meth:`~WriteBehindQueue.stats` reports write
+  counts and bytes.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WINDOW = 1.0
+
+
+class _Pending:
+    __slots__ = ("data", "indent", "ensure_ascii", "due", "submits")
+
+    def __init__(self, data: Any, indent: Optional[int], ensure_ascii: bool, due: float) -> None:
+        self.data = data
+        self.indent = indent
+        self.ensure_ascii = ensure_ascii
+        self.due = due
+        self.submits = 1
+
+
+class WriteBehindQueue:
+    """Coalescing background writer for JSON files."""
+
+    def __init__(self, window: float = DEFAULT_WINDOW, fsync: bool = True) -> None:
+        self.window = window
+        self.fsync = fsync
+        self._pending: Dict[str, _Pending] = {}
+        self._writing: Dict[str, _Pending] = {}  # taken off the queue, not yet on disk
+        self._cond = threading.Condition()
+        self._io_lock = threading.Lock()  # one writer at a time (thread or flush)
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+        self._stats = {"submits": 0, "coalesced": 0, "writes": 0, "bytes": 0, "errors": 0}
+
+    # ------------------------------------------------------------------
+    # Producer side
+    # ------------------------------------------------------------------
+    def submit(self, path: str, data: Any, indent: Optional[int] = 4, ensure_ascii: bool = False) -> None:
+        """Schedule *data* to be written to *path* as JSON."""
+        path = os.path.abspath(os.fspath(path))
+        with self._cond:
+            self._stats["submits"] += 1
+            entry = self._pending.get(path)
+            if entry is not None:
+                # Keep the original deadline so a steady stream still gets written
+                entry.data = data
+                entry.indent = indent
+                entry.ensure_ascii = ensure_ascii
+                entry.submits += 1
+                self._stats["coalesced"] += 1
+            else:
+                self._pending[path] = _Pending(data, indent, ensure_ascii, time.monotonic() + self.window)
+            self._ensure_thread()
+            self._cond.notify()
+
+    def pending(self, path: str) -> bool:
+        with self._cond:
+            return os.path.abspath(os.fspath(path)) in self._pending
+
+    def pending_data(self, path: str) -> Any:
+        """A private copy of the data waiting to be written to *path* (KeyError if none)."""
+        path = os.path.abspath(os.fspath(path))
+        with self._cond:
+            entry = self._pending.get(path) or self._writing[path]
+            text = self._encode(entry.data, None, entry.ensure_ascii)
+        return json.loads(text)
+
+    # ------------------------------------------------------------------
+    # Writer side
+    # ------------------------------------------------------------------
+    def _ensure_thread(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._stopped = False
+            self._thread = threading.Thread(target=self._run, name="write-behind", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._stopped:
+                    if self._pending:
+                        wait = min(e.due for e in self._pending.values()) - time.monotonic()
+                        if wait <= 0:
+                            break
+                        self._cond.wait(wait)
+                    else:
+                        self._cond.wait()
+                if self._stopped:
+                    return
+            self._write_due(time.monotonic())
+
+    def _take(self, now: Optional[float]) -> Dict[str, _Pending]:
+        with self._cond:
+            due = {p: e for p, e in self._pending.items() if now is None or e.due <= now}
+            for path in due:
+                del self._pending[path]
+            self._writing = due
+            return due
+
+    def _write_due(self, now: Optional[float]) -> int:
+        with self._io_lock:
+            entries = self._take(now)
+            try:
+                for path, entry in entries.items():
+                    self._write(path, entry)
+            finally:
+                with self._cond:
+                    self._writing = {}
+            return len(entries)
+
+    @staticmethod
+    def _encode(data: Any, indent: Optional[int], ensure_ascii: bool) -> str:
+        for attempt in range(3):
+            try:
+                text = json.dumps(data, ensure_ascii=ensure_ascii)
+                break
+            except RuntimeError:  # container mutated while a Python-level default ran
+                if attempt == 2:
+                    raise
+                time.sleep(0.01)
+        if indent is None:
+            return text
+        return json.dumps(json.loads(text), ensure_ascii=ensure_ascii, indent=indent)
+
+    def _write(self, path: str, entry: _Pending) -> None:
+        tmp = path + ".tmp"
+        try:
+            text = self._encode(entry.data, entry.indent, entry.ensure_ascii)
+            payload = text.encode("utf-8")
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            with open(tmp, "wb") as fh:
+                fh.write(payload)
+                fh.flush()
+                if self.fsync:
+                    os.fsync(fh.fileno())
+            os.replace(tmp, path)
+            with self._cond:
+                self._stats["writes"] += 1
+                self._stats["bytes"] += len(payload)
+            logger.debug(f"💾 Wrote {path} ({len(payload)} bytes, {entry.submits} change(s) coalesced)")
+        except Exception as e:
+            with self._cond:
+                self._stats["errors"] += 1
+            logger.error(f"❌ Write-behind failed for {path}: {e}")
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+
+    # ------------------------------------------------------------------
+    # Control
+    # ------------------------------------------------------------------
+    def flush(self) -> int:
+        """Write every pending file now, on the calling thread; returns the file count."""
+        return self._write_due(None)
+
+    def stop(self, flush: bool = True) -> None:
+        if flush:
+            self.flush()
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=5)
+
+    def stats(self) -> Dict[str, int]:
+        with self._cond:
+            stats = dict(self._stats)
+            stats["pending"] = len(self._pending)
+        return stats
+
+
+_queue: Optional[WriteBehindQueue] = None
+_queue_lock = threading.Lock()
+
+
+def get_write_behind() -> WriteBehindQueue:
+    """Process-wide :class:`WriteBehindQueue`."""
+    global _queue
+    with _queue_lock:
+        if _queue is None:
+            _queue = WriteBehindQueue()
+            # The writer is a daemon thread: don't lose submits made after
+            # (or without) the GUI's closeEvent flush
+            atexit.register(_queue.flush)
+        return _queue
+
+
+def read_json(path: str, default: Any = None) -> Any:
+    """Load JSON from *path*, preferring data still waiting in the write-behind queue.
+
+    Raises like :func:`json.load` for unreadable files; returns *default* if
+    the file does not exist and nothing is pending.
+    """
+    queue = _queue
+    if queue is not None:
+        try:
+            return queue.pending_data(path)
+        except KeyError:
+            pass
+    if not os.path.exists(path):
+        return default
+    with open(path, "r", encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+__all__ = ["WriteBehindQueue", "get_write_behind", "read_json", "DEFAULT_WINDOW"]
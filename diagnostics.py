@@ -1,4 +1,5 @@
 import logging
+import logging.handlers
 import platform
 import shutil
 from pathlib import Path
@@ -24,7 +25,9 @@ def run_diagnostics() -> Path:
 
     logger = logging.getLogger("diagnostics")
     logger.setLevel(logging.INFO)
-    handler = logging.FileHandler(log_file, encoding="utf-8")
+    handler = logging.handlers.RotatingFileHandler(
+        log_file, maxBytes=1024 * 1024, backupCount=3, encoding="utf-8"
+    )
     handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
     if not any(isinstance(h, logging.FileHandler) and h.baseFilename == str(log_file) for h in logger.handlers):
         logger.addHandler(handler)
@@ -41,6 +41,16 @@ class BaseDownloader(ABC):
         s = b.decode("ascii", "ignore")
         return re.sub(r'[<>:"/\\|?*]', "", s).replace(" ", "_").strip()
     
+    def download_segments(self) -> int:
+        """
+        Number of concurrent range connections per file (config ``download_segments``)
+        """
+        config = getattr(self.bot, "config", None) or {}
+        try:
+            return max(1, int(config.get("download_segments", 4)))
+        except (TypeError, ValueError, AttributeError):
+            return 4
+
     def get_adaptive_intervals(self):
         """
         Get adaptive monitoring intervals for all downloaders
@@ -0,0 +1,283 @@
+"""Filename index of the folders JDownloader saves into.
+
+When JD does not report ``localFilePath`` for a finished link,
+``JDownloaderDownloader`` has to find the file itself.  It used to
+``os.walk`` ``~/Downloads``, ``~/Desktop``, the JD folder and the target
+folder (up to three levels deep) for every file of every package, which on a
+downloads drive with 100k files took seconds per lookup.
+
+:class:`FileLocator` keeps a ``filename -> paths`` index of those roots
+instead:
+
+* the index is built once with ``os.scandir`` down to ``max_depth`` levels;
+* :meth:`~FileLocator.refresh` re-lists only directories whose mtime changed
+  (creating, deleting or renaming an entry updates the mtime of the directory
+  holding it), so keeping the index current costs one ``stat`` per indexed
+  directory rather than one per file;
+* :meth:`~FileLocator.lookup` resolves a whole batch of names after a single
+  refresh, and :meth:`~FileLocator.search` matches names against the index
+  without touching the disk;
+* per-download target folders added with :meth:`~FileLocator.add_root` are
+  kept in LRU order and the least recently used ones are dropped beyond
+  ``max_extra_roots``, so the index does not grow with every download.
+
+Names are matched case-insensitively, like the old walks did.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_DEPTH = 3
+DEFAULT_MAX_EXTRA_ROOTS = 16
+
+
+def default_roots() -> List[str]:
+    """Folders JDownloader commonly saves into on this machine."""
+    roots = [
+        os.path.expanduser("~/JDownloader/Downloads"),
+        os.path.expanduser("~/Downloads/JDownloader"),
+        os.path.expanduser("~/Downloads"),
+        os.path.expanduser("~/Desktop"),
+    ]
+    public_dir = os.environ.get("PUBLIC")
+    if public_dir:
+        roots.append(os.path.join(public_dir, "JDownloader", "Downloads"))
+        roots.append(os.path.join(public_dir, "Downloads"))
+    custom_dir = os.environ.get("JD_DOWNLOAD_DIR")
+    if custom_dir:
+        roots.append(custom_dir)
+    return roots
+
+
+class _Dir:
+    __slots__ = ("mtime", "depth", "files", "subdirs")
+
+    def __init__(self, mtime: int, depth: int) -> None:
+        self.mtime = mtime
+        self.depth = depth
+        self.files: Set[str] = set()
+        self.subdirs: Set[str] = set()
+
+
+class FileLocator:
+    """Incrementally refreshed ``filename -> paths`` index of some folders."""
+
+    def __init__(self, roots: Iterable[str] = (), max_depth: int = DEFAULT_MAX_DEPTH,
+                 min_refresh_interval: float = 0.5,
+                 max_extra_roots: int = DEFAULT_MAX_EXTRA_ROOTS) -> None:
+        self.max_depth = max_depth
+        self.min_refresh_interval = min_refresh_interval
+        self.max_extra_roots = max(1, int(max_extra_roots))
+        self._roots: List[str] = []
+        # Roots added after construction, least recently used first
+        self._extra: "OrderedDict[str, None]" = OrderedDict()
+        self._dirs: Dict[str, _Dir] = {}
+        self._by_name: Dict[str, Set[str]] = {}
+        self._lock = threading.RLock()
+        self._last_refresh = float("-inf")
+        self.stats = {"scans": 0, "stats": 0, "lookups": 0}
+        for root in roots:
+            self.add_root(root, pinned=True)
+
+    @property
+    def roots(self) -> List[str]:
+        with self._lock:
+            return list(self._roots)
+
+    def add_root(self, root: str, pinned: bool = False) -> None:
+        """Index *root* too (only marks it recently used if it is already a root).
+
+        Roots that are not *pinned* are evicted least recently used first
+        once there are more than ``max_extra_roots`` of them.
+        """
+        root = os.path.abspath(os.path.expanduser(root))
+        with self._lock:
+            if root in self._roots:
+                if pinned:
+                    self._extra.pop(root, None)
+                elif root in self._extra:
+                    self._extra.move_to_end(root)
+                return
+            self._roots.append(root)
+            if not pinned:
+                self._extra[root] = None
+            self._scan(root, 0)
+            while len(self._extra) > self.max_extra_roots:
+                self.remove_root(next(iter(self._extra)))
+
+    def remove_root(self, root: str) -> None:
+        """Stop indexing *root*; folders other roots reach stay indexed."""
+        root = os.path.abspath(os.path.expanduser(root))
+        with self._lock:
+            if root not in self._roots:
+                return
+            self._roots.remove(root)
+            self._extra.pop(root, None)
+            self._drop(root)
+            parent_path = os.path.dirname(root)
+            parent = self._dirs.get(parent_path)
+            if parent is not None and parent_path != root:
+                # Also under an outer root: list it again at that root's depth
+                parent.subdirs.discard(os.path.basename(root))
+                self._scan(parent_path, parent.depth)
+            for other in self._roots:
+                if other not in self._dirs:
+                    self._scan(other, 0)  # nested root dropped with *root*
+
+    # ------------------------------------------------------------------
+    # Index maintenance
+    # ------------------------------------------------------------------
+    def _index(self, path: str) -> None:
+        self._by_name.setdefault(os.path.basename(path).lower(), set()).add(path)
+
+    def _unindex(self, path: str) -> None:
+        key = os.path.basename(path).lower()
+        paths = self._by_name.get(key)
+        if paths is not None:
+            paths.discard(path)
+            if not paths:
+                del self._by_name[key]
+
+    def _drop(self, dirpath: str) -> None:
+        entry = self._dirs.pop(dirpath, None)
+        if entry is None:
+            return
+        for name in entry.files:
+            self._unindex(os.path.join(dirpath, name))
+        for sub in entry.subdirs:
+            self._drop(os.path.join(dirpath, sub))
+
+    def _scan(self, dirpath: str, depth: int) -> None:
+        """(Re)list *dirpath* and index its files; recurse into new subfolders."""
+        existing = self._dirs.get(dirpath)
+        if existing is not None and existing.depth < depth:
+            return  # already indexed through a shallower root
+        try:
+            mtime = os.stat(dirpath).st_mtime_ns
+            with os.scandir(dirpath) as it:
+                entries = list(it)
+        except OSError:
+            self._drop(dirpath)
+            return
+        self.stats["scans"] += 1
+        files, subdirs = set(), set()
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.add(entry.name)
+                elif entry.is_file():
+                    files.add(entry.name)
+            except OSError:
+                continue
+        fresh = existing is None or existing.depth != depth
+        old = _Dir(mtime, depth) if existing is None else existing
+        for name in old.files - files:
+            self._unindex(os.path.join(dirpath, name))
+        for name in files - old.files:
+            self._index(os.path.join(dirpath, name))
+        for name in old.subdirs - subdirs:
+            self._drop(os.path.join(dirpath, name))
+        entry = _Dir(mtime, depth)
+        entry.files, entry.subdirs = files, subdirs
+        self._dirs[dirpath] = entry
+        if depth + 1 < self.max_depth:
+            for name in subdirs if fresh else subdirs - old.subdirs:
+                self._scan(os.path.join(dirpath, name), depth + 1)
+
+    def refresh(self, force: bool = False) -> int:
+        """Re-list directories whose mtime changed; returns how many were re-listed."""
+        with self._lock:
+            now = time.monotonic()
+            if not force and now - self._last_refresh < self.min_refresh_interval:
+                return 0
+            self._last_refresh = now
+            before = self.stats["scans"]
+            for root in self._roots:
+                if root not in self._dirs:
+                    self._scan(root, 0)  # root (re)appeared
+            for dirpath, entry in list(self._dirs.items()):
+                if dirpath not in self._dirs:
+                    continue  # dropped together with a parent
+                self.stats["stats"] += 1
+                try:
+                    mtime = os.stat(dirpath).st_mtime_ns
+                except OSError:
+                    self._drop(dirpath)
+                    continue
+                if mtime != entry.mtime:
+                    self._scan(dirpath, entry.depth)
+            return self.stats["scans"] - before
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    def lookup(self, names: Iterable[str], refresh: bool = True) -> Dict[str, List[str]]:
+        """Paths of every name in *names* (case-insensitive), after one refresh.
+
+        Paths under earlier roots come first.
+        """
+        names = list(names)
+        with self._lock:
+            if refresh:
+                self.refresh()
+            self.stats["lookups"] += 1
+            return {name: self._ordered(self._by_name.get(name.lower(), ())) for name in names}
+
+    def search(self, predicate: Callable[[str], bool], refresh: bool = True) -> List[str]:
+        """Paths whose lower-cased file name satisfies *predicate*."""
+        with self._lock:
+            if refresh:
+                self.refresh()
+            self.stats["lookups"] += 1
+            found: List[str] = []
+            for name, paths in self._by_name.items():
+                if predicate(name):
+                    found.extend(paths)
+            return self._ordered(found)
+
+    def _ordered(self, paths: Iterable[str]) -> List[str]:
+        def rank(path: str) -> Tuple[int, str]:
+            for i, root in enumerate(self._roots):
+                if path.startswith(root + os.sep):
+                    return i, path
+            return len(self._roots), path
+        return sorted(paths, key=rank)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(paths) for paths in self._by_name.values())
+
+
+_locator: Optional[FileLocator] = None
+_locator_lock = threading.Lock()
+
+
+def get_file_locator() -> FileLocator:
+    """Process-wide :class:`FileLocator` over :func:`default_roots`."""
+    global _locator
+    with _locator_lock:
+        if _locator is None:
+            started = time.perf_counter()
+            _locator = FileLocator(default_roots())
+            logger.info(
+                f"🗂️ Indexed {len(_locator)} files in {len(_locator.roots)} download folders "
+                f"({time.perf_counter() - started:.2f}s)"
+            )
+        return _locator
+
+
+__all__ = [
+    "FileLocator",
+    "default_roots",
+    "get_file_locator",
+    "DEFAULT_MAX_DEPTH",
+    "DEFAULT_MAX_EXTRA_ROOTS",
+]
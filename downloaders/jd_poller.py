@@ -0,0 +1,297 @@
+"""One shared JDownloader poll loop for every active download.
+
+``JDownloaderDownloader._monitor_download`` used to run its own loop per
+download: ``device.downloads.query_packages()`` with the full default field
+set as often as every 0.1 s, then a walk over every package recomputing
+display names.  With several downloads in flight the My.JDownloader API was
+hit once per download per tick.
+
+:class:`JDPoller` owns the polling instead:
+
+* one ``query_packages`` call per tick for all waiters, asking only for the
+  fields the monitor uses (:data:`PACKAGE_QUERY`);
+* the result is diffed against the previous snapshot and only changes are
+  dispatched as :class:`PackageEvent` objects (``progress``, ``finished``,
+  ``removed``, plus ``linkgrabber`` while nothing reached the download list);
+* each waiter (:meth:`JDPoller.register`) has its own event queue and an
+  optional package filter;
+* the interval adapts to the aggregate activity: fast right after a waiter
+  registers or while packages are changing, slower once everything has been
+  quiet for a while, and no polling at all without waiters.
+
+:func:`get_jd_poller` returns the poller shared by everything using the same
+device object.
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+PACKAGE_FIELDS = ("uuid", "name", "bytesLoaded", "bytesTotal", "finished", "status")
+PACKAGE_QUERY = [{
+    "bytesLoaded": True,
+    "bytesTotal": True,
+    "finished": True,
+    "status": True,
+    "maxResults": -1,
+    "startAt": 0,
+}]
+LINKGRABBER_QUERY = [{"maxResults": -1, "startAt": 0}]
+
+EVENT_PROGRESS = "progress"
+EVENT_FINISHED = "finished"
+EVENT_REMOVED = "removed"
+EVENT_LINKGRABBER = "linkgrabber"
+EVENT_ERROR = "error"
+
+
+@dataclass(frozen=True)
+class PackageEvent:
+    """A change seen in the download list between two polls."""
+
+    kind: str
+    package: Dict[str, Any] = field(default_factory=dict)
+    delta: int = 0  # bytes loaded since the previous snapshot
+    error: str = ""
+
+
+def _package_key(package: Dict[str, Any]) -> str:
+    return str(package.get("uuid") or package.get("name") or "")
+
+
+def trim_package(package: Dict[str, Any]) -> Dict[str, Any]:
+    """Only the fields the monitor looks at."""
+    return {name: package[name] for name in PACKAGE_FIELDS if name in package}
+
+
+def diff_snapshots(previous: Dict[str, Dict[str, Any]],
+                   current: Dict[str, Dict[str, Any]]) -> List[PackageEvent]:
+    """Events turning *previous* into *current* (both keyed by package uuid)."""
+    events: List[PackageEvent] = []
+    for key, package in current.items():
+        old = previous.get(key)
+        loaded = package.get("bytesLoaded", 0) or 0
+        old_loaded = (old.get("bytesLoaded", 0) or 0) if old else 0
+        if (old is None or loaded != old_loaded or package.get("status") != old.get("status")
+                or package.get("bytesTotal") != old.get("bytesTotal")):
+            events.append(PackageEvent(EVENT_PROGRESS, package, loaded - old_loaded))
+        if package.get("finished") and not (old and old.get("finished")):
+            events.append(PackageEvent(EVENT_FINISHED, package))
+    for key in previous.keys() - current.keys():
+        events.append(PackageEvent(EVENT_REMOVED, previous[key]))
+    return events
+
+
+class PackageWaiter:
+    """Event queue of one monitor; obtained from :meth:`JDPoller.register`."""
+
+    def __init__(self, poller: "JDPoller", match: Optional[Callable[[Dict[str, Any]], bool]] = None) -> None:
+        self.poller = poller
+        self.match = match
+        self._events: "queue.Queue[PackageEvent]" = queue.Queue()
+
+    def put(self, event: PackageEvent) -> None:
+        if self.match is None or not event.package or self.match(event.package):
+            self._events.put(event)
+
+    def get(self, timeout: Optional[float] = None) -> List[PackageEvent]:
+        """Block up to *timeout* for the next event, then drain the queue."""
+        try:
+            events = [self._events.get(timeout=timeout)]
+        except queue.Empty:
+            return []
+        while True:
+            try:
+                events.append(self._events.get_nowait())
+            except queue.Empty:
+                return events
+
+    def close(self) -> None:
+        self.poller.unregister(self)
+
+    def __enter__(self) -> "PackageWaiter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class JDPoller:
+    """Polls one JD device on a background thread for all registered waiters."""
+
+    def __init__(self, device: Any, fast_interval: float = 0.25, normal_interval: float = 1.0,
+                 slow_interval: float = 2.0, fast_window: float = 30.0, active_window: float = 60.0,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        self.device = device
+        self.fast_interval = fast_interval
+        self.normal_interval = normal_interval
+        self.slow_interval = slow_interval
+        self.fast_window = fast_window      # fast polling after a waiter registers ...
+        self.active_window = active_window  # ... normal polling while things changed recently
+        self._clock = clock
+        self._waiters: List[PackageWaiter] = []
+        self._snapshot: Dict[str, Dict[str, Any]] = {}
+        self._linkgrabber: List[str] = []
+        self._last_register = float("-inf")
+        self._last_change = float("-inf")
+        self._changed_last_tick = False
+        self._cond = threading.Condition()
+        self._poll_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self.stats = {"polls": 0, "api_calls": 0, "events": 0, "errors": 0}
+
+    # ------------------------------------------------------------------
+    # Waiters
+    # ------------------------------------------------------------------
+    def register(self, match: Optional[Callable[[Dict[str, Any]], bool]] = None) -> PackageWaiter:
+        """New waiter; it first receives the current snapshot as ``progress`` events."""
+        waiter = PackageWaiter(self, match)
+        with self._cond:
+            for package in self._snapshot.values():
+                waiter.put(PackageEvent(EVENT_PROGRESS, package))
+                if package.get("finished"):
+                    waiter.put(PackageEvent(EVENT_FINISHED, package))
+            self._waiters.append(waiter)
+            self._last_register = self._clock()
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="jd-poller", daemon=True)
+                self._thread.start()
+            self._cond.notify_all()
+        return waiter
+
+    def unregister(self, waiter: PackageWaiter) -> None:
+        with self._cond:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+            if not self._waiters:
+                # Nobody is listening: start from scratch on the next register
+                self._snapshot = {}
+                self._linkgrabber = []
+            self._cond.notify_all()
+
+    @property
+    def waiter_count(self) -> int:
+        with self._cond:
+            return len(self._waiters)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        with self._cond:
+            return dict(self._snapshot)
+
+    # ------------------------------------------------------------------
+    # Polling
+    # ------------------------------------------------------------------
+    def _dispatch(self, events: List[PackageEvent], waiters: List[PackageWaiter]) -> None:
+        self.stats["events"] += len(events) * len(waiters)
+        for event in events:
+            for waiter in waiters:
+                try:
+                    waiter.put(event)
+                except Exception as e:  # a broken filter must not stop the others
+                    logger.debug(f"JD waiter filter failed: {e}")
+
+    def poll_once(self) -> List[PackageEvent]:
+        """Fetch the download list once, diff it and dispatch the changes."""
+        with self._poll_lock:
+            self.stats["polls"] += 1
+            try:
+                self.stats["api_calls"] += 1
+                packages = self.device.downloads.query_packages(PACKAGE_QUERY) or []
+                current = {_package_key(p): trim_package(p) for p in packages}
+                events = diff_snapshots(self._snapshot, current)
+                if not current:
+                    # Links are still being crawled: report what the linkgrabber holds
+                    self.stats["api_calls"] += 1
+                    pending = self.device.linkgrabber.query_packages(LINKGRABBER_QUERY) or []
+                    names = [p.get("name", "") for p in pending]
+                    if names != self._linkgrabber:
+                        events.extend(PackageEvent(EVENT_LINKGRABBER, trim_package(p)) for p in pending)
+                    self._linkgrabber = names
+                else:
+                    self._linkgrabber = []
+            except Exception as e:
+                self.stats["errors"] += 1
+                events = [PackageEvent(EVENT_ERROR, error=str(e))]
+                with self._cond:
+                    waiters = list(self._waiters)
+                self._dispatch(events, waiters)
+                return events
+            with self._cond:
+                # Swap the snapshot and pick the recipients together so a
+                # waiter registering now sees each change exactly once
+                self._snapshot = current
+                self._changed_last_tick = bool(events)
+                if events:
+                    self._last_change = self._clock()
+                waiters = list(self._waiters)
+            if events:
+                self._dispatch(events, waiters)
+            return events
+
+    def next_interval(self) -> float:
+        """Seconds until the next poll, from the aggregate activity."""
+        now = self._clock()
+        with self._cond:
+            if self._changed_last_tick or now - self._last_register < self.fast_window:
+                return self.fast_interval
+            if now - self._last_change < self.active_window:
+                return self.normal_interval
+            return self.slow_interval
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                if not self._waiters:
+                    self._thread = None
+                    return
+            self.poll_once()
+            interval = self.next_interval()
+            with self._cond:
+                if self._waiters:
+                    self._cond.wait(interval)
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Drop all waiters and let the poll thread finish."""
+        with self._cond:
+            self._waiters.clear()
+            thread = self._thread
+            self._cond.notify_all()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+
+_pollers: Dict[int, JDPoller] = {}
+_pollers_lock = threading.Lock()
+
+
+def get_jd_poller(device: Any) -> JDPoller:
+    """The :class:`JDPoller` shared by all monitors of *device*."""
+    with _pollers_lock:
+        poller = _pollers.get(id(device))
+        if poller is None or poller.device is not device:
+            poller = JDPoller(device)
+            _pollers[id(device)] = poller
+        return poller
+
+
+__all__ = [
+    "JDPoller",
+    "PackageEvent",
+    "PackageWaiter",
+    "diff_snapshots",
+    "get_jd_poller",
+    "trim_package",
+    "PACKAGE_QUERY",
+    "EVENT_PROGRESS",
+    "EVENT_FINISHED",
+    "EVENT_REMOVED",
+    "EVENT_LINKGRABBER",
+    "EVENT_ERROR",
+]
@@ -17,6 +17,21 @@ except ImportError:
     JDOWNLOADER_AVAILABLE = False
 
 from .base_downloader import BaseDownloader
+from .file_locator import get_file_locator
+from .jd_poller import EVENT_ERROR, EVENT_FINISHED, EVENT_LINKGRABBER, EVENT_REMOVED, get_jd_poller
+
+# Per-poll monitor output goes through this logger at DEBUG so that
+# LOG_LEVELS=downloaders.jdownloader=INFO skips it before any formatting.
+logger = logging.getLogger(__name__)
+
+# Package states JD sits in without loading bytes (host waits, pauses,
+# reconnects); they count as activity for the inactivity timeout
+WAIT_STATE_WORDS = ('pause', 'wait', 'queue', 'connect', 'retry')
+
+
+def in_wait_state(package: Dict[str, Any]) -> bool:
+    status = str(package.get('status') or '').lower()
+    return any(word in status for word in WAIT_STATE_WORDS)
 
 # Load environment variables
 load_dotenv()
@@ -124,7 +139,12 @@ class JDownloaderDownloader(BaseDownloader):
         """
         try:
             logging.info("🔗 Initializing JDownloader connection...")
-            
+            try:
+                from integrations.jd_client import install_keepalive_transport
+                install_keepalive_transport()
+            except Exception as e:
+                logging.debug(f"JD keep-alive transport not installed: {e}")
+
             self.jd = myjdapi.Myjdapi()
             self.jd.set_app_key(self.app_key)
             
@@ -333,7 +353,8 @@ class JDownloaderDownloader(BaseDownloader):
             time.sleep(3)
             
             # Monitor download progress and get downloaded files
-            downloaded_files = self._monitor_download(url, progress_callback, download_dir)
+            downloaded_files = self._monitor_download(
+                url, progress_callback, download_dir, expected_package=f"{thread_title}_{thread_id}")
             
             if downloaded_files:
                 # Update download info with new files if provided
@@ -364,387 +385,298 @@ class JDownloaderDownloader(BaseDownloader):
                 logging.info(f"🧹 JDownloader cleaning up session: {self.current_session_id}")
                 self.current_session_id = None
 
-    def _monitor_download(self, original_url: str, progress_callback=None, target_dir=None) -> list:
+    def _package_matcher(self, package_name: Optional[str], original_url: str):
+        """Filter for the poller: packages of this download only.
+
+        A package is ours if JD kept the name we gave it, or (checked once per
+        package, for names changed by packagizer rules) if it holds
+        *original_url*.  ``None`` (no filter) without a package name.
         """
-        Monitor download progress with faster, more responsive checking
+        if not package_name:
+            return None
+        wanted = package_name.strip().lower()
+        by_uuid: Dict[Any, bool] = {}
+
+        def match(package: Dict[str, Any]) -> bool:
+            if str(package.get('name') or '').strip().lower() == wanted:
+                return True
+            uuid = package.get('uuid')
+            if uuid is None:
+                return False
+            if uuid not in by_uuid:
+                try:
+                    links = self.device.downloads.query_links([{
+                        "packageUUIDs": [uuid], "url": True, "maxResults": -1, "startAt": 0,
+                    }]) or []
+                    by_uuid[uuid] = any(link.get('url') == original_url for link in links)
+                except Exception as e:
+                    logger.debug(f"Could not resolve links of JD package {uuid}: {e}")
+                    return False  # not cached: try again on the next event
+            return by_uuid[uuid]
+
+        return match
+
+    def _monitor_download(self, original_url: str, progress_callback=None, target_dir=None,
+                          expected_package: Optional[str] = None) -> list:
+        """
+        Monitor download progress through the shared JD poller.
+
+        All monitors of this device share one :class:`JDPoller`; this loop
+        only reacts to the package changes it dispatches for *expected_package*
+        (or the package holding *original_url*).
         """
         try:
             # 🚀 SMART TIMEOUT SYSTEM - Progressive timeout based on activity
             initial_timeout = 900      # 15 minutes to detect if download started (increased for large files)
             max_inactivity_time = 600  # 10 minutes without progress = timeout (increased for large files)
-            
+            wake_interval = 0.5        # cancel/timeout checks between events
+
             logging.info(f"🔧 Smart timeout config: startup_timeout={initial_timeout}s, inactivity_timeout={max_inactivity_time}s")
-            
-            # ⚡ Adaptive monitoring - start fast, slow down if needed
-            fast_interval = 0.1   # Very fast for first 30 seconds (small files)
-            normal_interval = 0.5 # Normal speed after fast phase
-            slow_interval = 2.0   # Slower for long downloads
-            
-            check_interval = fast_interval
-            elapsed_time = 0
-            last_activity_time = 0     # Last time we saw ANY progress/activity
-            last_bytes_loaded = -1     # Track actual download progress
-            download_started = False   # Has download actually started?
-            
-            logging.info(f"🔍 ⚡ Adaptive monitoring download for: {original_url}")
+            logging.info(f"🔍 ⚡ Monitoring download via shared JD poller: {original_url}")
+
+            host_name = self._extract_host_name(original_url)
+            display_names = {}  # package name -> progress display name
+
+            def display_name_for(package_name):
+                name = display_names.get(package_name)
+                if name is None:
+                    name = display_names[package_name] = self.format_progress_display_name(package_name, host_name)
+                return name
+
+            started_at = time.monotonic()
+            last_activity_time = started_at  # Last time we saw ANY progress/activity
+            download_started = False         # Has download actually started?
             package_found = False
-            last_progress = -1  # Track progress changes
-            fast_phase_duration = 30  # First 30 seconds = fast checking
-            
-            # 🧠 SMART TIMEOUT: Initial timeout OR inactivity timeout
-            while True:
-                # ✅ التقط إشارة الإلغاء من أى مكان:
-                # - لو حد نادى request_cancel()
-                # - أو لو الواجهة عندها status_widget.cancel_event متعلم
-                try:
-                    ui_cancelled = False
-                    bot = getattr(self, "bot", None)
-                    sw = getattr(getattr(bot, "status_widget", None), "cancel_event", None)
-                    if sw is not None:
-                        try:
-                            ui_cancelled = sw.is_set()
-                        except Exception:
-                            ui_cancelled = False
-
-                    if (getattr(self, "_cancel_event", None) and self._cancel_event.is_set()) or ui_cancelled:
-                        logging.info("🛑 Cancel detected — stopping & clearing JDownloader, then exiting monitor loop.")
-                        try:
-                            self._stop_and_clear_device()
-                        except Exception:
-                            pass
+            last_progress = -1               # Track progress changes
+            last_status_report = started_at
+
+            match = self._package_matcher(expected_package, original_url)
+            with get_jd_poller(self.device).register(match=match) as waiter:
+                while True:
+                    # ✅ التقط إشارة الإلغاء من أى مكان:
+                    # - لو حد نادى request_cancel()
+                    # - أو لو الواجهة عندها status_widget.cancel_event متعلم
+                    try:
+                        ui_cancelled = False
+                        bot = getattr(self, "bot", None)
+                        sw = getattr(getattr(bot, "status_widget", None), "cancel_event", None)
+                        if sw is not None:
+                            try:
+                                ui_cancelled = sw.is_set()
+                            except Exception:
+                                ui_cancelled = False
+
+                        if (getattr(self, "_cancel_event", None) and self._cancel_event.is_set()) or ui_cancelled:
+                            logging.info("🛑 Cancel detected — stopping & clearing JDownloader, then exiting monitor loop.")
+                            try:
+                                self._stop_and_clear_device()
+                            except Exception:
+                                pass
+                            return []
+                    except Exception:
+                        # لا تعطّل الحلقة لو حصلت مشكلة فى الفحص
+                        pass
+
+                    now = time.monotonic()
+                    elapsed_time = now - started_at
+                    # A package parked in a wait/pause/connect state produces no
+                    # diff events: keep the download alive from the snapshot
+                    if download_started and any(
+                        in_wait_state(p) for p in waiter.poller.snapshot().values()
+                        if match is None or match(p)
+                    ):
+                        last_activity_time = now
+                    # Check if we should timeout
+                    if not download_started and elapsed_time >= initial_timeout:
+                        logging.warning(f"⏰ JDownloader download STARTUP timeout after {elapsed_time:.0f}s - no download activity detected")
+                        return []
+                    if download_started and now - last_activity_time >= max_inactivity_time:
+                        logging.warning(f"⏰ JDownloader download INACTIVITY timeout after {now - last_activity_time:.0f}s without progress (total: {elapsed_time:.0f}s)")
                         return []
-                except Exception:
-                    # لا تعطّل الحلقة لو حصلت مشكلة فى الفحص
-                    pass
 
-                # Check if we should timeout
-                if not download_started and elapsed_time >= initial_timeout:
-                    logging.warning(f"⏰ No download activity detected after {initial_timeout}s")
-                    break
-                    
-                if download_started and (elapsed_time - last_activity_time) >= max_inactivity_time:
-                    logging.warning(f"⏰ No download progress for {max_inactivity_time}s (inactive)")
-                    break
-                try:
-                    # Check downloads with detailed progress
-                    downloads_info = self.device.downloads.query_packages()
-                    total_progress = 0
-                    active_downloads = 0
-                    
-                    if downloads_info:
-                        for package in downloads_info:
-                            package_name = package.get('name', '')
-                            finished = package.get('finished', False)
-                            bytes_loaded = package.get('bytesLoaded', 0)
-                            bytes_total = package.get('bytesTotal', 1)  # Avoid division by zero
-                            status = package.get('status', 'Unknown')
-                            
-                            # 🔄 Handle special statuses that shouldn't timeout
-                            is_paused = 'paused' in status.lower() or 'pause' in status.lower()
-                            is_waiting = 'wait' in status.lower() or 'queue' in status.lower()
-                            is_connecting = 'connect' in status.lower() or 'retry' in status.lower()
-                            
-                            # 🔍 Enhanced package monitoring with host info
-                            if bytes_total > 0:
-                                package_progress = int((bytes_loaded / bytes_total) * 100)
-                                
-                                # Extract host name from original URL for display
-                                host_name = self._extract_host_name(original_url)
-                                display_name = self.format_progress_display_name(package_name, host_name)
-                                
-                                # 🆔 SESSION VALIDATION: Only send progress for current session
-                                if progress_callback and (package_progress > last_progress or package_progress == 100):
-                                    # Check if this is still the current session
-                                    if hasattr(self, 'current_session_id') and self.current_session_id:
-                                        logging.debug(f"📶 JDownloader session {self.current_session_id} sending progress: {display_name} = {package_progress}%")
-                                        try:
-                                            # Try enhanced callback first
-                                            progress_callback(bytes_loaded, bytes_total, display_name, package_progress)
-                                            logging.debug(f"📊 {display_name}: {package_progress}%")
-                                        except TypeError:
-                                            # Fallback to legacy callback
-                                            progress_callback(bytes_loaded, bytes_total, display_name)
-                                    else:
-                                        logging.warning(f"🚫 JDownloader ignoring progress update - no active session")
-                                    
-                                    last_progress = package_progress
-                                
-                                logging.info(f"📊 Package '{package_name}': {package_progress}% | Status: {status} | Host: {host_name} | Finished: {finished}")
-                                
-                                # 🔍 ACTIVITY TRACKING - Monitor download activity
-                                if bytes_loaded > 0:
-                                    if not download_started:
-                                        logging.info(f"🚀 Download STARTED: {package_name} ({bytes_loaded}/{bytes_total} bytes)")
-                                        download_started = True
-                                        last_activity_time = elapsed_time
-                                    
-                                    package_found = True
-                                    
-                                    # Check if progress has changed (bytes downloaded)
-                                    if bytes_loaded != last_bytes_loaded:
-                                        last_activity_time = elapsed_time  # Update activity timestamp
-                                        progress_change = bytes_loaded - (last_bytes_loaded if last_bytes_loaded > 0 else 0)
-                                        last_bytes_loaded = bytes_loaded
-                                        logging.info(f"🔄 Progress: +{progress_change} bytes | Total: {bytes_loaded}/{bytes_total} ({package_progress}%)")
-                                    
-                                    # 🔄 Special states also count as activity
-                                    elif is_paused or is_waiting or is_connecting:
-                                        last_activity_time = elapsed_time  # Keep activity alive for special states
-                                        logging.info(f"🔄 Special state activity: {status} - keeping download alive")
-                                    
-                                    active_downloads += 1
-                                
-                                # ⚡ Check if package is actually complete but not marked as finished
-                                if package_progress >= 100 and not finished:
-                                    logging.info(f"📅 Package '{package_name}' is 100% downloaded, attempting file retrieval...")
-                                    # ✅ Try to get files with enhanced error handling
-                                    try:
-                                        downloaded_files = self._get_package_files(package, target_dir)
-                                        if downloaded_files:
-                                            logging.info(f"✅ SUCCESS: Retrieved {len(downloaded_files)} files from completed package")
-                                            if progress_callback:
-                                                try:
-                                                    progress_callback(bytes_total, bytes_total, display_name, 100)
-                                                except (TypeError, Exception) as e:
-                                                    logging.debug(f"Progress callback issue: {e}")
-                                                    progress_callback(bytes_total, bytes_total, display_name)
-                                            return downloaded_files
-                                        else:
-                                            logging.info(f"🔍 No files found yet, continuing to monitor...")
-                                    except Exception as e:
-                                        logging.warning(f"⚠️ Error getting package files: {e}")
-                            
-                            if finished:
-                                logging.info(f"✅ ⚡ JDownloader package COMPLETED: {package_name}")
-                                
-                                # ⚡ Try immediate file check first (no delay!)
-                                downloaded_files = self._get_package_files(package, target_dir)
-                                
-                                if downloaded_files:
-                                    # ✅ Files found immediately!
-                                    if progress_callback:
-                                        host_name = self._extract_host_name(original_url)
-                                        display_name = self.format_progress_display_name(package_name, host_name)
-                                        try:
-                                            progress_callback(100, 100, display_name, 100)
-                                        except TypeError:
-                                            progress_callback(100, 100, display_name)
-                                    logging.info(f"⚡ INSTANT: Found {len(downloaded_files)} files!")
-                                    return downloaded_files
-                                
-                                # ⏱️ Only wait 1 second if files not found immediately
-                                logging.info(f"⏱️ Waiting 1s for file finalization...")
-                                time.sleep(1)
-                                
-                                # Second try
-                                downloaded_files = self._get_package_files(package, target_dir)
-                                if downloaded_files:
-                                    if progress_callback:
-                                        host_name = self._extract_host_name(original_url)
-                                        display_name = self.format_progress_display_name(package_name, host_name)
-                                        try:
-                                            progress_callback(100, 100, display_name, 100)
-                                        except TypeError:
-                                            progress_callback(100, 100, display_name)
-                                    logging.info(f"⚡ QUICK: Found {len(downloaded_files)} files after 1s!")
-                                    return downloaded_files
-                                
-                                # Try alternative method quickly
-                                alt_files = self._find_files_by_package_name(package_name, target_dir)
-                                if alt_files:
-                                    if progress_callback:
-                                        host_name = self._extract_host_name(original_url)
-                                        display_name = self.format_progress_display_name(package_name, host_name)
-                                        try:
-                                            progress_callback(100, 100, display_name, 100)
-                                        except TypeError:
-                                            progress_callback(100, 100, display_name)
-                                    logging.info(f"⚡ ALT METHOD: Found {len(alt_files)} files!")
-                                    return alt_files
-                                
-                                # ⏱️ Final wait (reduced from 10s to 3s)
-                                logging.warning(f"⚠️ Package finished but no files found, final 3s wait...")
-                                time.sleep(3)
-                                final_files = self._get_package_files(package, target_dir)
-                                if final_files:
-                                    if progress_callback:
-                                        host_name = self._extract_host_name(original_url)
-                                        display_name = self.format_progress_display_name(package_name, host_name)
-                                        try:
-                                            progress_callback(100, 100, display_name, 100)
-                                        except TypeError:
-                                            progress_callback(100, 100, display_name)
-                                    logging.info(f"⚡ FINAL: Found {len(final_files)} files after 3s!")
-                                    return final_files
-                            
-                            # Calculate real progress for active downloads
-                            if bytes_total > 0:
-                                package_progress = int((bytes_loaded / bytes_total) * 100)
-                                total_progress += package_progress
-                        
-                        if finished:
-                            logging.info(f"✅ ⚡ JDownloader package COMPLETED: {package_name}")
-                            
-                            # ⚡ Try immediate file check first (no delay!)
-                            downloaded_files = self._get_package_files(package, target_dir)
-                            
-                            if downloaded_files:
-                                # ✅ Files found immediately!
-                                if progress_callback:
-                                    progress_callback(100, 100, package_name)
-                                logging.info(f"⚡ INSTANT: Found {len(downloaded_files)} files!")
-                                return downloaded_files
-                            
-                            # ⏱️ Only wait 1 second if files not found immediately
-                            logging.info(f"⏱️ Waiting 1s for file finalization...")
-                            time.sleep(1)
-                            
-                            # Second try
-                            downloaded_files = self._get_package_files(package, target_dir)
-                            if downloaded_files:
-                                if progress_callback:
-                                    progress_callback(100, 100, package_name)
-                                logging.info(f"⚡ QUICK: Found {len(downloaded_files)} files after 1s!")
-                                return downloaded_files
-                            
-                            # Try alternative method quickly
-                            alt_files = self._find_files_by_package_name(package_name, target_dir)
-                            if alt_files:
-                                if progress_callback:
-                                    progress_callback(100, 100, package_name)
-                                logging.info(f"⚡ ALT METHOD: Found {len(alt_files)} files!")
-                                return alt_files
-                            
-                            # ⏱️ Final wait (reduced from 10s to 3s)
-                            logging.warning(f"⚠️ Package finished but no files found, final 3s wait...")
-                            time.sleep(3)
-                            final_files = self._get_package_files(package, target_dir)
-                            if final_files:
-                                if progress_callback:
-                                    progress_callback(100, 100, package_name)
-                                logging.info(f"⚡ FINAL: Found {len(final_files)} files after 3s!")
-                                return final_files
-                        
-                        # Calculate real progress for active downloads
-                        if bytes_total > 0:
-                            package_progress = int((bytes_loaded / bytes_total) * 100)
-                            total_progress += package_progress
-                            active_downloads += 1
-                            package_found = True
-                            
-                            logging.info(f"📊 {package_name}: {package_progress}% ({bytes_loaded}/{bytes_total} bytes)")
-                
-                    # ⚡ Smart progress reporting (only when changed)
-                    if progress_callback and active_downloads > 0:
-                        # Calculate actual bytes for progress
-                        total_bytes_loaded = sum(pkg.get('bytesLoaded', 0) for pkg in downloads_info)
-                        total_bytes_total = sum(pkg.get('bytesTotal', 1) for pkg in downloads_info)
-                        
-                        if total_bytes_total > 0:
-                            # Calculate real progress - allow 100% when downloads complete
-                            real_progress = (total_bytes_loaded / total_bytes_total) * 100
-                            
-                            # 🎯 Only show 100% if bytes are fully loaded OR if we have finished packages
-                            if real_progress >= 99.9:  # Almost complete
-                                progress_percent = min(real_progress, 98)  # Cap at 98% until files confirmed
-                            else:
-                                progress_percent = real_progress
-                            
-                            # 🎯 Only update if progress changed significantly
-                            if abs(progress_percent - last_progress) >= 1:  # Update every 1%
-                                # 🏷️ Enhanced progress info with filename and host
-                                # Get the most active package name for display
-                                active_package_name = "JDownloader"
-                                for pkg in downloads_info:
-                                    if pkg.get('bytesTotal', 0) > 0:
-                                        active_package_name = pkg.get('name', 'JDownloader')
-                                        break
-                                
-                                # Format: "Filename.ext - JDownloader" for better user info
-                                display_name = f"{active_package_name} - JDownloader"
-                                progress_callback(int(progress_percent), 100, display_name)
-                                logging.info(f"📊 ⚡ Progress: {int(progress_percent)}% ({total_bytes_loaded}/{total_bytes_total} bytes) - {active_package_name}")
-                                last_progress = progress_percent
-                            
-                            # 🔍 Check if all downloads are actually complete (100% bytes)
-                            if real_progress >= 99.9 and active_downloads > 0:
-                                logging.info(f"✅ All downloads appear complete at {real_progress:.1f}% - checking for files...")
-                                # Try to find files from any completed packages
-                                for pkg in downloads_info:
-                                    pkg_bytes_loaded = pkg.get('bytesLoaded', 0)
-                                    pkg_bytes_total = pkg.get('bytesTotal', 1)
-                                    if pkg_bytes_total > 0 and (pkg_bytes_loaded / pkg_bytes_total) >= 0.999:  # 99.9% complete
-                                        final_files = self._get_package_files(pkg, target_dir)
-                                        if final_files:
-                                            logging.info(f"⚡ COMPLETION DETECTED: Found {len(final_files)} files from completed download!")
-                                            if progress_callback:
-                                                progress_callback(100, 100, pkg.get('name', 'JDownloader'))
-                                            return final_files
-                    
-                    # Check linkgrabber for pending items
-                    linkgrabber_info = self.device.linkgrabber.query_packages()
-                    
-                    if linkgrabber_info and not package_found:
-                        for package in linkgrabber_info:
-                            package_name = package.get('name', '')
-                            logging.info(f"📦 Package in linkgrabber: {package_name}")
-                            if progress_callback:
-                                progress_callback(1, 100, package_name)  # Starting progress (1%)
-                    
-                    # ⚡ Adaptive interval adjustment
-                    # If we saw progress change, reset activity timer
-                    if active_downloads > 0 or package_found:
-                        last_activity_time = elapsed_time
-                    
-                    # Adjust monitoring speed based on phase and activity
-                    if elapsed_time < fast_phase_duration:
-                        # Fast phase - check every 0.1s for first 30 seconds
-                        check_interval = fast_interval
-                    elif elapsed_time - last_activity_time < 60:
-                        # Active phase - recent activity, check every 0.5s
-                        check_interval = normal_interval
-                    else:
-                        # Slow phase - no recent activity, check every 2s
-                        check_interval = slow_interval
-                    
-                    time.sleep(check_interval)
-                    elapsed_time += check_interval
-                    
                     # Log progress every 30 seconds with detailed status
-                    if int(elapsed_time) % 30 == 0 and elapsed_time > 0:
+                    if now - last_status_report >= 30:
+                        last_status_report = now
                         status_msg = "🔍 MONITORING STATUS:\n"
                         status_msg += f"  ⏱️ Elapsed: {elapsed_time:.0f}s\n"
                         status_msg += f"  🚀 Download started: {'YES' if download_started else 'NO'}\n"
                         if download_started:
-                            inactivity = elapsed_time - last_activity_time
-                            status_msg += f"  🔄 Last activity: {inactivity:.0f}s ago\n"
-                            status_msg += f"  📊 Progress: {last_bytes_loaded} bytes\n"
-                        status_msg += f"  🔄 Check interval: {check_interval}s\n"
-                        status_msg += f"  📈 Active downloads: {active_downloads}"
+                            status_msg += f"  🔄 Last activity: {now - last_activity_time:.0f}s ago\n"
+                        status_msg += f"  📈 Packages: {len(waiter.poller.snapshot())}"
                         logging.info(status_msg)
-                        
-                except Exception as e:
-                    # 🛡️ Check if it's a deleted object error
-                    if "wrapped C/C++ object" in str(e) or "has been deleted" in str(e):
-                        logging.info(f"🚫 Download worker deleted, stopping monitoring")
-                        break
-                    else:
+
+                    try:
+                        verbose = logger.isEnabledFor(logging.DEBUG)
+                        for event in waiter.get(timeout=wake_interval):
+                            package = event.package
+                            package_name = package.get('name', '')
+
+                            if event.kind == EVENT_ERROR:
+                                if "wrapped C/C++ object" in event.error or "has been deleted" in event.error:
+                                    logging.info(f"🚫 Download worker deleted, stopping monitoring")
+                                    return []
+                                logging.error(f"❌ Error in monitoring loop: {event.error}")
+                                continue
+
+                            if event.kind == EVENT_LINKGRABBER:
+                                if verbose:
+                                    logger.debug(f"📦 Package in linkgrabber: {package_name}")
+                                if progress_callback and not package_found:
+                                    progress_callback(1, 100, package_name)  # Starting progress (1%)
+                                continue
+
+                            if event.kind == EVENT_REMOVED:
+                                logging.info(f"🗑️ JDownloader package removed: {package_name}")
+                                continue
+
+                            bytes_loaded = package.get('bytesLoaded', 0) or 0
+                            bytes_total = package.get('bytesTotal', 0) or 0
+                            status = package.get('status') or 'Unknown'
+                            display_name = display_name_for(package_name)
+
+                            if event.kind == EVENT_FINISHED:
+                                logging.info(f"✅ ⚡ JDownloader package COMPLETED: {package_name}")
+                                files = self._collect_finished_package_files(
+                                    package, target_dir, progress_callback, display_name)
+                                if files:
+                                    return files
+                                continue
+
+                            # EVENT_PROGRESS
+                            if bytes_total <= 0:
+                                continue
+                            package_found = True
+                            package_progress = int((bytes_loaded / bytes_total) * 100)
+
+                            # 🆔 SESSION VALIDATION: Only send progress for current session
+                            if progress_callback and (package_progress > last_progress or package_progress == 100):
+                                if getattr(self, 'current_session_id', None):
+                                    try:
+                                        # Try enhanced callback first
+                                        progress_callback(bytes_loaded, bytes_total, display_name, package_progress)
+                                    except TypeError:
+                                        # Fallback to legacy callback
+                                        progress_callback(bytes_loaded, bytes_total, display_name)
+                                    logging.info(f"📊 ⚡ Progress: {package_progress}% ({bytes_loaded}/{bytes_total} bytes) - {package_name}")
+                                else:
+                                    logging.warning(f"🚫 JDownloader ignoring progress update - no active session")
+                                last_progress = package_progress
+
+                            if verbose:
+                                logger.debug(f"📊 Package '{package_name}': {package_progress}% (+{event.delta} bytes) | Status: {status} | Host: {host_name}")
+
+                            # 🔍 ACTIVITY TRACKING - new bytes or a special state keep the download alive
+                            if bytes_loaded > 0:
+                                if not download_started:
+                                    logging.info(f"🚀 Download STARTED: {package_name} ({bytes_loaded}/{bytes_total} bytes)")
+                                    download_started = True
+                                if event.delta or in_wait_state(package):
+                                    last_activity_time = time.monotonic()
+
+                            # ⚡ Check if package is actually complete but not marked as finished
+                            if bytes_loaded >= bytes_total * 0.999 and not package.get('finished'):
+                                logging.info(f"📅 Package '{package_name}' is {package_progress}% downloaded, attempting file retrieval...")
+                                try:
+                                    downloaded_files = self._get_package_files(package, target_dir)
+                                    if downloaded_files:
+                                        logging.info(f"✅ SUCCESS: Retrieved {len(downloaded_files)} files from completed package")
+                                        self._report_complete(progress_callback, display_name)
+                                        return downloaded_files
+                                    logging.info(f"🔍 No files found yet, continuing to monitor...")
+                                except Exception as e:
+                                    logging.warning(f"⚠️ Error getting package files: {e}")
+
+                    except Exception as e:
+                        # 🛡️ Check if it's a deleted object error
+                        if "wrapped C/C++ object" in str(e) or "has been deleted" in str(e):
+                            logging.info(f"🚫 Download worker deleted, stopping monitoring")
+                            return []
                         logging.error(f"❌ Error in monitoring loop: {e}")
-                    time.sleep(check_interval)
-                    elapsed_time += check_interval
-            
-            # 🔍 Detailed timeout message based on what actually happened
-            if not download_started:
-                logging.warning(f"⏰ JDownloader download STARTUP timeout after {elapsed_time:.0f}s - no download activity detected")
-            else:
-                inactivity_duration = elapsed_time - last_activity_time
-                logging.warning(f"⏰ JDownloader download INACTIVITY timeout after {inactivity_duration:.0f}s without progress (total: {elapsed_time:.0f}s)")
-            return []
-            
+
         except Exception as e:
             logging.error(f"❌ Monitor download error: {e}")
             return []
 
+    @staticmethod
+    def _report_complete(progress_callback, display_name: str) -> None:
+        if not progress_callback:
+            return
+        try:
+            progress_callback(100, 100, display_name, 100)
+        except TypeError:
+            progress_callback(100, 100, display_name)
+
+    def _collect_finished_package_files(self, package, target_dir, progress_callback, display_name) -> list:
+        """Files of a package JD reports as finished, allowing a few seconds for finalization."""
+        attempts = (
+            (0, "INSTANT", lambda: self._get_package_files(package, target_dir)),
+            (1, "QUICK", lambda: self._get_package_files(package, target_dir)),
+            (0, "ALT METHOD", lambda: self._find_files_by_package_name(package.get('name', ''), target_dir)),
+            (3, "FINAL", lambda: self._get_package_files(package, target_dir)),
+        )
+        for delay, label, find in attempts:
+            if delay:
+                logging.info(f"⏱️ Waiting {delay}s for file finalization...")
+                time.sleep(delay)
+            files = find()
+            if files:
+                self._report_complete(progress_callback, display_name)
+                logging.info(f"⚡ {label}: Found {len(files)} files!")
+                return files
+        logging.warning(f"⚠️ Package finished but no files found: {package.get('name', '')}")
+        return []
+
+    def _wait_for_finalized(self, file_path, max_wait=300):
+        """Final path for *file_path*, waiting while JD still writes it as ``.part``.
+
+        Moving a .part file results in unusable archives, so we give JD ample
+        time to finalize the download; ``None`` if it never does.
+        """
+        if not file_path.lower().endswith('.part'):
+            return file_path
+        final_path = file_path[:-5]
+        logging.info(f"⏳ Waiting for JDownloader to finalize: {file_path}")
+        wait_time = 0
+        while wait_time < max_wait and not os.path.exists(final_path):
+            time.sleep(1)
+            wait_time += 1
+        if os.path.exists(final_path):
+            logging.info(f"✅ Finalized file detected: {final_path}")
+            return final_path
+        logging.error(f"❌ File remained incomplete after {max_wait}s: {file_path}")
+        return None
+
+    def _move_to_target(self, file_path, target_dir):
+        """Move *file_path* into *target_dir* (renaming on conflicts); the path to use afterwards."""
+        if not target_dir or os.path.dirname(file_path) == target_dir:
+            return file_path
+        try:
+            os.makedirs(target_dir, exist_ok=True)
+            filename = os.path.basename(file_path)
+            new_path = os.path.join(target_dir, filename)
+
+            # Handle file name conflicts
+            counter = 1
+            while os.path.exists(new_path):
+                name, ext = os.path.splitext(filename)
+                new_path = os.path.join(target_dir, f"{name}_{counter}{ext}")
+                counter += 1
+
+            shutil.move(file_path, new_path)
+            logging.info(f"✅ Moved file to: {new_path}")
+            return new_path
+        except Exception as e:
+            logging.error(f"❌ Error moving file {file_path}: {e}")
+            # Keep original path if move fails
+            return file_path
+
+    def _file_locator(self, target_dir=None):
+        """Shared index of the JD download folders, including *target_dir*."""
+        locator = get_file_locator()
+        if target_dir:
+            locator.add_root(target_dir)
+        return locator
+
     def _get_package_files(self, package, target_dir=None) -> list:
         """
         Get files from completed package and move them to target directory if needed
@@ -768,8 +700,9 @@ class JDownloaderDownloader(BaseDownloader):
                 logging.error(f"❌ Error querying links: {e}")
                 return []
             
+            unlocated = []  # names JD gave no path for, resolved together below
             for i, link in enumerate(links):
-                logging.info(f"🔗 Link {i}: {link}")
+                logging.debug(f"🔗 Link {i}: {link}")
                 
                 # Try different field names for file path
                 file_path = None
@@ -780,78 +713,31 @@ class JDownloaderDownloader(BaseDownloader):
                 
                 if not file_path:
                     logging.warning(f"⚠️ No file path found in link: {link}")
-                    # 🔍 FALLBACK: Try to find file by name in JDownloader's download directory
                     filename = link.get('name', '')
                     if filename:
-                        logging.info(f"🔍 TRIGGERING direct filesystem search for: {filename}")
-                        found_files = self._search_file_by_name(filename, target_dir)
-                        if found_files:
-                            downloaded_files.extend(found_files)
-                            logging.info(f"⚡ SUCCESS: Found {len(found_files)} files via filesystem search!")
-                            # Log each found file
-                            for found_file in found_files:
-                                logging.info(f"📁 Located: {found_file}")
-                        else:
-                            logging.error(f"❌ FAILED: Could not locate '{filename}' via filesystem search")
+                        unlocated.append(filename)
                     else:
                         logging.error(f"❌ No filename provided in link data: {link}")
                     continue
                     
                 if os.path.exists(file_path):
                     logging.info(f"📁 Found downloaded file: {file_path}")
-
-                    # If the file still has a temporary '.part' extension, wait
-                    # for JDownloader to finish and rename it. Moving a .part
-                    # file results in unusable archives, so we give the API
-                    # ample time to finalize the download before proceeding.
-                    if file_path.endswith('.part'):
-                        final_path = file_path[:-5]
-                        wait_time = 0
-                        max_wait = 300  # up to 5 minutes
-                        logging.info(
-                            f"⏳ Waiting for JDownloader to finalize: {file_path}")
-                        while wait_time < max_wait and not os.path.exists(final_path):
-                            time.sleep(1)
-                            wait_time += 1
-
-                        if os.path.exists(final_path):
-                            file_path = final_path
-                            logging.info(f"✅ Finalized file detected: {file_path}")
-                        else:
-                            logging.error(
-                                f"❌ File remained incomplete after {max_wait}s: {file_path}")
-                            continue
-
-                    # If target directory is specified and different from current location
-                    if target_dir and os.path.dirname(file_path) != target_dir:
-                        try:
-                            # Ensure target directory exists
-                            os.makedirs(target_dir, exist_ok=True)
-                            
-                            # Move file to target directory
-                            filename = os.path.basename(file_path)
-                            new_path = os.path.join(target_dir, filename)
-                            
-                            # Handle file name conflicts
-                            counter = 1
-                            while os.path.exists(new_path):
-                                name, ext = os.path.splitext(filename)
-                                new_path = os.path.join(target_dir, f"{name}_{counter}{ext}")
-                                counter += 1
-                            
-                            shutil.move(file_path, new_path)
-                            logging.info(f"✅ Moved file to: {new_path}")
-                            downloaded_files.append(new_path)
-                            
-                        except Exception as e:
-                            logging.error(f"❌ Error moving file {file_path}: {e}")
-                            # Keep original path if move fails
-                            downloaded_files.append(file_path)
-                    else:
-                        # File is already in correct location or no target specified
-                        downloaded_files.append(file_path)
+                    file_path = self._wait_for_finalized(file_path)
+                    if file_path:
+                        downloaded_files.append(self._move_to_target(file_path, target_dir))
                 else:
                     logging.warning(f"⚠️ File does not exist: {file_path}")
+
+            if unlocated:
+                # 🔍 FALLBACK: one indexed lookup for every file of the package
+                logging.info(f"🔍 TRIGGERING indexed filesystem search for {len(unlocated)} files")
+                for filename, found_files in self._search_files_by_names(unlocated, target_dir).items():
+                    if found_files:
+                        downloaded_files.extend(found_files)
+                        for found_file in found_files:
+                            logging.info(f"📁 Located: {found_file}")
+                    else:
+                        logging.error(f"❌ FAILED: Could not locate '{filename}' via filesystem search")
                         
         except Exception as e:
             logging.error(f"❌ Error getting package files: {e}")
@@ -861,97 +747,41 @@ class JDownloaderDownloader(BaseDownloader):
     
     def _find_files_by_package_name(self, package_name, target_dir=None) -> list:
         """
-        Alternative method to find downloaded files by scanning JDownloader's download directory
+        Alternative method to find recently downloaded files whose names share
+        a word with the package name, using the download-folder index
         """
         downloaded_files = []
         
         try:
-            # Common JDownloader download directories
-            possible_dirs = [
-                os.path.expanduser("~/Downloads"),
-                os.path.expanduser("~/Desktop"),
-            ]
-            public_dir = os.environ.get("PUBLIC")
-            if public_dir:
-                possible_dirs.append(os.path.join(public_dir, "Downloads"))
-            custom_dir = os.environ.get("JD_DOWNLOAD_DIR")
-            if custom_dir:
-                possible_dirs.append(custom_dir)
-            # Add target directory to search paths
-            if target_dir:
-                possible_dirs.insert(0, target_dir)
-            
             # Search for files with similar names
-            search_terms = package_name.replace('_', ' ').replace('-', ' ').split()
-            
-            for search_dir in possible_dirs:
-                if not os.path.exists(search_dir):
+            search_terms = [
+                term.lower()
+                for term in package_name.replace('_', ' ').replace('-', ' ').split()
+                if len(term) > 3
+            ]
+            if not search_terms:
+                return []
+
+            locator = self._file_locator(target_dir)
+            candidates = locator.search(lambda name: any(term in name for term in search_terms))
+            logging.info(f"🔍 {len(candidates)} indexed files match package '{package_name}'")
+
+            seen = set()
+            current_time = time.time()
+            for file_path in candidates:
+                # Skip temporary .part files until they finalize
+                file_path = self._wait_for_finalized(file_path)
+                if not file_path or file_path in seen:
                     continue
-                    
-                logging.info(f"🔍 Searching in: {search_dir}")
-                
-                # Look for recently created files
-                for root, dirs, files in os.walk(search_dir):
-                    for file in files:
-                        file_path = os.path.join(root, file)
-
-                        # Skip temporary .part files until they finalize
-                        if file.lower().endswith('.part'):
-                            final_path = file_path[:-5]
-                            wait_time = 0
-                            max_wait = 300
-                            logging.info(
-                                f"⏳ Waiting for JDownloader to finalize: {file_path}")
-                            while wait_time < max_wait and not os.path.exists(final_path):
-                                time.sleep(1)
-                                wait_time += 1
-
-                            if os.path.exists(final_path):
-                                file_path = final_path
-                                file = os.path.basename(final_path)
-                                logging.info(
-                                    f"✅ Finalized file detected: {file_path}")
-                            else:
-                                logging.debug(
-                                    f"Skipping incomplete temporary file: {file_path}")
-                                continue
-                        # Check if file was created recently (within last 10 minutes)
-                        try:
-                            file_time = os.path.getctime(file_path)
-                            current_time = time.time()
-                            if current_time - file_time <= 600:  # 10 minutes
-                                # Check if filename matches any search terms
-                                if any(term.lower() in file.lower() for term in search_terms if len(term) > 3):
-                                    logging.info(f"🎯 Found matching file: {file_path}")
-                                    
-                                    # Move to target directory if needed
-                                    if target_dir and os.path.dirname(file_path) != target_dir:
-                                        try:
-                                            os.makedirs(target_dir, exist_ok=True)
-                                            filename = os.path.basename(file_path)
-                                            new_path = os.path.join(target_dir, filename)
-                                            
-                                            # Handle conflicts
-                                            counter = 1
-                                            while os.path.exists(new_path):
-                                                name, ext = os.path.splitext(filename)
-                                                new_path = os.path.join(target_dir, f"{name}_{counter}{ext}")
-                                                counter += 1
-                                            
-                                            shutil.move(file_path, new_path)
-                                            downloaded_files.append(new_path)
-                                            logging.info(f"✅ Moved file to: {new_path}")
-                                        except Exception as e:
-                                            logging.error(f"❌ Error moving file: {e}")
-                                            downloaded_files.append(file_path)
-                                    else:
-                                        downloaded_files.append(file_path)
-                        except Exception as e:
-                            continue
-                    
-                    # Don't go too deep
-                    if len(root.split(os.sep)) - len(search_dir.split(os.sep)) > 2:
-                        break
+                seen.add(file_path)
+                # Check if file was created recently (within last 10 minutes)
+                try:
+                    if current_time - os.path.getctime(file_path) > 600:
+                        continue
+                except OSError:
+                    continue
+                logging.info(f"🎯 Found matching file: {file_path}")
+                downloaded_files.append(self._move_to_target(file_path, target_dir))
                         
         except Exception as e:
             logging.error(f"❌ Error in alternative file search: {e}")
@@ -961,179 +791,62 @@ class JDownloaderDownloader(BaseDownloader):
 
     def _search_file_by_name(self, filename, target_dir=None) -> list:
         """
-        🔍 POWERFUL: Direct file system search by exact filename 
+        🔍 Direct file system search by exact filename
         للبحث المباشر عن الملف في النظام عند فشل JDownloader API
         """
-        downloaded_files = []
-        
-        try:
-            # Get JDownloader's actual download directory from settings
-            jd_download_dirs = []
-            
-            # Try to get JDownloader's download directory from config
-            try:
-                # Common JDownloader paths
-                jd_paths = [
-                    os.path.expanduser("~/JDownloader/Downloads"),
-                    os.path.expanduser("~/Downloads/JDownloader"),
-                    os.path.expanduser("~/Downloads"),
-                    os.path.expanduser("~/Desktop"),
-                ]
-                public_dir = os.environ.get("PUBLIC")
-                if public_dir:
-                    jd_paths.insert(1, os.path.join(public_dir, "JDownloader", "Downloads"))
-
-                # Add target directory
-                if target_dir:
-                    jd_paths.insert(0, target_dir)
-                
-                jd_download_dirs = [d for d in jd_paths if os.path.exists(d)]
-                
-            except Exception:
-                jd_download_dirs = [os.path.expanduser("~/Downloads")]
-            
-            logging.info(f"🔍 Searching for '{filename}' in {len(jd_download_dirs)} directories...")
-            
-            # Search in each directory
-            for search_dir in jd_download_dirs:
-                logging.info(f"📁 Scanning: {search_dir}")
-                
-                # Search recursively but not too deep
-                for root, dirs, files in os.walk(search_dir):
-                    # Limit search depth to avoid performance issues
-                    level = root.replace(search_dir, '').count(os.sep)
-                    if level >= 3:  # Max 3 levels deep
-                        continue
-                    
-                    for file in files:
-                        file_path = os.path.join(root, file)
-
-                        # Skip temporary .part files until they finalize
-                        if file.lower().endswith('.part'):
-                            final_path = file_path[:-5]
-                            wait_time = 0
-                            max_wait = 300
-                            logging.info(
-                                f"⏳ Waiting for JDownloader to finalize: {file_path}")
-                            while wait_time < max_wait and not os.path.exists(final_path):
-                                time.sleep(1)
-                                wait_time += 1
-
-                            if os.path.exists(final_path):
-                                file_path = final_path
-                                file = os.path.basename(final_path)
-                                logging.info(
-                                    f"✅ Finalized file detected: {file_path}")
-                            else:
-                                logging.debug(
-                                    f"Skipping incomplete temporary file: {file_path}")
-                                continue
-                        # Exact filename match (case insensitive)
-                        if file.lower() == filename.lower():
+        return self._search_files_by_names([filename], target_dir).get(filename, [])
 
-                            # Check if file was created recently (within last 30 minutes)
-                            try:
-                                file_time = os.path.getctime(file_path)
-                                current_time = time.time()
-                                time_diff = current_time - file_time
-                                
-                                if time_diff <= 1800:  # 30 minutes
-                                    logging.info(f"✅ EXACT MATCH found: {file_path} (created {time_diff/60:.1f} min ago)")
-                                    
-                                    # Move to target directory if needed
-                                    if target_dir and root != target_dir:
-                                        try:
-                                            os.makedirs(target_dir, exist_ok=True)
-                                            new_path = os.path.join(target_dir, file)
-                                            
-                                            # Handle conflicts
-                                            counter = 1
-                                            while os.path.exists(new_path):
-                                                name, ext = os.path.splitext(file)
-                                                new_path = os.path.join(target_dir, f"{name}_{counter}{ext}")
-                                                counter += 1
-                                            
-                                            shutil.move(file_path, new_path)
-                                            downloaded_files.append(new_path)
-                                            logging.info(f"📦 Moved to target: {new_path}")
-                                        except Exception as e:
-                                            logging.error(f"❌ Move error: {e}")
-                                            downloaded_files.append(file_path)
-                                    else:
-                                        downloaded_files.append(file_path)
-                                        
-                                    # Found exact match, no need to continue searching this directory
-                                    break
-                                else:
-                                    logging.debug(f"⏰ File too old: {file_path} ({time_diff/60:.1f} min)")
-                                    
-                            except Exception as e:
-                                logging.error(f"❌ Error checking file time: {e}")
-                                continue
-                
-                # If we found files, break from directory search
-                if downloaded_files:
-                    break
-            
-            # If no exact match, try partial matching as fallback
-            if not downloaded_files:
-                logging.info(f"🔍 No exact match for '{filename}', trying partial match...")
-                base_name = os.path.splitext(filename)[0].lower()
-                
-                for search_dir in jd_download_dirs[:2]:  # Only search top 2 directories for partial
-                    for root, dirs, files in os.walk(search_dir):
-                        level = root.replace(search_dir, '').count(os.sep)
-                        if level >= 2:  # Shallower search for partial match
-                            continue
-                            
-                        for file in files:
-                            file_base = os.path.splitext(file)[0].lower()
-
-                            # Skip temporary .part files until they finalize
-                            file_path = os.path.join(root, file)
-                            if file.lower().endswith('.part'):
-                                final_path = file_path[:-5]
-                                wait_time = 0
-                                max_wait = 300
-                                logging.info(
-                                    f"⏳ Waiting for JDownloader to finalize: {file_path}")
-                                while wait_time < max_wait and not os.path.exists(final_path):
-                                    time.sleep(1)
-                                    wait_time += 1
-
-                                if os.path.exists(final_path):
-                                    file_path = final_path
-                                    file = os.path.basename(final_path)
-                                    file_base = os.path.splitext(file)[0].lower()
-                                    logging.info(
-                                        f"✅ Finalized file detected: {file_path}")
-                                else:
-                                    logging.debug(
-                                        f"Skipping incomplete temporary file: {file_path}")
-                                    continue
+    def _search_files_by_names(self, filenames, target_dir=None) -> dict:
+        """
+        Locate several files by exact (case-insensitive) name in one indexed
+        lookup, falling back to a partial name match for the ones not found.
+        Only files created within the last 30 minutes count.
+        """
+        results = {filename: [] for filename in filenames}
+        try:
+            locator = self._file_locator(target_dir)
+            # A file JD is still writing shows up as '<name>.part'
+            hits = locator.lookup(list(results) + [f"{filename}.part" for filename in results])
+            current_time = time.time()
 
-                            # Check if base names are similar
-                            if base_name in file_base or file_base in base_name:
+            def recent(file_path):
+                try:
+                    time_diff = current_time - os.path.getctime(file_path)
+                except OSError:
+                    return False
+                if time_diff > 1800:  # 30 minutes
+                    logging.debug(f"⏰ File too old: {file_path} ({time_diff/60:.1f} min)")
+                    return False
+                return True
 
-                                # Check recent creation
-                                try:
-                                    file_time = os.path.getctime(file_path)
-                                    current_time = time.time()
-                                    if current_time - file_time <= 1800:  # 30 minutes
-                                        logging.info(f"🎯 PARTIAL MATCH: {file_path}")
-                                        downloaded_files.append(file_path)
-                                        break
-                                except Exception:
-                                    continue
-                    
-                    if downloaded_files:
+            for filename in results:
+                candidates = hits[filename] or hits[f"{filename}.part"][:1]
+                for file_path in candidates:
+                    file_path = self._wait_for_finalized(file_path)
+                    if file_path and recent(file_path):
+                        logging.info(f"✅ EXACT MATCH found: {file_path}")
+                        results[filename].append(self._move_to_target(file_path, target_dir))
                         break
-            
+
+                if not results[filename]:
+                    # If no exact match, try partial matching as fallback
+                    base_name = os.path.splitext(filename)[0].lower()
+
+                    def similar(name):
+                        file_base = os.path.splitext(name)[0]
+                        return not name.endswith('.part') and (base_name in file_base or file_base in base_name)
+
+                    for file_path in locator.search(similar, refresh=False):
+                        if recent(file_path):
+                            logging.info(f"🎯 PARTIAL MATCH: {file_path}")
+                            results[filename].append(file_path)
+                            break
+
         except Exception as e:
             logging.error(f"❌ Error in file search: {e}")
-        
-        logging.info(f"🔍 Direct search result: {len(downloaded_files)} files found")
-        return downloaded_files
+
+        logging.info(f"🔍 Direct search result: {sum(map(len, results.values()))} files found")
+        return results
 
     def disconnect(self):
         """
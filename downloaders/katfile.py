@@ -7,6 +7,7 @@ from urllib.parse import urljoin
 from bs4 import BeautifulSoup
 from dotenv import load_dotenv
 from downloaders.base_downloader import BaseDownloader
+from downloaders.segmented import SegmentedDownloader
 
 # Load environment variables
 load_dotenv()
@@ -366,140 +367,36 @@ class KatfileDownloader(BaseDownloader):
         """
         Download from an existing response stream
         """
-        try:
-            safe_filename = self.sanitize_filename(filename)
-            dest_path = os.path.join(dest_dir, safe_filename)
-            temp_path = dest_path + ".downloading"
-            
-            total_size = int(response_stream.headers.get('content-length', 0))
-            downloaded = 0
-            
-            logging.info(f"Downloading {filename} ({total_size} bytes) to {dest_path}")
-            
-            # Enhanced progress tracking
-            start_time = time.time()
-            last_update_time = start_time
-            last_downloaded = 0
-            
-            display_name = self.format_progress_display_name(filename, "Katfile")
-            
-            with open(temp_path, 'wb') as f:
-                for chunk in response_stream.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
-                        downloaded += len(chunk)
-                        
-                        # Enhanced progress callback with timing and display info
-                        if progress_callback and total_size > 0:
-                            current_time = time.time()
-                            elapsed = current_time - start_time
-                            
-                            # Use adaptive reporting intervals
-                            report_interval = self.calculate_adaptive_interval(elapsed, current_time - last_update_time)
-                            
-                            # Only report if significant progress or enough time passed
-                            if (current_time - last_update_time) >= report_interval or downloaded == total_size:
-                                progress_percent = (downloaded / total_size) * 100
-                                # Enhanced progress callback with display name
-                                progress_callback(
-                                    downloaded, 
-                                    total_size, 
-                                    display_name,  # Enhanced display name
-                                    progress_percent  # Add percentage for consistency
-                                )
-                                last_update_time = current_time
-            
-            # Rename temp file to final name
-            if os.path.exists(temp_path):
-                if os.path.exists(dest_path):
-                    os.remove(dest_path)
-                os.rename(temp_path, dest_path)
-                logging.info(f"Successfully downloaded {filename}")
-                return True
-            else:
-                logging.error(f"Temporary file not found: {temp_path}")
-                return False
-                
-        except Exception as e:
-            logging.error(f"Error downloading from stream: {str(e)}", exc_info=True)
-            # Clean up temp file if it exists
-            temp_path = os.path.join(dest_dir, self.sanitize_filename(filename)) + ".downloading"
-            if os.path.exists(temp_path):
-                try:
-                    os.remove(temp_path)
-                except Exception:
-                    pass
-            return False
+        return self._segmented_download(
+            response_stream.url, filename, dest_dir, progress_callback, response=response_stream
+        )
 
     def _download_from_url(self, download_url, filename, dest_dir, progress_callback):
         """
         Download from a URL
         """
-        try:
-            safe_filename = self.sanitize_filename(filename)
-            dest_path = os.path.join(dest_dir, safe_filename)
-            temp_path = dest_path + ".downloading"
-            
-            logging.info(f"Starting download from URL: {download_url}")
-            
-            response = self.session.get(download_url, stream=True, timeout=30)
-            response.raise_for_status()
-            
-            total_size = int(response.headers.get('content-length', 0))
-            downloaded = 0
-            
-            logging.info(f"Downloading {filename} ({total_size} bytes) to {dest_path}")
-            
-            # Enhanced progress tracking for URL downloads
-            start_time = time.time()
-            last_update_time = start_time
-            
-            display_name = self.format_progress_display_name(filename, "Katfile")
-            
-            with open(temp_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
-                        downloaded += len(chunk)
-                        
-                        # Enhanced progress callback with timing and display info
-                        if progress_callback and total_size > 0:
-                            current_time = time.time()
-                            elapsed = current_time - start_time
-                            
-                            # Use adaptive reporting intervals
-                            report_interval = self.calculate_adaptive_interval(elapsed, current_time - last_update_time)
-                            
-                            # Only report if significant progress or enough time passed
-                            if (current_time - last_update_time) >= report_interval or downloaded == total_size:
-                                progress_percent = (downloaded / total_size) * 100
-                                # Enhanced progress callback with display name
-                                progress_callback(
-                                    downloaded, 
-                                    total_size, 
-                                    display_name,  # Enhanced display name
-                                    progress_percent  # Add percentage for consistency
-                                )
-                                last_update_time = current_time
-            
-            # Rename temp file to final name
-            if os.path.exists(temp_path):
-                if os.path.exists(dest_path):
-                    os.remove(dest_path)
-                os.rename(temp_path, dest_path)
-                logging.info(f"Successfully downloaded {filename}")
-                return True
-            else:
-                logging.error(f"Temporary file not found: {temp_path}")
-                return False
-                
-        except Exception as e:
-            logging.error(f"Error downloading from URL: {str(e)}", exc_info=True)
-            # Clean up temp file if it exists
-            temp_path = os.path.join(dest_dir, self.sanitize_filename(filename)) + ".downloading"
-            if os.path.exists(temp_path):
-                try:
-                    os.remove(temp_path)
-                except Exception:
-                    pass
-            return False
+        logging.info(f"Starting download from URL: {download_url}")
+        return self._segmented_download(download_url, filename, dest_dir, progress_callback)
+
+    def _segmented_download(self, download_url, filename, dest_dir, progress_callback, response=None):
+        """
+        Download with parallel byte-range segments when Katfile allows ``Range``
+        (premium direct links). An interrupted download keeps its ``.part`` file
+        and sidecar state and resumes on the next attempt.
+        """
+        safe_filename = self.sanitize_filename(filename)
+        dest_path = os.path.join(dest_dir, safe_filename)
+        display_name = self.format_progress_display_name(filename, "Katfile")
+        logging.info(f"Downloading {filename} to {dest_path}")
+
+        def _report(downloaded, total_size, name):
+            # Enhanced progress callback with display name and percentage
+            progress_callback(downloaded, total_size, name, (downloaded / total_size) * 100)
+
+        callback = _report if progress_callback else None
+
+        engine = SegmentedDownloader(self.session, segments=self.download_segments())
+        if engine.download(download_url, dest_path, callback, display_name, response=response):
+            logging.info(f"Successfully downloaded {filename}")
+            return True
+        return False
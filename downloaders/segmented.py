@@ -0,0 +1,427 @@
+"""Segmented, resumable multi-connection HTTP downloader.
+
+Premium Rapidgator/Katfile direct links answer ``Range`` requests, so a single
+throttled connection is not the limit.  :class:`SegmentedDownloader` splits the
+file into byte-range segments that are fetched concurrently and written in
+place into a preallocated ``<dest>.part`` file.  Progress of every segment is
+kept in a small JSON sidecar (``<dest>.part.json``) so an interrupted download
+resumes where it stopped instead of starting over.
+
+Servers that do not support ranges (or do not report a size) are streamed
+over one connection, like the old ``iter_content`` loops did.
+
+Progress goes through the usual ``progress_callback(cur, total, filename)``
+contract with the bytes of all segments aggregated.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+PART_SUFFIX = ".part"
+STATE_SUFFIX = ".part.json"
+
+_CONTENT_RANGE_RE = re.compile(r"bytes\s+(\d+)-(\d+)/(\d+|\*)", re.I)
+
+ProgressCallback = Callable[[int, int, str], None]
+
+
+class DownloadCancelled(Exception):
+    """Raised inside segment workers when the cancel event is set."""
+
+
+class _Segment:
+    __slots__ = ("start", "end", "done", "flushed")
+
+    def __init__(self, start: int, end: int, done: int = 0) -> None:
+        self.start = start
+        self.end = end  # inclusive
+        self.done = done
+        # Bytes known to be on disk; only this offset goes into the sidecar
+        self.flushed = done
+
+    @property
+    def length(self) -> int:
+        return self.end - self.start + 1
+
+    @property
+    def finished(self) -> bool:
+        return self.done >= self.length
+
+
+def _split(size: int, count: int) -> List[_Segment]:
+    count = max(1, min(count, size)) if size else 1
+    step = size // count
+    segments = []
+    start = 0
+    for i in range(count):
+        end = size - 1 if i == count - 1 else start + step - 1
+        segments.append(_Segment(start, end))
+        start = end + 1
+    return segments
+
+
+class SegmentedDownloader:
+    """Download a URL with ``segments`` concurrent ``Range`` requests.
+
+    Parameters
+    ----------
+    session:
+        ``requests.Session`` carrying the host's login cookies.  It is shared
+        by the segment threads (``requests`` sessions are safe for concurrent
+        ``get`` calls on independent connections).
+    segments:
+        Maximum number of concurrent connections.
+    min_segment_size:
+        Files are never split into segments smaller than this; small files
+        therefore use fewer connections.
+    cancel_event:
+        Optional ``threading.Event``; when set the download stops, keeps its
+        sidecar state and returns ``False``.
+    """
+
+    def __init__(
+        self,
+        session: Optional[requests.Session] = None,
+        segments: int = 4,
+        min_segment_size: int = 8 * 1024 * 1024,
+        chunk_size: int = 1024 * 1024,
+        timeout: float = 60,
+        max_retries: int = 3,
+        progress_interval: float = 0.5,
+        cancel_event: Optional[threading.Event] = None,
+        headers: Optional[dict] = None,
+    ) -> None:
+        self.session = session or requests.Session()
+        self.segments = max(1, int(segments))
+        self.min_segment_size = max(1, int(min_segment_size))
+        self.chunk_size = chunk_size
+        self.timeout = timeout
+        self.max_retries = max(0, int(max_retries))
+        self.progress_interval = progress_interval
+        self.cancel_event = cancel_event
+        self.headers = dict(headers or {})
+
+        self._lock = threading.Lock()
+        self._progress_callback: Optional[ProgressCallback] = None
+        self._display_name = ""
+        self._total = 0
+        self._last_progress = 0.0
+        self._last_state_save = 0.0
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    def download(
+        self,
+        url: str,
+        dest_path: str,
+        progress_callback: Optional[ProgressCallback] = None,
+        display_name: Optional[str] = None,
+        response: Optional[requests.Response] = None,
+    ) -> bool:
+        """Download *url* to *dest_path*; return ``True`` on success.
+
+        *response* may be an already-open streaming response for *url* (the
+        direct-link probe most downloaders do); it is used to learn the size
+        and range support and is consumed directly when the server cannot do
+        ranges.
+        """
+        self._progress_callback = progress_callback
+        self._display_name = display_name or os.path.basename(dest_path)
+        part_path = dest_path + PART_SUFFIX
+        state_path = dest_path + STATE_SUFFIX
+
+        try:
+            if response is not None:
+                url = getattr(response, "url", None) or url
+                size, ranges, validator = self._describe(response)
+            else:
+                response, size, ranges, validator = self._probe(url)
+
+            if not ranges or not size:
+                logger.info(f"⬇️ Range requests unsupported for {self._display_name}; using one connection")
+                return self._single_stream(response, url, dest_path, part_path)
+
+            if response is not None:
+                response.close()
+
+            segments = self._load_state(state_path, part_path, url, size, validator)
+            if segments is None:
+                count = min(self.segments, max(1, size // self.min_segment_size))
+                segments = _split(size, count)
+                self._preallocate(part_path, size)
+            else:
+                resumed = sum(s.done for s in segments)
+                logger.info(
+                    f"🔁 Resuming {self._display_name} at {resumed}/{size} bytes "
+                    f"({len(segments)} segments)"
+                )
+
+            self._total = size
+            ok = self._run_segments(url, part_path, state_path, segments, validator)
+            if not ok:
+                return False
+
+            os.replace(part_path, dest_path)
+            self._remove(state_path)
+            self._report(size, force=True)
+            logger.info(f"✅ Downloaded {self._display_name} ({size} bytes, {len(segments)} segments)")
+            return True
+        except DownloadCancelled:
+            logger.info(f"⏹️ Download cancelled: {self._display_name}")
+            return False
+        except Exception as e:
+            logger.error(f"❌ Segmented download failed for {self._display_name}: {e}", exc_info=True)
+            return False
+        finally:
+            self._progress_callback = None
+
+    # ------------------------------------------------------------------
+    # Probing
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _describe(response: requests.Response, range_requested: bool = False):
+        headers = response.headers
+        size = 0
+        m = _CONTENT_RANGE_RE.match(headers.get("Content-Range", "") or "")
+        if response.status_code == 206 and m and m.group(3) != "*":
+            size = int(m.group(3))
+            ranges = True
+        else:
+            try:
+                size = int(headers.get("Content-Length") or 0)
+            except ValueError:
+                size = 0
+            # A 200 answer to our own Range probe means the range was ignored.
+            ranges = not range_requested and (headers.get("Accept-Ranges") or "").lower() == "bytes"
+        validator = headers.get("ETag") or headers.get("Last-Modified") or ""
+        return size, ranges, validator
+
+    def _probe(self, url: str):
+        """Open *url* with ``Range: bytes=0-`` and inspect the answer.
+
+        The response is returned so the single-connection path can keep
+        reading it when the server ignores the range.
+        """
+        headers = dict(self.headers, Range="bytes=0-")
+        response = self.session.get(url, headers=headers, stream=True, timeout=self.timeout)
+        response.raise_for_status()
+        size, ranges, validator = self._describe(response, range_requested=True)
+        return response, size, ranges, validator
+
+    # ------------------------------------------------------------------
+    # Sidecar state
+    # ------------------------------------------------------------------
+    def _load_state(self, state_path, part_path, url, size, validator) -> Optional[List[_Segment]]:
+        if not (os.path.exists(state_path) and os.path.exists(part_path)):
+            return None
+        try:
+            with open(state_path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+            if state.get("size") != size or os.path.getsize(part_path) != size:
+                raise ValueError("size changed")
+            if validator and state.get("validator") and state["validator"] != validator:
+                raise ValueError("remote file changed")
+            segments = [_Segment(int(s), int(e), int(d)) for s, e, d in state["segments"]]
+            if not segments or segments[0].start != 0 or segments[-1].end != size - 1:
+                raise ValueError("bad segment table")
+            return segments
+        except Exception as e:
+            logger.warning(f"⚠️ Ignoring resume state for {self._display_name}: {e}")
+            self._remove(state_path)
+            return None
+
+    def _save_state(self, state_path, url, segments, validator) -> None:
+        state = {
+            "url": url,
+            "size": self._total,
+            "validator": validator,
+            "segments": [[s.start, s.end, s.flushed] for s in segments],
+        }
+        tmp = state_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(tmp, state_path)
+
+    # ------------------------------------------------------------------
+    # Transfers
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _preallocate(part_path: str, size: int) -> None:
+        os.makedirs(os.path.dirname(part_path) or ".", exist_ok=True)
+        with open(part_path, "wb") as f:
+            f.truncate(size)
+
+    def _run_segments(self, url, part_path, state_path, segments, validator) -> bool:
+        pending = [s for s in segments if not s.finished]
+        self._report(sum(s.done for s in segments), force=True)
+        errors: List[BaseException] = []
+        with ThreadPoolExecutor(max_workers=max(1, len(pending)), thread_name_prefix="segdl") as pool:
+            futures = [
+                pool.submit(self._fetch_segment, url, part_path, state_path, seg, segments, validator)
+                for seg in pending
+            ]
+            for fut in futures:
+                try:
+                    fut.result()
+                except BaseException as e:  # keep the other segments' progress
+                    errors.append(e)
+
+        with self._lock:
+            self._save_state(state_path, url, segments, validator)
+        if errors:
+            if any(isinstance(e, DownloadCancelled) for e in errors):
+                raise DownloadCancelled()
+            logger.error(
+                f"❌ {len(errors)} segment(s) of {self._display_name} failed; "
+                f"state kept for resume: {errors[0]}"
+            )
+            return False
+        return all(s.finished for s in segments)
+
+    def _fetch_segment(self, url, part_path, state_path, seg, segments, validator) -> None:
+        attempt = 0
+        while not seg.finished:
+            self._check_cancel()
+            before = seg.done
+            start = seg.start + seg.done
+            headers = dict(self.headers, Range=f"bytes={start}-{seg.end}")
+            if validator:
+                headers["If-Range"] = validator
+            try:
+                with self.session.get(url, headers=headers, stream=True, timeout=self.timeout) as r:
+                    if r.status_code != 206:
+                        raise IOError(f"expected 206 for range {start}-{seg.end}, got {r.status_code}")
+                    with open(part_path, "r+b") as f:
+                        f.seek(start)
+                        synced_at = time.monotonic()
+                        try:
+                            for chunk in r.iter_content(self.chunk_size):
+                                self._check_cancel()
+                                if not chunk:
+                                    continue
+                                room = seg.length - seg.done
+                                if len(chunk) > room:
+                                    chunk = chunk[:room]
+                                f.write(chunk)
+                                with self._lock:
+                                    seg.done += len(chunk)
+                                if time.monotonic() - synced_at >= 1.0:
+                                    # Never record offsets whose bytes are still in Python's buffer
+                                    self._sync(f, seg)
+                                    synced_at = time.monotonic()
+                                    with self._lock:
+                                        self._maybe_save_state(state_path, url, segments, validator)
+                                self._report(sum(s.done for s in segments))
+                                if seg.finished:
+                                    break
+                        finally:
+                            self._sync(f, seg)
+                if not seg.finished:
+                    raise IOError(f"connection closed at byte {seg.start + seg.done}")
+            except DownloadCancelled:
+                raise
+            except Exception as e:
+                attempt = 1 if seg.done > before else attempt + 1
+                if attempt > self.max_retries:
+                    raise
+                delay = min(2 ** attempt, 30)
+                logger.warning(
+                    f"⚠️ Segment {seg.start}-{seg.end} of {self._display_name} failed ({e}); "
+                    f"retry {attempt}/{self.max_retries} in {delay}s"
+                )
+                time.sleep(delay)
+
+    def _single_stream(self, response, url, dest_path, part_path) -> bool:
+        """Old-style single-connection download for servers without ranges."""
+        if response is None:
+            response = self.session.get(url, headers=self.headers, stream=True, timeout=self.timeout)
+            response.raise_for_status()
+        try:
+            total = int(response.headers.get("Content-Length") or 0)
+        except ValueError:
+            total = 0
+        self._total = total
+        done = 0
+        try:
+            os.makedirs(os.path.dirname(part_path) or ".", exist_ok=True)
+            with open(part_path, "wb") as f:
+                for chunk in response.iter_content(self.chunk_size):
+                    self._check_cancel()
+                    if not chunk:
+                        continue
+                    f.write(chunk)
+                    done += len(chunk)
+                    if total:
+                        self._report(done)
+            if total and done != total:
+                raise IOError(f"size mismatch: expected {total}, got {done}")
+        except BaseException:
+            # Without range support there is nothing to resume from.
+            self._remove(part_path)
+            raise
+        finally:
+            response.close()
+        os.replace(part_path, dest_path)
+        if total:
+            self._report(total, force=True)
+        logger.info(f"✅ Downloaded {self._display_name} ({done} bytes, single connection)")
+        return True
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+    def _check_cancel(self) -> None:
+        if self.cancel_event is not None and self.cancel_event.is_set():
+            raise DownloadCancelled()
+
+    def _sync(self, f, seg: _Segment) -> None:
+        """Flush *seg*'s file to disk and mark its written bytes as durable."""
+        f.flush()
+        os.fsync(f.fileno())
+        with self._lock:
+            seg.flushed = seg.done
+
+    def _maybe_save_state(self, state_path, url, segments, validator) -> None:
+        """Persist segment progress at most once a second (caller holds the lock)."""
+        now = time.monotonic()
+        if now - self._last_state_save >= 1.0:
+            self._last_state_save = now
+            self._save_state(state_path, url, segments, validator)
+
+    def _report(self, current: int, force: bool = False) -> None:
+        callback = self._progress_callback
+        if not callback or not self._total:
+            return
+        now = time.monotonic()
+        with self._lock:
+            if not force and now - self._last_progress < self.progress_interval:
+                return
+            self._last_progress = now
+        try:
+            callback(current, self._total, self._display_name)
+        except Exception:
+            logger.debug("progress callback failed", exc_info=True)
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            if os.path.exists(path):
+                os.remove(path)
+        except OSError:
+            pass
+
+
+__all__ = ["SegmentedDownloader", "DownloadCancelled", "PART_SUFFIX", "STATE_SUFFIX"]
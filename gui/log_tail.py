@@ -0,0 +1,211 @@
+"""Tail-following reader behind the "Log Output" page.
+
+``load_log_file`` used to read the whole ``forum_bot.log`` every five seconds
+and hand it to ``setPlainText``; with DEBUG logging the file grew to hundreds
+of MB.  This module keeps a file-position cursor instead:
+
+* :class:`LogTail` memory-maps the file once to find the start of the last
+  *N* records, then only reads the bytes appended since the cursor and
+  notices truncation/rotation (size shrank or the file was replaced);
+* records are a header line (``12:00:01 INFO …``) plus its continuation
+  lines (tracebacks), so level/keyword filters keep tracebacks together;
+* :class:`LogTailWorker` polls and filters on its own ``QThread`` and hands
+  the GUI only the lines to append — the widget itself is a
+  ``QPlainTextEdit`` with a maximum block count.
+
+Files are opened per poll and closed again so a ``RotatingFileHandler`` can
+rename them (Windows refuses to rename open files).
+"""
+
+from __future__ import annotations
+
+import logging
+import mmap
+import os
+import re
+import threading
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+from PyQt5.QtCore import QThread, pyqtSignal
+
+logger = logging.getLogger(__name__)
+
+LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+_LEVEL_RANK = {name: rank for rank, name in enumerate(LEVELS)}
+_LEVEL_RE = re.compile(r"\b(DEBUG|INFO|WARNING|ERROR|CRITICAL)\b")
+_HEADER_SPAN = 48  # the level name sits right after the timestamp
+
+def record_level(line: str) -> Optional[str]:
+    """Level of a record header line, ``None`` for continuation lines."""
+    match = _LEVEL_RE.search(line, 0, _HEADER_SPAN)
+    return match.group(1) if match else None
+
+
+@dataclass(frozen=True)
+class LogFilter:
+    """Minimum level plus a case-insensitive keyword, matched on the header line."""
+
+    min_level: str = "DEBUG"
+    keyword: str = ""
+
+    def matches(self, level: Optional[str], header: str) -> bool:
+        if level is not None and _LEVEL_RANK.get(level, 0) < _LEVEL_RANK.get(self.min_level, 0):
+            return False
+        return not self.keyword or self.keyword.lower() in header.lower()
+
+
+class LogTail:
+    """Cursor over a growing (and possibly rotated) text log file."""
+
+    def __init__(self, path: str, scan_limit: int = 64 * 1024 * 1024) -> None:
+        self.path = path
+        self.scan_limit = scan_limit  # bytes inspected when looking for the tail
+        self.position = 0
+        self._identity: Optional[Tuple[int, int]] = None
+        self._partial = b""
+        self._record_matches = True  # filter state of the record being continued
+
+    def _stat(self) -> Optional[os.stat_result]:
+        try:
+            return os.stat(self.path)
+        except OSError:
+            return None
+
+    @staticmethod
+    def _decode(raw: bytes) -> str:
+        return raw.decode("utf-8", errors="replace")
+
+    def tail(self, max_lines: int, flt: LogFilter = LogFilter()) -> List[str]:
+        """The last *max_lines* lines of matching records; moves the cursor to EOF."""
+        st = self._stat()
+        self._partial = b""
+        self._record_matches = True
+        if st is None:
+            self.position, self._identity = 0, None
+            return []
+        self._identity = (st.st_dev, st.st_ino)
+        if st.st_size == 0:
+            self.position = 0
+            return []
+        with open(self.path, "rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            size = len(mm)
+            end = size
+            if mm[size - 1:size] != b"\n":
+                # Keep a trailing partial line for the next read
+                cut = mm.rfind(b"\n") + 1
+                self._partial = mm[cut:size]
+                end = cut
+            self.position = size
+            floor = max(0, end - self.scan_limit)
+            kept: List[str] = []
+            pending: List[str] = []  # continuation lines seen (backwards) before their header
+            while end > floor and len(kept) < max_lines:
+                start = mm.rfind(b"\n", floor, end - 1) + 1
+                if start == 0 and floor > 0:
+                    break  # header lies before the scan window
+                line = self._decode(mm[start:end]).rstrip("\r\n")
+                end = start
+                level = record_level(line)
+                if level is None and end > floor:
+                    pending.append(line)
+                    continue
+                if flt.matches(level, line):
+                    pending.append(line)
+                    kept.extend(pending)
+                pending = []
+        kept.reverse()
+        return kept[-max_lines:]
+
+    def read_new(self, flt: LogFilter = LogFilter()) -> Tuple[List[str], bool]:
+        """Complete lines appended since the last call, filtered.
+
+        Returns ``(lines, restarted)``; ``restarted`` is true when the file
+        was truncated or replaced and reading started over at its beginning.
+        """
+        st = self._stat()
+        if st is None:
+            return [], False
+        restarted = False
+        identity = (st.st_dev, st.st_ino)
+        if identity != self._identity or st.st_size < self.position:
+            restarted = self._identity is not None
+            self._identity = identity
+            self.position = 0
+            self._partial = b""
+        if st.st_size == self.position:
+            return [], restarted
+        with open(self.path, "rb") as fh:
+            fh.seek(self.position)
+            raw = fh.read(st.st_size - self.position)
+        self.position += len(raw)
+        data = self._partial + raw
+        complete, sep, self._partial = data.rpartition(b"\n")
+        if not sep:
+            self._partial = data
+            return [], restarted
+        lines = []
+        for line in self._decode(complete).split("\n"):
+            line = line.rstrip("\r")
+            level = record_level(line)
+            if level is not None:
+                self._record_matches = flt.matches(level, line)
+            if self._record_matches:
+                lines.append(line)
+        return lines, restarted
+
+
+class LogTailWorker(QThread):
+    """Polls a :class:`LogTail` off the GUI thread and emits lines to show."""
+
+    lines_appended = pyqtSignal(list)
+    lines_reset = pyqtSignal(list)
+
+    def __init__(self, path: str, max_lines: int = 5000, interval_ms: int = 1000, parent=None) -> None:
+        super().__init__(parent)
+        self.tail = LogTail(path)
+        self.max_lines = max_lines
+        self.interval_ms = interval_ms
+        self._filter = LogFilter()
+        self._lock = threading.Lock()
+        self._rescan = True
+        self._wake = False  # set to cut the current poll interval short
+        self._stop = threading.Event()
+
+    def set_filter(self, min_level: str, keyword: str) -> None:
+        """Thread-safe; the view is rebuilt from the file tail on the next poll."""
+        with self._lock:
+            self._filter = LogFilter(min_level if min_level in _LEVEL_RANK else "DEBUG", keyword.strip())
+            self._rescan = True
+        self._wake = True
+
+    def stop(self) -> None:
+        self._stop.set()
+        self.wait(2000)
+
+    def poll_once(self) -> None:
+        with self._lock:
+            flt, rescan, self._rescan = self._filter, self._rescan, False
+        try:
+            if rescan:
+                self.lines_reset.emit(self.tail.tail(self.max_lines, flt))
+                return
+            lines, restarted = self.tail.read_new(flt)
+            if restarted:
+                logger.debug(f"Log file {self.tail.path} rotated, following the new file")
+            if lines:
+                self.lines_appended.emit(lines[-self.max_lines:])
+        except Exception as e:
+            logger.debug(f"Log tail poll failed: {e}")
+
+    def run(self) -> None:
+        while not self._stop.is_set():
+            self._wake = False
+            self.poll_once()
+            waited = 0
+            while waited < self.interval_ms and not self._wake and not self._stop.is_set():
+                self.msleep(50)
+                waited += 50
+
+
+__all__ = ["LEVELS", "LogFilter", "LogTail", "LogTailWorker", "record_level"]
@@ -1,9 +1,8 @@
 # ★ Inserts Keeplinks + host links at {LINKS} placeholder ★
 
-import hashlib
 import logging
 from pathlib import Path
-from integrations.jd_client import JDClient, hard_cancel
+from integrations.jd_client import get_jd_client, hard_cancel
 from PyQt5.QtWidgets import QAction, QApplication, QPlainTextEdit
 
 from config.config import DATA_DIR, save_configuration
@@ -26,13 +25,14 @@ import subprocess
 import sys
 import time
 import webbrowser
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from urllib.parse import urlparse, urlunparse, urlsplit, urlunsplit
 
 import requests
 from bs4 import BeautifulSoup, NavigableString
 from PyQt5 import QtCore
-from PyQt5.QtCore import (Q_ARG, QDateTime, QMetaObject, QMutex, QMutexLocker,
+from PyQt5.QtCore import (Q_ARG, QDateTime, QMetaObject,
                           QObject, QSize, Qt, QThread, QThreadPool, QTimer,
                           QUrl, pyqtSignal, pyqtSlot)
 from PyQt5.QtGui import (QBrush, QColor, QFont, QGuiApplication, QIcon,
@@ -59,12 +59,19 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.wait import WebDriverWait
 import templab_manager
+from common.logging_setup import apply_module_levels
 from core.category_manager import CategoryManager
+from core.driver_pool import DEFAULT_LEASE_TIMEOUT, DriverPool, default_pool_size
 from core.file_monitor import FileMonitor
 from core.file_processor import FileProcessor
+from core.hash_cache import get_hash_cache
 from core.job_manager import JobManager, QueueOrchestrator
+from core.progress_bus import DEFAULT_FPS, ProgressBus
+from core.rg_link_checker import get_rg_link_checker
 from core.selenium_bot import ForumBotSelenium as SeleniumBot
+from core.thread_store import SECTION_BACKUP, SECTION_MEGATHREADS, SECTION_PROCESS, get_thread_store
 from core.user_manager import get_user_manager
+from core.write_behind import get_write_behind
 from dotenv import find_dotenv, set_key
 from gui.advanced_bbcode_editor import AdvancedBBCodeEditor
 from gui.utils.responsive_manager import ResponsiveManager
@@ -76,7 +83,7 @@ from utils.host_priority import (
     get_highest_priority_host,
     filter_direct_links_for_host,
 )
-from utils.link_cache import persist_link_replacement
+from utils.link_cache import link_status_ttls, persist_link_replacement, split_fresh_links
 from utils.link_summary import LinkCheckSummary
 from workers.login_thread import LoginThread
 from workers.link_check_worker import LinkCheckWorker, CONTAINER_HOSTS, is_container_host
@@ -154,6 +161,10 @@ from .stats_widget import StatsWidget
 # MAGICAL TRANSFORMATION - Replace chaos with PERFECTION!
 from gui.professional_status_widget import ProfessionalStatusWidget as StatusWidget
 from .upload_status_handler import UploadStatusHandler
+from .log_tail import LEVELS as LOG_LEVELS, LogTailWorker
+from .table_row_index import TableRowIndex
+from .thread_filter_index import ALL_STATUSES, ThreadFilterIndex, status_mask
+from .table_pager import DEFAULT_PAGE_SIZE, LazyTablePager
 
 
 # import the DownloadWorker AGAIN if needed
@@ -293,42 +304,76 @@ class LinkStatusDelegate(QStyledItemDelegate):
         else:
             super().paint(painter, option, index)
 
+def rg_thread_result(links: list, results: dict) -> dict:
+    """``{'status','dead_links','checked_at'}`` for a thread from per-link checker results.
+
+    A link whose check failed (``None``) makes the thread ``'unknown'``
+    unless another link is already known to be dead.
+    """
+    dead = [l for l in links if results.get(l) is not None and results[l].get('status') != 'alive']
+    unknown = any(results.get(l) is None for l in links)
+    if not links:
+        status = 'none'
+    elif dead:
+        status = 'dead'
+    elif unknown:
+        status = 'unknown'
+    else:
+        status = 'alive'
+    return {'status': status, 'dead_links': dead, 'checked_at': int(time.time())}
+
+
 class RGLinkBatchWorker(QThread):
-    """Batch-check Rapidgator links for many threads with rate limiting.
+    """Batch-check Rapidgator links for many threads through the shared RG link checker.
+
+    The links of all threads go to :class:`~core.rg_link_checker.RGLinkChecker`
+    together (multi-URL requests, shared rate limit, cached results); a
+    thread's result is emitted as soon as all of its links are known.
 
     Signals:
     - progress_update(object): OperationStatus updates
-    - thread_checked(str, dict): {'status','dead_links','checked_at'}
+    - threads_checked(list): [(title, {'status','dead_links','checked_at'}), ...] per batch
     - finished(int): total processed thread count
     """
     progress_update = pyqtSignal(object)
-    thread_checked = pyqtSignal(str, dict)
+    threads_checked = pyqtSignal(list)
     finished = pyqtSignal(int)
 
     def __init__(self, bot: SeleniumBot, tasks: list, *,
                  rate_limit_per_min: int = 60,
-                 min_sleep_between_threads: float = 0.5,
+                 batch_size: int = 25,
+                 force: bool = False,
                  parent: QObject | None = None):
         super().__init__(parent)
         self.bot = bot
         self.tasks = list(tasks or [])  # [{'title': str, 'links': [..]}, ...] أو [(title, info)]
         self.rate_limit_per_min = max(1, int(rate_limit_per_min or 60))
-        self.min_interval = 60.0 / float(self.rate_limit_per_min)
-        self.min_sleep_between_threads = max(0.0, float(min_sleep_between_threads or 0.0))
+        self.batch_size = max(1, int(batch_size or 25))
+        self.force = force
         self._cancelled = False
 
     def request_stop(self):
         self._cancelled = True
 
-    def run(self):
-        import time
-        checked = 0
-        next_allowed = 0.0
+    def _final_status(self, title: str, result: dict) -> OperationStatus:
+        status = result['status']
+        if status == 'none':
+            stage, msg = OpStage.ERROR, "No RG links"
+        elif status == 'dead':
+            stage, msg = OpStage.ERROR, f"Dead: {len(result['dead_links'])}"
+        elif status == 'unknown':
+            stage, msg = OpStage.ERROR, "Check failed"
+        else:
+            stage, msg = OpStage.FINISHED, "Complete"
+        # حالة نهائية بـ 100% علشان Clear Finished/Errors يمسح البنود
+        return OperationStatus(
+            section="Backup Link Check", item=title, op_type=OpType.POST,
+            stage=stage, message=msg, progress=100, host="rapidgator",
+        )
 
+    def run(self):
+        threads = []  # [(title, links)]
         for task in self.tasks:
-            if self._cancelled:
-                break
-
             # يدعم شكلين للـtasks: dict أو tuple
             if isinstance(task, dict):
                 title = task.get('title', '').strip()
@@ -336,74 +381,54 @@ class RGLinkBatchWorker(QThread):
             else:
                 title, info = task  # (title, info)
                 links = [str(l).strip() for l in (info.get('rapidgator_links') or []) if str(l).strip()]
+            threads.append((title, list(dict.fromkeys(links))))
+
+        results: dict = {}
+        waiting: dict = {}    # url -> indexes of threads still waiting for it
+        remaining: list = []  # per thread: links without a result yet
+        for idx, (_, links) in enumerate(threads):
+            remaining.append(len(links))
+            for link in links:
+                waiting.setdefault(link, []).append(idx)
+        checked = 0
 
-            # ── حالة 0 لينك: انهى فوراً بتحذير وتقدم 100% ─────────────────────
-            if not links:
-                self.thread_checked.emit(title, {
-                    'status': 'none',
-                    'dead_links': [],
-                    'checked_at': int(time.time()),
-                })
-                self.progress_update.emit(OperationStatus(
-                    section="Backup Link Check", item=title, op_type=OpType.POST,
-                    stage=OpStage.ERROR, message="No RG links", progress=100, host="rapidgator",
-                ))
-                checked += 1
-                time.sleep(self.min_sleep_between_threads)
-                continue
-
-            dead = []
-            total = len(links)
-
-            for i, link in enumerate(links, 1):
-                if self._cancelled:
-                    break
-
-                # Rate limit (بسيط وثابت)
-                sleep_for = max(0.0, next_allowed - time.time())
-                if sleep_for > 0:
-                    time.sleep(sleep_for)
-
-                alive = False
-                try:
-                    res = self.bot.check_rapidgator_link_status(link)
-                    alive = bool(res and res.get('status') == 'ACCESS')
-                except Exception:
-                    alive = False
-
-                if not alive:
-                    dead.append(link)
-
-                pct = int(i * 100 / total)
-                self.progress_update.emit(OperationStatus(
-                    section="Backup Link Check", item=title, op_type=OpType.POST,
-                    stage=OpStage.RUNNING, message=f"Checking RG ({i}/{total})",
-                    progress=pct, host="rapidgator",
-                ))
-                next_allowed = time.time() + self.min_interval
-
-            if self._cancelled:
-                break
-
-            status = 'dead' if dead else 'alive'
-            final_stage = OpStage.ERROR if dead else OpStage.FINISHED
-            final_msg = f"Dead: {len(dead)}/{total}" if dead else "Complete"
-
-            # أرسل نتيجة الثريد بشكل متوافق مع on_rg_thread_checked()
-            self.thread_checked.emit(title, {
-                'status': status,
-                'dead_links': dead,
-                'checked_at': int(time.time()),
-            })
-            # حالة نهائية بـ 100% علشان Clear Finished/Errors يمسح البنود
-            self.progress_update.emit(OperationStatus(
-                section="Backup Link Check", item=title, op_type=OpType.POST,
-                stage=final_stage, message=final_msg, progress=100, host="rapidgator",
-            ))
-
-            checked += 1
-            time.sleep(self.min_sleep_between_threads)
-
+        def emit_done(indexes):
+            nonlocal checked
+            done = []
+            for idx in indexes:
+                title, links = threads[idx]
+                result = rg_thread_result(links, results)
+                done.append((title, result))
+                self.progress_update.emit(self._final_status(title, result))
+            if done:
+                checked += len(done)
+                self.threads_checked.emit(done)
+
+        def on_batch(batch):
+            finished = []
+            for url, res in batch.items():
+                results[url] = res
+                for idx in waiting.pop(url, ()):
+                    remaining[idx] -= 1
+                    if remaining[idx] == 0:
+                        finished.append(idx)
+            emit_done(finished)
+
+        # ── threads with 0 links finish right away ─────────────────────
+        emit_done([idx for idx, (_, links) in enumerate(threads) if not links])
+
+        checker = get_rg_link_checker(self.bot.rapidgator_check_token)
+        checker.set_rate(self.rate_limit_per_min)
+        checker.batch_size = self.batch_size
+        try:
+            checker.check(list(waiting), force=self.force, on_batch=on_batch,
+                          cancelled=lambda: self._cancelled)
+        except Exception as e:
+            logging.error(f"RG batch check failed: {e}")
+        logging.info(
+            f"RG check: {checked}/{len(threads)} threads, {len(results)} links, "
+            f"{checker.stats['requests']} API requests so far, cache {checker.cache.stats()}"
+        )
         self.finished.emit(checked)
 
 class ReplyBatchWorker(QThread):
@@ -531,6 +556,7 @@ class ForumBotGUI(QMainWindow):
         self._ui_noise_filter = _UiNoiseFilter()
         for handler in logging.getLogger().handlers:
             handler.addFilter(self._ui_noise_filter)
+        apply_module_levels(self.config.get('log_levels'))
         # Ensure no previously restored session leaks into the new UI
         # MODIFIED: Clear session but preserve user and process threads
         if self.user_manager.get_current_user():
@@ -581,12 +607,10 @@ class ForumBotGUI(QMainWindow):
         self.link_check_worker = None
         self._link_check_cache = {}
         self._load_link_check_cache()
-        self.by_raw_url = {}
-        self.by_canonical = {}
-        self.by_host_id = {}
-        # Backward-compatibility aliases
-        self.row_index_by_url = self.by_canonical
-        self.row_index_by_hostid = self.by_host_id
+
+        # Small JSON files (jobs, link cache, settings…) are written behind,
+        # at most once per file per window
+        get_write_behind().window = float(self.config.get("write_behind_window_ms", 1000)) / 1000.0
 
         # Initialize Rapidgator token from config
         self.bot.rapidgator_token = self.config.get('rapidgator_api_token', '')
@@ -634,8 +658,17 @@ class ForumBotGUI(QMainWindow):
         self.category_threads = {}
         self.category_workers = {}
         self.current_category = None
-        self.bot_lock = QMutex()
+        # Browser sessions for tracking/posting/template tasks: the main bot
+        # plus extra headless sessions logged in with its saved cookies
+        self.driver_pool = DriverPool(
+            primary=self.bot,
+            factory=self._create_pool_bot,
+            size=int(self.config.get('selenium_pool_size', default_pool_size())),
+            lease_timeout=float(self.config.get('selenium_lease_timeout', DEFAULT_LEASE_TIMEOUT)),
+        )
         self.process_threads = {}
+        self._process_sync_pool = None  # full Process Threads saves (see save_process_threads_data)
+        self._process_sync = None
         self.backup_threads = {}
         self.megathreads_workers = {}
         self.megathreads_data = {}
@@ -827,6 +860,22 @@ class ForumBotGUI(QMainWindow):
         else:
             logging.error(f"❌ NO HANDLER FOUND! status_widget class: {self.status_widget.__class__.__name__}")
 
+        # Worker progress goes through the coalescing bus: stage changes are
+        # forwarded at once, plain progress once per frame as one batch.
+        if not hasattr(self, "progress_bus"):
+            self.progress_bus = ProgressBus(fps=self.config.get("progress_fps", DEFAULT_FPS))
+            self.progress_bus.status_ready.connect(self.orch.progress_update.emit)
+            self.progress_bus.batch_ready.connect(self._on_progress_batch)
+
+    @pyqtSlot(list)
+    def _on_progress_batch(self, batch):
+        handler = getattr(self.status_widget, "on_progress_batch", None)
+        if handler is not None:
+            handler(batch)
+            return
+        for status in batch:
+            self.orch.progress_update.emit(status)
+
     @pyqtSlot(object)
     def register_worker(self, worker):
         """Thread-safe entry point for registering a worker with the GUI."""
@@ -848,8 +897,9 @@ class ForumBotGUI(QMainWindow):
         try:
             if hasattr(worker, "progress_update"):
                 # Standard workers emit a single OperationStatus
+                # Published from the worker thread; the bus hands batches to the GUI thread
                 worker.progress_update.connect(
-                    self.orch.progress_update.emit, Qt.QueuedConnection
+                    self.progress_bus.publish, Qt.DirectConnection
                 )
                 logging.debug(f"Connected progress_update signal for worker {type(worker).__name__}")
             elif hasattr(worker, "file_progress_update"):
@@ -867,11 +917,11 @@ class ForumBotGUI(QMainWindow):
                             eta=eta or 0.0,
                             host="",
                         )
-                        self.orch.progress_update.emit(status)
+                        self.progress_bus.publish(status)
                     except Exception as e:
                         logging.error(f"Error in download progress adapter: {e}")
 
-                worker.file_progress_update.connect(_adapter, Qt.QueuedConnection)
+                worker.file_progress_update.connect(_adapter, Qt.DirectConnection)
                 logging.debug(f"Connected file_progress_update signal for worker {type(worker).__name__}")
 
             # Connect UI-specific signals (like thread_discovered) - NOT progress_update!
@@ -927,7 +977,7 @@ class ForumBotGUI(QMainWindow):
         except Exception:
             pass
 
-        self.reply_worker = HeadlessPostWorker(self.bot, self.bot_lock, list(tasks or []), rate_limit_secs)
+        self.reply_worker = HeadlessPostWorker(self.bot, self.driver_pool, list(tasks or []), rate_limit_secs)
 
         # Route progress through orchestrator via register_worker
         self.register_worker(self.reply_worker)
@@ -948,15 +998,7 @@ class ForumBotGUI(QMainWindow):
 
                 # 1) علّم صف Process Threads كـ Posted + أخضر
                 #    أ. حاول تجيب الصف من الجدول بالـ Thread ID
-                row = None
-                try:
-                    for r in range(self.process_threads_table.rowCount()):
-                        item = self.process_threads_table.item(r, 2)  # عمود Thread ID
-                        if item and item.text().strip() == str(thread_id).strip():
-                            row = r
-                            break
-                except Exception:
-                    row = None
+                row = self.process_row_index.find(f"id:{str(thread_id).strip()}")
 
                 category_name = None
                 thread_title = None
@@ -2315,52 +2357,63 @@ class ForumBotGUI(QMainWindow):
         log_label.setFont(QFont("Arial", 12, QFont.Bold))
         log_layout.addWidget(log_label)
 
-        self.log_viewer = QTextBrowser()
+        # Level / keyword filter (applied by the tail worker, not the GUI thread)
+        filter_row = QHBoxLayout()
+        self.log_level_combo = QComboBox()
+        self.log_level_combo.addItems(list(LOG_LEVELS))
+        self.log_level_combo.setCurrentText(str(self.config.get('log_viewer_level', 'INFO')).upper())
+        self.log_keyword_input = QLineEdit()
+        self.log_keyword_input.setPlaceholderText("Filter log by keyword…")
+        filter_row.addWidget(QLabel("Level:"))
+        filter_row.addWidget(self.log_level_combo)
+        filter_row.addWidget(self.log_keyword_input, 1)
+        log_layout.addLayout(filter_row)
+
+        self.log_viewer = QPlainTextEdit()
         self.log_viewer.setReadOnly(True)
+        self.log_viewer.setLineWrapMode(QPlainTextEdit.NoWrap)
+        max_lines = int(self.config.get('log_viewer_max_lines', 5000))
+        self.log_viewer.setMaximumBlockCount(max_lines)
         log_layout.addWidget(self.log_viewer)
 
-        # Load existing log file content
-        self.load_log_file()
-
         # Add the log viewer to the content area as a new tab or section
         self.content_area.addWidget(log_widget)
 
-        # Optionally, set up a timer to refresh the log viewer periodically
-        self.log_timer = QTimer()
-        self.log_timer.timeout.connect(self.load_log_file)
-        self.log_timer.start(5000)  # Refresh every 5 seconds
+        # Follow the log file from a background thread: only appended bytes
+        # are read, filtered and handed over for display.
+        self.log_tail_worker = LogTailWorker(
+            os.path.join(DATA_DIR, 'forum_bot.log'),
+            max_lines=max_lines,
+            interval_ms=int(self.config.get('log_viewer_poll_ms', 1000)),
+        )
+        self.log_tail_worker.lines_reset.connect(self._on_log_lines_reset)
+        self.log_tail_worker.lines_appended.connect(self._on_log_lines_appended)
+        self._log_filter_timer = QTimer(self)
+        self._log_filter_timer.setSingleShot(True)
+        self._log_filter_timer.setInterval(250)
+        self._log_filter_timer.timeout.connect(self.load_log_file)
+        self.log_level_combo.currentIndexChanged.connect(self._log_filter_timer.start)
+        self.log_keyword_input.textChanged.connect(self._log_filter_timer.start)
+        self.load_log_file()
+        self.log_tail_worker.start()
 
     def load_log_file(self):
-        log_path = os.path.join(DATA_DIR, 'forum_bot.log')
-        if not os.path.exists(log_path):
-            # If the log file hasn't been created yet, silently skip loading it
-            # rather than spamming the user's log with warnings.
+        """(Re)load the log view from the tail of the file with the current filter."""
+        worker = getattr(self, 'log_tail_worker', None)
+        if worker is None:
             return
+        worker.set_filter(self.log_level_combo.currentText(), self.log_keyword_input.text())
 
-        try:
-            # Read the log file in binary mode and decode safely.  Many log
-            # files contain non‑ASCII bytes; reading with the default
-            # encoding can raise UnicodeDecodeError.  We read as bytes and
-            # decode using UTF‑8 with replacement, falling back to latin‑1
-            # and the system default if necessary.
-            with open(log_path, 'rb') as log_file:
-                raw = log_file.read()
-            try:
-                content = raw.decode('utf-8', errors='replace')
-            except Exception:
-                try:
-                    content = raw.decode('latin-1', errors='replace')
-                except Exception:
-                    content = raw.decode(errors='replace')
-            # Display the content in the log viewer if present
-            try:
-                if hasattr(self, 'log_text_edit') and self.log_text_edit:
-                    self.log_text_edit.setPlainText(content)
-            except Exception:
-                pass
-        except Exception as e:
-            # Log any error without crashing the UI
-            logging.error("Exception in load_log_file: %s", e, exc_info=True)
+    def _on_log_lines_reset(self, lines):
+        self.log_viewer.setPlainText("\n".join(lines))
+        self.log_viewer.moveCursor(QTextCursor.End)
+
+    def _on_log_lines_appended(self, lines):
+        bar = self.log_viewer.verticalScrollBar()
+        at_bottom = bar.value() >= bar.maximum() - 2
+        self.log_viewer.appendPlainText("\n".join(lines))
+        if at_bottom:
+            bar.setValue(bar.maximum())
 
     def on_thread_selected(self, item):
         """Handle thread selection and display its BBCode in the editor."""
@@ -2774,8 +2827,10 @@ class ForumBotGUI(QMainWindow):
                 if keeplinks_url:
                     canonical_links['keeplinks'] = keeplinks_url
 
+                changed = []
                 for cat_name, threads in (self.process_threads or {}).items():
                     if thread_title in threads:
+                        changed.append((cat_name, thread_title))
                         rec = threads[thread_title]
                         try:
                             logging.info("LINKS-BEFORE cat=%s title=%s links=%s (reupload)",
@@ -2797,7 +2852,7 @@ class ForumBotGUI(QMainWindow):
                                          cat_name, thread_title, rec.get('links'))
                         except Exception:
                             pass
-                self.save_process_threads_data()
+                self.save_process_threads_data(changed=changed)
             except Exception:
                 logging.exception("Failed to update canonical links on reupload")
 
@@ -2893,6 +2948,17 @@ class ForumBotGUI(QMainWindow):
                 "Keeplinks",
             ]
         )
+        self.backup_row_index = TableRowIndex(
+            self.backup_threads_table.model(),
+            lambda model, row: (model.index(row, 0).data(),),
+            self,
+        )
+        self.backup_pager = LazyTablePager(
+            self.backup_threads_table,
+            self._load_more_backup_rows,
+            int(self.config.get('thread_table_page_size', DEFAULT_PAGE_SIZE)),
+            self,
+        )
 
         # سلوك اختيار الصفوف
         self.backup_threads_table.setSelectionBehavior(QAbstractItemView.SelectRows)
@@ -3055,51 +3121,41 @@ class ForumBotGUI(QMainWindow):
         else:
             threads_to_check = self.backup_threads
 
+        links_by_title = {
+            title: list(dict.fromkeys(l.strip() for l in (info or {}).get('rapidgator_links', []) if l.strip()))
+            for title, info in threads_to_check.items()
+        }
+        # One batched, cached pass over every link instead of a request per link
+        checker = get_rg_link_checker(self.bot.rapidgator_check_token)
+        results = checker.check([l for links in links_by_title.values() for l in links])
+
         for title, thread_info in threads_to_check.items():
             if not thread_info:
                 logging.error(f"No backup info found for thread '{title}'.")
                 continue
 
-            rapidgator_links = thread_info.get('rapidgator_links', [])
-            thread_info['dead_rapidgator_links'] = []
-            dead_found = False
-
-            for link in rapidgator_links:
-                link = link.strip()
-                if not link:
-                    continue
-                is_alive = self.is_link_active(link)  # <--- uses updated is_link_active below
-                if not is_alive:
-                    logging.warning(f"Rapidgator link is dead: {link}")
-                    thread_info['dead_rapidgator_links'].append(link)
-                    dead_found = True
-                else:
-                    logging.info(f"Rapidgator link is alive: {link}")
-
-            if dead_found:
-                thread_info['rapidgator_status'] = 'dead'
-            else:
-                if rapidgator_links:
-                    thread_info['rapidgator_status'] = 'alive'
-                else:
-                    thread_info['rapidgator_status'] = 'none'
+            result = rg_thread_result(links_by_title[title], results)
+            if result['status'] == 'unknown':
+                logging.warning(f"Rapidgator check failed for '{title}', keeping previous status")
+                continue
+            for link in result['dead_links']:
+                logging.warning(f"Rapidgator link is dead: {link}")
+            thread_info['dead_rapidgator_links'] = result['dead_links']
+            thread_info['rapidgator_status'] = result['status']
 
             self.backup_threads[title] = thread_info
             # Update the table cell color to reflect new status
-            rows = self.backup_threads_table.rowCount()
-            for row in range(rows):
-                t_title_item = self.backup_threads_table.item(row, 0)
-                if t_title_item and t_title_item.text() == title:
-                    rapidgator_cell_item = self.backup_threads_table.item(row, 2)
-                    if rapidgator_cell_item:
-                        if thread_info['rapidgator_status'] == 'dead':
-                            self.set_backup_link_status_color(rapidgator_cell_item, False)
-                        elif thread_info['rapidgator_status'] == 'alive':
-                            self.set_backup_link_status_color(rapidgator_cell_item, True)
-                        else:
-                            rapidgator_cell_item.setBackground(QColor(255, 255, 255))
-                            rapidgator_cell_item.setData(Qt.UserRole, None)
-                    break
+            row = self.backup_row_index.find(title)
+            if row is not None:
+                rapidgator_cell_item = self.backup_threads_table.item(row, 2)
+                if rapidgator_cell_item:
+                    if thread_info['rapidgator_status'] == 'dead':
+                        self.set_backup_link_status_color(rapidgator_cell_item, False)
+                    elif thread_info['rapidgator_status'] == 'alive':
+                        self.set_backup_link_status_color(rapidgator_cell_item, True)
+                    else:
+                        rapidgator_cell_item.setBackground(QColor(255, 255, 255))
+                        rapidgator_cell_item.setData(Qt.UserRole, None)
 
         self.save_backup_threads_data()
         QApplication.processEvents()
@@ -3131,8 +3187,8 @@ class ForumBotGUI(QMainWindow):
         except Exception:
             pass
 
-        ttl_sec = int(23 * 3600)
-        now_ts = int(time.time())
+        # Threads whose links all have a fresh cached result are skipped
+        cache = get_rg_link_checker(self.bot.rapidgator_check_token).cache
 
         tasks: list[dict] = []
         for row in range(self.backup_threads_table.rowCount()):
@@ -3141,11 +3197,9 @@ class ForumBotGUI(QMainWindow):
             if not title_item or not rg_item:
                 continue
             title = title_item.text()
-            info = self.backup_threads.get(title, {}) or {}
-            last_ts = int(info.get('last_rg_check_ts', 0) or 0)
-            if last_ts and (now_ts - last_ts) < ttl_sec:
-                continue
             links = [s.strip() for s in (rg_item.text() or '').split('\n') if s.strip()]
+            if links and all(cache.is_fresh(cache.peek(link)) for link in links):
+                continue
             tasks.append({'title': title, 'links': links})
 
         if not tasks:
@@ -3162,36 +3216,42 @@ class ForumBotGUI(QMainWindow):
             pass
 
         rate_limit = int(self.config.get('rg_rate_limit_per_min', 60))
-        min_sleep = float(self.config.get('rg_min_sleep_between_threads', 0.5))
+        batch_size = int(self.config.get('rg_check_batch_size', 25))
         worker = RGLinkBatchWorker(self.bot, tasks, rate_limit_per_min=rate_limit,
-                                   min_sleep_between_threads=min_sleep)
+                                   batch_size=batch_size)
         self.rg_link_worker = worker
         self.register_worker(worker)
-        worker.thread_checked.connect(self.on_rg_thread_checked, Qt.QueuedConnection)
+        worker.threads_checked.connect(self.on_rg_threads_checked, Qt.QueuedConnection)
         worker.finished.connect(self.on_rg_check_finished, Qt.QueuedConnection)
         worker.start()
         logging.info("RG check: started batch worker with %d task(s)", len(tasks))
 
+    def on_rg_threads_checked(self, results: list):
+        """Apply a batch of ``(title, info)`` results from :class:`RGLinkBatchWorker`."""
+        for title, info in results:
+            self.on_rg_thread_checked(title, info)
+
     def on_rg_thread_checked(self, title: str, info: dict):
         try:
             status = info.get('status') or 'none'
             dead_links = list(info.get('dead_links') or [])
-            ts = int(info.get('checked_at') or int(time.time()))
+
+            row_idx = self.backup_row_index.find(title)
+            cell = self.backup_threads_table.item(row_idx, 2) if row_idx is not None else None
+            if status == 'unknown':
+                # Check failed (network/token): keep the previous result
+                if cell:
+                    cell.setToolTip("Rapidgator check failed; will retry on the next run")
+                return
 
             entry = dict(self.backup_threads.get(title, {}) or {})
             entry['rapidgator_status'] = status
             entry['dead_rapidgator_links'] = dead_links
-            entry['last_rg_check_ts'] = ts
+            # Per-link check times live in the RG link-status cache now
+            entry.pop('last_rg_check_ts', None)
             self.backup_threads[title] = entry
 
-            row_idx = -1
-            for r in range(self.backup_threads_table.rowCount()):
-                it = self.backup_threads_table.item(r, 0)
-                if it and it.text() == title:
-                    row_idx = r
-                    break
-            if row_idx >= 0:
-                cell = self.backup_threads_table.item(row_idx, 2)
+            if row_idx is not None:
                 if status == 'alive':
                     self.set_backup_link_status_color(cell, True)
                     cell.setToolTip("Rapidgator links: alive")
@@ -3561,8 +3621,8 @@ class ForumBotGUI(QMainWindow):
             try:
                 # FIRST: Save all user data BEFORE clearing memory
                 logging.info("💾 Saving user data before logout...")
-                self.save_process_threads_data()  # Save current process threads to user folder
-                self.save_backup_threads_data()  # Save backup threads
+                self.save_process_threads_data()  # Save current process threads to user folder (in the background)
+                self.save_backup_threads_data(force=True)  # Save backup threads before they are cleared
                 self.save_replied_thread_ids()  # Save replied thread IDs
                 self.save_megathreads_process_threads_data()  # Save megathreads
                 self.megathreads_category_manager.save_categories()  # Save megathreads categories
@@ -3668,8 +3728,10 @@ class ForumBotGUI(QMainWindow):
                     'rapidgator-backup': [],
                     'keeplinks': keeplinks_link,
                 }
+                changed = []
                 for cat_name, threads in (self.process_threads or {}).items():
                     if thread_title in threads:
+                        changed.append((cat_name, thread_title))
                         rec = threads[thread_title]
                         # log before
                         try:
@@ -3697,7 +3759,7 @@ class ForumBotGUI(QMainWindow):
                         except Exception:
                             pass
                 # Persist updated canonical data
-                self.save_process_threads_data()
+                self.save_process_threads_data(changed=changed)
             except Exception:
                 logging.exception("Failed to update canonical links in reupload_files")
         else:
@@ -3875,9 +3937,24 @@ class ForumBotGUI(QMainWindow):
         Returns True if the link is alive, False otherwise.
         """
         # If token was never set, skip
-        result = self.bot.check_rapidgator_link_status(url)
+        result = self.bot.check_rapidgator_link_status(url, force=False)
         return bool(result and result.get('status') == 'ACCESS')
 
+    def _create_pool_bot(self):
+        """Extra browser session for the driver pool (logged in by the pool)."""
+        bot = SeleniumBot(
+            forum_url=self.config['forum_url'],
+            username=self.config['username'],
+            password=self.config['password'],
+            protected_category=self.config['protected_category'],
+            headless=self.config.get('selenium_pool_headless', True),
+            config=self.config,
+            user_manager=self.user_manager,
+            download_dir=self.bot.download_dir,
+        )
+        bot.rapidgator_token = self.bot.rapidgator_token
+        return bot
+
     def init_timers(self):
         """Initialize timers for periodic tasks."""
         self.link_check_timer = QTimer()
@@ -4022,8 +4099,12 @@ class ForumBotGUI(QMainWindow):
 
         threads_management_layout.addWidget(filter_bar)
 
-        # Connect filter signals
-        self.process_filter_input.textChanged.connect(self.filter_process_threads)
+        # Connect filter signals - typing is debounced, toggles apply at once
+        self._proc_filter_timer = QTimer(self)
+        self._proc_filter_timer.setSingleShot(True)
+        self._proc_filter_timer.setInterval(int(self.config.get('process_filter_debounce_ms', 150)))
+        self._proc_filter_timer.timeout.connect(self.filter_process_threads)
+        self.process_filter_input.textChanged.connect(self._proc_filter_timer.start)
         self.filter_column_combo.currentIndexChanged.connect(self.filter_process_threads)
         for cb in (
                 self.status_pending_check,
@@ -4092,6 +4173,10 @@ class ForumBotGUI(QMainWindow):
         self.btn_check_links.clicked.connect(self.on_check_links_clicked)
         actions_layout.addWidget(self.btn_check_links)
 
+        self.chk_force_recheck = QCheckBox("Force recheck")
+        self.chk_force_recheck.setToolTip("Also re-check links whose cached status is still fresh")
+        actions_layout.addWidget(self.chk_force_recheck)
+
         self.btn_cancel_check = QPushButton("Cancel Link Check")
         self.btn_cancel_check.clicked.connect(self.on_cancel_check_clicked)
         actions_layout.addWidget(self.btn_cancel_check)
@@ -4149,6 +4234,18 @@ class ForumBotGUI(QMainWindow):
         self.process_threads_table.itemSelectionChanged.connect(self._save_proc_filter_state)
         self.process_threads_table.verticalScrollBar().valueChanged.connect(self._save_proc_filter_state)
         threads_management_layout.addWidget(self.process_threads_table)
+        self.process_filter_index = ThreadFilterIndex(self.process_threads_table)
+        # Rows are loaded a page at a time from the thread store while scrolling
+        self.process_pager = LazyTablePager(
+            self.process_threads_table,
+            lambda _offset, _limit: self.populate_process_threads_table(self.process_threads),
+            int(self.config.get('thread_table_page_size', DEFAULT_PAGE_SIZE)),
+            self,
+        )
+        # URL / host-id / thread-id / title -> row, kept in sync by the model
+        self.process_row_index = TableRowIndex(
+            self.process_threads_table.model(), self._process_row_keys, self
+        )
         splitter.addWidget(threads_management_widget)
 
         # ─── Bottom Layout: Advanced BBCode Editor ─────────────────────────────
@@ -4185,59 +4282,29 @@ class ForumBotGUI(QMainWindow):
 
     def filter_process_threads(self, _=None):
         """Filter the process threads table by search text, selected column, and status checkboxes."""
+        if hasattr(self, "_proc_filter_timer"):
+            self._proc_filter_timer.stop()
+
         # 1) Read filter inputs
-        search_text = self.process_filter_input.text().lower().strip()
+        search_text = self.process_filter_input.text()
         column = self.filter_column_combo.currentData()  # -1 = search all columns
-        terms = search_text.split()
-
-        # 2) Read status checkbox states
-        show_pending = self.status_pending_check.isChecked()
-        show_downloaded = self.status_downloaded_check.isChecked()
-        show_uploaded = self.status_uploaded_check.isChecked()
-        show_posted = self.status_posted_check.isChecked()
 
-        # If no status is checked, treat as if all are checked
-        if not any((show_pending, show_downloaded, show_uploaded, show_posted)):
-            show_pending = show_downloaded = show_uploaded = show_posted = True
-
-        table = self.process_threads_table
-        row_count = table.rowCount()
-        col_count = table.columnCount()
-
-        for row in range(row_count):
-            # A) Status filter: get the stored status key from column 0 UserRole
-            status_item = table.item(row, 0)
-            status_key = status_item.data(Qt.UserRole) if status_item else ""
-            status_ok = (
-                    (status_key == "status-pending" and show_pending) or
-                    (status_key == "status-downloaded" and show_downloaded) or
-                    (status_key == "status-uploaded" and show_uploaded) or
-                    (status_key == "status-posted" and show_posted)
-            )
+        # 2) Status checkboxes -> bitmask (none checked = all)
+        mask = status_mask(
+            self.status_pending_check.isChecked(),
+            self.status_downloaded_check.isChecked(),
+            self.status_uploaded_check.isChecked(),
+            self.status_posted_check.isChecked(),
+        )
 
-            # B) Text filter: match empty or appear in the chosen column(s)
-            if not terms:
-                text_ok = True
-            else:
-                text_ok = True
-                for term in terms:
-                    term_ok = False
-                    if column == -1:
-                        # Search all columns
-                        for c in range(col_count):
-                            item = table.item(row, c)
-                            if item and term in item.text().lower():
-                                term_ok = True
-                                break
-                    else:
-                        item = table.item(row, column)
-                        term_ok = bool(item and term in item.text().lower())
-                    if not term_ok:
-                        text_ok = False
-                        break
+        # A filter has to see every thread, not just the loaded pages
+        pager = getattr(self, "process_pager", None)
+        if pager is not None and pager.show_all(bool(search_text.strip()) or mask != ALL_STATUSES):
+            self.populate_process_threads_table(self.process_threads)
+            return  # repopulating re-applies the filter
 
-            # C) Show row only if both status and text match
-            table.setRowHidden(row, not (status_ok and text_ok))
+        # 3) Status bits first, then the cached lower-cased cell text
+        self.process_filter_index.apply(search_text, -1 if column is None else column, mask)
 
         self._save_proc_filter_state()
 
@@ -4473,17 +4540,23 @@ class ForumBotGUI(QMainWindow):
             self.statusBar().showMessage("لا توجد روابط للفحص.")
             return
 
+        # الروابط اللي حالتها في الكاش لسه طازة مش محتاجة JD
+        chk = getattr(self, "chk_force_recheck", None)
+        force = bool(chk is not None and chk.isChecked())
+        direct_urls, container_urls = self._skip_fresh_link_checks(
+            direct_urls, container_urls, visible_scope, force=force
+        )
+        if not direct_urls and not container_urls:
+            self.statusBar().showMessage(self._lc_summary.message(), 5000)
+            return
+
         email, password, device_name, app_key = self._get_myjd_credentials()
         if not email or not password:
             self.statusBar().showMessage("برجاء ضبط My.JDownloader (الإيميل والباسورد) من الإعدادات أولًا.")
             return
 
-        jd_client = JDClient(
-            email=email,
-            password=password,
-            device_name=device_name,
-            app_key=app_key,
-        )
+        # عميل JD مشترك: الجلسة والتوكن بيفضلوا بين الفحوصات
+        jd_client = get_jd_client(email, password, device_name, app_key)
 
         # Extend the polling timeout so manual captcha resolution has ample time
         # before the worker gives up and returns no results.
@@ -4505,6 +4578,7 @@ class ForumBotGUI(QMainWindow):
             poll_timeout_sec=600,
             single_host_mode=single_host_mode,
             auto_replace=auto_replace,
+            pipeline_size=int(self.config.get('link_check_pipeline_size', 8)),
         )
         self.link_check_worker.set_host_priority(host_priority)
         self.link_check_worker.chosen_host = chosen_host
@@ -4518,7 +4592,6 @@ class ForumBotGUI(QMainWindow):
         self.link_check_worker.progress.connect(self._on_link_progress)
         self.link_check_worker.finished.connect(self._on_link_finished)
         self.link_check_worker.error.connect(lambda msg: self.statusBar().showMessage(msg))
-        self.rebuild_row_index()
         total = len(direct_urls) + len(container_urls)
         self.statusBar().showMessage(f"Starting link check for {total} URLs…")
         self.link_check_worker.start()
@@ -4562,76 +4635,43 @@ class ForumBotGUI(QMainWindow):
             pass
         return ""
 
-    def rebuild_row_index(self):
-        """Rebuild lookup dictionaries for container and direct URLs."""
-        self.row_by_container = {}
-        self.row_by_direct = {}
-        rows = self.process_threads_table.rowCount()
-        rg_col = getattr(self, "RG_LINKS_COL", 3)
-        link_cols = {rg_col, 4, 5}
-        for r in range(rows):
-            for c in link_cols:
-                cell = self.process_threads_table.item(r, c)
-                if not cell:
-                    continue
-                text = cell.text() or ""
-                if not text:
-                    continue
-                for raw in URL_RE.findall(text):
-                    raw = raw.strip().strip('.,);]')
-                    canon = self.canonical_url(raw)
-                    hid = self.host_id_key(raw)
-                    self.row_by_container[raw] = r
-                    if canon:
-                        self.row_by_container[canon] = r
-                        self.row_by_direct[canon] = r
-                    self.row_by_direct[raw] = r
-                    if hid:
-                        self.row_by_direct[hid] = r
-                        self.row_by_container[hid] = r
+    def _url_keys(self, url: str):
+        """``(canonical_url, host_id_key)`` of *url*, memoized per string."""
+        cache = self.__dict__.setdefault("_proc_url_key_cache", {})
+        keys = cache.get(url)
+        if keys is None:
+            keys = cache[url] = (self.canonical_url(url), self.host_id_key(url))
+        return keys
 
-    def find_row(self, url: str):
-        if not url:
-            return None
-        if url in self.by_raw_url:
-            return self.by_raw_url[url]
-        canon = self.canonical_url(url)
-        row = self.by_canonical.get(canon)
-        if row is not None:
-            return row
-        hid = self.host_id_key(url)
-        row = self.by_host_id.get(hid)
-        if row is not None:
-            return row
-
-        sample = []
-        rows = self.process_threads_table.rowCount()
-        for r in range(rows):
-
-            cell = self.process_threads_table.item(r, 2)
-            if not cell:
-                continue
-            text = (cell.text() or "").strip()
-            if not text:
+    def _process_row_keys(self, model, row):
+        """Lookup keys of one Process Threads row for ``process_row_index``.
+
+        Every URL in the row is indexed raw, canonical and by host-id; the
+        thread id and title are indexed as ``id:<id>`` / ``title:<title>``.
+        """
+        title = model.index(row, 0).data()
+        if title:
+            yield f"title:{title}"
+        thread_id = model.index(row, 2).data()
+        if thread_id:
+            yield f"id:{str(thread_id).strip()}"
+        for col in range(model.columnCount()):
+            text = model.index(row, col).data()
+            if not isinstance(text, str) or "://" not in text:
                 continue
             for raw in URL_RE.findall(text):
                 raw = raw.strip().strip('.,);]')
-                c = self.canonical_url(raw)
-                h = self.host_id_key(raw)
-                sample.append([raw, c])
-                if c == canon or h == hid:
-                    self.by_raw_url[raw] = r
-                    if c:
-                        self.by_canonical[c] = r
-                    if h:
-                        self.by_host_id[h] = r
-                    return r
-        self.log.debug(
-            "ROW NOT FOUND | looking_for=%s sample_norm=%s",
-            canon or url,
-            sample[:3],
-        )
-        return None
+                yield raw
+                yield from self._url_keys(raw)
+
+    def find_row(self, url: str):
+        if not url:
+            return None
+        canon, hid = self._url_keys(url.strip())
+        row = self.process_row_index.find(url.strip(), canon, hid)
+        if row is None:
+            self.log.debug("ROW NOT FOUND | looking_for=%s", canon or url)
+        return row
 
     def on_cancel_check_clicked(self):
         if self.link_check_worker and self.link_check_worker.isRunning():
@@ -4647,6 +4687,41 @@ class ForumBotGUI(QMainWindow):
             except Exception:
                 pass
 
+    def _skip_fresh_link_checks(self, direct_urls, container_urls, visible_scope, *, force=False):
+        """Drop URLs whose cached status is younger than its TTL.
+
+        Rows whose links are all fresh get their cached status right away and
+        are counted in the summary; returns the ``(direct, containers)`` left
+        to send to JDownloader.
+        """
+        self._load_link_check_cache()
+        fresh, stale, counts = split_fresh_links(
+            direct_urls + container_urls,
+            self._link_check_cache,
+            link_status_ttls(self.config),
+            keys_of=self._url_keys,
+            force=force,
+        )
+        self._lc_summary.record_cache(counts["hits"], counts["misses"])
+        self.log.debug(
+            "CACHE | hits=%d | misses=%d | force=%s", counts["hits"], counts["misses"], force
+        )
+        if not fresh:
+            return direct_urls, container_urls
+
+        row_urls: dict[int, list[str]] = {}
+        for info in visible_scope.values():
+            row_urls.setdefault(info.get("row"), list(info.get("urls") or []))
+        for row, urls in row_urls.items():
+            if row is not None and urls and all(u in fresh for u in urls):
+                status = (fresh[urls[0]].get("status") or "UNKNOWN").upper()
+                self.update_status_cell(row, status)
+                self._lc_summary.update(row, status)
+
+        stale_set = set(stale)
+        return ([u for u in direct_urls if u in stale_set],
+                [u for u in container_urls if u in stale_set])
+
     def _on_link_progress(self, payload: dict):
         cache = getattr(self, "_link_check_cache", None)
         if cache is None:
@@ -4725,8 +4800,6 @@ class ForumBotGUI(QMainWindow):
                 except Exception as e:
                     self.log.warning("PERSIST (container replacement) failed: %s", e)
 
-                self.rebuild_row_index()
-
                 QtCore.QMetaObject.invokeMethod(
                     self.link_check_worker,
                     "ack_replaced",
@@ -4751,9 +4824,9 @@ class ForumBotGUI(QMainWindow):
             else:
                 display_status = "OFFLINE" if status == "UNKNOWN" else status
                 self.update_status_cell(row_idx, display_status)
-                cache.setdefault(container_url, {}).update({"status": status})
+                cache.setdefault(container_url, {}).update({"status": status, "checked_at": int(time.time())})
                 try:
-                    self.user_manager.save_user_data(self.LINK_STATUS_FILE, cache)
+                    self.user_manager.save_user_data(self.LINK_STATUS_FILE, cache, defer=True)
                 except Exception as e:
                     self.log.warning("Failed to persist link_status.json: %s", e)
                 self.log.debug(
@@ -4773,11 +4846,8 @@ class ForumBotGUI(QMainWindow):
             status = (payload.get("status") or "UNKNOWN").upper()
             row_idx = payload.get("row")
             if row_idx is None:
-                canon = self.canonical_url(url)
-                row_idx = self.row_by_direct.get(canon)
-                if row_idx is None:
-                    hid = self.host_id_key(url)
-                    row_idx = self.row_by_direct.get(hid)
+                canon, hid = self._url_keys(url)
+                row_idx = self.process_row_index.find(canon, url, hid)
                 if row_idx is None:
                     self.log.debug(
                         "UI STATUS MISS | session=%s | url=%s",
@@ -4787,9 +4857,9 @@ class ForumBotGUI(QMainWindow):
                     self._lc_stats["rows_not_found"] += 1
                     return
             self.update_status_cell(row_idx, status)
-            cache.setdefault(url, {}).update({"status": status})
+            cache.setdefault(url, {}).update({"status": status, "checked_at": int(time.time())})
             try:
-                self.user_manager.save_user_data(self.LINK_STATUS_FILE, cache)
+                self.user_manager.save_user_data(self.LINK_STATUS_FILE, cache, defer=True)
             except Exception as e:
                 self.log.warning("Failed to persist link_status.json: %s", e)
             self._lc_summary.update(row_idx, status)
@@ -4922,11 +4992,9 @@ class ForumBotGUI(QMainWindow):
                 vlinks[chosen_host_norm] = ventry
                 vlinks.pop('keeplinks', None)
 
-            # 5) Persist to disk and refresh indices
+            # 5) Persist to disk (the row index follows the table by itself)
             if hasattr(self, 'save_process_threads_data'):
-                self.save_process_threads_data()
-            if hasattr(self, 'rebuild_row_index'):
-                self.rebuild_row_index()
+                self.save_process_threads_data(changed=[(category, thread_key)])
 
             log.debug(
                 "PERSIST OK | row=%s | category=%s | key=%s | host=%s | url=%s | status=%s",
@@ -4945,7 +5013,7 @@ class ForumBotGUI(QMainWindow):
         pending = max(self._lc_total_groups - self._lc_summary.replaced, 0)
         cancelled = self.link_check_cancel_event.is_set()
         self.log.info(
-            "SUMMARY | session=%s | rows=%d | replaced=%d | online=%d | offline=%d | unknown=%d | pending=%d | cancelled=%s | dur=%.3f",
+            "SUMMARY | session=%s | rows=%d | replaced=%d | online=%d | offline=%d | unknown=%d | pending=%d | cache_hits=%d | cache_misses=%d | cancelled=%s | dur=%.3f",
             info.get("session_id"),
             len(self._lc_summary.row_statuses),
             self._lc_summary.replaced,
@@ -4953,6 +5021,8 @@ class ForumBotGUI(QMainWindow):
             self._lc_summary.counts["OFFLINE"],
             self._lc_summary.counts["UNKNOWN"],
             pending,
+            self._lc_summary.cache_hits,
+            self._lc_summary.cache_misses,
             cancelled,
             time.monotonic() - getattr(self, "_lc_start_ts", 0.0),
         )
@@ -4981,7 +5051,7 @@ class ForumBotGUI(QMainWindow):
             from core.user_manager import get_user_manager
             um = get_user_manager()
             if um and um.get_current_user():
-                um.save_user_data(self.LINK_STATUS_FILE, self._link_check_cache)
+                um.save_user_data(self.LINK_STATUS_FILE, self._link_check_cache, defer=True)
         except Exception as e:
             logging.error(f"Failed to save link status cache: {e}")
 
@@ -4990,123 +5060,16 @@ class ForumBotGUI(QMainWindow):
         cache = self._link_check_cache or {}
         if not cache:
             return
-        import re
-        rows = self.process_threads_table.rowCount()
-        cols = self.process_threads_table.columnCount()
-        for r in range(rows):
-            applied = False
-            for c in range(cols):
-                it = self.process_threads_table.item(r, c)
-                if not it:
-                    continue
-                text = it.text() or ""
-                for u in re.findall(r'https?://\S+', text, flags=re.IGNORECASE):
-                    u = u.strip().strip('.,);]')
-                    if u in cache:
-                        try:
-                            self.update_status_cell(r, cache[u]["status"])
-                        except Exception:
-                            pass
-                        applied = True
-                        break
-                if applied:
+        index = self.process_row_index
+        for r in range(self.process_threads_table.rowCount()):
+            for key in index.keys_of(r):
+                if key in cache:
+                    try:
+                        self.update_status_cell(r, cache[key]["status"])
+                    except Exception:
+                        pass
                     break
 
-    def _find_row_for_url(self, candidate_urls: list[str]) -> int:
-        """
-        Try to find the table row that contains any of the candidate URLs
-        (exact or substring match) in any text column. Returns row index or -1.
-        """
-        import re
-        rows = self.process_threads_table.rowCount()
-        cols = self.process_threads_table.columnCount()
-        # normalize candidates
-        cands = []
-        for u in (candidate_urls or []):
-            if not u:
-                continue
-            cands.append(u.strip())
-        if not cands:
-            return -1
-
-        for r in range(rows):
-            for c in range(cols):
-                it = self.process_threads_table.item(r, c)
-                if not it:
-                    continue
-                cell = (it.text() or "")
-                if not cell:
-                    continue
-                # quick substring check first, then a relaxed URL token match
-                for u in cands:
-                    if u in cell:
-                        return r
-                    # relaxed: match http(s) tokens trimmed of trailing punctuation
-                    for m in re.findall(r'https?://\S+', cell, flags=re.IGNORECASE):
-                        token = m.strip().strip('.,);]')
-                        if token == u:
-                            return r
-        return -1
-
-    def _find_row_by_url(self, url: str) -> int:
-        if not url:
-            return -1
-        table = self.process_threads_table
-        cols = table.columnCount()
-        target = url.strip()
-        rows = table.rowCount()
-        cols = table.columnCount()
-        for r in range(rows):
-            for c in range(cols):
-                item = table.item(r, c)
-                if not item:
-                    continue
-                cell = (item.text() or "").strip()
-                if cell == target:
-                    return r
-                for role in (Qt.UserRole, Qt.UserRole + 1, Qt.UserRole + 2):
-                    data = item.data(role)
-                    if isinstance(data, str) and data.strip() == target:
-                        return r
-        return -1
-
-    def _replace_url_in_row(self, row_idx: int, old_url: str, new_url: str) -> list:
-        table = self.process_threads_table
-        cols = table.columnCount()
-        changed = []
-        model = table.model()
-        for c in range(cols):
-            item = table.item(row_idx, c)
-            if not item:
-                continue
-            text = item.text() or ""
-            if old_url in text:
-                item.setText(text.replace(old_url, new_url))
-                idx = model.index(row_idx, c)
-                model.dataChanged.emit(idx, idx, [Qt.DisplayRole])
-                changed.append(c)
-        return changed
-
-    def find_row_by_url(self, url):
-        table = self.process_threads_table
-        cols = table.columnCount()
-        for row in range(table.rowCount()):
-            for col in range(cols):
-                item = table.item(row, col)
-                if item and url and item.text() == url:
-                    return row
-        return None
-
-    def find_row_by_name_host(self, name, host):
-        table = self.process_threads_table
-        cols = table.columnCount()
-        for row in range(table.rowCount()):
-            for col in range(cols):
-                item = table.item(row, col)
-                if item and host and host in item.text():
-                    return row
-        return None
-
     def update_status_cell(self, row, status, tooltip=""):
         color = {
             "ONLINE": QColor("#1e9e36"),
@@ -5358,7 +5321,7 @@ class ForumBotGUI(QMainWindow):
 
         if category_name in self.process_threads and thread_title in self.process_threads[category_name]:
             self.process_threads[category_name][thread_title]['row_status'] = 'replied'
-            self.save_process_threads_data()  # so it persists on disk
+            self.save_process_threads_data(changed=[(category_name, thread_title)])  # so it persists on disk
 
     def start_download_operation(self, rows: set[int] | None = None):
         """
@@ -5567,7 +5530,7 @@ class ForumBotGUI(QMainWindow):
         thread_title = self.process_threads_table.item(row, 0).text()
         if category_name in self.process_threads and thread_title in self.process_threads[category_name]:
             self.process_threads[category_name][thread_title]['row_status'] = 'downloaded'
-            self.save_process_threads_data()  # so next app restart, we remember
+            self.save_process_threads_data(changed=[(category_name, thread_title)])  # so next app restart, we remember
 
     def on_download_row_error(self, row: int, error_msg: str):
         """Color the row RED on download error."""
@@ -5588,7 +5551,7 @@ class ForumBotGUI(QMainWindow):
         thread_title = self.process_threads_table.item(row, 0).text()
         if category_name in self.process_threads and thread_title in self.process_threads[category_name]:
             self.process_threads[category_name][thread_title]['row_status'] = 'error'
-            self.save_process_threads_data()
+            self.save_process_threads_data(changed=[(category_name, thread_title)])
 
     def on_file_progress_update(self, row, progress):
         # For example, you could update a "Progress" column in the table
@@ -5628,7 +5591,7 @@ class ForumBotGUI(QMainWindow):
             }
 
             # Save and refresh
-            self.save_process_threads_data()
+            self.save_process_threads_data(changed=[(category_name, thread_title)])
             # 🔄 Refresh the table to show color changes
             self.populate_process_threads_table(self.process_threads)
             logging.info("🔄 Process threads table refreshed to show upload status")
@@ -5750,20 +5713,11 @@ class ForumBotGUI(QMainWindow):
         return updated_bbcode
 
     def reload_thread_links(self):
-        """Reload the thread links from the saved JSON file."""
+        """Reload the thread links from the saved thread store."""
         try:
-            # Use user-specific path if logged in, otherwise fallback
-            if self.user_manager.get_current_user():
-                user_folder = self.user_manager.get_user_folder()
-                file_path = os.path.join(user_folder, "process_threads.json")
-            else:
-                file_path = os.path.join(DATA_DIR, "process_threads.json")
-            with open(file_path, 'r') as f:
-                self.thread_links = json.load(f)
-            logging.info(f"Thread links loaded successfully from {file_path}.")
-        except FileNotFoundError:
-            logging.warning(f"No saved thread links file found at {file_path}.")
-            self.thread_links = {}
+            store = self._thread_store()
+            self.thread_links = store.load(SECTION_PROCESS)
+            logging.info(f"Thread links loaded successfully from {store.path}.")
         except Exception as e:
             logging.error(f"Failed to reload thread links: {e}")
             self.thread_links = {}
@@ -6002,7 +5956,7 @@ class ForumBotGUI(QMainWindow):
                 self.populate_backup_threads_table()
 
             # 6) حفظ وتحديث الحالة
-            self.save_process_threads_data()
+            self.save_process_threads_data(changed=[(category_name, thread_title)])
             self.mark_upload_complete(category_name, thread_title)
 
             updated_cols = []
@@ -6150,10 +6104,9 @@ class ForumBotGUI(QMainWindow):
         try:
             if not url:
                 return
-            from PyQt5.QtCore import QMutexLocker
-            with QMutexLocker(self.bot_lock):
-                if hasattr(self, "bot") and self.bot:
-                    self.bot.safe_navigate(url)
+            # The posted URL is opened in the main (visible) browser session
+            with self.driver_pool.lease(timeout=10, primary=True) as bot:
+                bot.safe_navigate(url)
         except Exception:
             logging.error("Failed to open posted URL", exc_info=True)
 
@@ -6294,7 +6247,7 @@ class ForumBotGUI(QMainWindow):
                     self.process_threads_table.item(row_index, 5).setText(keeplinks_val)
 
                 # Persist process_threads
-                self.save_process_threads_data()
+                self.save_process_threads_data(changed=[(category_name, thread_title)])
                 # Update backup data if backup links exist
                 backup_vals = _to_list(canonical.get('rapidgator-backup', {}).get('urls'))
                 if backup_vals:
@@ -6377,11 +6330,11 @@ class ForumBotGUI(QMainWindow):
 
     def start_auto_process(self, thread_ids):
         """Public API to start Auto‑Process by thread ids."""
-        rows = []
-        for row in range(self.process_threads_table.rowCount()):
-            tid = self.process_threads_table.item(row, 2).text()
-            if tid in {str(t) for t in thread_ids}:
-                rows.append(row)
+        rows = sorted({
+            row
+            for tid in thread_ids
+            for row in self.process_row_index.find_all(f"id:{str(tid).strip()}")
+        })
         self.process_threads_table.clearSelection()
         for r in rows:
             self.process_threads_table.selectRow(r)
@@ -6922,10 +6875,8 @@ class ForumBotGUI(QMainWindow):
 
     def get_thread_row(self, thread_title):
         """Find the row index for a thread in the process threads table."""
-        for row in range(self.process_threads_table.rowCount()):
-            if self.process_threads_table.item(row, 0).text() == thread_title:
-                return row
-        return -1
+        row = self.process_row_index.find(f"title:{thread_title}")
+        return -1 if row is None else row
 
     PROGRESS_STYLE_ACTIVE = """
         QProgressBar {
@@ -7260,7 +7211,7 @@ class ForumBotGUI(QMainWindow):
         # --- NEW: set row_status='uploaded' in process_threads, then save ---
         if category_name in self.process_threads and thread_title in self.process_threads[category_name]:
             self.process_threads[category_name][thread_title]['row_status'] = 'uploaded'
-            self.save_process_threads_data()
+            self.save_process_threads_data(changed=[(category_name, thread_title)])
 
     def on_upload_row_error(self, row: int, error_msg: str):
         """Color the row RED on upload error, set row_status='error'."""
@@ -7279,7 +7230,7 @@ class ForumBotGUI(QMainWindow):
         thread_title = self.process_threads_table.item(row, 0).text()
         if category_name in self.process_threads and thread_title in self.process_threads[category_name]:
             self.process_threads[category_name][thread_title]['row_status'] = 'error'
-            self.save_process_threads_data()
+            self.save_process_threads_data(changed=[(category_name, thread_title)])
 
     def update_thread_data_and_ui(self, category_name, thread_title, thread_id,
                                   uploaded_urls, keeplinks_url, backup_rg_urls=None):
@@ -7308,7 +7259,7 @@ class ForumBotGUI(QMainWindow):
                 }
 
             # Save updated data
-            self.save_process_threads_data()
+            self.save_process_threads_data(changed=[(category_name, thread_title)])
             if backup_rg_urls:
                 self.save_backup_threads_data()
 
@@ -7400,11 +7351,7 @@ class ForumBotGUI(QMainWindow):
 
     def calculate_file_hash(self, file_path):
         """Calculate MD5 hash of file for duplicate detection."""
-        hasher = hashlib.md5()
-        with open(file_path, 'rb') as f:
-            for chunk in iter(lambda: f.read(65536), b''):
-                hasher.update(chunk)
-        return hasher.hexdigest()
+        return get_hash_cache().md5(file_path)
 
     def is_file_already_uploaded(self, file_hash):
         """Check if file was already successfully uploaded."""
@@ -7447,8 +7394,10 @@ class ForumBotGUI(QMainWindow):
                     host_urls['katfile'].append(url)
 
             # Update process_threads data
-            for category in self.process_threads.values():
+            changed = []
+            for category_name, category in self.process_threads.items():
                 if thread_title in category:
+                    changed.append((category_name, thread_title))
                     category[thread_title]['links'] = {
                         'keeplinks': keeplinks_url,
                         'rapidgator.net': host_urls['rapidgator'],
@@ -7464,7 +7413,7 @@ class ForumBotGUI(QMainWindow):
             }
 
             # Save updated data
-            self.save_process_threads_data()
+            self.save_process_threads_data(changed=changed)
             self.save_backup_threads_data()
 
         except Exception as e:
@@ -7490,7 +7439,7 @@ class ForumBotGUI(QMainWindow):
                 del self.process_threads[category_name][thread_title]
 
                 # Save changes
-                self.save_process_threads_data()
+                self.save_process_threads_data(changed=[(category_name, thread_title)])
                 self.save_backup_threads_data()
 
                 logging.info(f"Thread '{thread_title}' moved from {category_name} to backup")
@@ -7528,7 +7477,7 @@ class ForumBotGUI(QMainWindow):
                     del self.process_threads[category_name]
 
                 # Save data and refresh UI
-                self.save_process_threads_data()
+                self.save_process_threads_data(changed=[(category_name, thread_title)])
                 self.save_backup_threads_data()
                 self.populate_process_threads_table(self.process_threads)
                 self.populate_backup_threads_table()
@@ -7539,10 +7488,46 @@ class ForumBotGUI(QMainWindow):
             logging.error(f"Error moving thread to backup: {str(e)}", exc_info=True)
 
     def populate_backup_threads_table(self):
-        """Populate the Backup Threads table with all backed-up threads."""
+        """Populate the Backup Threads table with the loaded pages of backed-up threads."""
         self.backup_threads_table.setRowCount(0)  # Clear existing rows
 
-        for thread_title, thread_info in self.backup_threads.items():
+        pager = getattr(self, "backup_pager", None)
+        window = pager.window if pager is not None else None
+        if window is None:
+            titles = list(self.backup_threads)
+        else:
+            titles = self._backup_page_titles(0, window)
+            pager.loaded(len(titles))
+        self._append_backup_rows(titles)
+
+        # Adjust columns and rows to show all lines
+        self.backup_threads_table.resizeColumnsToContents()
+        self.backup_threads_table.resizeRowsToContents()
+        self.apply_backup_filter()
+
+    def _backup_page_titles(self, offset, limit):
+        """Titles of one page of backup threads, in the order they were added."""
+        timer = getattr(self, "_backup_threads_save_timer", None)
+        if timer is not None and timer.isActive():
+            self.save_backup_threads_data(force=True)  # page from up-to-date rows
+        keys = self._thread_store().page_keys(SECTION_BACKUP, offset, limit, newest_first=False)
+        return [title for _category, title in keys]
+
+    def _load_more_backup_rows(self, offset, limit):
+        """Append the next page of backup threads (scrolled to the bottom)."""
+        titles = self._backup_page_titles(offset, limit)
+        self.backup_pager.loaded(offset + len(titles))
+        first = self.backup_threads_table.rowCount()
+        self._append_backup_rows(titles)
+        for row in range(first, self.backup_threads_table.rowCount()):
+            self.backup_threads_table.resizeRowToContents(row)
+        self.apply_backup_filter()
+
+    def _append_backup_rows(self, titles):
+        for thread_title in titles:
+            thread_info = self.backup_threads.get(thread_title)
+            if not isinstance(thread_info, dict):
+                continue  # deleted but not saved yet
             row_position = self.backup_threads_table.rowCount()
             self.backup_threads_table.insertRow(row_position)
 
@@ -7605,11 +7590,6 @@ class ForumBotGUI(QMainWindow):
             keeplinks_item = QTableWidgetItem(keeplinks_link)
             self.backup_threads_table.setItem(row_position, 4, keeplinks_item)
 
-        # Adjust columns and rows to show all lines
-        self.backup_threads_table.resizeColumnsToContents()
-        self.backup_threads_table.resizeRowsToContents()
-        self.apply_backup_filter()
-
     def apply_backup_filter(self):
         """Filter backup threads table based on current query."""
         query = (
@@ -7617,6 +7597,11 @@ class ForumBotGUI(QMainWindow):
             if hasattr(self, "backup_filter_input")
             else ""
         )
+        # Searching has to see every backup thread, not just the loaded pages
+        pager = getattr(self, "backup_pager", None)
+        if pager is not None and pager.show_all(bool(query)):
+            self.populate_backup_threads_table()
+            return  # repopulating re-applies the filter
         mode = (
             self.backup_filter_combo.currentText().lower()
             if hasattr(self, "backup_filter_combo")
@@ -7646,89 +7631,51 @@ class ForumBotGUI(QMainWindow):
 
             self.backup_threads_table.setRowHidden(row, not show)
 
-    def get_backup_threads_filepath(self):
-        if self.user_manager.get_current_user():
-            user_folder = self.user_manager.get_user_folder()
-            os.makedirs(user_folder, exist_ok=True)
-            return os.path.join(user_folder, "backup_threads.json")
-        else:
-            from utils.paths import get_data_folder
-            data_dir = get_data_folder()
-            return os.path.join(data_dir, "backup_threads.json")
-
     def save_backup_threads_data(self, force: bool = False):
         try:
-            # Determine the filename based on the current user
-            if self.user_manager.get_current_user():
-                user_folder = self.user_manager.get_user_folder()
-                os.makedirs(user_folder, exist_ok=True)
-                filename = os.path.join(user_folder, "backup_threads.json")
-            else:
-                data_dir = get_data_folder()
-                os.makedirs(data_dir, exist_ok=True)
-                filename = os.path.join(data_dir, "backup_threads.json")
-
-            # Serialize a copy to avoid concurrent modification
-            try:
-                serialized = json.dumps(self.backup_threads, ensure_ascii=False, indent=4)
-                data_copy = json.loads(serialized)
-            except Exception:
-                data_copy = dict(self.backup_threads)
-
             # Cancel any pending backup save to coalesce rapid calls
-            if hasattr(self, "_backup_threads_save_timer"):
-                timer = getattr(self, "_backup_threads_save_timer")
-                if timer.isActive():
-                    timer.stop()
+            timer = getattr(self, "_backup_threads_save_timer", None)
+            if timer is not None and timer.isActive():
+                timer.stop()
 
-            # Write the data synchronously if force=True, else on a background thread
-            def _write_backup(data, path):
+            def _write_backup():
                 try:
-                    with open(path, 'w', encoding='utf-8') as f:
-                        json.dump(data, f, ensure_ascii=False, indent=4)
-                    logging.info(f"Backup Threads data saved to {path}.")
+                    store = self._thread_store()
+                    written = store.sync(SECTION_BACKUP, self.backup_threads)
+                    logging.debug(f"Backup Threads data saved to {store.path} ({written} rows written).")
                 except Exception as ex:
                     logging.error(f"Error writing Backup Threads: {ex}", exc_info=True)
 
             # If force=True write synchronously and return
             if force:
-                try:
-                    with open(filename, 'w', encoding='utf-8') as f:
-                        json.dump(data_copy, f, ensure_ascii=False, indent=4)
-                    logging.info(f"Backup Threads data saved to {filename}.")
-                except Exception as ex:
-                    logging.error(f"Error writing Backup Threads: {ex}", exc_info=True)
+                _write_backup()
                 return
 
-            from PyQt5.QtCore import QTimer
-            def _start_backup_write():
-                import threading
-                t = threading.Thread(target=_write_backup, args=(data_copy, filename), daemon=True)
-                t.start()
-
-            if not hasattr(self, "_backup_threads_save_timer"):
-                self._backup_threads_save_timer = QTimer(self)
-                self._backup_threads_save_timer.setSingleShot(True)
-                self._backup_threads_save_timer.timeout.connect(_start_backup_write)
+            if timer is None:
+                from PyQt5.QtCore import QTimer
+                timer = self._backup_threads_save_timer = QTimer(self)
+                timer.setSingleShot(True)
+                timer.timeout.connect(_write_backup)
 
             # Start/reset the timer with small debounce interval (300 ms)
-            self._backup_threads_save_timer.start(300)
+            timer.start(300)
         except Exception as e:
             self.handle_exception("save_backup_threads_data", e)
 
     def load_backup_threads_data(self):
         try:
-            filename = self.get_backup_threads_filepath()
-            if not os.path.exists(filename):
-                logging.warning(f"No saved Backup Threads data found: {filename}")
+            store = self._thread_store()
+            store.import_legacy()  # legacy JSON copied in since the store was opened
+            self.backup_threads = store.load(SECTION_BACKUP)
+            if hasattr(self, "backup_pager"):
+                self.backup_pager.reset()  # start from the first page again
+            if not self.backup_threads:
+                logging.warning(f"No saved Backup Threads data found: {store.path}")
                 return False
 
-            with open(filename, 'r', encoding='utf-8') as f:
-                self.backup_threads = json.load(f)
-
             # ונעדכן את הטבלה ב-UI
             self.populate_backup_threads_table()
-            logging.info(f"Backup Threads data loaded from {filename}.")
+            logging.info(f"Backup Threads data loaded from {store.path}.")
             return True
         except Exception as e:
             self.handle_exception("load_backup_threads_data", e)
@@ -7739,22 +7686,14 @@ class ForumBotGUI(QMainWindow):
     # =================================================
     def load_megathreads_process_threads_data(self):
         try:
-            # Use user-specific path if logged in, otherwise fallback
-            if self.user_manager.get_current_user():
-                user_folder = self.user_manager.get_user_folder()
-                filename = os.path.join(user_folder, "megathreads_process_threads.json")
-            else:
-                data_dir = get_data_folder()
-                filename = os.path.join(data_dir, "megathreads_process_threads.json")
-
-            if not os.path.exists(filename):
-                logging.warning(f"No saved Megathreads Process Threads data found: {filename}")
+            store = self._thread_store()
+            store.import_legacy()  # legacy JSON copied in since the store was opened
+            self.megathreads_process_threads = store.load(SECTION_MEGATHREADS)
+            if not self.megathreads_process_threads:
+                logging.warning(f"No saved Megathreads Process Threads data found: {store.path}")
                 return False
 
-            with open(filename, 'r', encoding='utf-8') as f:
-                self.megathreads_process_threads = json.load(f)
-
-            logging.info(f"Megathreads Process Threads data loaded from {filename}.")
+            logging.info(f"Megathreads Process Threads data loaded from {store.path}.")
             return True
         except Exception as e:
             self.handle_exception("load_megathreads_process_threads_data", e)
@@ -7764,7 +7703,7 @@ class ForumBotGUI(QMainWindow):
         """Update the links for a thread in the process_threads data structure."""
         if category_name in self.process_threads and thread_title in self.process_threads[category_name]:
             self.process_threads[category_name][thread_title]['links'] = new_links
-            self.save_process_threads_data()
+            self.save_process_threads_data(changed=[(category_name, thread_title)])
             self.populate_process_threads_table(self.process_threads)
             logging.info(f"Updated links for thread '{thread_title}' in category '{category_name}'")
         else:
@@ -7794,7 +7733,7 @@ class ForumBotGUI(QMainWindow):
                     pass
 
                 # حفظ + تحديث الجدول فورًا عشان الواجهة والـ scope يتنضفوا حالًا
-                self.save_process_threads_data()
+                self.save_process_threads_data(changed=[(category_name, thread_title)])
                 self.populate_process_threads_table(self.process_threads)
 
             # Dialog with manual link, create folder, or local folder options
@@ -7890,12 +7829,14 @@ class ForumBotGUI(QMainWindow):
         elif action == set_password_action:
             text, ok = QInputDialog.getText(self, 'Set Password', 'Enter password:')
             if ok:
+                changed = []
                 for row in selected_rows:
                     t_title = self.process_threads_table.item(row, 0).text()
                     c_name = self.process_threads_table.item(row, 1).text()
                     if c_name in self.process_threads and t_title in self.process_threads[c_name]:
                         self.process_threads[c_name][t_title]['password'] = text
-                self.save_process_threads_data()
+                        changed.append((c_name, t_title))
+                self.save_process_threads_data(changed=changed)
                 self.populate_process_threads_table(self.process_threads)
 
     def on_process_thread_selected(self, row, column):
@@ -7945,7 +7886,7 @@ class ForumBotGUI(QMainWindow):
             if category_name in self.process_threads and thread_title in self.process_threads[category_name]:
                 self.process_threads[category_name][thread_title]['bbcode_content'] = bbcode_content
                 # Save the updated data
-                self.save_process_threads_data()
+                self.save_process_threads_data(changed=[(category_name, thread_title)])
                 logging.debug(f"BBCode content updated for thread '{thread_title}' in category '{category_name}'")
 
         except Exception as e:
@@ -8010,7 +7951,7 @@ class ForumBotGUI(QMainWindow):
                             'post_status': True,
                         })
                     # 3) persist to disk
-                    self.save_process_threads_data()
+                    self.save_process_threads_data(changed=[(category_name, thread_title)])
 
                     # 4) refresh the table so populate_process_threads_table applies the green color
                     self.populate_process_threads_table(self.process_threads)
@@ -8043,7 +7984,7 @@ class ForumBotGUI(QMainWindow):
                 bbcode_content = self.html_to_bbcode(html_content)
                 self.process_bbcode_editor.set_text(bbcode_content)
                 self.process_threads[category_name][thread_title]['bbcode_content'] = bbcode_content
-                self.save_process_threads_data()
+                self.save_process_threads_data(changed=[(category_name, thread_title)])
             else:
                 QMessageBox.warning(self, "Empty Content", "No content fetched from the thread.")
         except Exception as e:
@@ -8062,10 +8003,12 @@ class ForumBotGUI(QMainWindow):
             QMessageBox.Yes | QMessageBox.No, QMessageBox.No
         )
         if reply == QMessageBox.Yes:
+            removed = []
             for row in selected_rows:
                 thread_title = self.process_threads_table.item(row, 0).text()
                 category_name = self.process_threads_table.item(row, 1).text()
                 thread_id = self.process_threads_table.item(row, 2).text()
+                removed.append((category_name, thread_title))
 
                 # Remove only from self.process_threads
                 if category_name in self.process_threads:
@@ -8079,26 +8022,16 @@ class ForumBotGUI(QMainWindow):
                 # Remove from the table
                 self.process_threads_table.removeRow(row)
 
-            # Save the updated process threads data
-            self.save_process_threads_data()
+            # Save the updated process threads data (removed threads are deleted)
+            self.save_process_threads_data(changed=removed)
             logging.info("Removed selected threads from Process Threads section.")
             self.statusBar().showMessage(f'Removed {len(selected_rows)} thread(s) from Process Threads.')
 
     def save_megathreads_process_threads_data(self):
         try:
-            # Use user-specific path if logged in, otherwise fallback
-            if self.user_manager.get_current_user():
-                user_folder = self.user_manager.get_user_folder()
-                os.makedirs(user_folder, exist_ok=True)
-                filename = os.path.join(user_folder, "megathreads_process_threads.json")
-            else:
-                from utils.paths import get_data_folder
-                data_dir = get_data_folder()
-                filename = os.path.join(data_dir, "megathreads_process_threads.json")
-
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(self.megathreads_process_threads, f, ensure_ascii=False, indent=4)
-            logging.info(f"Megathreads Process Threads data saved to {filename}.")
+            store = self._thread_store()
+            written = store.sync(SECTION_MEGATHREADS, self.megathreads_process_threads)
+            logging.info(f"Megathreads Process Threads data saved to {store.path} ({written} rows written).")
         except Exception as e:
             self.handle_exception("save_megathreads_process_threads_data", e)
 
@@ -8136,6 +8069,7 @@ class ForumBotGUI(QMainWindow):
             processed_any = False
             first_new_thread_title = None
             first_bbcode_content = ''
+            added = []  # (category, title) of the threads added below
 
             # Loop over each discovered thread
             for thread_id, thread_info in new_threads.items():
@@ -8216,6 +8150,7 @@ class ForumBotGUI(QMainWindow):
                     logging.error(f"Failed to store post for templab: {exc}")
 
                 # Store in process_threads: versions + top-level
+                added.append((category_name, thread_title))
                 self.process_threads[category_name][thread_title] = {
                     'versions': [version_data],
                     'bbcode_content': bbcode_content,
@@ -8241,7 +8176,7 @@ class ForumBotGUI(QMainWindow):
             for cat, threads in self.process_threads.items():
                 logging.info(f"💾 Category '{cat}': {len(threads)} threads")
 
-            self.save_process_threads_data()
+            self.save_process_threads_data(changed=added)
 
             # Also save the category data so the Posts section persists across restarts
             self.save_category_data(category_name)
@@ -8306,16 +8241,16 @@ class ForumBotGUI(QMainWindow):
                 'versions': {thread_title: thread_data}
             }
 
-            # Update process threads table immediately
-            self.populate_process_threads_table(self.process_threads)
-
-            # Save to disk immediately for persistence
+            # Save to disk immediately for persistence (the table pages from the store)
             try:
-                self.save_process_threads_data(force=True)
+                self.save_process_threads_data(changed=[(category_name, thread_title)])
                 logging.debug(f"✅ LIVE: Saved thread '{thread_title}' to disk")
             except Exception as e:
                 logging.error(f"Failed to save live thread: {e}")
 
+            # Update process threads table immediately
+            self.populate_process_threads_table(self.process_threads)
+
             logging.debug(f"🔴 LIVE: Added thread '{thread_title}' with {len(file_hosts)} hosts to process threads")
 
         except Exception as e:
@@ -8328,6 +8263,7 @@ class ForumBotGUI(QMainWindow):
             if category_name not in self.process_threads:
                 self.process_threads[category_name] = {}
 
+            added = []  # (category, title) of the threads added below
             for thread_title, thread_info in new_threads.items():
                 try:
                     thread_url, thread_date, thread_id, file_hosts = thread_info
@@ -8358,6 +8294,7 @@ class ForumBotGUI(QMainWindow):
                         author = ''
 
                     # Add to Process Threads with Links and BBCode right away
+                    added.append((category_name, thread_title))
                     self.process_threads[category_name][thread_title] = {
                         'thread_url': thread_url,
                         'thread_date': thread_date,
@@ -8383,12 +8320,12 @@ class ForumBotGUI(QMainWindow):
                         thread_e)
                     continue  # Continue processing other threads
 
+            # Save the updated process threads data (the table pages from the store)
+            self.save_process_threads_data(changed=added)
+
             # Populate the Process Threads table
             self.populate_process_threads_table(self.process_threads)
 
-            # Save the updated process threads data
-            self.save_process_threads_data()
-
             logging.info("Process Threads data saved after new threads were added.")
 
             if new_threads:
@@ -8400,288 +8337,305 @@ class ForumBotGUI(QMainWindow):
             self.handle_exception(f"handle_new_threads_process_threads for category '{category_name}'", e)
 
     def populate_process_threads_table(self, process_threads):
-        """Populate the Process Threads table."""
-        self.process_threads_table.setRowCount(0)
+        """Populate the Process Threads table.
+
+        Rows are diffed against the table instead of rebuilding it: rows of
+        threads that disappeared are removed, changed rows are rewritten in
+        place, new threads are appended and unchanged rows are not touched.
+        Only the pages loaded so far (``process_pager``) get rows; which
+        threads those are comes from the store's indexed date query.
+        """
+        table = self.process_threads_table
+
+        pager = getattr(self, "process_pager", None)
+        window = pager.window if pager is not None else None
+        if window is None:
+            keys = [(c, t) for c, threads in process_threads.items() for t in threads]
+        else:
+            self.wait_process_threads_saved()
+            keys = self._thread_store().page_keys(SECTION_PROCESS, 0, window)
+        if pager is not None:
+            pager.loaded(len(keys))
 
         # Flatten threads to a list for sorting
         flat_threads = []
-        for category, threads in process_threads.items():
-            for thread_title, thread_info in threads.items():
-                # Get data from thread_info (handle both old and new formats)
-                if 'versions' in thread_info and thread_info['versions']:
-                    # New format: get latest version (versions is a dict, not list)
-                    if isinstance(thread_info['versions'], dict):
-                        latest_version = list(thread_info['versions'].values())[-1]
-                    else:
-                        latest_version = thread_info['versions'][-1]
-                    thread_url = latest_version.get('thread_url', '')
-                    thread_date = latest_version.get('thread_date', '')
-                    thread_id = latest_version.get('thread_id', '')
-                    links = latest_version.get('links', {})
-                    # Get status from latest version
-                    download_status = latest_version.get('download_status', False)
-                    upload_status = latest_version.get('upload_status', False)
-                    post_status = latest_version.get('post_status', False)
+        for category, thread_title in keys:
+            thread_info = process_threads.get(category, {}).get(thread_title)
+            if not isinstance(thread_info, dict):
+                continue  # deleted but not saved yet
+            # Get data from thread_info (handle both old and new formats)
+            if 'versions' in thread_info and thread_info['versions']:
+                # New format: get latest version (versions is a dict, not list)
+                if isinstance(thread_info['versions'], dict):
+                    latest_version = list(thread_info['versions'].values())[-1]
                 else:
-                    # Old format: data is directly in thread_info
-                    thread_url = thread_info.get('thread_url', '')
-                    thread_date = thread_info.get('thread_date', '')
-                    thread_id = thread_info.get('thread_id', '')
-                    links = thread_info.get('links', {})
-                    # Get status from thread_info (initialize as False if not exists)
-                    download_status = thread_info.get('download_status', False)
-                    upload_status = thread_info.get('upload_status', False)
-                    post_status = thread_info.get('post_status', False)
-
-                flat_threads.append({
-                    'category': category,
-                    'thread_title': thread_title,
-                    'thread_url': thread_url,
-                    'thread_date': thread_date,
-                    'thread_id': thread_id,
-                    'links': links,
-                    'download_status': download_status,
-                    'upload_status': upload_status,
-                    'post_status': post_status,
-                    'password': thread_info.get('password', ''),
-                    'author': thread_info.get('author', '')
-                })
+                    latest_version = thread_info['versions'][-1]
+                thread_url = latest_version.get('thread_url', '')
+                thread_date = latest_version.get('thread_date', '')
+                thread_id = latest_version.get('thread_id', '')
+                links = latest_version.get('links', {})
+                # Get status from latest version
+                download_status = latest_version.get('download_status', False)
+                upload_status = latest_version.get('upload_status', False)
+                post_status = latest_version.get('post_status', False)
+            else:
+                # Old format: data is directly in thread_info
+                thread_url = thread_info.get('thread_url', '')
+                thread_date = thread_info.get('thread_date', '')
+                thread_id = thread_info.get('thread_id', '')
+                links = thread_info.get('links', {})
+                # Get status from thread_info (initialize as False if not exists)
+                download_status = thread_info.get('download_status', False)
+                upload_status = thread_info.get('upload_status', False)
+                post_status = thread_info.get('post_status', False)
+
+            flat_threads.append({
+                'category': category,
+                'thread_title': thread_title,
+                'thread_url': thread_url,
+                'thread_date': thread_date,
+                'thread_id': thread_id,
+                'links': links,
+                'download_status': download_status,
+                'upload_status': upload_status,
+                'post_status': post_status,
+                'password': thread_info.get('password', ''),
+                'author': thread_info.get('author', '')
+            })
 
         # Sort threads by date if available (descending)
         flat_threads.sort(key=lambda x: x['thread_date'], reverse=True)
 
-        self.process_threads_table.setColumnCount(9)
-        self.process_threads_table.setHorizontalHeaderLabels([
-            "Thread Title", "Category", "Thread ID",
-            "Rapidgator Links", "RG Backup Link", "Keeplinks Link",
-            "Password", "Author", "Status"
-        ])
+        if table.columnCount() != 9:
+            table.setColumnCount(9)
+            table.setHorizontalHeaderLabels([
+                "Thread Title", "Category", "Thread ID",
+                "Rapidgator Links", "RG Backup Link", "Keeplinks Link",
+                "Password", "Author", "Status"
+            ])
 
+        priority_hosts = self.user_manager.get_user_setting(
+            'download_hosts_priority',
+            [
+                'rapidgator.net', 'katfile.com', 'nitroflare.com',
+                'ddownload.com', 'mega.nz', 'xup.in', 'f2h.io',
+                'filepv.com', 'filespayouts.com', 'uploady.io'
+            ],
+        )
+        wanted = {}
         for thread in flat_threads:
-            row_position = self.process_threads_table.rowCount()
-            self.process_threads_table.insertRow(row_position)
-
-            # Determine row background color based on status
-            download_status = thread.get('download_status', False)
-            upload_status = thread.get('upload_status', False)
-            post_status = thread.get('post_status', False)
-
-            # 🔍 ENHANCED DEBUG: Log status values for debugging
-            thread_title = thread.get('thread_title', 'Unknown')
-            category_name = thread.get('category', 'Unknown')
-            print(f"\n🔍 COLOR DEBUG - Thread: {thread_title} (Category: {category_name})")
-            print(f"📊 Status Values - Download: {download_status} | Upload: {upload_status} | Post: {post_status}")
-
-            # Determine status class name for CSS styling
-            status_class = None
-            status_tooltip = "Status: Download ○, Upload ○, Post ○"
-
-            if post_status:  # All complete (green)
-                status_class = "status-posted"
-                status_tooltip = "✅ Status: Download ✓, Upload ✓, Post ✓ (COMPLETED)"
-                print(f"🟢 APPLYING status-posted CSS class for {thread_title}")
-            elif upload_status:  # Download + Upload complete (orange)
-                status_class = "status-uploaded"
-                status_tooltip = "🟡 Status: Download ✓, Upload ✓, Post ○ (UPLOADED)"
-                print(f"🟠 APPLYING status-uploaded CSS class for {thread_title}")
-            elif download_status:  # Only download complete (blue)
-                status_class = "status-downloaded"
-                status_tooltip = "🔵 Status: Download ✓, Upload ○, Post ○ (DOWNLOADED)"
-                print(f"🔵 APPLYING status-downloaded CSS class for {thread_title}")
-            else:  # Nothing complete (pending)
-                status_class = "status-pending"
-                status_tooltip = "⚪ Status: Download ○, Upload ○, Post ○ (PENDING)"
-                print(f"⚪ APPLYING status-pending CSS class for {thread_title}")
-
-            # Force logging to ensure it's visible
-            logging.debug(f"🎨 COLOR SYSTEM: {thread_title} -> CSS Class: {status_class} | Tooltip: {status_tooltip}")
-
-            # Determine status string for filtering (without 'status-' prefix)
-            status_str = status_class.replace('status-', '') if status_class else 'pending'
-
-            title_item = QTableWidgetItem(thread['thread_title'])
-            title_item.setData(Qt.UserRole, status_class)  # ← store CSS class here
-            title_item.setData(Qt.UserRole + 1, status_str)  # ← if you still need string for filtering
-            title_item.setData(Qt.UserRole + 2, thread['thread_url'])  # Store URL in different role
-            title_color = QColor(theme_manager.get_current_theme().PRIMARY)
-            title_item.setForeground(title_color)
-            title_item.setToolTip(f"Click to open thread in browser\n{status_tooltip}")
-            self.process_threads_table.setItem(row_position, 0, title_item)
-
-            category_item = QTableWidgetItem(thread['category'])
-            category_item.setData(Qt.UserRole, status_class)
-            category_item.setData(Qt.UserRole + 1, status_str)
-            self.process_threads_table.setItem(row_position, 1, category_item)
-
-            thread_id_item = QTableWidgetItem(str(thread['thread_id']))
-            thread_id_item.setData(Qt.UserRole, status_class)
-            thread_id_item.setData(Qt.UserRole + 1, status_str)
-            self.process_threads_table.setItem(row_position, 2, thread_id_item)
-
-            # Apply background color for status-based styling
-            if status_class:
-                status_colors = {
-                    'status-pending': "#404040",
-                    'status-downloaded': "#0066CC",
-                    'status-uploaded': "#FF8C00",
-                    'status-posted': "#32CD32"
-                }
+            key = (thread['category'], thread['thread_title'])
+            if key not in wanted:
+                wanted[key] = self._process_thread_row_values(thread, priority_hosts)
 
-                bg_color = status_colors.get(status_class, "#FFFFFF")
-                text_color = "#FFFFFF" if status_class != 'status-pending' else "#CCCCCC"
+        signatures = getattr(self, "_proc_row_signatures", {})
 
-                item_stylesheet = f"background-color: {bg_color} !important; color: {text_color} !important;"
+        # 1) Drop rows whose thread is gone (and duplicate rows)
+        existing = {}
+        stale = []
+        for row in range(table.rowCount()):
+            key = self._process_thread_row_key(row)
+            if key in wanted and key not in existing:
+                existing[key] = row
+            else:
+                stale.append(row)
+        changed = [
+            (existing.get(key), values) for key, values in wanted.items()
+            if key not in existing or signatures.get(key) != values['signature']
+        ]
+        added = sum(1 for row, _ in changed if row is None)
+        updated = len(changed) - added
+
+        if stale or changed:
+            # Sorting stays off while cells are written so rows cannot move
+            # underneath us; re-enabling it sorts once at the end.
+            sorting = table.isSortingEnabled()
+            table.setSortingEnabled(False)
+            try:
+                for row in reversed(stale):
+                    table.removeRow(row)
+                if stale:
+                    existing = {self._process_thread_row_key(r): r for r in range(table.rowCount())}
+                    changed = [
+                        (existing.get((v['texts'][1], v['texts'][0])), v) for _, v in changed
+                    ]
+
+                # 2) Rewrite changed rows in place, 3) append new ones
+                for row, values in changed:
+                    if row is None:
+                        row = table.rowCount()
+                        table.insertRow(row)
+                    self._fill_process_thread_row(row, values)
+            finally:
+                table.setSortingEnabled(sorting)
+        self._proc_row_signatures = {k: v['signature'] for k, v in wanted.items()}
 
-                title_item.setData(Qt.UserRole + 1, item_stylesheet)
+        if changed or stale:
+            table.resizeColumnsToContents()
+            table.resizeRowsToContents()
+        logging.info(
+            f"Process Threads table populated: {added} added, {updated} updated, "
+            f"{len(stale)} removed, {table.rowCount()} rows"
+        )
 
-                bg_qcolor = QColor(bg_color)
-                text_qcolor = QColor(text_color)
-                background_brush = QBrush(bg_qcolor)
-                text_brush = QBrush(text_qcolor)
+        self.apply_cached_statuses_to_table()
+
+        if hasattr(self, "stats_widget"):
+            try:
+                self.stats_widget.update_thread_stats(process_threads)
+            except Exception as e:
+                logging.error(f"Failed to update thread stats: {e}")
 
-                title_item.setBackground(background_brush)
-                title_item.setForeground(text_brush)
+        self._restore_proc_filter_state()
 
-                print(f"🎨 FORCE APPLIED: {status_class} -> BG: {bg_color}, Text: {text_color} on row {row_position}")
-                logging.debug(f"🎨 FORCE STYLING: {thread_title} -> {status_class} -> BG: {bg_color}")
+    def _process_thread_row_key(self, row):
+        title_item = self.process_threads_table.item(row, 0)
+        category_item = self.process_threads_table.item(row, 1)
+        return (
+            category_item.text() if category_item else "",
+            title_item.text() if title_item else "",
+        )
 
-            links = thread['links']
-            # Determine primary host links based on user priority
-            priority_hosts = self.user_manager.get_user_setting(
-                'download_hosts_priority',
-                [
-                    'rapidgator.net', 'katfile.com', 'nitroflare.com',
-                    'ddownload.com', 'mega.nz', 'xup.in', 'f2h.io',
-                    'filepv.com', 'filespayouts.com', 'uploady.io'
-                ],
-            )
+    def _process_thread_row_values(self, thread, priority_hosts):
+        """Cell texts and status of one Process Threads row."""
+        download_status = thread.get('download_status', False)
+        upload_status = thread.get('upload_status', False)
+        post_status = thread.get('post_status', False)
+
+        # Determine status class name for CSS styling
+        if post_status:  # All complete (green)
+            status_class = "status-posted"
+            status_tooltip = "✅ Status: Download ✓, Upload ✓, Post ✓ (COMPLETED)"
+        elif upload_status:  # Download + Upload complete (orange)
+            status_class = "status-uploaded"
+            status_tooltip = "🟡 Status: Download ✓, Upload ✓, Post ○ (UPLOADED)"
+        elif download_status:  # Only download complete (blue)
+            status_class = "status-downloaded"
+            status_tooltip = "🔵 Status: Download ✓, Upload ○, Post ○ (DOWNLOADED)"
+        else:  # Nothing complete (pending)
+            status_class = "status-pending"
+            status_tooltip = "⚪ Status: Download ○, Upload ○, Post ○ (PENDING)"
+
+        links = thread['links']
+        # Determine primary host links based on user priority
+        primary_links = []
+        for host in priority_hosts:
+            entry = links.get(host, {})
+            if isinstance(entry, dict):
+                host_links = entry.get('urls', [])
+            else:
+                host_links = entry if isinstance(entry, list) else [entry]
+            if host_links:
+                primary_links = host_links
+                break
 
-            primary_links = []
-            for host in priority_hosts:
-                entry = links.get(host, {})
-                if isinstance(entry, dict):
-                    host_links = entry.get('urls', [])
+        if not primary_links:
+            # Fallback to any available host
+            for v in links.values():
+                if isinstance(v, dict):
+                    host_links = v.get('urls', [])
                 else:
-                    host_links = entry if isinstance(entry, list) else [entry]
+                    host_links = v if isinstance(v, list) else [v]
                 if host_links:
                     primary_links = host_links
                     break
 
-            if not primary_links:
-                # Fallback to any available host
-                for v in links.values():
-                    if isinstance(v, dict):
-                        host_links = v.get('urls', [])
-                    else:
-                        host_links = v if isinstance(v, list) else [v]
-                    if host_links:
-                        primary_links = host_links
-                        break
-
-            primary_text = "\n".join(primary_links)
-            primary_item = QTableWidgetItem(primary_text)
-            primary_item.setData(Qt.UserRole, status_str)
-            primary_item.setData(Qt.UserRole + 1, status_class)
-            self.process_threads_table.setItem(row_position, 3, primary_item)
-
-            for link in primary_links:
-                norm = self.canonical_url(link)
-                if norm:
-                    self.row_index_by_url[norm] = row_position
-                    hid = self.host_id_key(link)
-                    if hid:
-                        self.row_index_by_hostid[hid] = row_position
-
-            # Rapidgator Backup Link (handle both legacy key styles)
-            rg_backup_info = (
-                links.get('rapidgator_backup')
-                or links.get('rapidgator-backup')
-                or {}
-            )
-            rg_backup_links = (
-                rg_backup_info.get('urls', [])
-                if isinstance(rg_backup_info, dict)
-                else rg_backup_info
-            )
-            flat_backup = []
-            for link in rg_backup_links:
-                if isinstance(link, list):
-                    flat_backup.extend(link)
-                else:
-                    flat_backup.append(link)
-            rg_backup_text = "\n".join(flat_backup)
-            rg_backup_item = QTableWidgetItem(rg_backup_text)
-            rg_backup_item.setData(Qt.UserRole, status_str)
-            rg_backup_item.setData(Qt.UserRole + 1, status_class)
-
-            self.process_threads_table.setItem(row_position, 4, rg_backup_item)
-
-            for link in flat_backup:
-                norm = self.canonical_url(link)
-                if norm:
-                    self.row_index_by_url[norm] = row_position
-                hid = self.host_id_key(link)
-                if hid:
-                    self.row_index_by_hostid[hid] = row_position
-            # Keeplinks Link
-            keeplinks_link = links.get('keeplinks', '')
-            if isinstance(keeplinks_link, list):
-                keeplinks_link = "\n".join(keeplinks_link)
-            keeplinks_item = QTableWidgetItem(keeplinks_link)
-            keeplinks_item.setData(Qt.UserRole, status_str)
-            keeplinks_item.setData(Qt.UserRole + 1, status_class)
-            self.process_threads_table.setItem(row_position, 5, keeplinks_item)
-
-            for link in keeplinks_link.splitlines():
-                norm = self.canonical_url(link.strip())
-                if norm:
-                    self.row_index_by_url[norm] = row_position
-                hid = self.host_id_key(link.strip())
-                if hid:
-                    self.row_index_by_hostid[hid] = row_position
-            # Password column
-            password_text = thread.get('password', '')
-            password_item = QTableWidgetItem(password_text)
-            password_item.setData(Qt.UserRole, status_str)
-            password_item.setData(Qt.UserRole + 1, status_class)
-            self.process_threads_table.setItem(row_position, 6, password_item)
-
-            # Author column
-            author_text = thread.get('author', '')
-            author_item = QTableWidgetItem(author_text)
-            author_item.setData(Qt.UserRole, status_str)
-            author_item.setData(Qt.UserRole + 1, status_class)
-            self.process_threads_table.setItem(row_position, 7, author_item)
-
-            # Status column placeholder
-            status_item = QTableWidgetItem("")
-            self.process_threads_table.setItem(row_position, 8, status_item)
-
-        self.process_threads_table.resizeColumnsToContents()
-        self.process_threads_table.resizeRowsToContents()
-        logging.info("Process Threads table populated successfully")
-
-        self.apply_cached_statuses_to_table()
-
-        self.apply_cached_statuses_to_table()
-
-        if hasattr(self, "stats_widget"):
-            try:
-                self.stats_widget.update_thread_stats(process_threads)
-            except Exception as e:
-                logging.error(f"Failed to update thread stats: {e}")
+        # Rapidgator Backup Link (handle both legacy key styles)
+        rg_backup_info = (
+            links.get('rapidgator_backup')
+            or links.get('rapidgator-backup')
+            or {}
+        )
+        rg_backup_links = (
+            rg_backup_info.get('urls', [])
+            if isinstance(rg_backup_info, dict)
+            else rg_backup_info
+        )
+        flat_backup = []
+        for link in rg_backup_links:
+            if isinstance(link, list):
+                flat_backup.extend(link)
+            else:
+                flat_backup.append(link)
+
+        # Keeplinks Link
+        keeplinks_link = links.get('keeplinks', '')
+        if isinstance(keeplinks_link, list):
+            keeplinks_link = "\n".join(keeplinks_link)
+
+        texts = (
+            thread['thread_title'],
+            thread['category'],
+            str(thread['thread_id']),
+            "\n".join(primary_links),
+            "\n".join(flat_backup),
+            keeplinks_link,
+            thread.get('password', ''),
+            thread.get('author', ''),
+        )
+        return {
+            'texts': texts,
+            'thread_url': thread['thread_url'],
+            'status_class': status_class,
+            'status_tooltip': status_tooltip,
+            'signature': (texts, thread['thread_url'], status_class),
+        }
 
-        self._restore_proc_filter_state()
+    def _fill_process_thread_row(self, row_position, values):
+        """(Re)write the cells of one Process Threads row."""
+        table = self.process_threads_table
+        texts = values['texts']
+        status_class = values['status_class']
+        # Determine status string for filtering (without 'status-' prefix)
+        status_str = status_class.replace('status-', '')
+
+        title_item = QTableWidgetItem(texts[0])
+        title_item.setData(Qt.UserRole, status_class)  # ← store CSS class here
+        title_item.setData(Qt.UserRole + 2, values['thread_url'])  # Store URL in different role
+        title_item.setToolTip(f"Click to open thread in browser\n{values['status_tooltip']}")
+
+        # Apply background color for status-based styling
+        status_colors = {
+            'status-pending': "#404040",
+            'status-downloaded': "#0066CC",
+            'status-uploaded': "#FF8C00",
+            'status-posted': "#32CD32"
+        }
+        bg_color = status_colors.get(status_class, "#FFFFFF")
+        text_color = "#FFFFFF" if status_class != 'status-pending' else "#CCCCCC"
+        item_stylesheet = f"background-color: {bg_color} !important; color: {text_color} !important;"
+        title_item.setData(Qt.UserRole + 1, item_stylesheet)
+        title_item.setBackground(QBrush(QColor(bg_color)))
+        title_item.setForeground(QBrush(QColor(text_color)))
+        table.setItem(row_position, 0, title_item)
+
+        for col in (1, 2):
+            item = QTableWidgetItem(texts[col])
+            item.setData(Qt.UserRole, status_class)
+            item.setData(Qt.UserRole + 1, status_str)
+            table.setItem(row_position, col, item)
+
+        for col in range(3, 8):
+            item = QTableWidgetItem(texts[col])
+            item.setData(Qt.UserRole, status_str)
+            item.setData(Qt.UserRole + 1, status_class)
+            table.setItem(row_position, col, item)
+
+        # Status column placeholder (filled by link checks)
+        if table.item(row_position, 8) is None:
+            table.setItem(row_position, 8, QTableWidgetItem(""))
 
     def migrate_old_links_format(self):
         """Migrate old links format to new dictionary format."""
         try:
+            changed = []
             for category in self.process_threads:
                 for thread_title in self.process_threads[category]:
                     thread_data = self.process_threads[category][thread_title]
                     if 'links' in thread_data:
                         links = thread_data['links']
                         if isinstance(links, list):
+                            changed.append((category, thread_title))
                             # Convert old format to new flat structure
                             thread_data['links'] = {
                                 'rapidgator.net': [link for link in links if 'rapidgator.net' in link],
@@ -8690,7 +8644,8 @@ class ForumBotGUI(QMainWindow):
                             }
 
             # Save updated format
-            self.save_process_threads_data()
+            if changed:
+                self.save_process_threads_data(changed=changed)
         except Exception as e:
             logging.error(f"Error migrating links format: {str(e)}")
 
@@ -8751,7 +8706,7 @@ class ForumBotGUI(QMainWindow):
             # 3) ابنِ الـ worker بنفس المعطيات
             worker = MegaThreadsWorkerThread(
                 bot=self.bot,
-                bot_lock=self.bot_lock,
+                bot_lock=self.driver_pool,
                 category_manager=self.megathreads_category_manager,
                 category_name=category_name,
                 date_filters=df_list,
@@ -8801,6 +8756,7 @@ class ForumBotGUI(QMainWindow):
             if proceed_category_name not in self.process_threads:
                 self.process_threads[proceed_category_name] = {}
 
+            added = []  # (category, title) of the process threads written below
             for main_thread_title, version_info in new_versions.items():
                 actual_version_title = version_info.get('version_title')
                 if not actual_version_title:
@@ -8897,6 +8853,7 @@ class ForumBotGUI(QMainWindow):
 
                 # Also store in process_threads
                 # Use version_title as key since each version is distinct
+                added.append((proceed_category_name, actual_version_title))
                 self.process_threads[proceed_category_name][actual_version_title] = {
                     'versions': [new_version_data]
                 }
@@ -8917,7 +8874,7 @@ class ForumBotGUI(QMainWindow):
 
             # Save updated data immediately so it's visible without restart
             self.save_megathreads_process_threads_data()
-            self.save_process_threads_data()
+            self.save_process_threads_data(changed=added)
 
             # Refresh the Process Threads table to show the updated BBCode instantly
             self.populate_process_threads_table(self.process_threads)
@@ -9024,42 +8981,18 @@ class ForumBotGUI(QMainWindow):
             # وخذ منهما أيضاً page_from و page_to كما سبق
             page_from, page_to = self.settings_tab.get_page_range()
 
-            # 🔍 BOT HEALTH CHECK: Verify bot is responsive before creating worker
-            logging.info(f"🔍 Checking bot health before starting tracking for '{category_name}'")
-            try:
-                # Test bot responsiveness
-                if hasattr(self.bot, 'driver') and self.bot.driver:
-                    current_title = self.bot.driver.title
-                    logging.info(f"✅ Bot is responsive for '{category_name}' (current page: {current_title[:30]}...)")
-                else:
-                    logging.warning(f"⚠️ Bot driver may not be initialized for '{category_name}'")
-            except Exception as bot_check_error:
-                logging.error(f"⚠️ Bot health check failed for '{category_name}': {bot_check_error}")
-                # Continue anyway - let the worker handle bot issues
-
-            # 🔐 BOT LOCK STATUS CHECK: Ensure lock is not stuck from previous session
-            logging.info(f"🔐 Checking bot_lock status before starting '{category_name}'")
-            try:
-                # Try to acquire and immediately release the lock to test if it's available
-                lock_acquired = self.bot_lock.tryLock(1000)  # Try for 1 second
-                if lock_acquired:
-                    self.bot_lock.unlock()
-                    logging.info(f"✅ Bot lock is available for '{category_name}'")
-                else:
-                    logging.warning(f"⚠️ Bot lock appears to be stuck - attempting recovery for '{category_name}'")
-                    # Force unlock attempt (safer approach)
-                    try:
-                        self.bot_lock.unlock()
-                        logging.info(f"🔓 Forced bot_lock unlock successful for '{category_name}'")
-                    except:
-                        logging.warning(f"⚠️ Could not force unlock bot_lock for '{category_name}' - worker may hang")
-            except Exception as lock_check_error:
-                logging.warning(f"⚠️ Bot lock status check failed for '{category_name}': {lock_check_error}")
+            # 🔐 DRIVER POOL STATUS: the worker leases (and health-checks) its own
+            # browser session, waiting at most selenium_lease_timeout seconds
+            pool_stats = self.driver_pool.stats()
+            logging.info(
+                f"🔐 Browser sessions before starting '{category_name}': "
+                f"{pool_stats['busy']} busy / {pool_stats['sessions']} open (max {pool_stats['size']})"
+            )
 
             # ثم مرّر date_filter كسلسلة إلى WorkerThread
             worker = WorkerThread(
                 bot=self.bot,
-                bot_lock=self.bot_lock,
+                bot_lock=self.driver_pool,
                 category_manager=self.category_manager,
                 category_name=category_name,
                 date_filters=date_filter,
@@ -9441,7 +9374,7 @@ class ForumBotGUI(QMainWindow):
                             logging.error(f"Failed to update known hosts/priority for {host}: {e}")
 
                 # حفظ + تحديث الجدول فورًا
-                self.save_process_threads_data()
+                self.save_process_threads_data(changed=[(category, thread_title)])
                 self.populate_process_threads_table(self.process_threads)
 
                 if added_total > 0:
@@ -9530,7 +9463,7 @@ class ForumBotGUI(QMainWindow):
                 self.process_threads[category][thread_title]['links']['manual'] = [f'Manual folder: {folder_path}']
 
                 # Save data
-                self.save_process_threads_data()
+                self.save_process_threads_data(changed=[(category, thread_title)])
 
                 # Refresh UI to show the manual folder/link immediately
                 self.populate_process_threads_table(self.process_threads)
@@ -9604,7 +9537,7 @@ class ForumBotGUI(QMainWindow):
                 model.dataChanged.emit(tl, br)
 
             # Save and refresh UI
-            self.save_process_threads_data()
+            self.save_process_threads_data(changed=[(category_name, thread_title)])
             self.populate_process_threads_table(self.process_threads)
 
             # Finalize when files exist; otherwise poll folder
@@ -9670,7 +9603,7 @@ class ForumBotGUI(QMainWindow):
                     if thread_title not in self.process_threads[cat]:
                         self.process_threads[cat][thread_title] = {'thread_url': thread_url}
                     self.process_threads[cat][thread_title]['bbcode_content'] = bbcode_content
-                    self.save_process_threads_data()
+                    self.save_process_threads_data(changed=[(cat, thread_title)])
                     logging.info(
                         f"Saved BBCode for thread '{thread_title}' in category '{cat}'.")
             else:
@@ -9969,6 +9902,8 @@ class ForumBotGUI(QMainWindow):
     def closeEvent(self, event):
         """Handle the application closing event."""
         logging.info("Closing application. Stopping all worker threads.")
+        if getattr(self, "log_tail_worker", None) is not None:
+            self.log_tail_worker.stop()
         for category_name, worker in self.category_workers.items():
             worker.stop()
             worker.wait()
@@ -9988,26 +9923,33 @@ class ForumBotGUI(QMainWindow):
         # Save Megathreads data (already synchronous)
         self.save_megathreads_process_threads_data()
         # No need to call save_process_threads_data again; it's already saved above.
+        # Write out everything still waiting in the write-behind queue
+        try:
+            write_behind = get_write_behind()
+            write_behind.flush()
+            stats = write_behind.stats()
+            logging.info(
+                f"💾 Write-behind: {stats['writes']} writes, {stats['bytes']} bytes, "
+                f"{stats['coalesced']} saves coalesced, {stats['errors']} errors"
+            )
+        except Exception:
+            logging.error("Error flushing pending writes on close", exc_info=True)
+        try:
+            self.driver_pool.close()
+            stats = self.driver_pool.stats()
+            logging.info(
+                f"🌐 Browser sessions: {stats['leases']} leases, waited avg {stats['wait_avg']:.2f}s / "
+                f"max {stats['wait_max']:.2f}s, {stats['timeouts']} timeouts, "
+                f"{stats['created']} started, {stats['recycled']} recycled"
+            )
+        except Exception:
+            logging.error("Error closing pooled browser sessions", exc_info=True)
         if self.bot:
             self.bot.close()
             logging.info("Closed bot connection.")
         logging.info("Application closed.")
         event.accept()
 
-    def get_process_threads_filepath(self):
-        """
-        إرجاع المسار الكامل لملف Process Threads داخل مجلد المستخدم
-        """
-        if self.user_manager.get_current_user():
-            user_folder = self.user_manager.get_user_folder()
-            os.makedirs(user_folder, exist_ok=True)
-            return os.path.join(user_folder, "process_threads.json")
-        else:
-            # Fallback for non-logged users
-            data_dir = get_data_folder()
-            os.makedirs(data_dir, exist_ok=True)
-            return os.path.join(data_dir, "process_threads.json")
-
     def get_category_threads_filepath(self, category_name):
         """Return the filepath for a category's threads JSON."""
         sanitized_name = sanitize_filename(category_name)
@@ -10020,63 +9962,92 @@ class ForumBotGUI(QMainWindow):
             os.makedirs(data_dir, exist_ok=True)
             return os.path.join(data_dir, f"threads_{sanitized_name}.json")
 
-    def save_process_threads_data(self, force: bool = False):
+    def _thread_store(self):
+        """SQLite store of the current user's (or the shared data folder's) threads."""
+        if self.user_manager.get_current_user():
+            folder = self.user_manager.get_user_folder()
+        else:
+            folder = get_data_folder()
+        return get_thread_store(folder)
+
+    def save_process_threads_data(self, force: bool = False, changed=None):
         """
-        حفظ متغير self.process_threads إلى data/<username>_process_threads.json
-        تم التعديل لتكون عملية الحفظ فورية ومباشرة (Synchronous) لضمان عدم فقدان البيانات.
+        حفظ self.process_threads فى قاعدة بيانات المستخدم (threads.sqlite3).
+
+        ``changed`` is an optional iterable of ``(category, title)`` pairs: only
+        those threads are written (a thread missing from ``process_threads`` is
+        deleted).  Without it the whole dict is diffed against the database and
+        only threads whose content changed are rewritten; that diff hashes and
+        encodes every thread, so it runs on a background thread from a copy
+        taken here, unless ``force`` asks for it to finish before returning.
         """
         try:
-            # Determine target file and user for logging
-            filename = self.get_process_threads_filepath()
-            current_user = self.user_manager.get_current_user() if hasattr(self, 'user_manager') else None
-
-            logging.info(f"💾 Saving process threads data for user: {current_user} to {filename}")
-
-            # Serialize a copy of the data to avoid race conditions with other threads
-            # that might be modifying the dictionary while we are writing it.
-            data_copy = dict(self.process_threads)
-
-            # Ensure the directory exists before writing
-            os.makedirs(os.path.dirname(filename), exist_ok=True)
-
-            # Write the data synchronously to the file.
-            # Using 'with open' ensures the file is properly closed even if an error occurs.
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(data_copy, f, ensure_ascii=False, indent=4)
+            store = self._thread_store()
+            if changed is None and not force:
+                # Copying the dicts is cheap; encoding them is what blocks the GUI
+                snapshot = {
+                    category: {title: dict(info) if isinstance(info, dict) else info
+                               for title, info in (threads or {}).items()}
+                    for category, threads in self.process_threads.items()
+                }
+                if self._process_sync_pool is None:
+                    self._process_sync_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="thread-sync")
+                self._process_sync = self._process_sync_pool.submit(self._sync_process_threads, store, snapshot)
+                return
 
-            logging.info(f"✅ Process Threads data saved successfully to {filename}.")
+            self.wait_process_threads_saved()  # an older full diff must not land after this write
+            if changed is not None:
+                written = 0
+                for category, title in changed:
+                    info = self.process_threads.get(category, {}).get(title)
+                    if info is None:
+                        store.delete(SECTION_PROCESS, category, title)
+                    else:
+                        written += store.upsert(SECTION_PROCESS, category, title, info)
+                logging.debug(f"💾 Process Threads data saved to {store.path} ({written} rows written).")
+            else:
+                self._sync_process_threads(store, self.process_threads)
 
         except Exception as e:
             logging.error(f"❌ Error in save_process_threads_data: {e}", exc_info=True)
             # In a real application, you might want to signal this error to the user
             # self.handle_exception("save_process_threads_data", e)
 
+    @staticmethod
+    def _sync_process_threads(store, process_threads):
+        try:
+            written = store.sync(SECTION_PROCESS, process_threads)
+            logging.debug(f"💾 Process Threads data saved to {store.path} ({written} rows written).")
+        except Exception as e:
+            logging.error(f"❌ Error syncing Process Threads: {e}", exc_info=True)
+
+    def wait_process_threads_saved(self):
+        """Block until a background full save of the Process Threads is on disk."""
+        pending = getattr(self, "_process_sync", None)
+        if pending is not None and not pending.done():
+            pending.result()  # _sync_process_threads logs its own errors
+
     def load_process_threads_data(self):
         """
-        تحميل self.process_threads من مجلد المستخدم أو من الملف القديم
+        تحميل self.process_threads من قاعدة بيانات المستخدم
+        (ملف process_threads.json القديم بيتنقل لها أول مرة تلقائيًا)
         """
-        filename = self.get_process_threads_filepath()
         current_user = self.user_manager.get_current_user() if hasattr(self, 'user_manager') else None
-
         logging.info(f"[DATA] Loading process threads data for user: {current_user}")
-        logging.info(f"[DATA] Target file path: {filename}")
-
-        if not os.path.exists(filename):
-            logging.warning(f"[ERROR] No saved Process Threads data found: {filename}")
-            self.process_threads = {}  # Initialize empty dict
-            return False
 
         try:
-            with open(filename, 'r', encoding='utf-8') as f:
-                loaded_data = json.load(f)
-                logging.info(f"[DATA] Raw loaded data keys: {list(loaded_data.keys()) if loaded_data else 'EMPTY'}")
-                logging.info(f"[DATA] Raw loaded data size: {len(loaded_data) if loaded_data else 0} threads")
-
-                self.process_threads = loaded_data
-                logging.info(f"[DATA] self.process_threads after loading: {len(self.process_threads)} threads")
+            self.wait_process_threads_saved()  # e.g. the previous user's save at logout
+            store = self._thread_store()
+            store.import_legacy()  # legacy JSON copied in since the store was opened
+            self.process_threads = store.load(SECTION_PROCESS)
+            if hasattr(self, "process_pager"):
+                self.process_pager.reset()  # start from the first page again
+            if not self.process_threads:
+                logging.warning(f"[ERROR] No saved Process Threads data found: {store.path}")
+                return False
 
             self.populate_process_threads_table(self.process_threads)
-            logging.info(f"[OK] Process Threads data loaded from {filename} - {len(self.process_threads)} threads")
+            logging.info(f"[OK] Process Threads data loaded from {store.path} - {len(self.process_threads)} categories")
             return True
         except Exception as e:
             logging.error(f"[ERROR] Error loading Process Threads data: {e}", exc_info=True)
@@ -10207,6 +10178,8 @@ class ForumBotGUI(QMainWindow):
             if hasattr(self, 'bot') and self.bot:
                 # Update bot file paths for current user
                 self.bot.update_user_file_paths()
+                # Pooled sessions still carry the previous user's cookies
+                self.driver_pool.invalidate()
 
                 # Load user-specific bot data only if user is logged in
                 if current_user:
@@ -10477,6 +10450,7 @@ class ForumBotGUI(QMainWindow):
             files_to_migrate = [
                 'cookies.pkl',
                 'processed_threads.pkl',
+                'processed_threads.journal',
                 'rapidgator_download_token.json',
                 'rapidgator_upload_token.json'
             ]
@@ -10514,8 +10488,12 @@ class ForumBotGUI(QMainWindow):
         self.migrate_legacy_data_files()
         try:
             migrated_count = 0
-            for thread_id, thread_data in self.process_threads.items():
-                if 'versions' in thread_data:
+            changed = []
+            for category, threads in self.process_threads.items():
+                for thread_id, thread_data in (threads or {}).items():
+                    if not isinstance(thread_data, dict) or not isinstance(thread_data.get('versions'), list):
+                        continue
+                    before = migrated_count
                     for version in thread_data['versions']:
                         # Check if links is a string (old format)
                         if isinstance(version.get('links', ''), str) and version['links']:
@@ -10530,10 +10508,12 @@ class ForumBotGUI(QMainWindow):
                             old_links = version['links']
                             version['links'] = {'mixed': [old_links]}
                             migrated_count += 1
+                    if migrated_count > before:
+                        changed.append((category, thread_id))
 
             if migrated_count > 0:
                 logging.info(f"🔄 Migrated {migrated_count} old links format entries to new dictionary format")
-                self.save_process_threads_data()  # Save migrated data
+                self.save_process_threads_data(changed=changed)  # Save migrated data
 
         except Exception as e:
             logging.error(f"Error migrating old links format: {e}", exc_info=True)
@@ -10622,7 +10602,7 @@ class ForumBotGUI(QMainWindow):
                 logging.info(f"🐛 DEBUG - Thread info data: {thread_info}")
 
             # Save the updated data
-            self.save_process_threads_data()
+            self.save_process_threads_data(changed=[(category_name, thread_title)])
             logging.info(f"🐛 DEBUG - Saved updated data for thread '{thread_title}'")
 
             # Emit signal for thread-safe UI update
@@ -10959,7 +10939,7 @@ class ForumBotGUI(QMainWindow):
 
         worker = ProceedTemplateWorker(
             bot=self.bot,
-            bot_lock=self.bot_lock,
+            bot_lock=self.driver_pool,
             category=category,
             title=title,
             raw_bbcode=raw_bbcode,
@@ -10986,7 +10966,7 @@ class ForumBotGUI(QMainWindow):
         self.process_bbcode_editor.set_text(bbcode_filled)
         thread["bbcode_content"] = bbcode_filled
         self.current_post_data = thread
-        self.save_process_threads_data()
+        self.save_process_threads_data(changed=[(category, title)])
         ui_notifier.info("Proceed Template", "Template applied & image uploaded")
 
         logging.info(f"Proceed Template updated: {category}/{title}, len={len(bbcode_filled)}")
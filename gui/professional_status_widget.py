@@ -20,7 +20,7 @@ import threading
 from typing import Dict, Optional, Set
 from datetime import datetime, timedelta
 from PyQt5.QtWidgets import (
-    QWidget, QTableWidget, QTableWidgetItem, QVBoxLayout, QHeaderView,
+    QWidget, QTableView, QAbstractItemView, QVBoxLayout, QHeaderView,
     QProgressBar, QLabel, QHBoxLayout, QPushButton, QStyleOptionProgressBar,
     QApplication, QStyle, QSizePolicy, QStyledItemDelegate, QMenu, QMessageBox
 )
@@ -37,6 +37,7 @@ from utils.crash_protection import (
 )
 # Import theme system for proper integration
 from gui.themes import theme_manager
+from gui.status_model import OperationTableModel, OperationRow
 
 # Helper to get current theme (following the same pattern as other components)
 def T():
@@ -262,44 +263,6 @@ class ProfessionalProgressBar(QProgressBar):
             logger.error(f"Progress bar update failed: {e}", exc_info=True)
 
 
-class StatusRow:
-    """
-    Represents a single status row with bulletproof data management
-    """
-
-    def __init__(self, operation_id: str, row_index: int):
-        self.operation_id = operation_id
-        self.row_index = row_index
-        self.created_time = datetime.now()
-
-        # UI items (will be set when row is created)
-        self.section_item: Optional[QTableWidgetItem] = None
-        self.item_item: Optional[QTableWidgetItem] = None
-        self.operation_item: Optional[QTableWidgetItem] = None
-        self.status_item: Optional[QTableWidgetItem] = None
-        self.progress_item: Optional[QTableWidgetItem] = None  # Changed from progress_bar
-        self.progress_value: int = 0  # Store progress value
-        self.speed_item: Optional[QTableWidgetItem] = None
-        self.eta_item: Optional[QTableWidgetItem] = None
-        self.details_item: Optional[QTableWidgetItem] = None
-        self.duration_item: Optional[QTableWidgetItem] = None
-
-        # Host-specific status tracking for uploads
-        self.host_statuses: Dict[str, str] = {}  # host -> status (success/failed/pending)
-        self.host_urls: Dict[str, list] = {}  # host -> [urls]
-        self.retry_count: int = 0  # Track retry attempts
-        self.keeplinks_url: str = ""  # Store KeepLinks URL
-
-    def is_complete(self) -> bool:
-        """Check if row has all required UI items"""
-        return all([
-            self.section_item, self.item_item, self.operation_item,
-            self.status_item, self.progress_item,  # Changed from progress_bar
-            self.speed_item, self.eta_item,
-            self.details_item, self.duration_item
-        ])
-
-
 class ProfessionalStatusWidget(QWidget):
     """
     🎯 THE ULTIMATE STATUS WIDGET - PURE PROFESSIONAL MAGIC!
@@ -338,12 +301,15 @@ class ProfessionalStatusWidget(QWidget):
     openPostedUrl = pyqtSignal(str)  # url
     copyJDLinkRequested = pyqtSignal(str)  # jdl_path
 
+    # Rows kept in the table; older finished rows move to model.archived
+    MAX_ROWS = 2000
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
         # THE single mapping system - NO MORE CONFLICTS!
-        self._operation_rows: Dict[str, StatusRow] = {}  # operation_id -> StatusRow
-        self._row_operations: Dict[int, str] = {}  # row_index -> operation_id
+        # operation_id -> row lookups live in the model and are O(1)
+        self.model = OperationTableModel(max_rows=self.MAX_ROWS)
 
         # Legacy compatibility storage
         self._jd_links: Dict[tuple, str] = {}
@@ -408,20 +374,9 @@ class ProfessionalStatusWidget(QWidget):
         self.header = header  # Store reference for theme updates
         layout.addWidget(header)
 
-        # Status table
-        self.table = QTableWidget()
-        self.table.setColumnCount(9)
-        self.table.setHorizontalHeaderLabels([
-            "Section",
-            "Item",
-            "Operation",
-            "Status",
-            "Progress",
-            "Speed",
-            "ETA",
-            "Details",
-            "Duration",
-        ])
+        # Status table - a view over the model, only visible rows are painted
+        self.table = QTableView()
+        self.table.setModel(self.model)
 
         # Configure table
         self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeToContents)  # Section
@@ -443,22 +398,20 @@ class ProfessionalStatusWidget(QWidget):
         # Set a good default width for progress column
         self.table.setColumnWidth(4, 120)  # Progress bar width
 
-        # CRITICAL: Set default row height for all rows to ensure widgets fit
+        # CRITICAL: Fixed row height keeps the view from measuring every row
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
         self.table.verticalHeader().setDefaultSectionSize(30)  # Default height for new rows
         self.table.verticalHeader().setMinimumSectionSize(30)  # Minimum height
 
         self.table.setAlternatingRowColors(True)
-        self.table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.table.setSelectionMode(QTableWidget.ExtendedSelection)  # Allow multiple selection for batch operations
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.ExtendedSelection)  # Allow multiple selection for batch operations
         self.table.verticalHeader().setVisible(False)
 
         # Enable context menu
         self.table.setContextMenuPolicy(Qt.CustomContextMenu)
         self.table.customContextMenuRequested.connect(self._show_context_menu)
 
-        # Set default row height to accommodate progress bars
-        self.table.verticalHeader().setDefaultSectionSize(30)
-
         layout.addWidget(self.table)
 
         # Statistics footer
@@ -522,7 +475,7 @@ class ProfessionalStatusWidget(QWidget):
 
         # Table styling
         self.table.setStyleSheet(f"""
-            QTableWidget {{
+            QTableView {{
                 border: 1px solid {t.BORDER};
                 border-radius: {t.RADIUS_SMALL};
                 background-color: {t.SURFACE};
@@ -533,16 +486,16 @@ class ProfessionalStatusWidget(QWidget):
                 font-family: {t.FONT_FAMILY};
                 font-size: {t.FONT_SIZE_NORMAL};
             }}
-            QTableWidget::item {{
+            QTableView::item {{
                 padding: 8px;
                 border: none;
                 color: {t.TEXT_PRIMARY};
             }}
-            QTableWidget::item:selected {{
+            QTableView::item:selected {{
                 background-color: {t.PRIMARY};
                 color: {t.TEXT_ON_PRIMARY};
             }}
-            QTableWidget::item:hover {{
+            QTableView::item:hover {{
                 background-color: {t.SIDEBAR_ITEM_HOVER};
             }}
             QHeaderView::section {{
@@ -590,10 +543,13 @@ class ProfessionalStatusWidget(QWidget):
         """Public method to update theme when application theme changes"""
         self._apply_theme_styles()
 
-        # Update all existing progress bars
-        for status_row in self._operation_rows.values():
-            if status_row.progress_bar:
-                status_row.progress_bar.update_style()
+        # Progress bars are painted by the delegate - a repaint is enough
+        self.table.viewport().update()
+
+    @property
+    def _operation_rows(self) -> Dict[str, OperationRow]:
+        """Live ``operation_id -> OperationRow`` mapping kept by the model."""
+        return self.model.mapping()
 
     def _connect_signals(self):
         """Connect to the status manager signals for real-time updates"""
@@ -611,7 +567,8 @@ class ProfessionalStatusWidget(QWidget):
         )
 
         # Table selection
-        self.table.itemSelectionChanged.connect(self._on_selection_changed)
+        self.table.selectionModel().selectionChanged.connect(self._on_selection_changed)
+        self.model.rows_archived.connect(self._on_rows_archived)
 
     @crash_safe_execute(max_retries=1, default_return=None, severity=ErrorSeverity.MEDIUM)
     def _load_existing_operations(self):
@@ -637,22 +594,10 @@ class ProfessionalStatusWidget(QWidget):
 
         with QMutexLocker(self._ui_mutex):
             # Check if we already have this operation (prevent duplicates)
-            if operation_id in self._operation_rows:
+            if operation_id in self.model:
                 logger.warning(f"Operation {operation_id} already exists in table")
                 return
 
-            # Create new row with COMPLETE data immediately
-            row_index = self.table.rowCount()
-            self.table.insertRow(row_index)
-
-            # CRITICAL FIX: Set row height to ensure progress bar is visible!
-            self.table.setRowHeight(row_index, 30)  # Must be tall enough for progress bar
-
-            logger.info(f"✅ Created new row at index {row_index} for operation {operation_id}")
-
-            # Create status row object
-            status_row = StatusRow(operation_id, row_index)
-
             # Track upload operations for averaging
             op_type = operation_data.get('operation_type', '')
             if self._is_upload_operation(op_type):
@@ -666,22 +611,18 @@ class ProfessionalStatusWidget(QWidget):
                 self._upload_target_progress[operation_id] = initial_progress
                 logger.info(f"Tracking upload operation: {operation_id} with initial progress: {initial_progress}%")
 
-            # Create ALL cells with complete information
+            # Create the row with COMPLETE information - ONE operation = ONE row!
             try:
-                self._create_complete_row(status_row, operation_data)
-                logger.info(f"Row cells created successfully for {operation_id}")
+                self.model.add(operation_id, operation_data)
             except Exception as e:
-                logger.error(f"ERROR creating row cells: {e}", exc_info=True)
+                logger.error(f"ERROR creating row for {operation_id}: {e}", exc_info=True)
                 return
 
-            # Update mappings - ONE operation = ONE row!
-            self._operation_rows[operation_id] = status_row
-            self._row_operations[row_index] = operation_id
+            row_index = self.model.row_of(operation_id)
+            if row_index is not None and row_index == self.model.rowCount() - 1:
+                self.table.scrollTo(self.model.index(row_index, 0), QAbstractItemView.EnsureVisible)
 
-            # Schedule deferred UI update to avoid blocking
-            QTimer.singleShot(0, self._force_table_update)
-
-            logger.info(f"Operation row created: {operation_id} at row {row_index}, table now has {self.table.rowCount()} rows visible")
+            logger.debug(f"Operation row created: {operation_id} at row {row_index}, table now has {self.model.rowCount()} rows")
             self._update_statistics()
             self._schedule_status_save()
 
@@ -692,31 +633,32 @@ class ProfessionalStatusWidget(QWidget):
         Handle operation updates with INSTANT UI synchronization.
         UI updates IMMEDIATELY - no delays, no batching!
         """
-        logger.info(f"🔄 _on_operation_updated called: {operation_id}, changes: {changes}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"🔄 _on_operation_updated called: {operation_id}, changes: {changes}")
 
         with QMutexLocker(self._ui_mutex):
-            status_row = self._operation_rows.get(operation_id)
+            status_row = self.model.get(operation_id)
             if not status_row:
                 logger.warning(f"Received update for unknown operation: {operation_id}")
                 return
 
             # Update UI elements based on changes - INSTANTLY!
             if 'status' in changes:
-                logger.info(f"📊 Updating status cell to: {changes['status']}")
-                self._update_status_cell(status_row, changes['status'])
+                logger.debug(f"📊 Updating status cell to: {changes['status']}")
+                self._update_status_cell(operation_id, changes['status'])
 
             # Handle host-specific status updates
             if 'host' in changes:
                 host = changes['host']
                 host_status = changes.get('host_status', 'pending')
                 host_urls = changes.get('host_urls', [])
-                self._update_host_status(status_row, host, host_status, host_urls)
-                logger.info(f"🔄 Updated host status: {host} -> {host_status}")
+                self._update_host_status(operation_id, host, host_status, host_urls)
+                logger.debug(f"🔄 Updated host status: {host} -> {host_status}")
 
             # Update KeepLinks URL if provided
             if 'keeplinks_url' in changes:
                 status_row.keeplinks_url = changes['keeplinks_url']
-                logger.info(f"📎 Updated KeepLinks URL: {status_row.keeplinks_url}")
+                logger.debug(f"📎 Updated KeepLinks URL: {status_row.keeplinks_url}")
 
             # Always update progress bar if we have progress OR status changes
             if 'progress' in changes or 'progress_percentage' in changes or 'status' in changes:
@@ -785,10 +727,10 @@ class ProfessionalStatusWidget(QWidget):
                 logger.debug(
                     f"Updating progress bar: raw={progress}% display={display_progress}% - {status} - {operation_type}"
                 )
-                self._update_progress_bar(status_row, display_progress, status, operation_type)
+                self._update_progress_bar(operation_id, display_progress, status, operation_type)
 
             if 'details' in changes:
-                self._update_details_cell(status_row, changes['details'])
+                self._update_details_cell(operation_id, changes['details'])
 
             # Update speed with host-specific averaging for uploads
             speed = None
@@ -814,7 +756,7 @@ class ProfessionalStatusWidget(QWidget):
                     if host_speeds:
                         display_speed = sum(host_speeds) / len(host_speeds)
 
-                self._update_speed_cell(status_row, display_speed)
+                self._update_speed_cell(operation_id, display_speed)
 
             # Update ETA with host-specific averaging for uploads
             eta_seconds = None
@@ -847,10 +789,11 @@ class ProfessionalStatusWidget(QWidget):
                     if host_etas:
                         display_eta = sum(host_etas) / len(host_etas)
 
-                self._update_eta_cell(status_row, display_eta)
+                self._update_eta_cell(operation_id, display_eta)
 
-            # Update statistics
-            self._update_statistics()
+            # Counters only move when an operation changes state
+            if 'status' in changes:
+                self._update_statistics()
             self._schedule_status_save()
 
     @pyqtSlot(str, dict)
@@ -860,18 +803,17 @@ class ProfessionalStatusWidget(QWidget):
         Handle operation completion with beautiful visual feedback.
         """
         with QMutexLocker(self._ui_mutex):
-            status_row = self._operation_rows.get(operation_id)
-            if not status_row:
+            if operation_id not in self.model:
                 return
 
             # Update final state
             status = final_data.get('status', 'COMPLETED')
             operation_type = final_data.get('operation_type', '')
-            self._update_status_cell(status_row, status)
-            self._update_progress_bar(status_row, 100, status, operation_type)
+            self._update_status_cell(operation_id, status)
+            self._update_progress_bar(operation_id, 100, status, operation_type)
 
             if 'details' in final_data:
-                self._update_details_cell(status_row, final_data['details'])
+                self._update_details_cell(operation_id, final_data['details'])
 
             # Remove from upload tracking if it's an upload operation
             if operation_id in self._upload_operations:
@@ -882,11 +824,22 @@ class ProfessionalStatusWidget(QWidget):
                 logger.info(f"Removed completed upload from tracking: {operation_id}")
 
             # Highlight completed row briefly
-            self._highlight_completed_row(status_row)
+            self._highlight_completed_row(operation_id)
 
             logger.info(f"Operation completed in UI: {operation_id}")
+            self._update_statistics()
             self._schedule_status_save()
 
+    @pyqtSlot(list)
+    def _on_rows_archived(self, operation_ids: list):
+        """Finished rows pushed out by the row limit - drop their bookkeeping"""
+        for operation_id in operation_ids:
+            self._upload_operations.discard(operation_id)
+            self._upload_progress.pop(operation_id, None)
+            self._upload_display_progress.pop(operation_id, None)
+            self._upload_target_progress.pop(operation_id, None)
+        logger.debug(f"Archived {len(operation_ids)} finished operations ({self.model.archived_total} total)")
+
     @pyqtSlot(str)
     @crash_safe_execute(max_retries=2, default_return=None, severity=ErrorSeverity.MEDIUM)
     def _on_operation_removed(self, operation_id: str):
@@ -894,276 +847,47 @@ class ProfessionalStatusWidget(QWidget):
         Handle operation removal with smooth cleanup.
         """
         with QMutexLocker(self._ui_mutex):
-            status_row = self._operation_rows.get(operation_id)
-            if not status_row:
+            if not self.model.remove([operation_id]):
                 return
 
-            row_index = status_row.row_index
-
-            # Remove from table
-            self.table.removeRow(row_index)
-
-            # Clean up mappings
-            del self._operation_rows[operation_id]
-            if row_index in self._row_operations:
-                del self._row_operations[row_index]
-
-            # Update row indices for remaining rows
-            self._reindex_rows_after_removal(row_index)
-
             logger.info(f"Operation removed from UI: {operation_id}")
             self._update_statistics()
             self._schedule_status_save()
 
     # ==========================================
-    # ROW CREATION AND MANAGEMENT
+    # ROW MANAGEMENT
     # ==========================================
 
-    @crash_safe_execute(max_retries=2, default_return=None, severity=ErrorSeverity.CRITICAL)
-    def _create_complete_row(self, status_row: StatusRow, operation_data: dict):
-        """
-        Create a complete row with ALL information from the start.
-        NO MORE EMPTY CELLS - everything is ready immediately!
-        """
-        row = status_row.row_index
-
-        try:
-            # Section cell
-            section_text = str(operation_data.get('section', 'Unknown'))
-            status_row.section_item = QTableWidgetItem(section_text)
-            status_row.section_item.setFont(QFont("Arial", 9, QFont.Bold))
-            self.table.setItem(row, 0, status_row.section_item)
-            logger.debug(f"Created section cell: {section_text}")
-
-            # Item cell
-            status_row.item_item = QTableWidgetItem(operation_data.get('item', 'Unknown'))
-            self.table.setItem(row, 1, status_row.item_item)
-
-            # Operation type cell - Use section name for Template operations
-            op_type = operation_data.get('operation_type', 'UNKNOWN')
-            section = operation_data.get('section', '')
-
-            # If section is Template, use Template as operation name
-            if section.lower() == 'template':
-                operation_display = 'Template'
-            else:
-                operation_display = self._format_operation_type(op_type, section)
-
-            status_row.operation_item = QTableWidgetItem(operation_display)
-            status_row.operation_item.setFont(QFont("Arial", 9, QFont.Bold))
-            status_row.operation_item.setTextAlignment(Qt.AlignCenter)
-            self.table.setItem(row, 2, status_row.operation_item)
-
-            # Status cell
-            status = operation_data.get('status', 'PENDING')
-            status_row.status_item = QTableWidgetItem(status)
-            status_row.status_item.setTextAlignment(Qt.AlignCenter)
-            self._apply_status_styling(status_row.status_item, status)
-            self.table.setItem(row, 3, status_row.status_item)
-
-            # Speed cell (column 5)
-            speed = operation_data.get('transfer_speed', 0)
-            speed_text = self._format_speed(speed)
-            status_row.speed_item = QTableWidgetItem(speed_text)
-            status_row.speed_item.setTextAlignment(Qt.AlignCenter)
-            self.table.setItem(row, 5, status_row.speed_item)
-
-            # ETA cell (column 6)
-            eta_seconds = None
-            if operation_data.get('estimated_completion'):
-                try:
-                    eta_dt = datetime.fromisoformat(operation_data['estimated_completion'])
-                    eta_seconds = max(0, (eta_dt - datetime.now()).total_seconds())
-                except Exception:
-                    eta_seconds = None
-            else:
-                total_bytes = operation_data.get('total_bytes', 0)
-                transferred = operation_data.get('bytes_transferred', 0)
-                if speed and speed > 0 and total_bytes > 0:
-                    remaining = max(0, total_bytes - transferred)
-                    eta_seconds = remaining / speed
-            eta_text = self._format_eta(eta_seconds)
-            status_row.eta_item = QTableWidgetItem(eta_text)
-            status_row.eta_item.setTextAlignment(Qt.AlignCenter)
-            self.table.setItem(row, 6, status_row.eta_item)
-
-            # Details cell (column 7)
-            details = operation_data.get('details', 'Initializing...')
-            status_row.details_item = QTableWidgetItem(details)
-            status_row.details_item.setToolTip(details)  # Show full text on hover
-            self.table.setItem(row, 7, status_row.details_item)
-
-            # Duration cell (column 8)
-            status_row.duration_item = QTableWidgetItem("0s")
-            status_row.duration_item.setTextAlignment(Qt.AlignCenter)
-            self.table.setItem(row, 8, status_row.duration_item)
-
-            # Progress cell (column 4) - Using delegate pattern
-            # Get progress - already in 0-100 range from workers
-            progress_raw = operation_data.get('progress_percentage', 0)
-            if progress_raw == 0:
-                progress_raw = operation_data.get('progress', 0)
-            # Progress is ALREADY in 0-100 range, DO NOT multiply!
-            progress = int(progress_raw)
-
-            # Create a QTableWidgetItem for the progress cell
-            status_row.progress_item = QTableWidgetItem("")
-            # Store the progress value in UserRole for the delegate to paint
-            status_row.progress_item.setData(Qt.UserRole, progress)
-            # Set the item in the table
-            self.table.setItem(row, 4, status_row.progress_item)
-
-            logger.info(f"Set progress cell with delegate: progress={progress}%")
-
-            # Store progress value for future updates
-            status_row.progress_value = progress
-
-            # Ensure the row is visible if needed
-            if row == self.table.rowCount() - 1:  # Last row
-                self.table.scrollToItem(self.table.item(row, 0), QTableWidget.EnsureVisible)
-
-        except Exception as e:
-            logger.error(f"Error in _create_complete_row: {e}", exc_info=True)
-            # Ensure we at least have basic items to prevent crashes
-            if not status_row.section_item:
-                status_row.section_item = QTableWidgetItem("Error")
-                self.table.setItem(row, 0, status_row.section_item)
-            if not status_row.item_item:
-                status_row.item_item = QTableWidgetItem("Error")
-                self.table.setItem(row, 1, status_row.item_item)
-
     @crash_safe_execute(max_retries=1, default_return=None, severity=ErrorSeverity.MEDIUM)
-    def _update_status_cell(self, status_row: StatusRow, status):
-        """Update status cell with beautiful styling"""
-        if status_row.status_item:
-            # Convert OperationStatus enum to string if needed
-            status_text = status.value if hasattr(status, 'value') else str(status)
-            status_row.status_item.setText(status_text)
-            self._apply_status_styling(status_row.status_item, status_text)
-
-    def _update_progress_bar(self, status_row: StatusRow, percentage: int, status: str, operation_type: str = ""):
-        """Update progress value using delegate pattern"""
-        try:
-            if status_row.progress_item:
-                # Update the progress value in UserRole
-                status_row.progress_item.setData(Qt.UserRole, percentage)
-                status_row.progress_value = percentage
-
-                # Emit dataChanged signal to trigger delegate repaint
-                model_index = self.table.model().index(status_row.row_index, 4)
-                self.table.model().dataChanged.emit(model_index, model_index, [Qt.UserRole])
+    def _update_status_cell(self, operation_id: str, status):
+        """Update status cell; colors come from the model"""
+        self.model.update(operation_id, status=status)
 
-                # Force viewport update
-                self.table.viewport().update()
-
-                logger.debug(f"Updated progress for row {status_row.row_index}: {percentage}%")
+    def _update_progress_bar(self, operation_id: str, percentage: int, status: str, operation_type: str = ""):
+        """Update progress value painted by the delegate"""
+        try:
+            self.model.update(operation_id, progress=percentage)
         except Exception as e:
             logger.error(f"Failed to update progress: {e}", exc_info=True)
 
     @crash_safe_execute(max_retries=1, default_return=None, severity=ErrorSeverity.MEDIUM)
-    def _update_details_cell(self, status_row: StatusRow, details: str):
-        """Update details cell with tooltip"""
-        if status_row.details_item:
-            # Include host status if available
-            if status_row.host_statuses:
-                host_summary = self._format_host_status_summary(status_row)
-                if host_summary:
-                    details = f"{details} | {host_summary}"
-            status_row.details_item.setText(details)
-            status_row.details_item.setToolTip(details)
-
-    def _format_host_status_summary(self, status_row: StatusRow) -> str:
-        """Format host status summary for display"""
-        if not status_row.host_statuses:
-            return ""
-
-        success_count = sum(1 for s in status_row.host_statuses.values() if s == "success")
-        failed_count = sum(1 for s in status_row.host_statuses.values() if s == "failed")
-        pending_count = sum(1 for s in status_row.host_statuses.values() if s == "pending")
-
-        parts = []
-        if success_count > 0:
-            parts.append(f"✅{success_count}")
-        if failed_count > 0:
-            parts.append(f"❌{failed_count}")
-        if pending_count > 0:
-            parts.append(f"⏳{pending_count}")
-
-        return " ".join(parts)
-
-    def _update_host_status(self, status_row: StatusRow, host: str, status: str, urls: list = None):
+    def _update_details_cell(self, operation_id: str, details: str):
+        """Update details cell; the host summary is appended by the model"""
+        self.model.update(operation_id, details=details)
+
+    def _update_host_status(self, operation_id: str, host: str, status: str, urls: list = None):
         """Update status for a specific host"""
-        status_row.host_statuses[host] = status
-        if urls:
-            status_row.host_urls[host] = urls
-
-        # Update details display
-        if status_row.details_item:
-            current_text = status_row.details_item.text()
-            # Remove old host summary if present
-            if " | " in current_text:
-                current_text = current_text.split(" | ")[0]
-
-            host_summary = self._format_host_status_summary(status_row)
-            if host_summary:
-                new_text = f"{current_text} | {host_summary}"
-                status_row.details_item.setText(new_text)
-                status_row.details_item.setToolTip(new_text)
+        self.model.set_host_status(operation_id, host, status, urls)
 
     @crash_safe_execute(max_retries=1, default_return=None, severity=ErrorSeverity.MEDIUM)
-    def _update_speed_cell(self, status_row: StatusRow, speed: float):
+    def _update_speed_cell(self, operation_id: str, speed: float):
         """Update speed cell"""
-        if status_row.speed_item:
-            status_row.speed_item.setText(self._format_speed(speed))
+        self.model.update(operation_id, speed=speed)
 
     @crash_safe_execute(max_retries=1, default_return=None, severity=ErrorSeverity.MEDIUM)
-    def _update_eta_cell(self, status_row: StatusRow, eta_seconds: float):
+    def _update_eta_cell(self, operation_id: str, eta_seconds: float):
         """Update ETA cell"""
-        if status_row.eta_item:
-            status_row.eta_item.setText(self._format_eta(eta_seconds))
-
-    def _format_speed(self, bytes_per_sec: float) -> str:
-        """Format transfer speed for display"""
-        if not bytes_per_sec or bytes_per_sec <= 0:
-            return "--"
-        speed = float(bytes_per_sec)
-        units = ["B/s", "KB/s", "MB/s", "GB/s"]
-        idx = 0
-        while speed >= 1024 and idx < len(units) - 1:
-            speed /= 1024
-            idx += 1
-        return f"{speed:.1f} {units[idx]}"
-
-    def _format_eta(self, seconds: Optional[float]) -> str:
-        """Format ETA seconds into human-readable text"""
-        if seconds is None or seconds <= 0:
-            return "--"
-        seconds = int(seconds)
-        mins, secs = divmod(seconds, 60)
-        hours, mins = divmod(mins, 60)
-        parts = []
-        if hours:
-            parts.append(f"{hours}h")
-        if mins:
-            parts.append(f"{mins}m")
-        parts.append(f"{secs}s")
-        return " ".join(parts)
-
-    def _apply_status_styling(self, item: QTableWidgetItem, status: str):
-        """Apply beautiful status-based styling"""
-        status_colors = {
-            'PENDING': QColor(150, 150, 150),      # Gray
-            'INITIALIZING': QColor(52, 152, 219),  # Blue
-            'RUNNING': QColor(46, 204, 113),       # Green
-            'PAUSED': QColor(241, 196, 15),        # Yellow
-            'COMPLETED': QColor(39, 174, 96),      # Dark Green
-            'FAILED': QColor(231, 76, 60),         # Red
-            'CANCELLED': QColor(149, 165, 166)     # Light Gray
-        }
-
-        color = status_colors.get(status.upper(), QColor(100, 100, 100))
-        item.setForeground(color)
-        item.setFont(QFont("Arial", 9, QFont.Bold))
+        self.model.update(operation_id, eta=eta_seconds)
 
     def _is_upload_operation(self, op_type: str) -> bool:
         """Check if operation type is an upload operation"""
@@ -1219,10 +943,9 @@ class ProfessionalStatusWidget(QWidget):
 
             # Step 5: Update each upload operation with professional smoothing
             for op_id in self._upload_operations:
-                if op_id not in self._operation_rows:
+                if op_id not in self.model:
                     continue
 
-                status_row = self._operation_rows[op_id]
                 operation = self.status_manager.get_operation(op_id)
 
                 if not operation or not operation.is_active:
@@ -1260,74 +983,18 @@ class ProfessionalStatusWidget(QWidget):
                 # Update progress bar with smoothed value
                 smoothed_value = max(0, min(100, int(self._upload_display_progress[op_id])))
                 self._update_progress_bar(
-                    status_row,
+                    op_id,
                     smoothed_value,
                     operation.status,
                     operation.operation_type
                 )
 
-    def _format_operation_type(self, op_type: str, section: str = "") -> str:
-        """Format operation type for display based on section context"""
-        # Use section name for specific sections
-        section_lower = section.lower()
-        if section_lower in ['template', 'templates']:
-            return 'Template'
-        elif section_lower in ['backup', 'backups']:
-            return 'Backup'
-        elif section_lower in ['post', 'posting']:
-            return 'Posting'
-        elif section_lower in ['track', 'tracking']:
-            return 'Tracking'
-
-        # Default type mapping for other operations
-        type_map = {
-            'TRACKING': 'Tracking',
-            'POSTING': 'Posting',
-            'BACKUP': 'Backup',
-            'REUPLOAD': 'Re-upload',
-            'DOWNLOAD': 'Download',
-            'UPLOAD_RAPIDGATOR': 'RapidGator',
-            'UPLOAD_KATFILE': 'KatFile',
-            'UPLOAD_NITROFLARE': 'NitroFlare',
-            'UPLOAD_DDOWNLOAD': 'DDownload',
-            'UPLOAD_UPLOADY': 'Uploady',
-            'UPLOAD_MULTI': 'Multi-Host',
-            'EXTRACT': 'Extract',
-            'COMPRESS': 'Compress'
-        }
-        return type_map.get(op_type, op_type)
-
     @crash_safe_execute(max_retries=1, default_return=None, severity=ErrorSeverity.LOW)
-    def _highlight_completed_row(self, status_row: StatusRow):
+    def _highlight_completed_row(self, operation_id: str):
         """Briefly highlight completed operations"""
-        row = status_row.row_index
-        # Simple highlight - could add animation here
-        for col in range(self.table.columnCount()):
-            item = self.table.item(row, col)
-            if item:
-                original_color = item.background()
-                item.setBackground(QColor(39, 174, 96, 50))  # Light green
-                # Reset after 2 seconds
-                QTimer.singleShot(2000, lambda: item.setBackground(original_color))
-
-    def _reindex_rows_after_removal(self, removed_row: int):
-        """Update row indices after row removal"""
-        new_operation_rows = {}
-        new_row_operations = {}
-
-        for op_id, status_row in self._operation_rows.items():
-            if status_row.row_index > removed_row:
-                status_row.row_index -= 1
-            new_operation_rows[op_id] = status_row
-
-        for row, op_id in self._row_operations.items():
-            if row > removed_row:
-                new_row_operations[row - 1] = op_id
-            elif row < removed_row:
-                new_row_operations[row] = op_id
-
-        self._operation_rows = new_operation_rows
-        self._row_operations = new_row_operations
+        self.model.highlight(operation_id, 2.0)
+        # Repaint once the highlight has expired
+        QTimer.singleShot(2000, lambda: self.model.refresh_row(operation_id))
 
     # ==========================================
     # PERIODIC UPDATES
@@ -1335,41 +1002,15 @@ class ProfessionalStatusWidget(QWidget):
 
     @crash_safe_execute(max_retries=1, default_return=None, severity=ErrorSeverity.LOW)
     def _update_durations(self):
-        """Update duration display for all active operations"""
-        with QMutexLocker(self._ui_mutex):
-            for operation_id, status_row in self._operation_rows.items():
-                operation = self.status_manager.get_operation(operation_id)
-                if operation and status_row.duration_item:
-                    duration_text = self._format_duration(operation.duration.total_seconds())
-                    status_row.duration_item.setText(duration_text)
-
-    def _format_duration(self, seconds: float) -> str:
-        """Format duration for display"""
-        if seconds < 60:
-            return f"{int(seconds)}s"
-        elif seconds < 3600:
-            return f"{int(seconds / 60)}m {int(seconds % 60)}s"
-        else:
-            hours = int(seconds / 3600)
-            minutes = int((seconds % 3600) / 60)
-            return f"{hours}h {minutes}m"
-
-    def _force_table_update(self):
-        """Force table and all cell widgets to update - called via QTimer for thread safety"""
-        try:
-            if self.table and self.table.viewport():
-                self.table.viewport().update()
-                # Only update the table itself, not individual widgets to avoid loops
-                self.table.update()
-        except Exception as e:
-            logger.debug(f"Table update error (non-critical): {e}")
+        """Repaint the duration column of running operations"""
+        self.model.refresh_durations()
 
     @crash_safe_execute(max_retries=1, default_return=None, severity=ErrorSeverity.LOW)
     def _update_statistics(self):
         """Update statistics display"""
         stats = self.status_manager.get_statistics()
-        active_count = len([op for op in self.status_manager.get_all_operations() if op.is_active])
-        total_count = len(self._operation_rows)
+        active_count = self.model.active_count()
+        total_count = len(self.model)
 
         stats_text = f"Active: {active_count} | Total: {total_count} | " \
                     f"Completed: {stats.get('total_completed', 0)} | " \
@@ -1383,27 +1024,26 @@ class ProfessionalStatusWidget(QWidget):
 
     def get_selected_operation_id(self) -> Optional[str]:
         """Get currently selected operation ID"""
-        current_row = self.table.currentRow()
-        if current_row >= 0:
-            return self._row_operations.get(current_row)
+        current = self.table.currentIndex()
+        if current.isValid():
+            return self.model.operation_id_at(current.row())
         return None
 
     def select_operation(self, operation_id: str):
         """Select specific operation in the table"""
-        status_row = self._operation_rows.get(operation_id)
-        if status_row:
-            self.table.selectRow(status_row.row_index)
+        row = self.model.row_of(operation_id)
+        if row is not None:
+            self.table.selectRow(row)
 
     def clear_completed_operations(self):
         """Clear all completed operations"""
         # This will trigger automatic removal through the status manager
-        for operation_id in list(self._operation_rows.keys()):
+        for operation_id in self.model.ids():
             operation = self.status_manager.get_operation(operation_id)
             if operation and operation.is_finished:
                 self.status_manager.remove_operation(operation_id)
 
-    @pyqtSlot()
-    def _on_selection_changed(self):
+    def _on_selection_changed(self, *_args):
         """Handle table selection changes"""
         operation_id = self.get_selected_operation_id()
         if operation_id:
@@ -1416,11 +1056,11 @@ class ProfessionalStatusWidget(QWidget):
 
     def get_operation_count(self) -> int:
         """Get current number of operations"""
-        return len(self._operation_rows)
+        return len(self.model)
 
     def get_active_operation_count(self) -> int:
         """Get number of active operations"""
-        return len([op for op in self.status_manager.get_all_operations() if op.is_active])
+        return self.model.active_count()
 
     def get_jd_link(self, key):
         return self._jd_links.get(tuple(key))
@@ -1458,7 +1098,7 @@ class ProfessionalStatusWidget(QWidget):
                 "operations": []
             }
 
-            for operation_id, row in self._operation_rows.items():
+            for operation_id in self.model.ids():
                 operation = self.status_manager.get_operation(operation_id)
                 if operation:
                     op_data = {
@@ -1491,13 +1131,14 @@ class ProfessionalStatusWidget(QWidget):
 
         This is how operations get created and updated in the status widget!
         """
-        logger.info(f"🎯 on_progress_update called with: {op}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"🎯 on_progress_update called with: {op}")
         try:
             # Handle OperationStatus object from orchestrator
             if hasattr(op, 'section') and hasattr(op, 'item'):
                 section = op.section
                 item = op.item
-                logger.info(f"  Processing update for {section}:{item}")
+                logger.debug(f"  Processing update for {section}:{item}")
 
                 # CRITICAL FIX: Check if operation already exists in StatusManager first!
                 # This prevents duplicate operations from being created
@@ -1505,20 +1146,25 @@ class ProfessionalStatusWidget(QWidget):
 
                 # First check StatusManager for existing operation
                 all_ops = self.status_manager.get_all_operations()
-                logger.info(f"  Current operations in StatusManager: {len(all_ops)}")
+                logger.debug(f"  Current operations in StatusManager: {len(all_ops)}")
 
                 for operation in all_ops:
                     if operation.section == section and operation.item == item:
                         operation_id = operation.operation_id
-                        logger.info(f"  Found existing operation {operation_id} for {section}:{item}")
+                        logger.debug(f"  Found existing operation {operation_id} for {section}:{item}")
 
                         # If the operation is already finished, ignore duplicate finish signals
                         if operation.is_finished:
-                            logger.info("  Operation already finished - ignoring update")
+                            logger.debug("  Operation already finished - ignoring update")
+                            return
+
+                        # Rows pushed out by MAX_ROWS stay archived - a late update must not revive them
+                        if self.model.is_archived(operation_id):
+                            logger.debug(f"  Operation {operation_id} is archived - ignoring late update")
                             return
 
                         # CRITICAL: Check if this operation has a UI row!
-                        if operation_id not in self._operation_rows:
+                        if operation_id not in self.model:
                             logger.warning(f"⚠️ Operation {operation_id} exists but has NO UI row! Creating now...")
                             # Force creation of UI row
                             operation_data = self.status_manager._serialize_operation(operation)
@@ -1603,20 +1249,28 @@ class ProfessionalStatusWidget(QWidget):
                 # Update through StatusManager for real-time display!
                 if updates:
                     self.status_manager.update_operation(operation_id, **updates)
-                    logger.info(f"📊 UPDATED: {section}:{item} - {updates.get('details', '')} ({int(updates.get('progress', 0) * 100)}%)")
+                    logger.debug(f"📊 UPDATED: {section}:{item} - {updates.get('details', '')} ({int(updates.get('progress', 0) * 100)}%)")
 
                 # Immediate speed/ETA update
-                if speed is not None or eta_seconds is not None:
-                    status_row = self._operation_rows.get(operation_id)
-                    if status_row:
-                        if speed is not None:
-                            self._update_speed_cell(status_row, speed)
-                        if eta_seconds is not None:
-                            self._update_eta_cell(status_row, eta_seconds)
+                if operation_id in self.model:
+                    if speed is not None:
+                        self._update_speed_cell(operation_id, speed)
+                    if eta_seconds is not None:
+                        self._update_eta_cell(operation_id, eta_seconds)
 
         except Exception as e:
             logger.error(f"Error in on_progress_update: {e}", exc_info=True)
 
+    @pyqtSlot(list)
+    def on_progress_batch(self, batch):
+        """Apply one frame of coalesced updates from the ProgressBus with a single repaint."""
+        self.table.setUpdatesEnabled(False)
+        try:
+            for op in batch:
+                self.on_progress_update(op)
+        finally:
+            self.table.setUpdatesEnabled(True)
+
     def reload_from_disk(self):
         """Public method for reloading state from disk (compatibility with main_window)"""
         # Clear current operations
@@ -1629,11 +1283,8 @@ class ProfessionalStatusWidget(QWidget):
         """Clear all operations from the widget"""
         try:
             with QMutexLocker(self._ui_mutex):
-                # Clear table
-                self.table.setRowCount(0)
-                # Clear mappings
-                self._operation_rows.clear()
-                self._row_operations.clear()
+                # Clear table and mappings in one model reset
+                self.model.clear()
                 logger.debug("Cleared all operations from professional status widget")
         except Exception as e:
             logger.error(f"Error clearing operations: {e}")
@@ -1706,14 +1357,14 @@ class ProfessionalStatusWidget(QWidget):
         try:
             from core.status_manager import OperationStatus
 
-            if operation_id and operation_id in self._operation_rows:
+            if operation_id and operation_id in self.model:
                 self.status_manager.update_operation(operation_id,
                     status=OperationStatus.COMPLETED,
                     details=details,
                     progress=100)
             else:
                 # Complete the most recent active operation
-                for op_id in reversed(list(self._operation_rows.keys())):
+                for op_id in reversed(self.model.ids()):
                     operation = self.status_manager.get_operation(op_id)
                     if operation and operation.is_active:
                         self.status_manager.update_operation(op_id,
@@ -1777,7 +1428,7 @@ class ProfessionalStatusWidget(QWidget):
             logger.info(f"🔴 STATUS WIDGET: Received live thread discovery for '{thread_title}' in category '{category_name}'")
 
             # Find the active tracking operation for this category
-            for operation_id, row in self._operation_rows.items():
+            for operation_id in self.model.ids():
                 operation = self.status_manager.get_operation(operation_id)
                 if (operation and operation.is_active and
                     operation.section == "Tracking" and operation.item == category_name):
@@ -1833,7 +1484,7 @@ class ProfessionalStatusWidget(QWidget):
 
             with QMutexLocker(self._ui_mutex):
                 # Iterate through all operations
-                for operation_id, status_row in list(self._operation_rows.items()):
+                for operation_id in self.model.ids():
                     operation = self.status_manager.get_operation(operation_id)
                     if operation and operation.is_active:
                         # Update status to CANCELLED
@@ -1845,9 +1496,9 @@ class ProfessionalStatusWidget(QWidget):
                         cancelled_count += 1
 
                         # Update UI immediately
-                        self._update_status_cell(status_row, "CANCELLED")
-                        self._update_progress_bar(status_row, 0, "CANCELLED", operation.operation_type)
-                        self._update_details_cell(status_row, "Cancelled by user")
+                        self._update_status_cell(operation_id, "CANCELLED")
+                        self._update_progress_bar(operation_id, 0, "CANCELLED", operation.operation_type)
+                        self._update_details_cell(operation_id, "Cancelled by user")
 
             # Emit cancel signals for compatibility
             parent = self.parent()
@@ -1874,18 +1525,16 @@ class ProfessionalStatusWidget(QWidget):
                 # Get operations to remove
                 operations_to_remove = []
 
-                for operation_id, status_row in list(self._operation_rows.items()):
+                for operation_id in self.model.ids():
                     operation = self.status_manager.get_operation(operation_id)
                     if operation and operation.status in [OperationStatus.COMPLETED,
                                                          OperationStatus.FAILED,
                                                          OperationStatus.CANCELLED]:
                         operations_to_remove.append(operation_id)
 
-                # Remove operations
+                # Remove operations - one model removal per contiguous block
+                removed_count = self._remove_operation_rows(operations_to_remove)
                 for operation_id in operations_to_remove:
-                    self._remove_operation_row(operation_id)
-                    removed_count += 1
-
                     # Also remove from upload tracking if present
                     self._upload_operations.discard(operation_id)
                     self._upload_progress.pop(operation_id, None)
@@ -1922,14 +1571,10 @@ class ProfessionalStatusWidget(QWidget):
 
             with QMutexLocker(self._ui_mutex):
                 # Count operations
-                total_count = len(self._operation_rows)
+                total_count = len(self.model)
 
-                # Clear the table
-                self.table.setRowCount(0)
-
-                # Clear all mappings
-                self._operation_rows.clear()
-                self._row_operations.clear()
+                # Clear the table and all mappings
+                self.model.clear()
                 self._upload_operations.clear()
                 self._upload_progress.clear()
                 self._upload_display_progress.clear()
@@ -1949,34 +1594,24 @@ class ProfessionalStatusWidget(QWidget):
 
     def _remove_operation_row(self, operation_id: str):
         """Remove a single operation row from the table"""
-        try:
-            status_row = self._operation_rows.get(operation_id)
-            if not status_row:
-                return
+        self._remove_operation_rows([operation_id])
 
-            # Remove the table row
-            self.table.removeRow(status_row.row_index)
-
-            # Update row indices for all rows after the removed one
-            for op_id, row in self._operation_rows.items():
-                if row.row_index > status_row.row_index:
-                    row.row_index -= 1
-
-            # Update row_operations mapping
-            self._row_operations = {}
-            for op_id, row in self._operation_rows.items():
-                self._row_operations[row.row_index] = op_id
-
-            # Remove from operation_rows
-            del self._operation_rows[operation_id]
+    def _remove_operation_rows(self, operation_ids: list) -> int:
+        """Remove operation rows from the table in one batch"""
+        try:
+            removed = self.model.remove(operation_ids)
 
             # Remove from status manager if completed
-            operation = self.status_manager.get_operation(operation_id)
-            if operation and not operation.is_active:
-                self.status_manager.remove_operation(operation_id)
+            for operation_id in operation_ids:
+                operation = self.status_manager.get_operation(operation_id)
+                if operation and not operation.is_active:
+                    self.status_manager.remove_operation(operation_id)
 
+            self._update_statistics()
+            return removed
         except Exception as e:
-            logger.error(f"Failed to remove operation row {operation_id}: {e}")
+            logger.error(f"Failed to remove operation rows {operation_ids}: {e}")
+            return 0
 
     @pyqtSlot(QPoint)
     def _show_context_menu(self, position):
@@ -1985,13 +1620,11 @@ class ProfessionalStatusWidget(QWidget):
             menu = QMenu(self)
 
             # Get selected rows
-            selected_rows = set()
-            for item in self.table.selectedItems():
-                selected_rows.add(item.row())
+            selected_rows = {index.row() for index in self.table.selectionModel().selectedRows()}
 
             if selected_rows:
                 # Actions for selected operations
-                selected_op_ids = [self._row_operations.get(row) for row in selected_rows]
+                selected_op_ids = [self.model.operation_id_at(row) for row in sorted(selected_rows)]
                 selected_op_ids = [op_id for op_id in selected_op_ids if op_id]  # Filter None
 
                 if selected_op_ids:
@@ -2005,8 +1638,8 @@ class ProfessionalStatusWidget(QWidget):
                             has_running = True
 
                         # Check for failed hosts in upload operations
-                        if op_id in self._operation_rows:
-                            status_row = self._operation_rows[op_id]
+                        status_row = self.model.get(op_id)
+                        if status_row:
                             if status_row.host_statuses:
                                 for host, status in status_row.host_statuses.items():
                                     if status == "failed":
@@ -2016,7 +1649,7 @@ class ProfessionalStatusWidget(QWidget):
                     # Add retry options for failed hosts
                     if has_failed_hosts and len(selected_op_ids) == 1:  # Single selection for host-specific retry
                         op_id = selected_op_ids[0]
-                        status_row = self._operation_rows[op_id]
+                        status_row = self.model.get(op_id)
                         retry_menu = menu.addMenu("🔄 Retry Failed Hosts")
 
                         for host, status in status_row.host_statuses.items():
@@ -2029,8 +1662,8 @@ class ProfessionalStatusWidget(QWidget):
                         retry_all_failed = menu.addAction("🔄 Retry All Failed")
                         retry_all_failed.triggered.connect(
                             lambda: self.retryRequested.emit(
-                                status_row.section_item.text() if status_row.section_item else "",
-                                status_row.item_item.text() if status_row.item_item else "",
+                                status_row.section,
+                                status_row.item,
                                 "UPLOAD"
                             )
                         )
@@ -2089,13 +1722,12 @@ class ProfessionalStatusWidget(QWidget):
             removed_count = 0
 
             with QMutexLocker(self._ui_mutex):
+                removed_count = self._remove_operation_rows(operation_ids)
                 for operation_id in operation_ids:
-                    self._remove_operation_row(operation_id)
                     self._upload_operations.discard(operation_id)
                     self._upload_progress.pop(operation_id, None)
                     self._upload_display_progress.pop(operation_id, None)
                     self._upload_target_progress.pop(operation_id, None)
-                    removed_count += 1
 
             if removed_count > 0:
                 logger.info(f"Removed {removed_count} selected operations")
@@ -2110,18 +1742,18 @@ class ProfessionalStatusWidget(QWidget):
             logger.info(f"Retrying upload for host: {host} in operation: {operation_id}")
 
             # Get the status row
-            status_row = self._operation_rows.get(operation_id)
+            status_row = self.model.get(operation_id)
             if not status_row:
                 logger.warning(f"Operation {operation_id} not found")
                 return
 
             # Update host status to pending
-            self._update_host_status(status_row, host, "pending")
+            self._update_host_status(operation_id, host, "pending")
 
             # Emit signal to trigger retry for this specific host
             # This would need to be handled by the upload worker
-            section = status_row.section_item.text() if status_row.section_item else ""
-            item = status_row.item_item.text() if status_row.item_item else ""
+            section = status_row.section
+            item = status_row.item
 
             # Create custom signal data including the specific host
             retry_data = {
@@ -32,6 +32,7 @@ from PyQt5.QtWidgets import (
 )
 
 from core.user_manager import get_user_manager
+from core.write_behind import get_write_behind, read_json
 from .themes.modern_theme import theme_manager
 # Mapping of alternate site identifiers to canonical names
 SITE_ALIASES = {
@@ -556,9 +557,7 @@ class StatsWidget(QWidget):
         """Load thread stats history from disk."""
         try:
             path = self.user_manager.get_user_data_path("thread_stats_history.json")
-            if os.path.exists(path):
-                with open(path, "r", encoding="utf-8") as fh:
-                    return json.load(fh)
+            return read_json(path, default={}) or {}
         except Exception as exc:  # pragma: no cover - best effort
             _LOG.error("Failed to load thread stats history: %s", exc, exc_info=False)
         return {}
@@ -567,8 +566,7 @@ class StatsWidget(QWidget):
         """Persist thread stats history to disk."""
         try:
             path = self.user_manager.get_user_data_path("thread_stats_history.json")
-            with open(path, "w", encoding="utf-8") as fh:
-                json.dump(self.thread_history, fh, ensure_ascii=False, indent=2)
+            get_write_behind().submit(path, self.thread_history, indent=2)
         except Exception as exc:  # pragma: no cover - best effort
             _LOG.error("Failed to save thread stats history: %s", exc, exc_info=False)
 
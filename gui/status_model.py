@@ -1,7 +1,11 @@
-from typing import List
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Deque, Dict, Iterable, List, Optional, Set
 
-from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt
-from PyQt5.QtGui import QColor
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt, pyqtSignal
+from PyQt5.QtGui import QColor, QFont
 
 from .themes import theme_manager
 
@@ -22,10 +26,15 @@ class StatusTableModel(QAbstractTableModel):
         "ETA",
         "Progress",
     ]
+    _attrs = (
+        "section", "item", "op_type", "added", "stage", "message",
+        "errors", "host", "speed", "eta", "progress",
+    )
 
     def __init__(self) -> None:
         super().__init__()
         self._rows: List[OperationStatus] = []
+        self._index: Dict[tuple, int] = {}
 
     # Qt model interface -------------------------------------------------
     def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # type: ignore[override]
@@ -115,43 +124,497 @@ class StatusTableModel(QAbstractTableModel):
         if h:
             return f"{h:d}:{m:02d}:{s:02d}"
         return f"{m:d}:{s:02d}"
+    @staticmethod
+    def _key(op: OperationStatus) -> tuple:
+        return (op.section, op.item, op.op_type, op.host)
+
     def upsert(self, op: OperationStatus) -> None:
-        key = (op.section, op.item, op.op_type, op.host)
-        for row, existing in enumerate(self._rows):
-            if (existing.section, existing.item, existing.op_type, existing.host) == key:
-                # Determine which columns have changed compared to the existing
-                # OperationStatus.  We update only those indices to minimise
-                # view refresh work.
-                changed: list[int] = []
-                if existing.section != op.section:
-                    changed.append(0)
-                if existing.item != op.item:
-                    changed.append(1)
-                if existing.op_type != op.op_type:
-                    changed.append(2)
-                if existing.added != op.added:
-                    changed.append(3)
-                if existing.stage != op.stage:
-                    changed.append(4)
-                if existing.message != op.message:
-                    changed.append(5)
-                if existing.errors != op.errors:
-                    changed.append(6)
-                if existing.host != op.host:
-                    changed.append(7)
-                if existing.speed != op.speed:
-                    changed.append(8)
-                if existing.eta != op.eta:
-                    changed.append(9)
-                if existing.progress != op.progress:
-                    changed.append(10)
-                self._rows[row] = op
-                for col in changed:
-                    idx = self.index(row, col)
-                    self.dataChanged.emit(
-                        idx, idx, [Qt.DisplayRole, Qt.BackgroundRole]
-                    )
-                return
+        key = self._key(op)
+        row = self._index.get(key)
+        if row is not None:
+            existing = self._rows[row]
+            # Determine which columns have changed compared to the existing
+            # OperationStatus.  One ranged dataChanged covers them all.
+            changed = [
+                col for col, attr in enumerate(self._attrs)
+                if getattr(existing, attr) != getattr(op, attr)
+            ]
+            self._rows[row] = op
+            if changed:
+                self.dataChanged.emit(
+                    self.index(row, changed[0]),
+                    self.index(row, changed[-1]),
+                    [Qt.DisplayRole, Qt.BackgroundRole],
+                )
+            return
         self.beginInsertRows(QModelIndex(), len(self._rows), len(self._rows))
+        self._index[key] = len(self._rows)
         self._rows.append(op)
-        self.endInsertRows()
\ No newline at end of file
+        self.endInsertRows()
+
+
+# ----------------------------------------------------------------------
+# StatusManager operations (ProfessionalStatusWidget)
+# ----------------------------------------------------------------------
+FINISHED_STATUSES = ("COMPLETED", "FAILED", "CANCELLED")
+ACTIVE_STATUSES = ("INITIALIZING", "RUNNING")
+
+STATUS_COLORS = {
+    "PENDING": (150, 150, 150),       # Gray
+    "INITIALIZING": (52, 152, 219),   # Blue
+    "RUNNING": (46, 204, 113),        # Green
+    "PAUSED": (241, 196, 15),         # Yellow
+    "COMPLETED": (39, 174, 96),       # Dark Green
+    "FAILED": (231, 76, 60),          # Red
+    "CANCELLED": (149, 165, 166),     # Light Gray
+}
+
+OPERATION_TYPE_LABELS = {
+    "TRACKING": "Tracking",
+    "POSTING": "Posting",
+    "BACKUP": "Backup",
+    "REUPLOAD": "Re-upload",
+    "DOWNLOAD": "Download",
+    "UPLOAD_RAPIDGATOR": "RapidGator",
+    "UPLOAD_KATFILE": "KatFile",
+    "UPLOAD_NITROFLARE": "NitroFlare",
+    "UPLOAD_DDOWNLOAD": "DDownload",
+    "UPLOAD_UPLOADY": "Uploady",
+    "UPLOAD_MULTI": "Multi-Host",
+    "EXTRACT": "Extract",
+    "COMPRESS": "Compress",
+}
+
+
+def _enum_text(value) -> str:
+    return str(value.value if hasattr(value, "value") else value)
+
+
+def format_speed(bytes_per_sec: Optional[float]) -> str:
+    """Format transfer speed for display"""
+    if not bytes_per_sec or bytes_per_sec <= 0:
+        return "--"
+    speed = float(bytes_per_sec)
+    units = ["B/s", "KB/s", "MB/s", "GB/s"]
+    idx = 0
+    while speed >= 1024 and idx < len(units) - 1:
+        speed /= 1024
+        idx += 1
+    return f"{speed:.1f} {units[idx]}"
+
+
+def format_eta(seconds: Optional[float]) -> str:
+    """Format ETA seconds into human-readable text"""
+    if seconds is None or seconds <= 0:
+        return "--"
+    seconds = int(seconds)
+    mins, secs = divmod(seconds, 60)
+    hours, mins = divmod(mins, 60)
+    parts = []
+    if hours:
+        parts.append(f"{hours}h")
+    if mins:
+        parts.append(f"{mins}m")
+    parts.append(f"{secs}s")
+    return " ".join(parts)
+
+
+def format_duration(seconds: float) -> str:
+    """Format duration for display"""
+    if seconds < 60:
+        return f"{int(seconds)}s"
+    elif seconds < 3600:
+        return f"{int(seconds / 60)}m {int(seconds % 60)}s"
+    else:
+        hours = int(seconds / 3600)
+        minutes = int((seconds % 3600) / 60)
+        return f"{hours}h {minutes}m"
+
+
+def format_operation_type(op_type: str, section: str = "") -> str:
+    """Format operation type for display based on section context"""
+    section_lower = (section or "").lower()
+    if section_lower in ["template", "templates"]:
+        return "Template"
+    elif section_lower in ["backup", "backups"]:
+        return "Backup"
+    elif section_lower in ["post", "posting"]:
+        return "Posting"
+    elif section_lower in ["track", "tracking"]:
+        return "Tracking"
+    return OPERATION_TYPE_LABELS.get(op_type, op_type)
+
+
+@dataclass
+class OperationRow:
+    """Display state of one StatusManager operation (one table row)."""
+
+    operation_id: str
+    section: str = "Unknown"
+    item: str = "Unknown"
+    operation_type: str = "UNKNOWN"
+    status: str = "PENDING"
+    progress: int = 0
+    speed: float = 0.0
+    eta: Optional[float] = None
+    details: str = ""
+    started: datetime = field(default_factory=datetime.now)
+    ended: Optional[datetime] = None
+
+    # Host-specific status tracking for uploads
+    host_statuses: Dict[str, str] = field(default_factory=dict)  # host -> success/failed/pending
+    host_urls: Dict[str, list] = field(default_factory=dict)
+    retry_count: int = 0
+    keeplinks_url: str = ""
+    highlight_until: float = 0.0
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in FINISHED_STATUSES
+
+    @property
+    def is_active(self) -> bool:
+        return self.status in ACTIVE_STATUSES
+
+    def host_summary(self) -> str:
+        if not self.host_statuses:
+            return ""
+        values = list(self.host_statuses.values())
+        parts = []
+        for status, icon in (("success", "✅"), ("failed", "❌"), ("pending", "⏳")):
+            count = values.count(status)
+            if count:
+                parts.append(f"{icon}{count}")
+        return " ".join(parts)
+
+    def details_text(self) -> str:
+        summary = self.host_summary()
+        return f"{self.details} | {summary}" if summary else self.details
+
+    @classmethod
+    def from_operation_data(cls, operation_id: str, data: dict) -> "OperationRow":
+        def _dt(value):
+            if isinstance(value, datetime):
+                return value
+            try:
+                return datetime.fromisoformat(value) if value else None
+            except (TypeError, ValueError):
+                return None
+
+        speed = data.get("transfer_speed", 0) or 0
+        eta = None
+        eta_dt = _dt(data.get("estimated_completion"))
+        if eta_dt:
+            eta = max(0.0, (eta_dt - datetime.now()).total_seconds())
+        else:
+            total_bytes = data.get("total_bytes", 0) or 0
+            transferred = data.get("bytes_transferred", 0) or 0
+            if speed > 0 and total_bytes > 0:
+                eta = max(0, total_bytes - transferred) / speed
+
+        progress = data.get("progress_percentage", 0)
+        if not progress:
+            progress = data.get("progress", 0) or 0
+        return cls(
+            operation_id=operation_id,
+            section=str(data.get("section", "Unknown")),
+            item=str(data.get("item", "Unknown")),
+            operation_type=_enum_text(data.get("operation_type", "UNKNOWN")),
+            status=_enum_text(data.get("status", "PENDING")),
+            progress=int(progress),
+            speed=speed,
+            eta=eta,
+            details=str(data.get("details", "Initializing...")),
+            started=_dt(data.get("start_time")) or datetime.now(),
+            ended=_dt(data.get("end_time")),
+        )
+
+    def snapshot(self) -> dict:
+        return {
+            "operation_id": self.operation_id,
+            "section": self.section,
+            "item": self.item,
+            "operation_type": self.operation_type,
+            "status": self.status,
+            "progress": self.progress,
+            "details": self.details_text(),
+            "start_time": self.started.isoformat(),
+            "end_time": self.ended.isoformat() if self.ended else None,
+        }
+
+
+class OperationTableModel(StatusTableModel):
+    """Table model behind :class:`ProfessionalStatusWidget`.
+
+    * ``operation_id -> row`` lookups are O(1); row positions are rebuilt
+      lazily once per batch of removals instead of renumbering per row.
+    * updates emit one ranged ``dataChanged`` per row; the duration column is
+      refreshed with a single ranged emission over the active rows.
+    * at most ``max_rows`` rows are kept: the oldest finished rows are moved
+      to the bounded ``archived`` history and announced via ``rows_archived``.
+    """
+
+    columns = [
+        "Section",
+        "Item",
+        "Operation",
+        "Status",
+        "Progress",
+        "Speed",
+        "ETA",
+        "Details",
+        "Duration",
+    ]
+    COL_SECTION, COL_ITEM, COL_OPERATION, COL_STATUS, COL_PROGRESS, \
+        COL_SPEED, COL_ETA, COL_DETAILS, COL_DURATION = range(9)
+
+    # Which columns a field change has to repaint
+    FIELD_COLUMNS = {
+        "section": (0, 2),
+        "item": (1,),
+        "operation_type": (2,),
+        "status": (3, 4),
+        "progress": (4,),
+        "speed": (5,),
+        "eta": (6,),
+        "details": (7,),
+        "host_statuses": (7,),
+        "started": (8,),
+        "ended": (8,),
+        "highlight_until": tuple(range(9)),
+    }
+
+    _CENTERED = {COL_OPERATION, COL_STATUS, COL_SPEED, COL_ETA, COL_DURATION}
+    _BOLD = {COL_SECTION, COL_OPERATION, COL_STATUS}
+
+    rows_archived = pyqtSignal(list)  # operation_ids moved to the archive
+
+    def __init__(self, max_rows: int = 2000, archive_size: int = 5000) -> None:
+        super().__init__()
+        self.max_rows = max(1, int(max_rows))
+        self._rows: List[OperationRow] = []  # type: ignore[assignment]
+        self._by_id: Dict[str, OperationRow] = {}
+        self._positions: Dict[str, int] = {}
+        self._positions_dirty = False
+        self.archived: Deque[dict] = deque(maxlen=max(1, int(archive_size)))
+        self._archived_ids: Set[str] = set()
+        self.archived_total = 0
+        self._bold_font: Optional[QFont] = None
+        self._colors: Dict[str, QColor] = {}
+
+    def upsert(self, op: OperationStatus) -> None:  # type: ignore[override]
+        raise TypeError("OperationTableModel rows are keyed by operation_id; use add()/update()")
+
+    # Lookups -----------------------------------------------------------
+    def __contains__(self, operation_id) -> bool:
+        return operation_id in self._by_id
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def is_archived(self, operation_id: str) -> bool:
+        """``True`` if the row was moved to the ``archived`` history."""
+        return operation_id in self._archived_ids
+
+    def get(self, operation_id: str) -> Optional[OperationRow]:
+        return self._by_id.get(operation_id)
+
+    def ids(self) -> List[str]:
+        return [r.operation_id for r in self._rows]
+
+    def records(self) -> List[OperationRow]:
+        return list(self._rows)
+
+    def mapping(self) -> Dict[str, OperationRow]:
+        """Live ``operation_id -> OperationRow`` mapping (do not mutate)."""
+        return self._by_id
+
+    def row_of(self, operation_id: str) -> Optional[int]:
+        if self._positions_dirty:
+            self._positions = {r.operation_id: i for i, r in enumerate(self._rows)}
+            self._positions_dirty = False
+        return self._positions.get(operation_id)
+
+    def operation_id_at(self, row: int) -> Optional[str]:
+        if 0 <= row < len(self._rows):
+            return self._rows[row].operation_id
+        return None
+
+    def active_count(self) -> int:
+        return sum(1 for r in self._rows if r.is_active)
+
+    # Qt model interface --------------------------------------------------
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):  # type: ignore[override]
+        if not index.isValid() or index.row() >= len(self._rows):
+            return None
+        rec = self._rows[index.row()]
+        col = index.column()
+        if role == Qt.DisplayRole:
+            if col == self.COL_SECTION:
+                return rec.section
+            if col == self.COL_ITEM:
+                return rec.item
+            if col == self.COL_OPERATION:
+                return format_operation_type(rec.operation_type, rec.section)
+            if col == self.COL_STATUS:
+                return rec.status
+            if col == self.COL_SPEED:
+                return format_speed(rec.speed)
+            if col == self.COL_ETA:
+                return format_eta(rec.eta)
+            if col == self.COL_DETAILS:
+                return rec.details_text()
+            if col == self.COL_DURATION:
+                end = rec.ended or datetime.now()
+                return format_duration(max(0.0, (end - rec.started).total_seconds()))
+            return None
+        if role == Qt.UserRole and col == self.COL_PROGRESS:
+            return rec.progress
+        if role == Qt.ToolTipRole and col in (self.COL_ITEM, self.COL_DETAILS):
+            return rec.item if col == self.COL_ITEM else rec.details_text()
+        if role == Qt.TextAlignmentRole and col in self._CENTERED:
+            return Qt.AlignCenter
+        if role == Qt.FontRole and col in self._BOLD:
+            if self._bold_font is None:
+                self._bold_font = QFont("Arial", 9, QFont.Bold)
+            return self._bold_font
+        if role == Qt.ForegroundRole and col == self.COL_STATUS:
+            return self._color(rec.status.upper())
+        if role == Qt.BackgroundRole and rec.highlight_until and time.monotonic() < rec.highlight_until:
+            return QColor(39, 174, 96, 50)  # Light green
+        return None
+
+    def _color(self, status: str) -> QColor:
+        color = self._colors.get(status)
+        if color is None:
+            color = QColor(*STATUS_COLORS.get(status, (100, 100, 100)))
+            self._colors[status] = color
+        return color
+
+    # Mutation ------------------------------------------------------------
+    def add(self, operation_id: str, operation_data: dict) -> OperationRow:
+        existing = self._by_id.get(operation_id)
+        if existing is not None:
+            return existing
+        rec = OperationRow.from_operation_data(operation_id, operation_data)
+        row = len(self._rows)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._rows.append(rec)
+        self._by_id[operation_id] = rec
+        if not self._positions_dirty:
+            self._positions[operation_id] = row
+        self.endInsertRows()
+        self._enforce_limit()
+        return rec
+
+    def update(self, operation_id: str, **fields) -> bool:
+        """Apply *fields* to the row and repaint only the affected columns."""
+        rec = self._by_id.get(operation_id)
+        if rec is None:
+            return False
+        cols: List[int] = []
+        for name, value in fields.items():
+            if name == "status":
+                value = _enum_text(value)
+            elif name == "progress":
+                value = max(0, min(100, int(value)))
+            if getattr(rec, name) == value and name != "host_statuses":
+                continue
+            setattr(rec, name, value)
+            cols.extend(self.FIELD_COLUMNS.get(name, ()))
+        if "status" in fields:
+            if rec.is_finished and rec.ended is None:
+                rec.ended = datetime.now()
+                cols.append(self.COL_DURATION)
+            elif not rec.is_finished and rec.ended is not None:
+                rec.ended = None
+                cols.append(self.COL_DURATION)
+        if cols:
+            self._emit_row(operation_id, min(cols), max(cols))
+        return True
+
+    def set_host_status(self, operation_id: str, host: str, status: str, urls: Optional[list] = None) -> None:
+        rec = self._by_id.get(operation_id)
+        if rec is None:
+            return
+        rec.host_statuses[host] = status
+        if urls:
+            rec.host_urls[host] = urls
+        self._emit_row(operation_id, self.COL_DETAILS, self.COL_DETAILS)
+
+    def highlight(self, operation_id: str, seconds: float = 2.0) -> None:
+        self.update(operation_id, highlight_until=time.monotonic() + seconds)
+
+    def refresh_row(self, operation_id: str) -> None:
+        self._emit_row(operation_id, 0, len(self.columns) - 1)
+
+    def _emit_row(self, operation_id: str, first_col: int, last_col: int) -> None:
+        row = self.row_of(operation_id)
+        if row is not None:
+            self.dataChanged.emit(self.index(row, first_col), self.index(row, last_col))
+
+    def refresh_durations(self) -> None:
+        """Repaint the duration column of running rows with one emission."""
+        first = last = None
+        for i, rec in enumerate(self._rows):
+            if rec.ended is None:
+                if first is None:
+                    first = i
+                last = i
+        if first is not None:
+            col = self.COL_DURATION
+            self.dataChanged.emit(self.index(first, col), self.index(last, col), [Qt.DisplayRole])
+
+    def remove(self, operation_ids: Iterable[str]) -> int:
+        """Remove rows, emitting one ``beginRemoveRows`` per contiguous block."""
+        rows = sorted(
+            (r for r in (self.row_of(op_id) for op_id in set(operation_ids)) if r is not None),
+            reverse=True,
+        )
+        if not rows:
+            return 0
+        # Group descending rows into contiguous [start, end] blocks
+        blocks: List[List[int]] = []
+        for row in rows:
+            if blocks and blocks[-1][0] == row + 1:
+                blocks[-1][0] = row
+            else:
+                blocks.append([row, row])
+        for start, end in blocks:
+            self.beginRemoveRows(QModelIndex(), start, end)
+            for rec in self._rows[start:end + 1]:
+                self._by_id.pop(rec.operation_id, None)
+            del self._rows[start:end + 1]
+            self.endRemoveRows()
+        self._positions_dirty = True
+        return len(rows)
+
+    def clear(self) -> None:
+        self.beginResetModel()
+        self._rows.clear()
+        self._by_id.clear()
+        self._positions.clear()
+        self._positions_dirty = False
+        self.endResetModel()
+
+    def _enforce_limit(self) -> None:
+        excess = len(self._rows) - self.max_rows
+        if excess <= 0:
+            return
+        victims = []
+        for rec in self._rows:
+            if rec.is_finished:
+                victims.append(rec)
+                if len(victims) >= excess:
+                    break
+        if not victims:
+            return
+        for rec in victims:
+            if len(self.archived) == self.archived.maxlen:
+                self._archived_ids.discard(self.archived[0]["operation_id"])
+            self.archived.append(rec.snapshot())
+            self._archived_ids.add(rec.operation_id)
+        self.archived_total += len(victims)
+        ids = [rec.operation_id for rec in victims]
+        self.remove(ids)
+        self.rows_archived.emit(ids)
@@ -0,0 +1,86 @@
+"""Page-at-a-time loading for the thread tables.
+
+The Process and Backup Threads tables used to get one ``QTableWidget`` row
+per thread up front, so opening a user with tens of thousands of threads
+built every row (and resized every column over them) before the window
+responded.  :class:`LazyTablePager` keeps a row *window* instead:
+
+* the owner fills the table with the first :attr:`~LazyTablePager.limit`
+  rows of a paged query (``ThreadStore.page_keys``) and reports how many it
+  got through :meth:`~LazyTablePager.loaded`;
+* scrolling to the bottom grows the window by one page and asks the owner
+  for the next page, until a query comes back short;
+* :meth:`~LazyTablePager.show_all` lifts the window while a text filter is
+  active, so searching still covers every thread.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Callable, Optional
+
+from PyQt5.QtCore import QObject
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PAGE_SIZE = 500
+
+
+class LazyTablePager(QObject):
+    """Grow a table's row window a page at a time as it is scrolled down.
+
+    ``load_more(offset, limit)`` is called with the rows already in the
+    window and the page size when the user reaches the bottom.
+    """
+
+    def __init__(self, table, load_more: Callable[[int, int], None], page_size: int = DEFAULT_PAGE_SIZE,
+                 parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self.table = table
+        self.page_size = max(1, int(page_size))
+        self._load_more = load_more
+        self._unlimited = False
+        self._busy = False
+        self.limit = self.page_size
+        self.exhausted = False
+        table.verticalScrollBar().valueChanged.connect(self._on_scroll)
+
+    @property
+    def window(self) -> Optional[int]:
+        """Rows the table should hold, or ``None`` for all of them."""
+        return None if self._unlimited else self.limit
+
+    def reset(self) -> None:
+        """Back to the first page (e.g. after switching users)."""
+        self.limit = self.page_size
+        self.exhausted = False
+
+    def show_all(self, unlimited: bool) -> bool:
+        """Lift (or restore) the window; ``True`` if that changed it."""
+        changed = unlimited != self._unlimited
+        self._unlimited = unlimited
+        return changed
+
+    def loaded(self, rows: int) -> None:
+        """The owner's query for :attr:`window` returned *rows* rows."""
+        window = self.window
+        self.exhausted = window is None or rows < window
+
+    def _on_scroll(self, value: int) -> None:
+        if self._busy or self.exhausted or self._unlimited:
+            return
+        bar = self.table.verticalScrollBar()
+        if value < bar.maximum():
+            return
+        offset = self.limit
+        self.limit += self.page_size
+        self._busy = True  # the owner's refresh moves the scroll bar again
+        try:
+            self._load_more(offset, self.page_size)
+        except Exception as e:
+            logger.error(f"❌ Loading more table rows failed: {e}", exc_info=True)
+        finally:
+            self._busy = False
+
+
+__all__ = ["LazyTablePager", "DEFAULT_PAGE_SIZE"]
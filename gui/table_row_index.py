@@ -0,0 +1,181 @@
+"""Per-row caches kept in sync with a table model.
+
+Several handlers in the main window map something back to a table row — a
+checked URL, a Rapidgator host-id, a thread id or title — and used to do it
+by scanning every cell with ``URL_RE.findall``.  The classes here derive a
+value per row once and keep it current from the model's signals:
+
+* :class:`RowCache` — base class: one cached value per row, re-computed
+  lazily after ``dataChanged``, shifted on ``rowsInserted``/``rowsRemoved``
+  and carried across a re-sort (``layoutChanged``) via persistent indexes;
+* :class:`TableRowIndex` — a ``key -> row`` dictionary built from the keys
+  each row yields, so lookups are O(1) instead of O(rows × cols).
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from PyQt5.QtCore import QModelIndex, QObject, QPersistentModelIndex
+
+logger = logging.getLogger(__name__)
+
+
+class RowCache(QObject):
+    """One lazily computed value per row of *model*."""
+
+    def __init__(self, model, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._model = model
+        self._rows: List[Any] = []  # None while dirty
+        self._pending_layout: Optional[List[Tuple[QPersistentModelIndex, Any]]] = None
+
+        model.dataChanged.connect(self._on_data_changed)
+        model.rowsInserted.connect(self._on_rows_inserted)
+        model.rowsRemoved.connect(self._on_rows_removed)
+        model.layoutAboutToBeChanged.connect(self._on_layout_about_to_change)
+        model.layoutChanged.connect(self._on_layout_changed)
+        model.modelReset.connect(self._on_reset)
+        self._on_reset()
+
+    # Hooks for subclasses -------------------------------------------------
+    def _compute(self, row: int) -> Any:
+        raise NotImplementedError
+
+    def _rows_dirty(self, rows: range) -> None:
+        """*rows* are about to be recomputed (cached values still present)."""
+
+    def _rows_moved(self) -> None:
+        """Row positions changed (insert/remove/sort/reset)."""
+
+    # Model bookkeeping -------------------------------------------------------
+    def _row_count(self) -> int:
+        try:
+            return self._model.rowCount()
+        except RuntimeError:  # model is being destroyed with its view
+            return 0
+
+    def _on_reset(self, *_args) -> None:
+        self._rows = [None] * self._row_count()
+        self._rows_moved()
+
+    def _on_data_changed(self, top_left: QModelIndex, bottom_right: QModelIndex, *_roles) -> None:
+        rows = range(top_left.row(), min(bottom_right.row() + 1, len(self._rows)))
+        self._rows_dirty(rows)
+        for row in rows:
+            self._rows[row] = None
+
+    def _on_rows_inserted(self, _parent: QModelIndex, first: int, last: int) -> None:
+        self._rows[first:first] = [None] * (last - first + 1)
+        self._rows_moved()
+
+    def _on_rows_removed(self, _parent: QModelIndex, first: int, last: int) -> None:
+        del self._rows[first:last + 1]
+        self._rows_moved()
+
+    def _on_layout_about_to_change(self, *_args) -> None:
+        # Sorting permutes rows: remember where each cached row goes
+        m = self._model
+        self._pending_layout = [
+            (QPersistentModelIndex(m.index(row, 0)), value)
+            for row, value in enumerate(self._rows)
+            if value is not None
+        ]
+
+    def _on_layout_changed(self, *_args) -> None:
+        pending, self._pending_layout = self._pending_layout, None
+        self._rows = [None] * self._row_count()
+        for pindex, value in pending or ():
+            row = pindex.row()
+            if 0 <= row < len(self._rows):
+                self._rows[row] = value
+        self._rows_moved()
+
+    # Access ------------------------------------------------------------------
+    def value(self, row: int) -> Any:
+        value = self._rows[row]
+        if value is None:
+            value = self._rows[row] = self._compute(row)
+        return value
+
+    def invalidate(self) -> None:
+        """Forget every cached value (e.g. after edits with signals blocked)."""
+        self._on_reset()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+
+class TableRowIndex(RowCache):
+    """``key -> row`` lookup over the keys yielded by ``row_keys(model, row)``.
+
+    When several rows yield the same key the lowest row wins.  Entries are
+    patched in place after cell edits and rebuilt from the cached keys (no
+    cell access) after rows were inserted, removed or re-sorted.
+    """
+
+    def __init__(self, model, row_keys: Callable[[Any, int], Iterable[str]],
+                 parent: Optional[QObject] = None) -> None:
+        self._row_keys = row_keys
+        self._owners: Dict[str, Set[int]] = {}
+        self._stale = True
+        self._dirty: Set[int] = set()
+        super().__init__(model, parent)
+
+    def _compute(self, row: int) -> Tuple[str, ...]:
+        return tuple(dict.fromkeys(k for k in self._row_keys(self._model, row) if k))
+
+    def _rows_dirty(self, rows: range) -> None:
+        if self._stale:
+            return
+        for row in rows:
+            if row in self._dirty:
+                continue
+            for key in self._rows[row] or ():
+                owners = self._owners.get(key)
+                if owners is not None:
+                    owners.discard(row)
+                    if not owners:
+                        del self._owners[key]
+            self._dirty.add(row)
+
+    def _rows_moved(self) -> None:
+        self._stale = True
+        self._dirty.clear()
+
+    def _sync(self) -> None:
+        if self._stale:
+            self._owners = {}
+            rows = range(len(self._rows))
+            self._stale = False
+        else:
+            rows = [r for r in self._dirty if r < len(self._rows)]
+        for row in rows:
+            for key in self.value(row):
+                self._owners.setdefault(key, set()).add(row)
+        self._dirty.clear()
+
+    def find(self, *keys: str) -> Optional[int]:
+        """Row of the first of *keys* that is indexed, else ``None``."""
+        self._sync()
+        for key in keys:
+            if key:
+                owners = self._owners.get(key)
+                if owners:
+                    return min(owners)
+        return None
+
+    def find_all(self, key: str) -> List[int]:
+        """Every row yielding *key*, in row order."""
+        self._sync()
+        return sorted(self._owners.get(key, ()))
+
+    def keys_of(self, row: int) -> Tuple[str, ...]:
+        return self.value(row)
+
+    def __contains__(self, key: str) -> bool:
+        return self.find(key) is not None
+
+
+__all__ = ["RowCache", "TableRowIndex"]
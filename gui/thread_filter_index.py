@@ -0,0 +1,150 @@
+"""Token index behind the Process Threads search box.
+
+``filter_process_threads`` used to walk every row × column of the table and
+call ``item(r, c).text().lower()`` for every term on every keystroke.
+:class:`ThreadFilterIndex` keeps a lower-cased copy of each row's cells next
+to a status bit, so a filter pass is a few string ``in`` checks per row:
+
+* rows are re-read from the model only after they changed — the index
+  follows ``dataChanged``/``rowsInserted``/``rowsRemoved``/``layoutChanged`` of
+  the view's model and marks rows dirty instead of rescanning; a re-sort
+  carries the cached rows over through persistent indexes;
+* the status bitmask is tested before any text;
+* when the query only narrows the previous one (terms extended or added,
+  same column, no status re-enabled) only the currently visible rows are
+  re-checked;
+* visibility is changed only for rows whose state actually flips.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import List, Optional, Sequence, Tuple
+
+from PyQt5.QtCore import QModelIndex, Qt
+
+from .table_row_index import RowCache
+
+logger = logging.getLogger(__name__)
+
+STATUS_BITS = {
+    "status-pending": 1,
+    "status-downloaded": 2,
+    "status-uploaded": 4,
+    "status-posted": 8,
+}
+ALL_STATUSES = 1 | 2 | 4 | 8
+
+
+def status_mask(pending: bool, downloaded: bool, uploaded: bool, posted: bool) -> int:
+    """Bitmask for the status checkboxes; nothing checked means everything."""
+    mask = (
+        (STATUS_BITS["status-pending"] if pending else 0)
+        | (STATUS_BITS["status-downloaded"] if downloaded else 0)
+        | (STATUS_BITS["status-uploaded"] if uploaded else 0)
+        | (STATUS_BITS["status-posted"] if posted else 0)
+    )
+    return mask or ALL_STATUSES
+
+
+def _refines(old_terms: Sequence[str], new_terms: Sequence[str]) -> bool:
+    """True when every row matching *new_terms* also matches *old_terms*."""
+    return all(any(old in new for new in new_terms) for old in old_terms)
+
+
+class ThreadFilterIndex(RowCache):
+    """Lower-cased cell cache + status bits for a table view's rows."""
+
+    def __init__(self, view, status_column: int = 0, status_role: int = Qt.UserRole) -> None:
+        self._view = view
+        self._status_column = status_column
+        self._status_role = status_role
+
+        # Per-row cache value: (status_bit, per-column text, joined text)
+        self._hidden: List[bool] = []
+        self._last: Optional[Tuple[Tuple[str, ...], int, int]] = None
+        self.rows_scanned = 0  # rows tested by the last apply()
+        super().__init__(view.model(), view)
+
+    # ------------------------------------------------------------------
+    # Model bookkeeping
+    # ------------------------------------------------------------------
+    def _on_reset(self, *_args) -> None:
+        super()._on_reset()
+        self._last = None
+        try:
+            self._hidden = [self._view.isRowHidden(r) for r in range(len(self._rows))]
+        except RuntimeError:  # view already destroyed, model is tearing down
+            self._rows = []
+            self._hidden = []
+
+    def _on_rows_inserted(self, parent: QModelIndex, first: int, last: int) -> None:
+        super()._on_rows_inserted(parent, first, last)
+        self._hidden[first:first] = [False] * (last - first + 1)
+
+    def _on_rows_removed(self, parent: QModelIndex, first: int, last: int) -> None:
+        super()._on_rows_removed(parent, first, last)
+        del self._hidden[first:last + 1]
+
+    def _on_layout_changed(self, *args) -> None:
+        super()._on_layout_changed(*args)
+        self._last = None
+        try:
+            self._hidden = [self._view.isRowHidden(r) for r in range(len(self._rows))]
+        except RuntimeError:
+            self._hidden = [False] * len(self._rows)
+
+    def _compute(self, row: int) -> Tuple[int, Tuple[str, ...], str]:
+        m = self._model
+        texts = []
+        for col in range(m.columnCount()):
+            value = m.index(row, col).data(Qt.DisplayRole)
+            texts.append(str(value).lower() if value is not None else "")
+        status = m.index(row, self._status_column).data(self._status_role)
+        bit = STATUS_BITS.get(status or "", 0)
+        return (bit, tuple(texts), "\n".join(texts))
+
+    # ------------------------------------------------------------------
+    # Filtering
+    # ------------------------------------------------------------------
+    def matches(self, row: int, terms: Sequence[str], column: int = -1, mask: int = ALL_STATUSES) -> bool:
+        bit, texts, joined = self.value(row)
+        if not bit & mask:
+            return False
+        if not terms:
+            return True
+        if column < 0:
+            haystack = joined
+        else:
+            haystack = texts[column] if column < len(texts) else ""
+        return all(term in haystack for term in terms)
+
+    def apply(self, text: str, column: int = -1, mask: int = ALL_STATUSES) -> int:
+        """Show/hide rows for the query; returns how many rows changed state."""
+        terms = tuple(text.lower().split())
+        dirty = [r for r, entry in enumerate(self._rows) if entry is None]
+        if (
+            self._last is not None
+            and self._last[1] == column
+            and not mask & ~self._last[2]
+            and _refines(self._last[0], terms)
+        ):
+            candidates = sorted(set(r for r, h in enumerate(self._hidden) if not h).union(dirty))
+        else:
+            candidates = range(len(self._rows))
+
+        changed = 0
+        scanned = 0
+        for row in candidates:
+            scanned += 1
+            hide = not self.matches(row, terms, column, mask)
+            if hide != self._hidden[row]:
+                self._hidden[row] = hide
+                self._view.setRowHidden(row, hide)
+                changed += 1
+        self.rows_scanned = scanned
+        self._last = (terms, column, mask)
+        return changed
+
+
+__all__ = ["ThreadFilterIndex", "STATUS_BITS", "ALL_STATUSES", "status_mask"]
@@ -3,7 +3,12 @@
 import time
 import logging
 import os
-from typing import List, Iterable, Optional
+import threading
+from collections import Counter
+from typing import Dict, List, Iterable, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
 
 try:
     from myjdapi import Myjdapi
@@ -12,6 +17,56 @@ except Exception as e:
 
 log = logging.getLogger(__name__)
 
+# My.JDownloader session tokens expire server-side; renew them (cheap
+# /my/reconnect with the regain token) before that happens instead of
+# waiting for a TOKEN_INVALID in the middle of a session.
+TOKEN_REFRESH_INTERVAL = 20 * 60
+
+_TOKEN_ERRORS = ("TOKEN_INVALID", "AUTH_FAILED", "403")
+
+
+# ====== Keep-alive transport ======
+class _KeepAliveRequests:
+    """Stands in for the ``requests`` module inside ``myjdapi``.
+
+    ``myjdapi`` calls ``requests.get``/``requests.post`` for every API call,
+    which opens a new TCP/TLS connection each time.  Routing those calls
+    through one pooled ``Session`` keeps the connections to the My.JD server
+    (and the direct-connection endpoint) alive between calls.
+    """
+
+    exceptions = requests.exceptions
+
+    def __init__(self, session: requests.Session):
+        self.session = session
+
+    def get(self, url, **kwargs):
+        return self.session.get(url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.session.post(url, **kwargs)
+
+
+_transport_lock = threading.Lock()
+
+
+def install_keepalive_transport(pool_size: int = 8) -> bool:
+    """Make ``myjdapi`` use a shared keep-alive session (idempotent)."""
+    try:
+        from myjdapi import myjdapi as myjdapi_module
+    except Exception:
+        return False
+    with _transport_lock:
+        if isinstance(getattr(myjdapi_module, "requests", None), _KeepAliveRequests):
+            return True
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        myjdapi_module.requests = _KeepAliveRequests(session)
+        log.debug("JD transport: keep-alive session installed (pool=%d)", pool_size)
+        return True
+
 def hard_cancel(post, logger=None):
     """إيقاف وتنظيف كامل لقوائم التحميل و الـLinkGrabber باستخدام جلسة JD الحالية."""
     log = (logger.info if logger else print)
@@ -41,11 +96,6 @@ def hard_cancel(post, logger=None):
         links = _call("downloadsV2/queryLinks", [{"maxResults": -1, "uuid": True}])
         if links is None:
             return False
-        link_ids = [l.get("uuid") for l in (links or []) if l.get("uuid")]
-        if _call("downloadsV2/removeLinks", [link_ids, None]) is None:
-            return False
-        log(f"🧹 Removed {len(link_ids)} active JD links")
-
         link_ids = [l.get("uuid") for l in (links or []) if l.get("uuid")]
         if link_ids:
             if _call("downloadsV2/removeLinks", [link_ids, None]) is None:
@@ -87,16 +137,37 @@ class JDClient:
       - abort_linkgrabber() -> bool  <-- جديد لإيقاف الفحص ومسح كل شيء
 
     Internally uses `myjdapi`, so you don't deal with signatures/HMAC.
+
+    All device calls go through :meth:`_action`, which renews the session
+    token every ``token_refresh_interval`` seconds, reconnects once on a
+    token error and counts round-trips per endpoint in ``stats``.  Use
+    :func:`get_jd_client` to share one connected client per account.
     """
-    def __init__(self, email: str, password: str, device_name: str = "", app_key: str = "PyForumBot"):
+    def __init__(self, email: str, password: str, device_name: str = "", app_key: str = "PyForumBot",
+                 token_refresh_interval: float = TOKEN_REFRESH_INTERVAL, clock=time.monotonic):
+        install_keepalive_transport()
         self.api = Myjdapi()
         self.email = (email or "").strip()
         self.password = (password or "").strip()
         self.device_name = (device_name or "").strip()
         self.app_key = (app_key or "PyForumBot").strip()
         self.device = None
-
-    def connect(self) -> bool:
+        self.token_refresh_interval = float(token_refresh_interval)
+        self._clock = clock
+        self._token_ts: Optional[float] = None  # when the session token was (re)issued
+        self._stop_endpoint: Optional[str] = None
+        self._lock = threading.RLock()
+        self.stats: Counter = Counter()
+
+    def connect(self, force: bool = False) -> bool:
+        """Log in and pick the device; a connected client only renews its token unless *force*."""
+        with self._lock:
+            if self.device is not None and not force:
+                self._refresh_token_if_due()
+                return self.device is not None
+            return self._login()
+
+    def _login(self) -> bool:
         try:
             if not self.email or not self.password:
                 log.error("JD.connect: missing email/password")
@@ -131,6 +202,8 @@ class JDClient:
                 return False
 
             self.device = sel
+            self._token_ts = self._clock()
+            self.stats["login"] += 1
             log.debug("JD.connect: selected device=%s", getattr(self.device, "name", None))
             return True
         except Exception as e:
@@ -144,47 +217,71 @@ class JDClient:
         except Exception:
             return False
 
-    def post(self, path: str, params=None, _retried=False):
+    # ====== Session token ======
+    def _refresh_token_if_due(self) -> None:
+        """Renew the session token before it expires (reconnect, else full login)."""
+        if self._token_ts is None or self._clock() - self._token_ts < self.token_refresh_interval:
+            return
+        try:
+            self.api.reconnect()
+            self._token_ts = self._clock()
+            self.stats["reconnect"] += 1
+            log.debug("JD token refreshed proactively")
+        except Exception as e:
+            log.debug("JD token refresh failed (%s); logging in again", e)
+            self._login()
+
+    def _action(self, path: str, payload=None):
+        """One device call: proactive token refresh, one retry after a token error."""
+        path = "/" + path if not path.startswith("/") else path
+        payload = [] if payload is None else payload
+        with self._lock:
+            self._refresh_token_if_due()
+            device = self.device
+        self.stats[path] += 1
+        try:
+            return device.action(path, payload)
+        except Exception as e:
+            if not any(tok in str(e) for tok in _TOKEN_ERRORS) or self._token_ts is None:
+                raise
+            log.warning("⚠️ DEVICE token invalid; reconnecting & retrying…")
+            with self._lock:
+                if not self._login():
+                    raise
+                device = self.device
+            self.stats[path] += 1
+            return device.action(path, payload)
+
+    @property
+    def round_trips(self) -> int:
+        """Device calls made so far (logins/reconnects not included)."""
+        return sum(n for key, n in self.stats.items() if key.startswith("/"))
+
+    def post(self, path: str, params=None):
         """
         Wrapper موحّد لطلبات JD:
-          - يفضّل الاتصال المباشر (Direct)
-          - على 403/TOKEN_INVALID: يعمل reconnect() ويعيد المحاولة
-          - لو فشل المباشر تانى: يفولبَك إلى MyJD (سحابى) ويعيد المحاولة النهائية
+          - يفضّل الاتصال المباشر (Direct) — myjdapi بيدير directconnect تلقائياً
+          - يجدد التوكن قبل ما يخلص، وعلى 403/TOKEN_INVALID يعمل login ويعيد المحاولة مرة
+          - لو فشل تانى: يفولبَك إلى MyJD (سحابى) كمحاولة أخيرة
         """
-        path = "/" + path if not path.startswith("/") else path
-        payload = [] if params is None else params
-
-        def _try_device():
-            # myjdapi بيدير directconnect تلقائياً لو متاح
-            return self.device.action(path, payload)
-
         try:
-            return _try_device()
-        except Exception as e1:
-            msg = str(e1) if e1 else ""
-            token_err = "TOKEN_INVALID" in msg or "403" in msg
-            if token_err and not _retried:
-                self.logger.warning("⚠️ DEVICE token invalid; reconnecting & retrying…")
-                try:
-                    # يجدد الجلسة + directconnect
-                    self.connect(force=True)
-                except Exception as re:
-                    self.logger.debug(f"Reconnect failed softly: {re}")
-                # جرّب الجهاز المحلى تانى
-                try:
-                    return _try_device()
-                except Exception as e2:
-                    self.logger.debug(f"Direct retry failed: {e2}; falling back to MyJD…")
-                    # فولباك للسحابة كمحاولة أخيرة
-                    try:
-                        return self.api.call_device(self.device, path, payload)
-                    except Exception as e3:
-                        # فشل نهائى
-                        raise e3
-            # أخطاء أخرى أو أعدنا المحاولة بالفعل: ارمِ الاستثناء للأعلى
-            raise
-
-    def add_links_to_linkgrabber(self, urls: List[str], start_check: bool = True) -> bool:
+            return self._action(path, params)
+        except Exception as e:
+            call_device = getattr(self.api, "call_device", None)
+            if call_device is None:
+                raise
+            log.debug(f"Direct call failed: {e}; falling back to MyJD…")
+            path = "/" + path if not path.startswith("/") else path
+            return call_device(self.device, path, [] if params is None else params)
+
+    def add_links_to_linkgrabber(self, urls: List[str], start_check: bool = True,
+                                 package_name: Optional[str] = None) -> bool:
+        """Add *urls* to the LinkGrabber.
+
+        ``package_name`` puts everything crawled from these URLs into one
+        package of that name (overriding the packagizer), so the caller can
+        tell which links came from which URL.
+        """
         try:
             if not self.device:
                 log.error("JD.add_links: device not ready")
@@ -200,12 +297,15 @@ class JDClient:
                 "deepDecrypt": True,
                 "checkAvailability": True,
             }
+            if package_name:
+                payload["packageName"] = package_name
+                payload["overwritePackagizerRules"] = True
             # /linkgrabberv2/* expects a LIST of params
-            self.device.action("/linkgrabberv2/addLinks", [payload])
+            self._action("/linkgrabberv2/addLinks", [payload])
             log.debug("JD.add_links (raw): %d urls sent", len(urls))
             if start_check:
                 try:
-                    self.device.action("/linkgrabberv2/startOnlineCheck", [])
+                    self._action("/linkgrabberv2/startOnlineCheck", [])
                 except Exception:
                     try:
                         self.device.linkgrabberv2.start_online_check([])
@@ -229,7 +329,7 @@ class JDClient:
                     ids.append(int(uid))
                 except Exception:
                     ids.append(uid)
-            self.device.action("/linkgrabberv2/startOnlineCheck", [ids])
+            self._action("/linkgrabberv2/startOnlineCheck", [ids])
             return True
         except Exception as e:
             log.exception("JD.start_online_check: failed: %s", e)
@@ -256,7 +356,7 @@ class JDClient:
                 "uuid": True,
             }
             try:
-                res = self.device.action("/linkgrabberv2/queryLinks", [query]) or []
+                res = self._action("/linkgrabberv2/queryLinks", [query]) or []
             except Exception:
                 try:
                     res = self.device.linkgrabberv2.query_links(query) or []
@@ -270,6 +370,20 @@ class JDClient:
             log.exception("JD.query_links failed: %s", e)
             return []
 
+    def query_link_packages(self) -> list:
+        """LinkGrabber packages (``uuid``, ``name``, ``childCount``)."""
+        try:
+            if not self.device:
+                return []
+            query = {"childCount": True, "saveTo": True, "status": True}
+            res = self._action("/linkgrabberv2/queryPackages", [query]) or []
+            if isinstance(res, dict):
+                res = [res]
+            return res
+        except Exception as e:
+            log.debug("JD.query_link_packages failed: %s", e)
+            return []
+
     def remove_links(self, link_ids: Iterable) -> bool:
         try:
             if not self.device:
@@ -287,7 +401,7 @@ class JDClient:
                 return True
             # Try several variants to maximize compatibility
             try:
-                self.device.action("/linkgrabberv2/removeLinks", [{"linkIds": ids}])
+                self._action("/linkgrabberv2/removeLinks", [{"linkIds": ids}])
                 log.debug("JD.remove_links: removed %d items via {'linkIds': [...]}",
                           len(ids))
                 return True
@@ -302,10 +416,10 @@ class JDClient:
                 pass
             # Fallback: remove by packages
             pkg_query = {"packageUUIDs": True}
-            pkgs = self.device.action("/linkgrabberv2/queryPackages", [pkg_query]) or []
+            pkgs = self._action("/linkgrabberv2/queryPackages", [pkg_query]) or []
             pkg_ids = [p.get("packageUUID") for p in pkgs if p.get("packageUUID")]
             if pkg_ids:
-                self.device.action("/linkgrabberv2/removePackages", [{"packageIds": pkg_ids}])
+                self._action("/linkgrabberv2/removePackages", [{"packageIds": pkg_ids}])
                 log.debug("JD.remove_links: removed by packages: %d", len(pkg_ids))
                 return True
             return False
@@ -319,7 +433,7 @@ class JDClient:
                 return False
             # Try new API first
             try:
-                self.device.action("/linkgrabberv2/clearList", [])
+                self._action("/linkgrabberv2/clearList", [])
                 log.debug("JD.clear: cleared via /linkgrabberv2/clearList")
                 return True
             except Exception:
@@ -352,14 +466,14 @@ class JDClient:
             ("/linkgrabberv2/abortLinkGrabberTasks", []),
         ]:
             try:
-                self.device.action(ep, body)
+                self._action(ep, body)
                 log.debug("JD.abort: called %s", ep)
                 ok = True
             except Exception:
                 pass
         # في كل الأحوال امسح القائمة
         try:
-            self.device.action("/linkgrabberv2/clearList", [])
+            self._action("/linkgrabberv2/clearList", [])
             log.debug("JD.abort: cleared linkgrabber list")
             ok = True
         except Exception:
@@ -371,79 +485,77 @@ class JDClient:
                 ok = True
         return ok
     # ====== إيقاف التحميلات ومسح قوائم التحميل والـ LinkGrabber ======
-    def stop_all_downloads(self) -> bool:
-        """حاول إيقاف كل التحميلات الجارية."""
-        if not self.device:
-            return False
-        ok = False
-        for ep, body in [
-            ("/downloadcontroller/stop", []),
-            ("/downloadcontroller/abort", []),
-            ("/toolbar/stopDownloads", []),
-        ]:
-            try:
-                self.device.action(ep, body)
-                log.debug("JD.stop_downloads: called %s", ep)
-                ok = True
-            except Exception:
-                pass
+    _STOP_ENDPOINTS = ("/downloadcontroller/stop", "/downloadcontroller/abort", "/toolbar/stopDownloads")
 
-        # تأكد من تعطيل كل الحزم حتى لا تستمر التحميلات
-        pkg_ids: List[str] = []
+    def _download_package_ids(self) -> List[str]:
         try:
-            pkgs = self.device.action("/downloadsV2/queryPackages", [{"uuid": True}]) or []
+            pkgs = self._action("/downloadsV2/queryPackages", [{"uuid": True}]) or []
         except Exception:
             try:
                 pkgs = self.device.downloads.query_packages() or []
             except Exception:
                 pkgs = []
+        pkg_ids: List[str] = []
         for p in pkgs:
             uid = p.get("uuid") or p.get("packageUUID")
             if uid:
                 pkg_ids.append(uid)
-        if pkg_ids:
+        return pkg_ids
+
+    def _disable_packages(self, pkg_ids: List[str]) -> bool:
+        if not pkg_ids:
+            return False
+        try:
+            self._action("/downloadsV2/setEnabled", [{"packageUUIDs": pkg_ids, "enabled": False}])
+            log.debug("JD: disabled %d packages", len(pkg_ids))
+            return True
+        except Exception:
+            return False
+
+    def stop_all_downloads(self, pkg_ids: Optional[List[str]] = None) -> bool:
+        """حاول إيقاف كل التحميلات الجارية.
+
+        The stop endpoints are alternatives for different JD versions: the
+        first one that works is remembered and tried first next time.
+        """
+        if not self.device:
+            return False
+        ok = False
+        working = self._stop_endpoint
+        endpoints = ([working] if working else []) + [ep for ep in self._STOP_ENDPOINTS if ep != working]
+        for ep in endpoints:
             try:
-                self.device.action(
-                    "/downloadsV2/setEnabled",
-                    [{"packageUUIDs": pkg_ids, "enabled": False}],
-                )
-                log.debug("JD.stop_downloads: disabled %d packages", len(pkg_ids))
+                self._action(ep, [])
+                log.debug("JD.stop_downloads: called %s", ep)
+                self._stop_endpoint = ep
                 ok = True
+                break
             except Exception:
                 pass
+
+        # تأكد من تعطيل كل الحزم حتى لا تستمر التحميلات
+        if pkg_ids is None:
+            pkg_ids = self._download_package_ids()
+        if self._disable_packages(pkg_ids):
+            ok = True
         return ok
 
-    def clear_download_list(self) -> bool:
-        """إزالة كل العناصر من قائمة التحميلات."""
+    def clear_download_list(self, pkg_ids: Optional[List[str]] = None, disabled: bool = False) -> bool:
+        """إزالة كل العناصر من قائمة التحميلات.
+
+        ``pkg_ids``/``disabled`` let :meth:`stop_and_clear` reuse the package
+        list it already fetched and skip disabling the packages twice.
+        """
         if not self.device:
             return False
-        pkg_ids = []
         ok = False
-        pkg_ids: List[str] = []
-        try:
-            pkgs = self.device.action("/downloadsV2/queryPackages", [{"uuid": True}]) or []
-        except Exception:
-            try:
-                pkgs = self.device.downloads.query_packages() or []
-            except Exception:
-                pkgs = []
-        for p in pkgs:
-            uid = p.get("uuid") or p.get("packageUUID")
-            if uid:
-                pkg_ids.append(uid)
-        if pkg_ids:
-            try:
-                self.device.action(
-                    "/downloadsV2/setEnabled",
-                    [{"packageUUIDs": pkg_ids, "enabled": False}],
-                )
-                log.debug("JD.clear_downloads: disabled %d packages", len(pkg_ids))
-                ok = True
-            except Exception:
-                pass
+        if pkg_ids is None:
+            pkg_ids = self._download_package_ids()
+        if not disabled and self._disable_packages(pkg_ids):
+            ok = True
 
         try:
-            self.device.action("/downloadsV2/clearList", [])
+            self._action("/downloadsV2/clearList", [])
             log.debug("JD.clear_downloads: cleared via /downloadsV2/clearList")
             return True
         except Exception:
@@ -451,7 +563,7 @@ class JDClient:
 
         if pkg_ids:
             try:
-                self.device.action("/downloadsV2/removePackages", [{"packageUUIDs": pkg_ids}])
+                self._action("/downloadsV2/removePackages", [{"packageUUIDs": pkg_ids}])
                 log.debug("JD.clear_downloads: removed %d packages", len(pkg_ids))
                 return True
             except Exception:
@@ -466,13 +578,15 @@ class JDClient:
     def stop_and_clear(self) -> bool:
         """أوقف التحميلات ونظف قوائم التحميل و الـ LinkGrabber"""
         ok = False
+        pkg_ids: List[str] = []
         try:
-            if self.stop_all_downloads():
+            pkg_ids = self._download_package_ids() if self.device else []
+            if self.stop_all_downloads(pkg_ids):
                 ok = True
         except Exception:
             pass
         try:
-            if self.clear_download_list():
+            if self.clear_download_list(pkg_ids, disabled=True):
                 ok = True
         except Exception:
             pass
@@ -481,14 +595,6 @@ class JDClient:
                 ok = True
         except Exception:
             pass
-        try:
-            self.device.downloads.cleanup(
-                "DELETE_FINISHED", "REMOVE_LINKS_AND_DELETE_FILES", "ALL"
-            )
-            ok = True
-        except Exception:
-            pass
-
         try:
             self.device.downloads.cleanup(
                 "DELETE_FINISHED", "REMOVE_LINKS_AND_DELETE_FILES", "ALL"
@@ -561,23 +667,10 @@ def stop_and_clear_jdownloader(cfg_or_client=None, wait_timeout: float = 8.0):
             log.warning("stop_and_clear_jdownloader: missing My.JD credentials.")
             return False
 
-        try:
-            api = Myjdapi()
-            api.connect(email, password)
-            api.update_devices()
-            dev = None
-            if device_name:
-                try:
-                    dev = api.get_device(device_name)
-                except Exception:
-                    dev = None
-            if not dev:
-                devices = api.list_devices() or []
-                if devices:
-                    dev = devices[0]
-            jd = type("TmpJD", (), {"device": dev, "is_connected": True})()
-        except Exception as e:
-            log.exception(f"stop_and_clear_jdownloader: connect failed: {e}")
+        # الجلسة المشتركة بدل login جديد كل مرة
+        jd = get_jd_client(email, password, device_name, app_key)
+        if not jd.connect():
+            log.error("stop_and_clear_jdownloader: connect() returned False.")
             return False
 
     dev = getattr(jd, "device", None)
@@ -596,6 +689,8 @@ def stop_and_clear_jdownloader(cfg_or_client=None, wait_timeout: float = 8.0):
     if not dev:
         log.error("stop_and_clear_jdownloader: no device to act upon.")
         return False
+    # مع JDClient نعدّي الطلبات على _action (تجديد التوكن + عدّ الطلبات)
+    act = jd._action if isinstance(jd, JDClient) else dev.action
 
     # 2) أوقف الكنترولر + Pause فورى (نجرّب مسارات متعددة للتوافق)
     for path, payload in [
@@ -605,24 +700,24 @@ def stop_and_clear_jdownloader(cfg_or_client=None, wait_timeout: float = 8.0):
         ("/downloadcontroller/pause", [True]),
     ]:
         try:
-            dev.action(path, payload)
+            act(path, payload)
         except Exception:
             pass
 
     # 3) LinkGrabber: أوقف أى Tasks
     for path in ["/linkgrabberv2/abort", "/linkgrabberv2/cancel", "/linkgrabberv2/stopOnlineCheck"]:
         try:
-            dev.action(path, [])
+            act(path, [])
         except Exception:
             pass
 
     # 4) امسح الـ Downloads (نجيب UUIDs وبعدين نستخدم الاسم الصحيح للحقل)
     def _query_download_package_uuids():
         try:
-            pkgs = dev.action("/downloadsV2/queryPackages", [{"packageUUIDs": True}]) or []
+            pkgs = act("/downloadsV2/queryPackages", [{"packageUUIDs": True}]) or []
         except Exception:
             try:
-                pkgs = dev.action("/downloads/queryPackages", [{"packageUUIDs": True}]) or []
+                pkgs = act("/downloads/queryPackages", [{"packageUUIDs": True}]) or []
             except Exception:
                 pkgs = []
         uuids = []
@@ -645,7 +740,7 @@ def stop_and_clear_jdownloader(cfg_or_client=None, wait_timeout: float = 8.0):
             ("/downloadsV2/setEnabled", [{"packageUUIDs": d_pkg_uuids, "enabled": False}]),
         ]:
             try:
-                dev.action(path, payload)
+                act(path, payload)
                 removed = True
                 break
             except Exception:
@@ -653,14 +748,14 @@ def stop_and_clear_jdownloader(cfg_or_client=None, wait_timeout: float = 8.0):
         if not removed:
             # فولباك أخير: clearList (قد يمسح المُكتمل فقط)
             try:
-                dev.action("/downloadsV2/clearList", [])
+                act("/downloadsV2/clearList", [])
             except Exception:
                 pass
 
     # 5) LinkGrabber: امسح الباكدجات/اللينكات (packageIds غالبًا فى LG)
     def _query_lg_package_ids():
         try:
-            pkgs = dev.action("/linkgrabberv2/queryPackages", [{"packageUUIDs": True}]) or []
+            pkgs = act("/linkgrabberv2/queryPackages", [{"packageUUIDs": True}]) or []
         except Exception:
             pkgs = []
         ids = []
@@ -679,21 +774,21 @@ def stop_and_clear_jdownloader(cfg_or_client=None, wait_timeout: float = 8.0):
             ("/linkgrabberv2/removeLinks", [[], lg_pkg_ids]),
         ]:
             try:
-                dev.action(path, payload)
+                act(path, payload)
                 cleared = True
                 break
             except Exception:
                 continue
         if not cleared:
             try:
-                dev.action("/linkgrabberv2/clearList", [])
+                act("/linkgrabberv2/clearList", [])
                 cleared = True
             except Exception:
                 pass
     else:
         # مفيش باكدجز؟ جرّب clearList مباشرة
         try:
-            dev.action("/linkgrabberv2/clearList", [])
+            act("/linkgrabberv2/clearList", [])
         except Exception:
             pass
 
@@ -701,14 +796,14 @@ def stop_and_clear_jdownloader(cfg_or_client=None, wait_timeout: float = 8.0):
     deadline = time.time() + float(wait_timeout)
     while time.time() < deadline:
         try:
-            d_left = dev.action("/downloadsV2/queryPackages", [{"packageUUIDs": True}]) or []
+            d_left = act("/downloadsV2/queryPackages", [{"packageUUIDs": True}]) or []
         except Exception:
             try:
-                d_left = dev.action("/downloads/queryPackages", [{"packageUUIDs": True}]) or []
+                d_left = act("/downloads/queryPackages", [{"packageUUIDs": True}]) or []
             except Exception:
                 d_left = []
         try:
-            lg_left = dev.action("/linkgrabberv2/queryPackages", [{"packageUUIDs": True}]) or []
+            lg_left = act("/linkgrabberv2/queryPackages", [{"packageUUIDs": True}]) or []
         except Exception:
             lg_left = []
         if not d_left and not lg_left:
@@ -719,4 +814,22 @@ def stop_and_clear_jdownloader(cfg_or_client=None, wait_timeout: float = 8.0):
     return True
 
 
+# ====== Shared clients ======
+_clients: Dict[Tuple[str, str, str], JDClient] = {}
+_clients_lock = threading.Lock()
 
+
+def get_jd_client(email: str, password: str, device_name: str = "", app_key: str = "PyForumBot") -> JDClient:
+    """The shared :class:`JDClient` of this account/device.
+
+    Callers used to build (and log in) a fresh client for every link check;
+    the shared one keeps its session, token and device selection, so
+    ``connect()`` on it is free while the token is valid.
+    """
+    key = ((email or "").strip().lower(), (device_name or "").strip(), (app_key or "PyForumBot").strip())
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None or client.password != (password or "").strip():
+            client = JDClient(email, password, device_name, app_key)
+            _clients[key] = client
+        return client
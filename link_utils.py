@@ -31,6 +31,8 @@ from __future__ import annotations
 import logging
 from typing import Any, Dict, List, Optional
 
+from utils.host_classifier import canonical_host
+
 log = logging.getLogger(__name__)
 
 # Mapping of known synonyms to canonical keys.  All keys in this map
@@ -61,6 +63,12 @@ _KEY_ALIASES = {
     "keeplinks": "keeplinks",
 }
 
+# Canonical file-host keys that can also be reached through a host alias
+# such as ``rg.to`` or ``www.rapidgator.net``.
+_HOST_KEYS = frozenset(
+    v for v in _KEY_ALIASES.values() if v not in ("keeplinks", "rapidgator-backup")
+)
+
 
 def _flatten(value: Any) -> List[str]:
     """Flatten arbitrary nested link structures into a flat list of strings.
@@ -123,6 +131,8 @@ def normalize_links(src: Any) -> Dict[str, Any]:
             continue
         key_lower = str(raw_key).lower().strip()
         canonical_key = _KEY_ALIASES.get(key_lower)
+        if not canonical_key and canonical_host(key_lower) in _HOST_KEYS:
+            canonical_key = canonical_host(key_lower)
         if not canonical_key:
             # Skip unknown keys (e.g. 'thread_id')
             continue
@@ -0,0 +1,50 @@
+"""Recorded-response stand-in for a ``myjdapi`` device.
+
+Plug it into a :class:`integrations.jd_client.JDClient` (``client.device =
+RecordedJDDevice.from_recording("link_check_session")``) to run JD code paths
+offline and count the API round-trips they make.
+"""
+
+import copy
+import json
+from collections import Counter
+from pathlib import Path
+
+RECORDINGS_DIR = Path(__file__).resolve().parent / "jd_recordings"
+
+
+class RecordedJDDevice:
+    """Replays recorded device responses and logs every call.
+
+    ``responses`` maps an API path to the successive responses recorded for
+    it; once they run out the last one repeats.  A path without a recording
+    raises, like JD does for an endpoint it does not know.
+    """
+
+    name = "recorded"
+
+    def __init__(self, responses):
+        self._responses = {path: list(replies) for path, replies in responses.items()}
+        self._served = Counter()
+        self.calls = []
+
+    @classmethod
+    def from_recording(cls, name):
+        data = json.loads((RECORDINGS_DIR / f"{name}.json").read_text(encoding="utf-8"))
+        return cls(data["responses"])
+
+    def action(self, path, params=()):
+        self.calls.append((path, params))
+        replies = self._responses.get(path)
+        if not replies:
+            raise Exception(f"404 no recorded response for {path}")
+        served = self._served[path]
+        self._served[path] += 1
+        return copy.deepcopy(replies[min(served, len(replies) - 1)])
+
+    @property
+    def round_trips(self):
+        return len(self.calls)
+
+    def per_path(self):
+        return Counter(path for path, _ in self.calls)
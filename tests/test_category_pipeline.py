@@ -0,0 +1,55 @@
+from datetime import date, datetime
+
+from core.category_pipeline import (
+    ThreadRow,
+    listing_page_url,
+    page_is_older_than,
+    parse_thread_rows,
+)
+
+
+LISTING = """
+<table>
+<tr><td>
+  <a id="thread_title_101" href="showthread.php?t=101">First</a>
+  <div class="smallfont">Uploader, 24.05.2025</div>
+</td></tr>
+<tr><td>
+  <a id="thread_title_102" href="/showthread.php?t=102">Second</a>
+  <div class="smallfont" style="x">no date</div>
+</td></tr>
+<tr><td>
+  <a id="thread_title_103" href="https://www.mygully.com/showthread.php?t=103">Third</a>
+  <div class="smallfont">Uploader, 20.05.2025</div>
+</td></tr>
+</table>
+"""
+
+
+def _parse(text):
+    try:
+        return datetime.strptime(text, "%d.%m.%Y").date()
+    except ValueError:
+        return None
+
+
+def test_listing_page_url():
+    base = "https://www.mygully.com/forum/377-ebooks/"
+    assert listing_page_url(base, 1) == base
+    assert listing_page_url(base, 3) == "https://www.mygully.com/forum/377-ebooks-3/"
+
+
+def test_parse_thread_rows_skips_rows_without_date():
+    rows = parse_thread_rows(LISTING, "https://www.mygully.com")
+    assert rows == [
+        ThreadRow("101", "First", "https://www.mygully.com/showthread.php?t=101", "24.05.2025"),
+        ThreadRow("103", "Third", "https://www.mygully.com/showthread.php?t=103", "20.05.2025"),
+    ]
+
+
+def test_page_is_older_than():
+    rows = parse_thread_rows(LISTING, "https://www.mygully.com")
+    assert page_is_older_than(rows, date(2025, 5, 25), _parse)
+    assert not page_is_older_than(rows, date(2025, 5, 21), _parse)
+    assert not page_is_older_than(rows, None, _parse)
+    assert not page_is_older_than([], date(2025, 5, 25), _parse)
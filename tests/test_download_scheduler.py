@@ -0,0 +1,80 @@
+from core.download_scheduler import DownloadScheduler, parse_host_limits
+
+
+def _items(thread_id, links, fallback=()):
+    return [
+        {
+            "link_id": f"{thread_id}-{i}",
+            "thread_id": thread_id,
+            "link": link,
+            "fallback_links": list(fallback),
+            "new_files": [],
+        }
+        for i, link in enumerate(links)
+    ]
+
+
+def test_parse_host_limits():
+    assert parse_host_limits("rapidgator=4, katfile.com=2; rg.to=5, bad=x") == {
+        "rapidgator.net": 5,
+        "katfile.com": 2,
+    }
+    assert parse_host_limits({"www.nitroflare.com": "3"}) == {"nitroflare.com": 3}
+    assert parse_host_limits(None) == {}
+
+
+def test_host_and_global_caps():
+    sched = DownloadScheduler(global_limit=3, host_limits={"rapidgator.net": 2})
+    sched.add_thread("t1", _items("t1", [f"https://rapidgator.net/file/{i}" for i in range(4)]
+                                  + ["https://katfile.com/k1"]))
+    started = sched.drain_ready()
+    hosts = [sched.host_of(i) for i in started]
+    assert hosts.count("rapidgator.net") == 2
+    assert "katfile.com" in hosts
+    assert len(started) == 3
+    assert sched.next_ready() is None
+
+    sched.complete(started[0], True)
+    nxt = sched.next_ready()
+    assert sched.host_of(nxt) == "rapidgator.net"
+
+
+def test_round_robin_between_threads():
+    sched = DownloadScheduler(global_limit=4)
+    sched.add_thread("a", _items("a", [f"https://rapidgator.net/file/a{i}" for i in range(3)]))
+    sched.add_thread("b", _items("b", [f"https://rapidgator.net/file/b{i}" for i in range(3)]))
+    order = [item["thread_id"] for item in sched.drain_ready()]
+    assert order == ["a", "b", "a", "b"]
+
+
+def test_fallback_promotion_and_thread_callback():
+    done = []
+    sched = DownloadScheduler(global_limit=2, on_thread_complete=lambda tid, st: done.append((tid, list(st["failed"]))))
+    sched.add_thread("t", _items("t", ["https://rapidgator.net/file/1"],
+                                 fallback=["https://katfile.com/x", "https://nitroflare.com/view/y"]))
+    first = sched.next_ready()
+    promoted = sched.complete(first, False)
+    assert promoted["link"] == "https://katfile.com/x"
+    assert promoted["fallback_links"] == ["https://nitroflare.com/view/y"]
+    assert promoted["failed_links"] == ["https://rapidgator.net/file/1"]
+    assert not done
+
+    second = sched.next_ready()
+    assert second is promoted
+    assert sched.complete(second, True) is None
+    assert done == [("t", [])]
+    assert sched.is_idle()
+
+
+def test_throughput_aggregates_active_and_finished():
+    sched = DownloadScheduler(global_limit=2)
+    sched.add_thread("t", _items("t", ["https://rapidgator.net/file/1", "https://katfile.com/2"]))
+    a, b = sched.drain_ready()
+    sched.record_progress(a["link_id"], 100, 200)
+    sched.record_progress(b["link_id"], 50, 100)
+    assert sched.throughput(now=10.0)[:2] == (150, 300)
+    sched.complete(a, True)
+    sched.record_progress(b["link_id"], 100, 100)
+    done, total, speed = sched.throughput(now=11.0)
+    assert (done, total) == (200, 300)
+    assert speed == 50.0
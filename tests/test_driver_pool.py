@@ -0,0 +1,182 @@
+import threading
+
+import pytest
+
+from core.driver_pool import DriverPool, DriverPoolTimeout, lease_bot
+
+
+class FakeBot:
+    def __init__(self, name):
+        self.name = name
+        self.alive = True
+        self.closed = False
+        self.restarts = 0
+        self.cookies_file = f"{name}.pkl"
+        self.processed_thread_ids = set()
+        self.is_logged_in = True
+
+    def close(self):
+        self.closed = True
+
+    def initialize_driver_with_retries(self):
+        self.restarts += 1
+        self.alive = True
+        return True
+
+    def load_cookies(self):
+        return False
+
+
+def make_pool(size=3, **kwargs):
+    made = []
+
+    def factory():
+        bot = FakeBot(f"extra{len(made)}")
+        made.append(bot)
+        return bot
+
+    prepared = []
+    pool = DriverPool(
+        FakeBot("main"), factory, size=size,
+        prepare=lambda primary, bot: prepared.append((primary.name, bot.name)),
+        health_check=lambda bot: bot.alive, **kwargs,
+    )
+    return pool, made, prepared
+
+
+def test_primary_first_then_extra_sessions_up_to_size():
+    pool, made, prepared = make_pool(size=3)
+    with pool.lease() as a:
+        assert a is pool.primary
+        with pool.lease() as b, pool.lease() as c:
+            assert [b.name, c.name] == ["extra0", "extra1"]
+            assert prepared == [("main", "extra0"), ("main", "extra1")]
+            with pytest.raises(DriverPoolTimeout):
+                pool.acquire(timeout=0)
+    # Everything is idle again: the main bot is preferred, nothing new created
+    with pool.lease() as again:
+        assert again is pool.primary
+    stats = pool.stats()
+    assert (stats["leases"], stats["timeouts"], stats["created"]) == (4, 1, 2)
+    assert (stats["sessions"], stats["busy"]) == (3, 0)
+
+
+def test_dead_sessions_are_recycled():
+    pool, made, _ = make_pool(size=2)
+    main = pool.acquire()
+    extra = pool.acquire()
+    extra.alive = False
+    pool.release(extra)
+    # Health check before the next lease replaces the dead extra session
+    replacement = pool.acquire()
+    assert extra.closed and replacement is made[1]
+    pool.release(replacement)
+
+    with pytest.raises(RuntimeError):
+        with pool.lease(primary=False):
+            raise RuntimeError("task failed")  # healthy session: kept
+    assert pool.stats()["idle"] == 1
+
+    main.alive = False
+    pool.release(main, broken=True)
+    assert main.restarts == 1 and main.alive
+    assert pool.stats()["recycled"] == 2
+    with pool.lease() as bot:
+        assert bot is main
+
+
+def test_lease_waits_for_release_and_records_wait_time():
+    now = [0.0]
+    waiting = threading.Event()
+
+    def clock():
+        if threading.current_thread().name == "waiter":
+            waiting.set()
+        return now[0]
+
+    pool, _, _ = make_pool(size=1, clock=clock)
+    bot = pool.acquire()
+    got = []
+
+    t = threading.Thread(target=lambda: got.append(pool.acquire(timeout=60)), name="waiter")
+    t.start()
+    assert waiting.wait(5)
+    now[0] = 5.0
+    pool.release(bot)
+    t.join(5)
+    assert got == [bot]
+    assert pool.stats()["wait_max"] == 5.0
+
+
+def test_invalidate_retires_extra_sessions():
+    pool, made, _ = make_pool(size=2)
+    main, extra = pool.acquire(), pool.acquire()
+    pool.invalidate()
+    pool.release(extra)
+    pool.release(main)
+    assert extra.closed and not main.closed
+    with pool.lease() as a, pool.lease() as b:
+        assert (a, b) == (main, made[1])
+
+
+def test_lease_bot_accepts_a_plain_mutex():
+    class Mutex:
+        def __init__(self):
+            self.calls = []
+
+        def tryLock(self, ms):
+            self.calls.append(("try", ms))
+            return True
+
+        def unlock(self):
+            self.calls.append("unlock")
+
+    bot, mutex = object(), Mutex()
+    with lease_bot(bot, mutex, timeout=10) as leased:
+        assert leased is bot
+    assert mutex.calls == [("try", 10000), "unlock"]
+    with lease_bot(bot, None) as leased:
+        assert leased is bot
+
+
+def test_failed_session_start_backs_off_without_shrinking():
+    now = [0.0]
+    pool, made, _ = make_pool(size=2, clock=lambda: now[0])
+    real_factory = pool.factory
+
+    def flaky():
+        if not made:
+            made.append(None)
+            raise RuntimeError("chrome did not start")
+        return real_factory()
+
+    pool.factory = flaky
+    main = pool.acquire()
+    with pytest.raises(DriverPoolTimeout):
+        pool.acquire(timeout=0)
+    assert pool.stats()["create_errors"] == 1 and pool.size == 2
+    now[0] = 5.0
+    extra = pool.acquire(timeout=0)
+    assert extra is made[1] and pool.stats()["sessions"] == 2
+    pool.release(extra)
+    pool.release(main)
+
+
+def test_main_session_that_stays_dead_is_not_handed_out():
+    now = [0.0]
+    pool, _, _ = make_pool(size=1, clock=lambda: now[0])
+    main = pool.primary
+    main.alive = False
+    main.initialize_driver_with_retries = lambda: False
+    with pytest.raises(DriverPoolTimeout):
+        pool.acquire(timeout=0)
+    assert pool.stats()["busy"] == 0
+    # Still in its backoff: no new restart attempt yet
+    with pytest.raises(DriverPoolTimeout):
+        pool.acquire(timeout=0, primary=True)
+    assert pool.stats()["recycled"] == 1
+
+    del main.initialize_driver_with_retries
+    now[0] = 5.0
+    with pool.lease(timeout=0) as bot:
+        assert bot is main and main.alive and main.restarts == 1
@@ -0,0 +1,89 @@
+import os
+
+from downloaders import jdownloader
+from downloaders.file_locator import FileLocator
+from downloaders.jdownloader import JDownloaderDownloader
+
+
+def _touch(path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"x")
+
+
+def _bump(path):
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+
+def test_index_refreshes_only_changed_directories(tmp_path):
+    for i in range(20):
+        _touch(tmp_path / f"d{i}" / f"file{i}.rar")
+    _touch(tmp_path / "a" / "b" / "c" / "too_deep.rar")
+    locator = FileLocator([str(tmp_path)], max_depth=3, min_refresh_interval=0)
+
+    hits = locator.lookup(["FILE3.RAR", "file7.rar", "missing.rar", "too_deep.rar"])
+    assert hits["FILE3.RAR"] == [str(tmp_path / "d3" / "file3.rar")]
+    assert hits["file7.rar"] and not hits["missing.rar"] and not hits["too_deep.rar"]
+
+    scans = locator.stats["scans"]
+    assert locator.refresh() == 0 and locator.stats["scans"] == scans
+
+    _touch(tmp_path / "d5" / "new.part1.rar")
+    (tmp_path / "d6" / "file6.rar").unlink()
+    for d in ("d5", "d6"):
+        _bump(tmp_path / d)
+    assert locator.refresh() == 2
+    assert locator.lookup(["new.part1.rar"])["new.part1.rar"] == [str(tmp_path / "d5" / "new.part1.rar")]
+    assert locator.lookup(["file6.rar"])["file6.rar"] == []
+    assert locator.search(lambda name: name.startswith("file1")) == sorted(
+        str(tmp_path / f"d{i}" / f"file{i}.rar") for i in (1, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19))
+
+
+def test_extra_roots_are_evicted_least_recently_used(tmp_path):
+    downloads = tmp_path / "Downloads"
+    _touch(downloads / "pkgA" / "a.rar")
+    for name in ("out1", "out2", "out3"):
+        _touch(tmp_path / name / f"{name}.rar")
+    locator = FileLocator([str(downloads)], min_refresh_interval=0, max_extra_roots=2)
+
+    locator.add_root(str(downloads / "pkgA"))
+    locator.add_root(str(tmp_path / "out1"))
+    locator.add_root(str(tmp_path / "out2"))  # evicts pkgA
+    assert locator.roots == [str(downloads), str(tmp_path / "out1"), str(tmp_path / "out2")]
+    # pkgA is still reached through the pinned Downloads root
+    assert locator.lookup(["a.rar"])["a.rar"] == [str(downloads / "pkgA" / "a.rar")]
+
+    locator.add_root(str(tmp_path / "out1"))  # used again: out2 is now the oldest
+    locator.add_root(str(tmp_path / "out3"))
+    hits = locator.lookup(["out1.rar", "out2.rar", "out3.rar"])
+    assert hits["out2.rar"] == [] and hits["out1.rar"] and hits["out3.rar"]
+
+    locator.remove_root(str(downloads))
+    assert locator.lookup(["a.rar"])["a.rar"] == []
+
+
+class _Downloads:
+    def query_links(self, params):
+        return [{"name": "Book.Part1.rar"}, {"name": "book.part2.rar"}, {"name": "gone.rar"}]
+
+
+class _Device:
+    downloads = _Downloads()
+
+
+def test_package_files_are_resolved_in_one_lookup(tmp_path, monkeypatch):
+    src, target = tmp_path / "Downloads", tmp_path / "target"
+    _touch(src / "pkg" / "book.part1.rar")
+    _touch(src / "pkg" / "book.part2.rar")
+    locator = FileLocator([str(src)], min_refresh_interval=0)
+    monkeypatch.setattr(jdownloader, "get_file_locator", lambda: locator)
+
+    downloader = JDownloaderDownloader.__new__(JDownloaderDownloader)
+    downloader.device = _Device()
+    lookups = locator.stats["lookups"]
+    files = downloader._get_package_files({"uuid": "u1"}, str(target))
+
+    assert sorted(files) == [str(target / "book.part1.rar"), str(target / "book.part2.rar")]
+    assert all(os.path.exists(f) for f in files) and not (src / "pkg" / "book.part1.rar").exists()
+    # One batched lookup plus one partial-match search for the file that is missing
+    assert locator.stats["lookups"] - lookups == 2
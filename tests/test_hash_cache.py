@@ -0,0 +1,66 @@
+import hashlib
+import os
+import threading
+
+from core import hash_cache
+from core.hash_cache import FileHashCache, hash_file
+
+
+def test_hash_file_computes_all_digests_in_one_pass(tmp_path):
+    path = tmp_path / "data.bin"
+    data = os.urandom(3 * 1024 * 1024 + 5)
+    path.write_bytes(data)
+    digests = hash_file(str(path), ("md5", "sha256"), buffer_size=1024 * 1024)
+    assert digests == {
+        "md5": hashlib.md5(data).hexdigest(),
+        "sha256": hashlib.sha256(data).hexdigest(),
+    }
+
+
+def test_cache_hits_and_invalidation(tmp_path, monkeypatch):
+    path = tmp_path / "a.rar"
+    path.write_bytes(b"first")
+    calls = []
+    real_hash = hash_cache.hash_file
+    monkeypatch.setattr(hash_cache, "hash_file", lambda *a, **k: calls.append(a[0]) or real_hash(*a, **k))
+
+    cache = FileHashCache(str(tmp_path / "hashes.json"))
+    assert cache.md5(str(path)) == hashlib.md5(b"first").hexdigest()
+    assert cache.md5(str(path)) == hashlib.md5(b"first").hexdigest()
+    assert len(calls) == 1
+    assert cache.hits == 1
+
+    path.write_bytes(b"second version")
+    assert cache.md5(str(path)) == hashlib.md5(b"second version").hexdigest()
+    assert len(calls) == 2
+
+
+def test_cache_is_persisted(tmp_path):
+    path = tmp_path / "a.rar"
+    path.write_bytes(b"payload")
+    store = str(tmp_path / "hashes.json")
+    FileHashCache(store).md5(str(path))
+
+    reloaded = FileHashCache(store)
+    assert reloaded.peek(str(path)) == hashlib.md5(b"payload").hexdigest()
+
+
+def test_concurrent_requests_share_one_computation(tmp_path, monkeypatch):
+    path = tmp_path / "big.bin"
+    path.write_bytes(b"x" * 1024)
+    gate = threading.Event()
+    calls = []
+    real_hash = hash_cache.hash_file
+
+    def slow_hash(*args, **kwargs):
+        calls.append(args[0])
+        gate.wait(5)
+        return real_hash(*args, **kwargs)
+
+    monkeypatch.setattr(hash_cache, "hash_file", slow_hash)
+    cache = FileHashCache(None, max_workers=2)
+    futures = [cache.submit(str(path)) for _ in range(3)]
+    gate.set()
+    results = {f.result(timeout=5)["md5"] for f in futures}
+    assert results == {hashlib.md5(b"x" * 1024).hexdigest()}
+    assert len(calls) == 1
@@ -0,0 +1,68 @@
+import time
+
+from utils.host_classifier import (
+    HostClassifier,
+    canonical_host,
+    classify_url,
+    is_container_url,
+    url_hostname,
+)
+
+
+def test_url_hostname():
+    assert url_hostname("https://User@WWW.Rapidgator.net:443/file/x") == "www.rapidgator.net"
+    assert url_hostname("not a url") == ""
+
+
+def test_classify_subdomains_and_aliases():
+    assert classify_url("https://rapidgator.net/file/abc") == "rapidgator.net"
+    assert classify_url("https://dl3.www.rapidgator.net/file/abc") == "rapidgator.net"
+    assert classify_url("https://rg.to/file/abc") == "rapidgator.net"
+    assert classify_url("https://ddl.to/abc") == "ddownload.com"
+    assert classify_url("https://example.com/rapidgator.net") is None
+    assert classify_url("https://notrapidgator.net/file") is None
+
+
+def test_canonical_host_and_containers():
+    assert canonical_host("WWW.rg.to") == "rapidgator.net"
+    assert canonical_host("www.example.com") == "example.com"
+    assert is_container_url("https://www.keeplinks.org/p/abc")
+    assert not is_container_url("https://rapidgator.net/file/abc")
+
+
+def test_normalize_url_rewrites_alias_host_only():
+    c = HostClassifier()
+    assert c.normalize_url("https://rg.to/file/abc/rg.to.rar") == "https://rapidgator.net/file/abc/rg.to.rar"
+    url = "https://rapidgator.net/file/abc"
+    assert c.normalize_url(url) is url
+
+
+def test_alias_requires_known_canonical_host():
+    c = HostClassifier(["katfile.com"])
+    assert c.classify("https://rg.to/file/abc") is None
+    assert c.classify("https://katfile.com/abc") == "katfile.com"
+
+
+def test_classify_text_and_group():
+    text = "a https://rg.to/file/1 b\nhttps://nitroflare.com/view/X\nhttps://keeplinks.org/p/1"
+    c = HostClassifier()
+    assert list(c.classify_text(text)) == [
+        ("https://rg.to/file/1", "rapidgator.net"),
+        ("https://nitroflare.com/view/X", "nitroflare.com"),
+        ("https://keeplinks.org/p/1", None),
+    ]
+    assert c.group(c.find_urls(text)) == {
+        "rapidgator.net": ["https://rapidgator.net/file/1"],
+        "nitroflare.com": ["https://nitroflare.com/view/X"],
+    }
+
+
+def test_classify_text_megathread_is_fast():
+    hosts = ["rapidgator.net", "katfile.com", "nitroflare.com", "ddownload.com", "example.org"]
+    text = "\n".join(f"https://{hosts[i % 5]}/file/{i}/part{i}.rar" for i in range(5000))
+    c = HostClassifier()
+    start = time.perf_counter()
+    found = [h for _url, h in c.classify_text(text) if h]
+    elapsed = time.perf_counter() - start
+    assert len(found) == 4000
+    assert elapsed < 0.5
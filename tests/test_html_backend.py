@@ -0,0 +1,83 @@
+import pytest
+
+from core import html_backend
+
+
+THREAD_PAGE = """
+<html><body>
+<table><tr><td class="alt2"><a class="bigusername" href="member.php?u=1"><span> Uploader </span></a></td></tr></table>
+<div id="post_message_11">
+  Intro <a href="https://rapidgator.net/file/aaa/book.rar.html">RG</a>
+  <pre class="alt2">https://katfile.com/bbb/book.rar
+https://keeplinks.org/p/xyz</pre>
+  <quote>mirror https://nitroflare.com/view/CCC</quote>
+  <div class="alt2"><code>outer<code>https://ddownload.com/<b>ddd</b></code></code></div>
+</div>
+<table><tr><td class="thead">Reply header</td></tr></table>
+<div id="post_message_12"><a href="https://mega.nz/file/zzz">mega</a></div>
+<table><tr><td class="thead">Footer</td></tr></table>
+<div id="post_message_13">not followed by a header</div>
+</body></html>
+"""
+
+LISTING_PAGE = """
+<table>
+<tr><td><a id="thread_title_1" href="showthread.php?t=1">One</a>
+  <div class="smallfont">Uploader, 24.05.2025</div></td></tr>
+<tr><td><a id="thread_title_2" href="showthread.php?t=2">Two</a>
+  <div class="smallfont" style="color:red">styled</div></td></tr>
+</table>
+"""
+
+BACKENDS = [html_backend.BACKEND_HTML_PARSER]
+if html_backend.LXML_AVAILABLE:
+    BACKENDS.append(html_backend.BACKEND_LXML)
+
+
+@pytest.fixture(params=BACKENDS)
+def backend(request):
+    previous = html_backend.get_backend()
+    assert html_backend.set_backend(request.param) == request.param
+    yield request.param
+    html_backend.set_backend(previous)
+
+
+def test_extract_thread_posts(backend):
+    author, posts = html_backend.extract_thread_posts(THREAD_PAGE)
+    assert author == "Uploader"
+    assert [p.post_id for p in posts] == ["post_message_11", "post_message_12"]
+    first = posts[0]
+    assert first.hrefs == ["https://rapidgator.net/file/aaa/book.rar.html"]
+    assert "https://katfile.com/bbb/book.rar" in first.pre_texts[0]
+    assert "https://nitroflare.com/view/CCC" in first.quote_texts[0]
+    assert first.code_texts == ["https://ddownload.com/ddd"]
+    assert posts[1].hrefs == ["https://mega.nz/file/zzz"]
+
+
+def test_xml_declared_page_is_parsed(backend):
+    page = '<?xml version="1.0" encoding="windows-1256"?>' + THREAD_PAGE
+    author, posts = html_backend.extract_thread_posts(page)
+    assert author == "Uploader"
+    assert [p.post_id for p in posts] == ["post_message_11", "post_message_12"]
+    rows = html_backend.extract_listing_rows('<?xml version="1.0" encoding="utf-8"?>' + LISTING_PAGE)
+    assert [r.title for r in rows] == ["One", "Two"]
+
+
+def test_extract_listing_rows(backend):
+    rows = html_backend.extract_listing_rows(LISTING_PAGE)
+    assert rows == [
+        html_backend.ListingRow("One", "showthread.php?t=1", "24.05.2025"),
+        html_backend.ListingRow("Two", "showthread.php?t=2", None),
+    ]
+
+
+def test_post_content_from_tag_matches_fast_path(backend):
+    soup = html_backend.make_soup(THREAD_PAGE)
+    tag_content = html_backend.post_content_from_tag(soup.find("div", id="post_message_11"))
+    _author, posts = html_backend.extract_thread_posts(THREAD_PAGE)
+    assert tag_content == posts[0]
+
+
+def test_unknown_backend_is_ignored():
+    previous = html_backend.get_backend()
+    assert html_backend.set_backend("selectolax-nope") == previous
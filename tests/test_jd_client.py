@@ -87,4 +87,94 @@ def test_start_online_check_ids():
     assert jd.device.calls
     path, params = jd.device.calls[0]
     assert path == "/linkgrabberv2/startOnlineCheck"
-    assert params == [[1, 2]]
\ No newline at end of file
+    assert params == [[1, 2]]
+
+class FakeApi:
+    def __init__(self):
+        self.reconnects = 0
+        self.fail_reconnect = False
+
+    def reconnect(self):
+        self.reconnects += 1
+        if self.fail_reconnect:
+            raise Exception("regain token expired")
+        return True
+
+
+def _connected_client(device, now):
+    jd = JDClient("e", "p", token_refresh_interval=60, clock=lambda: now[0])
+    jd.api = FakeApi()
+    logins = []
+
+    def login():
+        logins.append(now[0])
+        jd.device = device
+        jd._token_ts = now[0]
+        return True
+
+    jd._login = login
+    assert jd.connect()
+    return jd, logins
+
+
+def test_connected_client_refreshes_token_proactively():
+    now = [0.0]
+    device = DummyDeviceStart()
+    jd, logins = _connected_client(device, now)
+
+    assert jd.connect() and jd.query_link_packages() is not None
+    assert logins == [0.0] and jd.api.reconnects == 0
+
+    now[0] = 61.0  # token older than the refresh interval
+    jd.start_online_check([1])
+    assert jd.api.reconnects == 1 and logins == [0.0]
+
+    now[0] = 130.0
+    jd.api.fail_reconnect = True  # regain failed: full login instead
+    jd.start_online_check([1])
+    assert logins == [0.0, 130.0]
+    assert jd.round_trips == 3 and jd.stats["/linkgrabberv2/startOnlineCheck"] == 2
+
+
+def test_token_error_reconnects_and_retries_once():
+    class ExpiringDevice(DummyDeviceStart):
+        def __init__(self):
+            super().__init__()
+            self.fail = 1
+
+        def action(self, path, params):
+            if self.fail:
+                self.fail -= 1
+                raise Exception("TOKEN_INVALID")
+            return super().action(path, params)
+
+    now = [0.0]
+    jd, logins = _connected_client(ExpiringDevice(), now)
+    assert jd.post("linkgrabberv2/clearList") is True
+    assert len(logins) == 2 and jd.stats["/linkgrabberv2/clearList"] == 2
+
+
+def test_stop_and_clear_queries_download_packages_once():
+    class Device(DummyDeviceStart):
+        def action(self, path, params):
+            super().action(path, params)
+            if path == "/downloadsV2/queryPackages":
+                return [{"uuid": 1}, {"uuid": 2}]
+            return True
+
+    jd = JDClient("e", "p")
+    jd.device = Device()
+    assert jd.stop_and_clear() is True
+    assert jd.stats["/downloadsV2/queryPackages"] == 1
+    assert jd.stats["/downloadsV2/setEnabled"] == 1
+    # the first stop endpoint worked: the alternatives are not tried
+    assert jd.stats["/downloadcontroller/stop"] == 1 and "/toolbar/stopDownloads" not in jd.stats
+
+
+def test_get_jd_client_is_shared_per_account():
+    from integrations.jd_client import get_jd_client
+
+    a = get_jd_client("User@x", "p", "dev")
+    assert get_jd_client("user@x ", "p", "dev") is a
+    assert get_jd_client("user@x", "p", "other") is not a
+    assert get_jd_client("user@x", "changed", "dev") is not a
@@ -0,0 +1,160 @@
+import threading
+
+from downloaders import jd_poller
+from downloaders.jd_poller import (EVENT_FINISHED, EVENT_LINKGRABBER, EVENT_PROGRESS, EVENT_REMOVED,
+                                   JDPoller, PACKAGE_QUERY)
+from downloaders.jdownloader import JDownloaderDownloader
+
+
+class FakeDownloads:
+    """Stands in for ``myjdapi`` ``device.downloads``."""
+
+    def __init__(self):
+        self.packages = []
+        self.queries = []
+
+    def query_packages(self, params=None):
+        self.queries.append(params)
+        return [dict(p, comment="unused", hosts=["rapidgator.net"]) for p in self.packages]
+
+    def query_links(self, params=None):
+        return []
+
+
+class FakeLinkgrabber:
+    def __init__(self):
+        self.packages = []
+        self.queries = 0
+
+    def query_packages(self, params=None):
+        self.queries += 1
+        return list(self.packages)
+
+
+class FakeDevice:
+    def __init__(self):
+        self.name = "fake"
+        self.downloads = FakeDownloads()
+        self.linkgrabber = FakeLinkgrabber()
+
+
+def _pkg(loaded, total=1000, finished=False, uuid=1, name="Book.pdf"):
+    return {"uuid": uuid, "name": name, "bytesLoaded": loaded, "bytesTotal": total,
+            "finished": finished, "status": "Running"}
+
+
+def test_one_query_per_tick_is_diffed_and_dispatched():
+    device = FakeDevice()
+    poller = JDPoller(device)
+    poller._thread = threading.current_thread()  # drive poll_once by hand
+    everything = poller.register()
+    only_b = poller.register(match=lambda p: p.get("name") == "B")
+
+    device.linkgrabber.packages = [{"name": "crawling"}]
+    assert [e.kind for e in poller.poll_once()] == [EVENT_LINKGRABBER]
+    assert poller.poll_once() == []  # linkgrabber unchanged
+
+    device.downloads.packages = [_pkg(0), _pkg(10, uuid=2, name="B")]
+    assert len(poller.poll_once()) == 2
+    device.downloads.packages = [_pkg(100), _pkg(10, uuid=2, name="B")]
+    events = poller.poll_once()
+    assert [(e.kind, e.delta) for e in events] == [(EVENT_PROGRESS, 100)]
+    assert "comment" not in events[0].package  # only the monitored fields are kept
+
+    device.downloads.packages = [_pkg(1000, finished=True)]
+    assert [e.kind for e in poller.poll_once()] == [EVENT_PROGRESS, EVENT_FINISHED, EVENT_REMOVED]
+
+    assert device.downloads.queries == [PACKAGE_QUERY] * 5
+    assert device.linkgrabber.queries == 2
+    assert [e.kind for e in everything.get(0)] == [EVENT_LINKGRABBER, EVENT_PROGRESS, EVENT_PROGRESS,
+                                                   EVENT_PROGRESS, EVENT_PROGRESS, EVENT_FINISHED, EVENT_REMOVED]
+    assert [(e.kind, e.package["name"]) for e in only_b.get(0)] == [(EVENT_PROGRESS, "B"), (EVENT_REMOVED, "B")]
+
+    late = poller.register()  # joins with the current state
+    assert [e.kind for e in late.get(0)] == [EVENT_PROGRESS, EVENT_FINISHED]
+
+
+def test_interval_follows_aggregate_activity():
+    now = [0.0]
+    device = FakeDevice()
+    poller = JDPoller(device, fast_interval=0.1, normal_interval=1, slow_interval=5,
+                      fast_window=30, active_window=60, clock=lambda: now[0])
+    poller._thread = threading.current_thread()
+    poller.register()
+    assert poller.next_interval() == 0.1  # just registered
+
+    now[0] = 40.0
+    device.downloads.packages = [_pkg(10)]
+    poller.poll_once()
+    assert poller.next_interval() == 0.1  # changing
+    poller.poll_once()
+    assert poller.next_interval() == 1  # changed recently
+    now[0] = 200.0
+    assert poller.next_interval() == 5  # quiet
+
+
+def test_monitor_download_runs_on_the_shared_poller(monkeypatch):
+    device = FakeDevice()
+    monkeypatch.setitem(jd_poller._pollers, id(device), JDPoller(device, fast_interval=0.01))
+    downloader = JDownloaderDownloader.__new__(JDownloaderDownloader)
+    downloader.device, downloader.bot, downloader.current_session_id = device, None, "s1"
+    downloader._cancel_event = threading.Event()
+    monkeypatch.setattr(downloader, "_get_package_files",
+                        lambda package, target_dir=None: ["/dl/Book.pdf"] if package.get("finished") else [])
+
+    progress = []
+
+    def on_progress(loaded, total, name, percent=None):
+        progress.append(percent)
+        if percent is not None and percent < 100:
+            device.downloads.packages = [_pkg(loaded + 500, finished=loaded + 500 >= 1000)]
+
+    device.downloads.packages = [_pkg(1)]
+    assert downloader._monitor_download("https://rapidgator.net/file/x", on_progress) == ["/dl/Book.pdf"]
+    assert progress == [0, 50, 100, 100]
+    assert jd_poller._pollers[id(device)].waiter_count == 0
+
+
+def _monitor(monkeypatch, device):
+    monkeypatch.setitem(jd_poller._pollers, id(device), JDPoller(device, fast_interval=0.01))
+    downloader = JDownloaderDownloader.__new__(JDownloaderDownloader)
+    downloader.device, downloader.bot, downloader.current_session_id = device, None, "s1"
+    downloader._cancel_event = threading.Event()
+    monkeypatch.setattr(downloader, "_get_package_files",
+                        lambda package, target_dir=None: [f"/dl/{package['name']}"] if package.get("finished") else [])
+    return downloader
+
+
+def test_monitor_ignores_other_downloads_packages(monkeypatch):
+    device = FakeDevice()
+    downloader = _monitor(monkeypatch, device)
+
+    def on_progress(loaded, total, name, percent=None):
+        device.downloads.packages = [_pkg(1000, finished=True, uuid=2, name="Other_9"),
+                                     _pkg(1000, finished=True, name="Book_1")]
+
+    device.downloads.packages = [_pkg(1000, finished=True, uuid=2, name="Other_9"), _pkg(1, name="Book_1")]
+    assert downloader._monitor_download("https://rapidgator.net/file/x", on_progress,
+                                        expected_package="Book_1") == ["/dl/Book_1"]
+
+
+def test_wait_state_keeps_the_download_alive(monkeypatch):
+    import types
+    from downloaders import jdownloader
+
+    device = FakeDevice()
+    downloader = _monitor(monkeypatch, device)
+    waiting = dict(_pkg(10, name="Book_1"), status="Waiting for host")
+    device.downloads.packages = [waiting]
+    now = [0.0]
+
+    def clock():
+        # every look at the clock is 100 s later; the host wait ends after 20 minutes
+        now[0] += 100
+        if now[0] >= 1200:
+            device.downloads.packages = [_pkg(1000, finished=True, name="Book_1")]
+        return now[0]
+
+    monkeypatch.setattr(jdownloader, "time", types.SimpleNamespace(monotonic=clock, sleep=lambda s: None))
+    assert downloader._monitor_download("https://rapidgator.net/file/x", None,
+                                        expected_package="Book_1") == ["/dl/Book_1"]
@@ -0,0 +1,56 @@
+"""Round-trip budget of a Check Links session against recorded JD responses."""
+
+import importlib.util
+import pathlib
+import threading
+import types
+
+from integrations.jd_client import JDClient
+from jd_fake_device import RecordedJDDevice
+
+# Loaded from its file: importing the ``workers`` package pulls in Selenium.
+_spec = importlib.util.spec_from_file_location(
+    "link_check_worker", pathlib.Path(__file__).resolve().parents[1] / "workers" / "link_check_worker.py"
+)
+link_check_worker = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(link_check_worker)
+LinkCheckWorker = link_check_worker.LinkCheckWorker
+
+CONTAINERS = ["https://keeplinks.org/p/aaaa", "https://keeplinks.org/p/bbbb", "https://keeplinks.org/p/cccc"]
+
+
+def run_session(monkeypatch, pipeline_size):
+    monkeypatch.setattr(link_check_worker.time, "sleep", lambda _=None: None)
+    jd = JDClient("e", "p")
+    jd.device = RecordedJDDevice.from_recording("link_check_session")
+    worker = LinkCheckWorker(
+        jd, [], CONTAINERS, threading.Event(), poll_timeout_sec=60, poll_interval=0, pipeline_size=pipeline_size
+    )
+    events = []
+    worker.progress = types.SimpleNamespace(emit=events.append)
+    worker.run()
+    return jd, [e for e in events if e["type"] == "container"]
+
+
+def test_pipelined_session_round_trips(monkeypatch):
+    jd, containers = run_session(monkeypatch, pipeline_size=3)
+
+    chosen = {c["container_url"]: c["chosen"] for c in containers}
+    assert chosen[CONTAINERS[0]]["url"].startswith("https://rapidgator.net/file/aaa1")
+    assert chosen[CONTAINERS[1]]["status"] == "OFFLINE"
+    assert chosen[CONTAINERS[2]]["url"].startswith("https://rapidgator.net/file/ccc1")
+
+    assert jd.device.per_path() == {
+        "/linkgrabberv2/clearList": 2,        # session reset + final clear
+        "/linkgrabberv2/addLinks": 3,         # one per container, no extra startOnlineCheck
+        "/linkgrabberv2/queryLinks": 5,       # shared by all containers in flight
+        "/linkgrabberv2/queryPackages": 5,
+        "/linkgrabberv2/removeLinks": 3,      # two ticks with finished containers + ACK cleanup
+    }
+    assert jd.round_trips == jd.device.round_trips == 18
+
+
+def test_pipelining_beats_sequential_round_trips(monkeypatch):
+    sequential, _ = run_session(monkeypatch, pipeline_size=1)
+    pipelined, _ = run_session(monkeypatch, pipeline_size=3)
+    assert pipelined.round_trips < sequential.round_trips
@@ -937,4 +937,67 @@ def test_container_replacement_persists_and_survives_restart(monkeypatch):
     apply_cached_statuses(table2, cache_file)
 
     assert table2.item(0, 3).text() == "\n".join(links)
-    assert table2.item(0, 8).text() == "ONLINE"
\ No newline at end of file
+    assert table2.item(0, 8).text() == "ONLINE"
+
+def test_pipelined_containers_attributed_by_package(monkeypatch):
+    class JD(DummyJD):
+        def __init__(self):
+            super().__init__()
+            self.added = []  # (url, package name)
+            self.items = []
+            self.packages = []
+            self.cleared = 0
+
+        def add_links_to_linkgrabber(self, urls, start_check=True, package_name=None):
+            url = urls[0]
+            self.added.append((url, package_name))
+            pkg = f"p-{url}"
+            # c3's package gets renamed by JD: only containerURL identifies it
+            self.packages.append({"uuid": pkg, "name": "renamed" if url == "c3" else package_name})
+            for n in range(2):
+                self.items.append({
+                    "url": f"https://rapidgator.net/file/{url}{n}",
+                    "availability": "ONLINE",
+                    "uuid": f"{url}-{n}",
+                    "packageUUID": pkg,
+                    "containerURL": url,
+                })
+            return True
+
+        def query_links(self):
+            return list(self.items)
+
+        def query_link_packages(self):
+            return list(self.packages)
+
+        def remove_links(self, ids):
+            super().remove_links(ids)
+            self.items = [it for it in self.items if it["uuid"] not in ids]
+            return 200
+
+        def remove_all_from_linkgrabber(self):
+            self.cleared += 1
+            return True
+
+    monkeypatch.setattr(link_check_worker.time, "sleep", lambda _=None: None)
+    jd = JD()
+    worker = LinkCheckWorker(
+        jd, [], ["c1", "c2", "c3"], threading.Event(), poll_timeout_sec=60, poll_interval=0, pipeline_size=2
+    )
+    events: list = []
+    worker.progress = types.SimpleNamespace(emit=lambda payload: events.append(payload))
+    worker.run()
+
+    names = [name for _, name in jd.added]
+    assert [url for url, _ in jd.added] == ["c1", "c2", "c3"]
+    assert len(set(names)) == 3 and all(names)
+    containers = {e["container_url"]: e for e in events if e["type"] == "container"}
+    assert set(containers) == {"c1", "c2", "c3"}
+    for url, payload in containers.items():
+        assert payload["chosen"]["url"] == f"https://rapidgator.net/file/{url}0"
+        assert [s["url"] for s in payload["siblings"]] == [f"https://rapidgator.net/file/{url}1"]
+    # finished containers are removed per tick (c1+c2 together, then c3), then the
+    # pending ACK groups in one call; the whole list is only cleared at start/end
+    assert jd.removed[:2] == [["c1-0", "c1-1", "c2-0", "c2-1"], ["c3-0", "c3-1"]]
+    assert len(jd.removed) == 3
+    assert jd.cleared == 2
@@ -1,5 +1,5 @@
 import json
-from utils.link_cache import persist_link_replacement
+from utils.link_cache import link_status_ttls, persist_link_replacement, split_fresh_links
 
 
 class DummyUserManager:
@@ -118,4 +118,36 @@ def test_persist_replacement_and_restore_status():
     apply_cached_statuses(table, cache)
 
     assert table.item(0, 3).text() == "http://direct\nhttp://direct2"
-    assert table.item(0, 8).text() == "ONLINE"
\ No newline at end of file
+    assert table.item(0, 8).text() == "ONLINE"
+
+
+def test_split_fresh_links_per_status_ttl_and_aliases():
+    now = 100_000
+    cache = {
+        "https://rapidgator.net/file/aaa/x.rar.html": {"status": "ONLINE", "checked_at": now - 3600},
+        "https://nitroflare.com/view/bbb": {"status": "OFFLINE", "checked_at": now - 3600},
+        "https://ddownload.com/ccc": {"status": "UNKNOWN", "checked_at": now - 3600},
+        "https://turbobit.net/ddd": {"status": "ONLINE"},  # legacy entry, no timestamp
+    }
+    ttl = link_status_ttls({"link_check_ttl_offline": 600})
+    assert ttl["online"] == 6 * 3600 and ttl["offline"] == 600
+
+    def keys_of(url):
+        # stands in for canonical URL / host-id keys
+        return [url.split("/file/")[-1].split("/")[0]] if "/file/" in url else []
+
+    urls = [
+        "https://rapidgator.net/file/aaa",  # alias of the cached RG link
+        "https://nitroflare.com/view/bbb",
+        "https://ddownload.com/ccc",
+        "https://turbobit.net/ddd",
+        "https://new.example/eee",
+    ]
+    fresh, stale, counts = split_fresh_links(urls, cache, ttl, keys_of=keys_of, clock=lambda: now)
+    assert list(fresh) == ["https://rapidgator.net/file/aaa"]
+    assert fresh["https://rapidgator.net/file/aaa"]["status"] == "ONLINE"
+    assert stale == urls[1:]
+    assert counts == {"hits": 1, "misses": 4}
+
+    fresh, stale, counts = split_fresh_links(urls, cache, ttl, keys_of=keys_of, force=True, clock=lambda: now)
+    assert not fresh and stale == urls and counts["hits"] == 0
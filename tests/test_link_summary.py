@@ -31,4 +31,12 @@ def test_summary_single_row():
     s.update(5, 'ONLINE', replaced=True)
     msg = s.message()
     assert '1 rows' in msg
-    assert 'replaced 1' in msg
\ No newline at end of file
+    assert 'replaced 1' in msg
+
+
+def test_summary_cache_counts():
+    s = LinkCheckSummary()
+    assert 'cached' not in s.message()
+    s.record_cache(7, 3)
+    s.update(0, 'ONLINE')
+    assert 'cached 7, checked 3' in s.message()
@@ -0,0 +1,44 @@
+import os
+
+from gui.log_tail import LogFilter, LogTail
+
+
+def _write(path, text, mode="a"):
+    with open(path, mode, encoding="utf-8") as fh:
+        fh.write(text)
+
+
+def test_tail_keeps_tracebacks_with_their_record(tmp_path):
+    path = tmp_path / "forum_bot.log"
+    _write(path, "".join(f"12:00:{i:02d} DEBUG noise {i}\n" for i in range(50)), "w")
+    _write(path, "12:01:00 ERROR boom\nTraceback (most recent call last):\n  File x\n")
+    _write(path, "12:01:01 INFO done\n12:01:02 INFO part")
+
+    tail = LogTail(str(path))
+    assert tail.tail(3) == ["Traceback (most recent call last):", "  File x", "12:01:01 INFO done"]
+    assert tail.position == os.path.getsize(path)
+
+    assert tail.tail(10, LogFilter("WARNING")) == [
+        "12:01:00 ERROR boom", "Traceback (most recent call last):", "  File x"]
+    assert tail.tail(20, LogFilter("DEBUG", "NOISE 4")) == [
+        "12:00:04 DEBUG noise 4"] + [f"12:00:{i} DEBUG noise {i}" for i in range(40, 50)]
+
+
+def test_read_new_follows_appends_and_rotation(tmp_path):
+    path = tmp_path / "forum_bot.log"
+    _write(path, "12:00:00 INFO start\n", "w")
+    tail = LogTail(str(path))
+    assert tail.tail(100) == ["12:00:00 INFO start"]
+    assert tail.read_new() == ([], False)
+
+    _write(path, "12:00:01 DEBUG hidden\n  detail\n12:00:02 WARNING shown\n12:00:03 INFO half")
+    assert tail.read_new(LogFilter("INFO")) == (["12:00:02 WARNING shown"], False)
+    _write(path, " line\n")
+    assert tail.read_new(LogFilter("INFO")) == (["12:00:03 INFO half line"], False)
+
+    os.replace(path, str(path) + ".1")  # RotatingFileHandler rollover
+    _write(path, "12:00:04 INFO fresh\n", "w")
+    assert tail.read_new() == (["12:00:04 INFO fresh"], True)
+    _write(path, "", "w")  # truncated
+    _write(path, "12:00:05 INFO x\n")
+    assert tail.read_new() == (["12:00:05 INFO x"], True)
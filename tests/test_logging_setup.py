@@ -0,0 +1,36 @@
+import logging
+import os
+
+from common.logging_setup import ModuleLevelFilter, RateLimitFilter, parse_module_levels
+
+
+def _record(level=logging.INFO, lineno=10, created=0.0, name="root", pathname=None, msg="tick"):
+    pathname = pathname or os.path.join(os.path.dirname(os.path.dirname(__file__)), "downloaders", "jdownloader.py")
+    record = logging.LogRecord(name, level, pathname, lineno, msg, None, None)
+    record.created = created
+    return record
+
+
+def test_rate_limit_drops_repeats_and_reports_them():
+    flt = RateLimitFilter(burst=3, window=10.0)
+    passed = [flt.filter(_record(created=t * 0.1)) for t in range(10)]
+    assert passed == [True] * 3 + [False] * 7
+    assert flt.filter(_record(level=logging.WARNING, created=1.0))  # never dropped
+    assert flt.filter(_record(lineno=11, created=1.0))  # other call site
+
+    record = _record(created=10.5)
+    assert flt.filter(record)
+    assert record.getMessage() == "tick (+7 similar messages suppressed)"
+    assert flt.suppressed == 7
+
+
+def test_module_levels_apply_to_root_logger_records():
+    assert parse_module_levels("downloaders=WARNING, downloaders.jdownloader=INFO,bad=NOPE") == {
+        "downloaders": logging.WARNING, "downloaders.jdownloader": logging.INFO}
+    flt = ModuleLevelFilter()
+    flt.levels = parse_module_levels({"downloaders": "WARNING", "downloaders.jdownloader": "INFO"})
+    assert not flt.filter(_record(level=logging.DEBUG))
+    assert flt.filter(_record(level=logging.INFO))
+    other = os.path.join(os.path.dirname(os.path.dirname(__file__)), "downloaders", "rapidgator.py")
+    assert not flt.filter(_record(pathname=other))
+    assert flt.filter(_record(name="gui.main_window", level=logging.DEBUG))
@@ -0,0 +1,110 @@
+import os
+import threading
+from email.parser import BytesParser
+from email.policy import HTTP
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from uploaders.multipart_stream import StreamingMultipartBody, UploadCancelled
+
+
+@pytest.fixture
+def payload_file(tmp_path):
+    path = tmp_path / 'big "book".rar'
+    path.write_bytes(os.urandom(3 * 1024 * 1024 + 17))
+    return path
+
+
+@pytest.mark.parametrize("use_mmap", [False, True])
+def test_body_matches_declared_length_and_parses(payload_file, use_mmap):
+    body = StreamingMultipartBody(
+        {"file": (payload_file.name, str(payload_file), "application/octet-stream"), "sess_id": "abc"},
+        chunk_size=1024 * 1024,
+        use_mmap=use_mmap,
+    )
+    raw = b"".join(bytes(chunk) for chunk in body)
+    assert len(raw) == len(body) == body.len
+
+    msg = BytesParser(policy=HTTP).parsebytes(
+        b"Content-Type: " + body.content_type.encode() + b"\r\n\r\n" + raw
+    )
+    parts = {p.get_param("name", header="content-disposition"): p for p in msg.iter_parts()}
+    assert parts["file"].get_payload(decode=True) == payload_file.read_bytes()
+    assert parts["file"].get_param("filename", header="content-disposition") == "big %22book%22.rar"
+    assert parts["sess_id"].get_payload(decode=True) == b"abc"
+
+
+def test_progress_is_rate_limited_and_final(payload_file):
+    calls = []
+    body = StreamingMultipartBody(
+        {"file": (payload_file.name, str(payload_file))},
+        progress_callback=lambda sent, total: calls.append((sent, total)),
+        chunk_size=1024 * 1024,
+        progress_interval=3600,
+        progress_bytes=2 * 1024 * 1024,
+    )
+    for _chunk in body:
+        pass
+    assert calls[-1] == (body.len, body.len)
+    assert 2 <= len(calls) <= 3
+
+
+def test_cancelled_check_stops_iteration(payload_file):
+    sent = []
+    body = StreamingMultipartBody(
+        {"file": (payload_file.name, str(payload_file))},
+        chunk_size=1024 * 1024,
+        cancelled=lambda: len(sent) >= 2,
+    )
+    with pytest.raises(UploadCancelled):
+        for chunk in body:
+            sent.append(len(chunk))
+    assert len(sent) == 2 and body.bytes_sent < body.len
+
+
+def test_open_file_object_is_read_from_current_position(tmp_path):
+    path = tmp_path / "data.bin"
+    path.write_bytes(b"HEADERpayload")
+    with open(path, "rb") as f:
+        f.seek(6)
+        body = StreamingMultipartBody({"f": ("data.bin", f)}, boundary="B")
+        raw = b"".join(bytes(c) for c in body)
+    assert b"\r\n\r\npayload\r\n--B--\r\n" in raw
+    assert b"HEADER" not in raw
+
+
+def test_requests_sends_content_length(payload_file):
+    received = {}
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def do_POST(self):
+            received["length"] = int(self.headers["Content-Length"])
+            received["chunked"] = self.headers.get("Transfer-Encoding")
+            received["body"] = self.rfile.read(received["length"])
+            self.send_response(200)
+            self.send_header("Content-Length", "2")
+            self.end_headers()
+            self.wfile.write(b"ok")
+
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    try:
+        body = StreamingMultipartBody({"file": (payload_file.name, str(payload_file))})
+        r = requests.post(
+            f"http://127.0.0.1:{httpd.server_address[1]}/upload",
+            data=body,
+            headers={"Content-Type": body.content_type},
+            timeout=30,
+        )
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+    assert r.text == "ok"
+    assert received["length"] == body.len
+    assert received["chunked"] is None
+    assert payload_file.read_bytes() in received["body"]
@@ -0,0 +1,83 @@
+import pytest
+
+try:
+    from PyQt5.QtCore import Qt
+    from PyQt5.QtWidgets import QApplication
+except Exception:  # pragma: no cover - optional dependency
+    pytest.skip("PyQt5 not available", allow_module_level=True)
+
+from gui.status_model import OperationTableModel
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+def _data(section="Uploads", item="a.rar", status="RUNNING", **extra):
+    data = {"section": section, "item": item, "operation_type": "UPLOAD_MULTI",
+            "status": status, "details": "Uploading"}
+    data.update(extra)
+    return data
+
+
+def test_add_update_emits_one_ranged_change(app):
+    model = OperationTableModel()
+    model.add("op1", _data())
+    model.add("op2", _data(item="b.rar"))
+    assert model.add("op1", _data()) is model.get("op1")  # no duplicate rows
+    assert model.rowCount() == 2 and model.row_of("op2") == 1
+
+    changes = []
+    model.dataChanged.connect(lambda tl, br, roles=(): changes.append((tl.row(), tl.column(), br.column())))
+    model.update("op2", progress=40, speed=2048)
+    assert changes == [(1, model.COL_PROGRESS, model.COL_SPEED)]
+    assert model.index(1, model.COL_PROGRESS).data(Qt.UserRole) == 40
+    assert model.index(1, model.COL_SPEED).data() == "2.0 KB/s"
+
+    changes.clear()
+    model.update("op2", progress=40)  # unchanged -> no repaint
+    assert changes == []
+
+    model.set_host_status("op2", "rapidgator", "success")
+    assert model.index(1, model.COL_DETAILS).data() == "Uploading | ✅1"
+
+
+def test_remove_keeps_lookup_consistent(app):
+    model = OperationTableModel()
+    for i in range(6):
+        model.add(f"op{i}", _data(item=f"{i}.rar"))
+    removed = []
+    model.rowsAboutToBeRemoved.connect(lambda parent, first, last: removed.append((first, last)))
+    assert model.remove(["op1", "op2", "op4", "missing"]) == 3
+    assert sorted(removed) == [(1, 2), (4, 4)]
+    assert model.ids() == ["op0", "op3", "op5"]
+    assert [model.row_of(i) for i in model.ids()] == [0, 1, 2]
+    assert model.operation_id_at(2) == "op5"
+
+
+def test_row_limit_archives_oldest_finished_rows(app):
+    model = OperationTableModel(max_rows=3)
+    archived = []
+    model.rows_archived.connect(archived.extend)
+    model.add("run", _data())
+    model.add("done1", _data(status="COMPLETED"))
+    model.add("done2", _data(status="FAILED"))
+    model.add("new", _data())
+    assert archived == ["done1"]
+    assert model.ids() == ["run", "done2", "new"]
+    assert model.archived[-1]["operation_id"] == "done1"
+    assert model.is_archived("done1") and not model.is_archived("run")
+
+    # Running rows are never archived, even above the limit
+    model.update("done2", status="RUNNING")
+    model.add("new2", _data())
+    assert len(model) == 4 and model.archived_total == 1
+
+
+def test_archived_ids_follow_the_bounded_history(app):
+    model = OperationTableModel(max_rows=1, archive_size=2)
+    for i in range(4):
+        model.add(f"done{i}", _data(item=f"{i}.rar", status="COMPLETED"))
+    assert [r["operation_id"] for r in model.archived] == ["done1", "done2"]
+    assert [model.is_archived(f"done{i}") for i in range(4)] == [False, True, True, False]
@@ -0,0 +1,81 @@
+import os
+import pickle
+
+from core.processed_store import ProcessedThreadStore
+
+
+def test_add_discard_persist_and_reload(tmp_path):
+    path = tmp_path / "processed_threads.journal"
+    store = ProcessedThreadStore(str(path), fsync=False)
+    store.add("1")
+    store.add("2")
+    store.add("2")
+    store.discard("1")
+    store.add(3)
+    assert "2" in store and 3 in store and "1" not in store
+    store.close()
+
+    assert path.read_text().splitlines() == ["+1", "+2", "-1", "+3"]
+    reloaded = ProcessedThreadStore(str(path), fsync=False)
+    assert set(reloaded) == {"2", "3"}
+
+
+def test_torn_last_record_is_dropped(tmp_path):
+    path = tmp_path / "processed_threads.journal"
+    path.write_text("+1\n+2\n+3")
+    store = ProcessedThreadStore(str(path), fsync=False)
+    assert set(store) == {"1", "2"}
+    store.add("4")
+    store.close()
+    assert path.read_text() == "+1\n+2\n+4\n"
+
+
+def test_crlf_journal_from_windows_loads(tmp_path):
+    path = tmp_path / "processed_threads.journal"
+    path.write_bytes(b"+1\r\n+2\r\n-1\r\n")
+    store = ProcessedThreadStore(str(path), fsync=False)
+    assert set(store) == {"2"}
+    store.add("3")
+    store.close()
+    assert path.read_bytes() == b"+1\r\n+2\r\n-1\r\n+3\n"
+
+
+def test_migrates_legacy_pickle(tmp_path):
+    legacy = tmp_path / "processed_threads.pkl"
+    with open(legacy, "wb") as fh:
+        pickle.dump({"10", "11"}, fh)
+    path = tmp_path / "processed_threads.journal"
+    store = ProcessedThreadStore(str(path), legacy_pickle=str(legacy), fsync=False)
+    assert set(store) == {"10", "11"}
+    assert not legacy.exists()
+    assert os.path.exists(str(legacy) + ".migrated")
+
+
+def test_background_compaction_keeps_concurrent_writes(tmp_path):
+    path = tmp_path / "processed_threads.journal"
+    store = ProcessedThreadStore(str(path), fsync=False, compact_min_records=10)
+    for i in range(20):
+        store.add(str(i))
+        store.discard(str(i))
+    store.add("keep")
+    assert store.maybe_compact()
+    store.add("late")
+    store.wait_for_compaction()
+    store.add("after")
+    store.close()
+
+    reloaded = ProcessedThreadStore(str(path), fsync=False)
+    assert set(reloaded) == {"keep", "late", "after"}
+    assert len(path.read_text().splitlines()) == 3
+
+
+def test_clear_and_replace(tmp_path):
+    path = tmp_path / "processed_threads.journal"
+    store = ProcessedThreadStore(str(path), fsync=False)
+    store.add("1")
+    store.clear()
+    assert len(store) == 0
+    store.replace({"5", "6"})
+    store.add("7")
+    store.close()
+    assert set(ProcessedThreadStore(str(path), fsync=False)) == {"5", "6", "7"}
@@ -0,0 +1,74 @@
+import time
+
+import pytest
+
+PyQt5 = pytest.importorskip("PyQt5")
+from PyQt5.QtCore import QCoreApplication  # noqa: E402
+
+from core.progress_bus import ProgressBus  # noqa: E402
+from models.operation_status import OperationStatus, OpStage, OpType  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QCoreApplication.instance() or QCoreApplication([])
+
+
+def _status(item, stage, progress=0, host="rapidgator"):
+    return OperationStatus(section="Uploads", item=item, op_type=OpType.UPLOAD,
+                           stage=stage, progress=progress, host=host)
+
+
+def _bus():
+    bus = ProgressBus(fps=10)
+    bus._timer.stop()  # flush manually
+    immediate, batches = [], []
+    bus.status_ready.connect(immediate.append)
+    bus.batch_ready.connect(batches.append)
+    return bus, immediate, batches
+
+
+def test_running_updates_are_coalesced_per_operation(app):
+    bus, immediate, batches = _bus()
+    for pct in range(0, 101, 10):
+        bus.publish(_status("a.rar", OpStage.RUNNING, pct))
+        bus.publish(_status("a.rar", OpStage.RUNNING, pct, host="katfile"))
+    # First RUNNING per key is a transition and goes out at once
+    assert [s.host for s in immediate] == ["rapidgator", "katfile"]
+
+    bus.flush()
+    assert len(batches) == 1
+    assert sorted((s.host, s.progress) for s in batches[0]) == [("katfile", 100), ("rapidgator", 100)]
+    stats = bus.stats()
+    assert stats["published"] == 22
+    assert stats["coalesced"] == 18
+    assert stats["batches"] == 1 and stats["pending"] == 0
+
+
+def test_transitions_are_immediate_and_drop_stale_progress(app):
+    bus, immediate, batches = _bus()
+    bus.publish(_status("b.rar", OpStage.QUEUED))
+    bus.publish(_status("b.rar", OpStage.RUNNING, 5))
+    bus.publish(_status("b.rar", OpStage.RUNNING, 50))
+    bus.publish(_status("b.rar", OpStage.FINISHED, 100))
+    assert [s.stage for s in immediate] == [OpStage.QUEUED, OpStage.RUNNING, OpStage.FINISHED]
+
+    bus.flush()
+    assert batches == []
+    assert bus.stats()["dropped"] == 1
+
+
+def test_timer_flushes_at_frame_rate(app):
+    bus = ProgressBus(fps=50)
+    batches = []
+    bus.batch_ready.connect(batches.append)
+    bus.publish(_status("c.rar", OpStage.RUNNING, 1))
+    bus.publish(_status("c.rar", OpStage.RUNNING, 2))
+    deadline = 50
+    while not batches and deadline:
+        app.processEvents()
+        QCoreApplication.sendPostedEvents()
+        time.sleep(0.01)
+        deadline -= 1
+    assert batches and batches[0][0].progress == 2
+    bus.stop()
@@ -0,0 +1,136 @@
+from core.link_status_cache import LinkStatusCache
+from core.rg_link_checker import ALIVE, DEAD, RGLinkChecker, TokenBucket
+
+
+def rg_url(i):
+    return f"https://rapidgator.net/file/{i:032x}/file{i}.rar.html"
+
+
+class FakeAPI:
+    """Answers ``/file/check_link`` calls; ids in ``dead`` are reported missing."""
+
+    def __init__(self, dead=(), fail_ids=(), reject_tokens=()):
+        self.dead = set(dead)
+        self.fail_ids = set(fail_ids)
+        self.reject_tokens = set(reject_tokens)
+        self.calls = []
+
+    def __call__(self, token, urls):
+        self.calls.append((token, list(urls)))
+        if token in self.reject_tokens:
+            return 401, []
+        if any(u in self.fail_ids for u in urls):
+            raise ConnectionError("boom")
+        items = [{"url": u, "status": "NO_ACCESS" if u in self.dead else "ACCESS", "filename": "f.rar"}
+                 for u in urls]
+        return 200, items
+
+
+def make_checker(api, tokens=("tok",), clock=None):
+    issued = []
+
+    def provider(refresh):
+        issued.append(refresh)
+        return tokens[min(len(issued), len(tokens)) - 1]
+
+    cache = LinkStatusCache(ttl={"alive": 100, "dead": 10}, clock=clock or (lambda: 1000.0))
+    checker = RGLinkChecker(provider, cache, rate_per_min=6000, batch_size=25, fetch=api)
+    checker.bucket.acquire = lambda cancelled=None: True
+    return checker, issued
+
+
+def test_batches_and_cache_hits():
+    urls = [rg_url(i) for i in range(60)]
+    api = FakeAPI(dead={urls[7]})
+    checker, issued = make_checker(api)
+    batches = []
+
+    results = checker.check(urls, on_batch=lambda b: batches.append(len(b)))
+    assert [len(u) for _, u in api.calls] == [25, 25, 10]
+    assert batches == [25, 25, 10]
+    assert issued == [False]
+    assert results[urls[7]]["status"] == DEAD
+    assert results[urls[0]]["status"] == ALIVE and results[urls[0]]["filename"] == "f.rar"
+
+    # Everything is fresh now: no requests, cached results still reported
+    seen = {}
+    again = checker.check(urls, on_batch=seen.update)
+    assert len(api.calls) == 3
+    assert again == results and seen == results
+    assert checker.cache.stats()["hits"] == 60
+
+    assert len(checker.check(urls, force=True)) == 60
+    assert len(api.calls) == 6
+
+
+def test_per_status_ttl():
+    now = [1000.0]
+    urls = [rg_url(1), rg_url(2)]
+    api = FakeAPI(dead={urls[1]})
+    checker, _ = make_checker(api, clock=lambda: now[0])
+    checker.check(urls)
+    now[0] += 50  # dead result expired, alive one still fresh
+    checker.check(urls)
+    assert api.calls[-1][1] == [urls[1]]
+
+
+def test_token_refresh_on_401():
+    api = FakeAPI(reject_tokens={"old"})
+    checker, issued = make_checker(api, tokens=("old", "new"))
+    results = checker.check([rg_url(1)])
+    assert issued == [False, True]
+    assert [t for t, _ in api.calls] == ["old", "new"]
+    assert results[rg_url(1)]["status"] == ALIVE
+
+
+def test_failed_batch_is_not_cached():
+    urls = [rg_url(i) for i in range(30)]
+    api = FakeAPI(fail_ids={urls[3]})
+    checker, _ = make_checker(api)
+    results = checker.check(urls)
+    assert all(results[u] is None for u in urls[:25])
+    assert all(results[u]["status"] == ALIVE for u in urls[25:])
+    assert checker.cache.peek(urls[0]) is None
+    assert checker.stats["errors"] == 1
+
+
+def test_cancel_stops_single_url_fallback():
+    urls = [rg_url(i) for i in range(5)]
+    api = FakeAPI()
+    real_api = api.__call__
+    checker, _ = make_checker(lambda token, batch: (400, []) if len(batch) > 1 else real_api(token, batch))
+    checker.bucket.acquire = lambda cancelled=None: not (cancelled and cancelled())
+    results = checker.check(urls, cancelled=lambda: len(api.calls) >= 2)
+    assert len(api.calls) == 2
+    assert sorted(results) == sorted(urls[:2])
+
+
+def test_single_url_fallback_error_marks_only_that_url_unknown():
+    urls = [rg_url(i) for i in range(4)]
+    api = FakeAPI(dead={urls[0]}, fail_ids={urls[2]})
+    checker, _ = make_checker(lambda token, batch: (400, []) if len(batch) > 1 else api(token, batch))
+    results = checker.check(urls)
+    assert results[urls[0]]["status"] == DEAD
+    assert results[urls[1]]["status"] == ALIVE
+    assert results[urls[2]] is None
+    assert results[urls[3]]["status"] == ALIVE
+    assert checker.cache.peek(urls[2]) is None
+    assert checker.stats["errors"] == 1
+
+
+def test_token_bucket_paces_requests():
+    now = [0.0]
+    slept = []
+
+    def sleep(seconds):
+        slept.append(seconds)
+        now[0] += seconds
+
+    bucket = TokenBucket(rate=2.0, capacity=1.0, clock=lambda: now[0], sleep=sleep)
+    for _ in range(5):
+        assert bucket.acquire()
+    # one banked token, then one every 0.5 s
+    assert abs(now[0] - 2.0) < 1e-9
+    stopped = TokenBucket(0.1, clock=lambda: now[0], sleep=sleep)
+    stopped.acquire()
+    assert stopped.acquire(cancelled=lambda: True) is False
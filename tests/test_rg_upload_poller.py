@@ -0,0 +1,128 @@
+import threading
+import time
+
+from uploaders.rg_upload_poller import RapidgatorUploadPoller
+
+
+class FakeApi:
+    """upload_info stub: each id reports Processing until its countdown hits 0."""
+
+    def __init__(self, countdowns, fail=()):
+        self.countdowns = dict(countdowns)
+        self.fail = set(fail)
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def __call__(self, token, upload_id):
+        with self.lock:
+            self.calls.append((token, upload_id, time.monotonic()))
+            if upload_id in self.fail:
+                return {"state": 3, "state_label": "Fail"}
+            left = self.countdowns[upload_id]
+            self.countdowns[upload_id] = left - 1
+        if left > 0:
+            return {"state": 1, "state_label": "Processing"}
+        return {"state": 2, "file": {"url": f"https://rapidgator.net/file/{upload_id}"}}
+
+
+def _poller(api, **kwargs):
+    kwargs.setdefault("initial_interval", 0.01)
+    kwargs.setdefault("max_interval", 0.05)
+    return RapidgatorUploadPoller(fetch=api, idle_exit=0.2, **kwargs)
+
+
+def test_resolves_many_uploads_concurrently():
+    api = FakeApi({"a": 0, "b": 2, "c": 4})
+    poller = _poller(api)
+    futures = {uid: poller.submit(uid, "tok") for uid in "abc"}
+    assert {uid: f.result(timeout=5) for uid, f in futures.items()} == {
+        uid: f"https://rapidgator.net/file/{uid}" for uid in "abc"
+    }
+    assert poller.pending_count == 0
+
+
+def test_failure_and_timeout_resolve_to_none():
+    api = FakeApi({"slow": 10_000}, fail={"bad"})
+    poller = _poller(api)
+    assert poller.submit("bad", "tok").result(timeout=5) is None
+    assert poller.submit("slow", "tok", timeout=0.2).result(timeout=5) is None
+
+
+def test_backoff_spaces_out_requests():
+    api = FakeApi({"x": 5})
+    poller = _poller(api, initial_interval=0.02, max_interval=1.0, backoff=2.0)
+    poller.submit("x", "tok").result(timeout=5)
+    stamps = [t for _, uid, t in api.calls if uid == "x"]
+    gaps = [b - a for a, b in zip(stamps, stamps[1:])]
+    assert len(gaps) == 5
+    assert gaps[-1] > gaps[0] * 3
+
+
+def test_duplicate_submit_shares_future_and_cancel_drops_it():
+    api = FakeApi({"d": 10_000})
+    poller = _poller(api)
+    first = poller.submit("d", "tok")
+    assert poller.submit("d", "tok") is first
+    assert first.cancel()
+    deadline = time.monotonic() + 5
+    while poller.pending_count and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert poller.pending_count == 0
+
+
+def test_start_upload_retries_when_no_final_url(monkeypatch):
+    from concurrent.futures import Future
+
+    from uploaders.rapidgator_upload_handler import RapidgatorUploadHandler
+
+    handler = RapidgatorUploadHandler.__new__(RapidgatorUploadHandler)
+    attempts = []
+
+    def start_attempt(folder_id, progress_cb, cancelled=None):
+        attempts.append(threading.current_thread().name)
+        done = Future()
+        done.set_result("https://rapidgator.net/file/ok" if len(attempts) == 3 else None)
+        return done
+
+    monkeypatch.setattr(handler, "_start_attempt", start_attempt)
+    assert handler.start_upload().result(timeout=5) == "https://rapidgator.net/file/ok"
+    assert len(attempts) == 3 and attempts[0] == threading.current_thread().name
+
+    attempts.clear()
+    monkeypatch.setattr(handler, "_start_attempt", lambda *a, **k: attempts.append(1) or Future())
+    pending = handler.start_upload(max_retries=2)
+    assert not pending.done()  # still waiting on the poller
+
+
+def test_cancelled_start_upload_stops_retry_and_poll(monkeypatch):
+    from concurrent.futures import Future
+
+    from uploaders.multipart_stream import UploadCancelled
+    from uploaders.rapidgator_upload_handler import RapidgatorUploadHandler
+
+    handler = RapidgatorUploadHandler.__new__(RapidgatorUploadHandler)
+    handler.filepath = type("P", (), {"name": "book.rar"})()
+    in_transfer, aborted = threading.Event(), threading.Event()
+    polls = []
+
+    def start_attempt(folder_id, progress_cb, cancelled=None):
+        if not polls:  # first attempt: processing failed, no URL
+            polls.append(Future())
+            polls[0].set_result(None)
+            return polls[0]
+        in_transfer.set()
+        while not cancelled():
+            time.sleep(0.01)
+        aborted.set()
+        raise UploadCancelled("upload cancelled")
+
+    monkeypatch.setattr(handler, "_start_attempt", start_attempt)
+    outcome = handler.start_upload(retry_delay=0)
+    assert in_transfer.wait(5)  # retry thread is sending the file again
+    assert outcome.cancel()
+    assert aborted.wait(5) and len(polls) == 1
+
+    pending = Future()
+    monkeypatch.setattr(handler, "_start_attempt", lambda *a, **k: pending)
+    outcome = handler.start_upload()
+    assert outcome.cancel() and pending.cancelled()
@@ -0,0 +1,137 @@
+import itertools
+import os
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from downloaders import segmented
+from downloaders.segmented import PART_SUFFIX, STATE_SUFFIX, SegmentedDownloader
+
+PAYLOAD = bytes(range(256)) * 4096  # 1 MiB
+
+
+class _Handler(BaseHTTPRequestHandler):
+    ranges = True
+    fail_after = None  # stop sending after this many bytes per request
+    requests_seen = []
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        cls = type(self)
+        rng = self.headers.get("Range")
+        cls.requests_seen.append(rng)
+        m = re.match(r"bytes=(\d+)-(\d*)", rng or "")
+        if cls.ranges and m:
+            start = int(m.group(1))
+            end = int(m.group(2)) if m.group(2) else len(PAYLOAD) - 1
+            body = PAYLOAD[start:end + 1]
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{end}/{len(PAYLOAD)}")
+        else:
+            body = PAYLOAD
+            self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", '"v1"')
+        self.end_headers()
+        if cls.fail_after is not None:
+            body = body[:cls.fail_after]
+        try:
+            self.wfile.write(body)
+        except OSError:
+            pass
+
+
+@pytest.fixture
+def server():
+    _Handler.ranges = True
+    _Handler.fail_after = None
+    _Handler.requests_seen = []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}/file.rar"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _engine(**kwargs):
+    kwargs.setdefault("segments", 4)
+    kwargs.setdefault("min_segment_size", 64 * 1024)
+    kwargs.setdefault("chunk_size", 16 * 1024)
+    kwargs.setdefault("progress_interval", 0)
+    return SegmentedDownloader(requests.Session(), **kwargs)
+
+
+def test_segmented_download_reassembles_file(server, tmp_path):
+    dest = str(tmp_path / "file.rar")
+    progress = []
+    assert _engine().download(server, dest, lambda c, t, n: progress.append((c, t, n)))
+    with open(dest, "rb") as f:
+        assert f.read() == PAYLOAD
+    assert not os.path.exists(dest + PART_SUFFIX)
+    assert not os.path.exists(dest + STATE_SUFFIX)
+    assert progress[-1] == (len(PAYLOAD), len(PAYLOAD), "file.rar")
+    assert all(a[0] <= b[0] for a, b in zip(progress, progress[1:]))
+    segment_ranges = [r for r in _Handler.requests_seen if r != "bytes=0-"]
+    assert len(segment_ranges) == 4
+
+
+def test_interrupted_download_resumes(server, tmp_path):
+    dest = str(tmp_path / "file.rar")
+    _Handler.fail_after = 100 * 1024
+    assert not _engine(max_retries=0).download(server, dest)
+    assert os.path.exists(dest + STATE_SUFFIX)
+    assert os.path.getsize(dest + PART_SUFFIX) == len(PAYLOAD)
+
+    _Handler.fail_after = None
+    _Handler.requests_seen = []
+    assert _engine().download(server, dest)
+    with open(dest, "rb") as f:
+        assert f.read() == PAYLOAD
+    resumed_starts = [int(re.match(r"bytes=(\d+)", r).group(1)) for r in _Handler.requests_seen[1:]]
+    assert resumed_starts and all(start % (256 * 1024) != 0 for start in resumed_starts)
+    assert not os.path.exists(dest + STATE_SUFFIX)
+
+
+def test_without_range_support_uses_single_connection(server, tmp_path):
+    _Handler.ranges = False
+    dest = str(tmp_path / "file.rar")
+    assert _engine().download(server, dest)
+    with open(dest, "rb") as f:
+        assert f.read() == PAYLOAD
+    assert _Handler.requests_seen == ["bytes=0-"]
+
+
+def test_cancel_keeps_resume_state(server, tmp_path):
+    cancel = threading.Event()
+    cancel.set()
+    dest = str(tmp_path / "file.rar")
+    assert not _engine(cancel_event=cancel).download(server, dest)
+    assert not os.path.exists(dest)
+    assert os.path.exists(dest + STATE_SUFFIX)
+
+
+def test_saved_offsets_are_already_on_disk(server, tmp_path, monkeypatch):
+    ticks = itertools.count()
+    monkeypatch.setattr(segmented.time, "monotonic", lambda: next(ticks) * 0.4)
+    dest = str(tmp_path / "file.rar")
+    engine = _engine(chunk_size=1024)  # smaller than the file buffer
+    saved = []
+    real_save = engine._save_state
+
+    def checking_save(state_path, url, segments, validator):
+        with open(dest + PART_SUFFIX, "rb") as f:
+            disk = f.read()
+        for s in segments:
+            end = s.start + s.flushed
+            saved.append(disk[s.start:end] == PAYLOAD[s.start:end])
+        real_save(state_path, url, segments, validator)
+
+    engine._save_state = checking_save
+    assert engine.download(server, dest)
+    assert len(saved) > 4 and all(saved)
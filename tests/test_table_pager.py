@@ -0,0 +1,78 @@
+import pytest
+
+try:
+    from PyQt5.QtWidgets import QApplication, QTableWidget, QTableWidgetItem
+except Exception:  # pragma: no cover - optional dependency
+    pytest.skip("PyQt5 not available", allow_module_level=True)
+
+from gui.table_pager import LazyTablePager
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+TITLES = [f"Thread {i}" for i in range(7)]
+
+
+def _paged_table(page_size=3):
+    table = QTableWidget(0, 1)
+    table.resize(200, 60)  # small enough that a page overflows the viewport
+    calls = []
+
+    def append(titles):
+        for title in titles:
+            row = table.rowCount()
+            table.insertRow(row)
+            table.setItem(row, 0, QTableWidgetItem(title))
+
+    def load_more(offset, limit):
+        calls.append((offset, limit))
+        page = TITLES[offset:offset + limit]
+        pager.loaded(offset + len(page))
+        append(page)
+
+    pager = LazyTablePager(table, load_more, page_size)
+    first = TITLES[:pager.window]
+    pager.loaded(len(first))
+    append(first)
+    return table, pager, calls
+
+
+def _scroll_to_bottom(table):
+    bar = table.verticalScrollBar()
+    bar.setValue(bar.maximum())
+
+
+def test_scrolling_to_bottom_loads_next_page_until_exhausted(app):
+    table, pager, calls = _paged_table()
+    table.show()
+    app.processEvents()
+    assert table.rowCount() == 3 and not pager.exhausted
+
+    while not pager.exhausted:
+        _scroll_to_bottom(table)
+        app.processEvents()
+
+    assert calls == [(3, 3), (6, 3)]
+    assert table.rowCount() == len(TITLES)
+    _scroll_to_bottom(table)
+    assert len(calls) == 2  # nothing left to ask for
+    table.close()
+
+
+def test_show_all_lifts_window_and_reset_restarts(app):
+    table, pager, calls = _paged_table()
+    assert pager.window == 3
+    assert pager.show_all(True) is True
+    assert pager.show_all(True) is False
+    assert pager.window is None
+    pager.loaded(len(TITLES))
+    assert pager.exhausted
+
+    assert pager.show_all(False) is True
+    pager.limit = 9
+    pager.reset()
+    assert pager.window == 3 and not pager.exhausted
+    assert calls == []
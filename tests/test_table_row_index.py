@@ -0,0 +1,63 @@
+import pytest
+
+try:
+    from PyQt5.QtCore import Qt
+    from PyQt5.QtWidgets import QApplication, QTableWidget, QTableWidgetItem
+except Exception:  # pragma: no cover - optional dependency
+    pytest.skip("PyQt5 not available", allow_module_level=True)
+
+from gui.table_row_index import TableRowIndex
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+def _keys(model, row):
+    yield f"title:{model.index(row, 0).data()}"
+    for url in (model.index(row, 1).data() or "").split():
+        yield url
+
+
+def _table(rows):
+    table = QTableWidget(0, 2)
+    for title, links in rows:
+        row = table.rowCount()
+        table.insertRow(row)
+        table.setItem(row, 0, QTableWidgetItem(title))
+        table.setItem(row, 1, QTableWidgetItem(links))
+    return table
+
+
+def test_lookup_follows_edits(app):
+    table = _table([("A", "https://rg/a https://kf/a"), ("B", "https://rg/b"), ("C", "https://rg/a")])
+    index = TableRowIndex(table.model(), _keys)
+    assert index.find("https://kf/a") == 0
+    assert index.find("missing", "title:B") == 1
+    assert index.find_all("https://rg/a") == [0, 2]  # lowest row wins for find()
+
+    calls = []
+    index._row_keys = lambda m, r: calls.append(r) or _keys(m, r)
+    table.item(0, 1).setText("https://rg/new")
+    assert index.find("https://rg/new") == 0
+    assert index.find("https://kf/a") is None
+    assert index.find("https://rg/a") == 2  # duplicate survives the edit
+    assert calls == [0]  # only the edited row was re-read
+
+
+def test_lookup_follows_inserts_removals_and_sorting(app):
+    table = _table([("C", "https://rg/c"), ("A", "https://rg/a"), ("B", "https://rg/b")])
+    index = TableRowIndex(table.model(), _keys)
+    assert index.find("title:A") == 1
+
+    table.removeRow(0)
+    assert index.find("https://rg/a") == 0 and index.find("title:C") is None
+    table.insertRow(0)
+    table.setItem(0, 0, QTableWidgetItem("D"))
+    assert index.find("title:B") == 2 and index.find("title:D") == 0
+
+    table.setSortingEnabled(True)
+    table.sortByColumn(0, Qt.DescendingOrder)
+    assert [index.find(f"title:{t}") for t in "DBA"] == [0, 1, 2]
+    assert index.keys_of(2) == ("title:A", "https://rg/a")
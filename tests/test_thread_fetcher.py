@@ -0,0 +1,94 @@
+import threading
+import time
+
+from core.thread_fetcher import ThreadPageFetcher, is_logged_in_html
+
+
+MEMBER_PAGE = '<html><a href="login.php?do=logout&amp;logouthash=x">Abmelden</a>post</html>'
+GUEST_PAGE = '<html><input type="text" name="vb_login_username"></html>'
+
+
+class FakeResponse:
+    def __init__(self, url, text, status_code=200):
+        self.url = url
+        self.text = text
+        self.status_code = status_code
+
+
+class FakeSession:
+    def __init__(self, pages, delay=0.0):
+        self.pages = pages
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self.closed = False
+        self._lock = threading.Lock()
+
+    def get(self, url, timeout=None):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(self.delay)
+            page = self.pages[url]
+            if isinstance(page, Exception):
+                raise page
+            return page
+        finally:
+            with self._lock:
+                self.active -= 1
+
+    def close(self):
+        self.closed = True
+
+
+def test_is_logged_in_html():
+    assert is_logged_in_html(MEMBER_PAGE)
+    assert not is_logged_in_html(GUEST_PAGE)
+    assert not is_logged_in_html("")
+
+
+def test_fetch_all_keeps_order_and_flags_fallbacks():
+    pages = {
+        "u1": FakeResponse("u1", MEMBER_PAGE + "1"),
+        "u2": FakeResponse("https://x/login/", MEMBER_PAGE),
+        "u3": FakeResponse("u3", GUEST_PAGE),
+        "u4": FakeResponse("u4", MEMBER_PAGE, status_code=503),
+        "u5": RuntimeError("boom"),
+        "u6": FakeResponse("u6", MEMBER_PAGE + "6"),
+    }
+    fetcher = ThreadPageFetcher(FakeSession(pages), max_workers=3)
+    result = list(fetcher.fetch_all(list(pages)))
+    assert [u for u, _ in result] == list(pages)
+    assert result[0][1].endswith("1")
+    assert result[5][1].endswith("6")
+    assert [html for _, html in result[1:5]] == [None, None, None, None]
+
+
+def test_fetch_all_is_bounded_and_concurrent():
+    urls = [f"u{i}" for i in range(12)]
+    session = FakeSession({u: FakeResponse(u, MEMBER_PAGE) for u in urls}, delay=0.05)
+    fetcher = ThreadPageFetcher(session, max_workers=4)
+    started = time.monotonic()
+    assert all(html for _, html in fetcher.fetch_all(urls))
+    assert time.monotonic() - started < 12 * 0.05
+    assert 1 < session.peak <= 4
+    fetcher.close()
+    assert session.closed
+
+
+def test_fetch_ahead_is_lazy_and_stops_early():
+    requested = []
+
+    def urls():
+        for i in range(10):
+            requested.append(i)
+            yield f"u{i}"
+
+    session = FakeSession({f"u{i}": FakeResponse(f"u{i}", MEMBER_PAGE) for i in range(10)})
+    fetcher = ThreadPageFetcher(session)
+    pages = fetcher.fetch_ahead(urls(), lookahead=2)
+    assert next(pages)[0] == "u0"
+    assert next(pages)[0] == "u1"
+    pages.close()
+    assert len(requested) <= 4
@@ -0,0 +1,97 @@
+import pytest
+
+try:
+    from PyQt5.QtCore import Qt
+    from PyQt5.QtWidgets import QApplication, QTableWidget, QTableWidgetItem
+except Exception:  # pragma: no cover - optional dependency
+    pytest.skip("PyQt5 not available", allow_module_level=True)
+
+from gui.thread_filter_index import ALL_STATUSES, STATUS_BITS, ThreadFilterIndex, status_mask
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+ROWS = [
+    ("Alpha Book 2024", "Ebooks", "101", "status-pending"),
+    ("Beta Movie", "Filme", "102", "status-posted"),
+    ("Alpha Movie", "Filme", "103", "status-uploaded"),
+    ("Gamma Audio", "Hörbücher", "104", "status-pending"),
+]
+
+
+def _table():
+    table = QTableWidget(0, 3)
+    for title, category, tid, status in ROWS:
+        row = table.rowCount()
+        table.insertRow(row)
+        title_item = QTableWidgetItem(title)
+        title_item.setData(Qt.UserRole, status)
+        table.setItem(row, 0, title_item)
+        table.setItem(row, 1, QTableWidgetItem(category))
+        table.setItem(row, 2, QTableWidgetItem(tid))
+    return table
+
+
+def _visible(table):
+    return [table.item(r, 0).text() for r in range(table.rowCount()) if not table.isRowHidden(r)]
+
+
+def test_text_column_and_status_filters(app):
+    table = _table()
+    index = ThreadFilterIndex(table)
+
+    index.apply("alpha")
+    assert _visible(table) == ["Alpha Book 2024", "Alpha Movie"]
+    index.apply("alpha movie")
+    assert _visible(table) == ["Alpha Movie"]
+    index.apply("film", column=1)
+    assert _visible(table) == ["Beta Movie", "Alpha Movie"]
+    index.apply("", mask=STATUS_BITS["status-pending"])
+    assert _visible(table) == ["Alpha Book 2024", "Gamma Audio"]
+    index.apply("")
+    assert len(_visible(table)) == len(ROWS)
+    assert status_mask(False, False, False, False) == ALL_STATUSES
+
+
+def test_extended_query_only_rescans_visible_rows(app):
+    table = _table()
+    index = ThreadFilterIndex(table)
+    index.apply("movie")
+    assert index.rows_scanned == 4
+    index.apply("movie alpha")
+    assert index.rows_scanned == 2
+    assert _visible(table) == ["Alpha Movie"]
+    index.apply("movie")  # widening the query needs a full pass
+    assert index.rows_scanned == 4
+
+
+def test_index_follows_edits_inserts_and_removals(app):
+    table = _table()
+    index = ThreadFilterIndex(table)
+    index.apply("movie")
+
+    table.item(0, 0).setText("Alpha Movie Remastered")
+    table.removeRow(3)
+    table.insertRow(1)
+    item = QTableWidgetItem("Delta Movie")
+    item.setData(Qt.UserRole, "status-downloaded")
+    table.setItem(1, 0, item)
+
+    index.apply("movie")
+    assert _visible(table) == ["Alpha Movie Remastered", "Delta Movie", "Beta Movie", "Alpha Movie"]
+
+
+def test_sorting_keeps_cache_aligned_with_rows(app):
+    table = _table()
+    index = ThreadFilterIndex(table)
+    index.apply("movie")
+    table.setSortingEnabled(True)
+    table.sortByColumn(0, Qt.AscendingOrder)
+
+    index.apply("movie beta")
+    assert _visible(table) == ["Beta Movie"]
+    index.apply("", mask=STATUS_BITS["status-uploaded"])
+    assert _visible(table) == ["Alpha Movie"]
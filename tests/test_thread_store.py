@@ -0,0 +1,97 @@
+import json
+import os
+
+from core.thread_store import SECTION_BACKUP, SECTION_MEGATHREADS, SECTION_PROCESS, ThreadStore
+
+
+def _store(tmp_path, **kwargs):
+    return ThreadStore(str(tmp_path / "threads.sqlite3"), synchronous="OFF", **kwargs)
+
+
+def _process_threads():
+    return {
+        "Ebooks": {
+            "Book A": {"thread_id": "1", "thread_date": "2024-01-02", "links": {}},
+            "Book B": {"thread_id": "2", "thread_date": "2024-03-01", "upload_status": True,
+                       "versions": [{"thread_id": "2", "links": {"rapidgator.net": ["u1"]}}]},
+        },
+        "Filme": {"Movie": {"thread_id": "3", "thread_date": "2024-02-01", "post_status": True}},
+    }
+
+
+def test_migrates_legacy_json_once(tmp_path):
+    data = _process_threads()
+    (tmp_path / "process_threads.json").write_text(json.dumps(data), encoding="utf-8")
+    (tmp_path / "backup_threads.json").write_text(json.dumps({"Book A": {"rapidgator_status": "alive"}}),
+                                                  encoding="utf-8")
+
+    store = _store(tmp_path, legacy_dir=str(tmp_path))
+    assert store.load(SECTION_PROCESS) == data
+    assert store.load(SECTION_BACKUP) == {"Book A": {"rapidgator_status": "alive"}}
+    assert store.load(SECTION_MEGATHREADS) == {}
+    assert os.path.exists(tmp_path / "process_threads.json.migrated")
+    assert not os.path.exists(tmp_path / "process_threads.json")
+    store.close()
+
+    # A JSON file appearing later is not imported over the database again
+    (tmp_path / "process_threads.json").write_text("{}", encoding="utf-8")
+    reopened = _store(tmp_path, legacy_dir=str(tmp_path))
+    assert reopened.load(SECTION_PROCESS) == data
+
+
+def test_sync_writes_only_changed_threads(tmp_path):
+    store = _store(tmp_path)
+    data = _process_threads()
+    assert store.sync(SECTION_PROCESS, data) == 4  # three threads + one version
+
+    data["Ebooks"]["Book A"]["download_status"] = True
+    assert store.sync(SECTION_PROCESS, data) == 1
+    data["Ebooks"]["Book B"]["versions"].append({"thread_id": "4"})
+    assert store.sync(SECTION_PROCESS, data) == 1  # only the new version row
+    assert store.sync(SECTION_PROCESS, data) == 0
+
+    del data["Filme"]
+    store.sync(SECTION_PROCESS, data)
+    store.close()
+    assert _store(tmp_path).load(SECTION_PROCESS) == data
+
+
+def test_upsert_and_indexed_queries(tmp_path):
+    store = _store(tmp_path)
+    store.sync(SECTION_PROCESS, _process_threads())
+    assert store.upsert(SECTION_PROCESS, "Ebooks", "Book A", {"thread_id": "1", "thread_date": "2024-01-02",
+                                                              "post_status": True}) == 1
+    assert store.get(SECTION_PROCESS, "Ebooks", "Book A")["post_status"] is True
+
+    assert store.count(SECTION_PROCESS, status="posted") == 2
+    assert store.count(SECTION_PROCESS, category="Ebooks") == 2
+    assert store.count(SECTION_PROCESS, since="2024-02-01") == 2
+    assert store.count(SECTION_PROCESS, status=["posted", "uploaded"]) == 3
+
+    titles = [title for page in store.iter_pages(SECTION_PROCESS, page_size=2) for _, title, _ in page]
+    assert titles == ["Book B", "Movie", "Book A"]  # newest first
+    assert store.page(SECTION_PROCESS, 0, 10, status="uploaded")[0][2]["versions"][0]["thread_id"] == "2"
+    assert store.page_keys(SECTION_PROCESS, 1, 1) == [("Filme", "Movie")]
+    assert store.page_keys(SECTION_PROCESS, limit=None, category="Ebooks", newest_first=False) == [
+        ("Ebooks", "Book A"), ("Ebooks", "Book B")]
+
+    # Threads added live keep their date in a {title: version} dict
+    store.upsert(SECTION_PROCESS, "Filme", "Live", {"versions": {"Live": {"thread_date": "2024-04-01"}}})
+    assert store.page_keys(SECTION_PROCESS, 0, 1) == [("Filme", "Live")]
+
+    store.delete(SECTION_PROCESS, "Ebooks", "Book B")
+    assert store.get(SECTION_PROCESS, "Ebooks", "Book B") is None
+
+
+def test_legacy_json_created_later_is_imported(tmp_path):
+    store = _store(tmp_path, legacy_dir=str(tmp_path))
+    assert not store.is_migrated(SECTION_PROCESS)
+    store.upsert(SECTION_PROCESS, "Ebooks", "Book A", {"thread_id": "1", "post_status": True})
+
+    # e.g. copied into the user folder by UserManager.migrate_legacy_data
+    (tmp_path / "process_threads.json").write_text(json.dumps(_process_threads()), encoding="utf-8")
+    store.import_legacy()
+    loaded = store.load(SECTION_PROCESS)
+    assert loaded["Ebooks"]["Book A"] == {"thread_id": "1", "post_status": True}  # database row wins
+    assert set(loaded["Ebooks"]) == {"Book A", "Book B"} and "Movie" in loaded["Filme"]
+    assert store.is_migrated(SECTION_PROCESS)
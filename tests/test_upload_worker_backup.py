@@ -53,3 +53,41 @@ def test_upload_worker_separates_backup_host(tmp_path, monkeypatch):
     final = worker._prepare_final_urls()
     assert final["rapidgator"] == ["https://rapidgator.net/main.rar"]
     assert final["rapidgator-backup"] == ["https://rapidgator.net/backup.rar"]
+
+
+def test_upload_host_all_starts_next_transfer_before_rg_processing_finishes(tmp_path, monkeypatch):
+    from concurrent.futures import Future
+
+    files = []
+    for name in ("a.rar", "b.rar"):
+        path = tmp_path / name
+        path.write_bytes(b"data")
+        files.append(str(path))
+    bot = SimpleNamespace(config={}, send_to_keeplinks=lambda urls: "keeplink")
+    worker = UploadWorker(bot, row=0, folder_path=str(tmp_path), thread_id="t1", upload_hosts=["rapidgator"], files=files)
+
+    started, pending = [], []
+
+    def fake_upload_single(self, host_idx, file_path):
+        # Every transfer starts before any processing future resolves.
+        assert all(not f.done() for f in pending)
+        started.append(file_path.name)
+        fut = Future()
+        pending.append(fut)
+        return fut
+
+    monkeypatch.setattr(UploadWorker, "_upload_single", fake_upload_single)
+    original_await = UploadWorker._await_processing
+
+    def resolve_then_await(self, host_idx, file_path, future):
+        future.set_result(f"https://rapidgator.net/file/{file_path.name}")
+        return original_await(self, host_idx, file_path, future)
+
+    monkeypatch.setattr(UploadWorker, "_await_processing", resolve_then_await)
+
+    assert worker._upload_host_all(0) == "success"
+    assert started == ["a.rar", "b.rar"]
+    assert worker.upload_results[0]["urls"] == [
+        "https://rapidgator.net/file/a.rar",
+        "https://rapidgator.net/file/b.rar",
+    ]
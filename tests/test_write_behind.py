@@ -0,0 +1,55 @@
+import json
+import os
+import time
+
+from core.write_behind import WriteBehindQueue
+
+
+def test_burst_is_coalesced_into_one_write(tmp_path):
+    queue = WriteBehindQueue(window=0.05, fsync=False)
+    path = tmp_path / "jobs.json"
+    data = {}
+    for i in range(50):
+        data[str(i)] = {"status": "running"}
+        queue.submit(str(path), data)
+    assert queue.pending(str(path)) and not path.exists()
+    assert queue.pending_data(str(path)) == data  # readers see the queued state
+
+    deadline = time.monotonic() + 5
+    while queue.pending(str(path)) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    queue.stop()
+    assert json.loads(path.read_text(encoding="utf-8")) == data
+    stats = queue.stats()
+    assert stats["writes"] == 1 and stats["submits"] == 50 and stats["coalesced"] == 49
+    assert stats["bytes"] == len(path.read_bytes())
+    assert not (tmp_path / "jobs.json.tmp").exists()
+
+
+def test_flush_writes_pending_files_synchronously(tmp_path):
+    queue = WriteBehindQueue(window=60, fsync=False)
+    a, b = tmp_path / "a.json", tmp_path / "sub" / "b.json"
+    queue.submit(str(a), {"x": "ä"}, indent=2)
+    queue.submit(str(b), [1, 2])
+    assert queue.flush() == 2
+    assert json.loads(a.read_text(encoding="utf-8")) == {"x": "ä"}
+    assert "ä" in a.read_text(encoding="utf-8")  # ensure_ascii=False by default
+    assert json.loads(b.read_text(encoding="utf-8")) == [1, 2]
+    assert queue.stats()["pending"] == 0
+    queue.stop()
+
+
+def test_shared_queue_is_flushed_at_exit(tmp_path):
+    import subprocess
+    import sys
+
+    target = tmp_path / "late.json"
+    script = (
+        "from core.write_behind import get_write_behind\n"
+        "q = get_write_behind()\n"
+        "q.window = 60\n"
+        f"q.submit({str(target)!r}, {{'saved': True}})\n"
+    )
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    subprocess.run([sys.executable, "-c", script], cwd=root, check=True, timeout=60)
+    assert json.loads(target.read_text(encoding="utf-8")) == {"saved": True}
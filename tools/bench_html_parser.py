@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+
+"""Benchmark thread-page parsing backends.
+
+Compares the historic ``extract_file_hosts`` traversal (``html.parser`` tree,
+``find_all(lambda ...)`` for ``td.thead`` plus ``find_previous`` per post and
+BeautifulSoup link extraction) with the one-pass extractors in
+:mod:`core.html_backend` on both tree builders.
+
+Pass saved vBulletin ``showthread`` pages as arguments, or run without
+arguments to benchmark a synthetic 100-post megathread page::
+
+    python tools/bench_html_parser.py saved/megathread_p12.html
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import re
+import statistics
+import sys
+import time
+from typing import Callable, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from bs4 import BeautifulSoup  # noqa: E402
+
+from core import html_backend  # noqa: E402
+
+_POST_TEMPLATE = """
+<table class="tborder" id="post{n}"><tr><td class="thead">
+  <div class="normal">#{n} &nbsp; 24.05.2025, 10:{m:02d}</div></td></tr>
+<tr><td class="alt2"><a class="bigusername" href="member.php?u={n}"><span>user{n}</span></a>
+  <div class="smallfont">Mitglied</div></td>
+<td class="alt1"><div id="post_message_{n}">
+  <b>Release {n}</b><br><img src="//fastpic.org/{n}.jpg"><br>
+  <a href="https://rapidgator.net/file/{n}aa/release.part1.rar.html">part1</a><br>
+  <a href="https://rg.to/file/{n}bb/release.part2.rar.html">part2</a><br>
+  <pre class="alt2">https://katfile.com/{n}cc/release.part1.rar
+https://nitroflare.com/view/{n}DD/release.part2.rar
+https://keeplinks.org/p{n}/abcdef</pre>
+  <quote>Mirror: https://ddownload.com/{n}ee/release.rar</quote>
+  <div class="alt2"><code><code>https://uploady.io/{n}ff/release.rar</code></code></div>
+  {filler}
+</div></td></tr></table>
+"""
+
+
+def synthetic_megathread(posts: int = 100) -> str:
+    filler = "<p>" + ("Lorem ipsum dolor sit amet " * 20) + "</p>"
+    body = "".join(
+        _POST_TEMPLATE.format(n=n, m=n % 60, filler=filler) for n in range(1, posts + 1)
+    )
+    return (
+        "<html><head><title>Megathread</title></head><body>"
+        '<a href="login.php?do=logout">Abmelden</a>'
+        f"{body}"
+        '<table><tr><td class="thead">Quick reply</td></tr></table>'
+        "</body></html>"
+    )
+
+
+def legacy_extract(html: str) -> int:
+    """The pre-backend traversal, kept here only as the benchmark baseline."""
+    soup = BeautifulSoup(html, "html.parser")
+    soup.select_one("td.alt2 a.bigusername span")
+    links = 0
+    headers = soup.find_all(lambda tag: tag.name == "td" and "thead" in tag.get("class", []))
+    for header in headers:
+        post = header.find_previous("div", {"id": re.compile(r"post_message_\d+")})
+        if not post:
+            continue
+        links += len(post.find_all("a", href=True))
+        for pre in post.find_all("pre", class_="alt2"):
+            links += len(re.findall(r"(https?://[^\s<>]+)", pre.get_text(separator="\n")))
+        for quote in post.find_all("quote"):
+            links += len(re.findall(r"(https?://[^\s<>]+)", quote.get_text(separator="\n")))
+        for code in post.select("div.alt2 code code"):
+            links += len(re.findall(r"(https?://[^\s<>]+)", code.get_text(separator="")))
+    return links
+
+
+def backend_extract(html: str) -> int:
+    _author, posts = html_backend.extract_thread_posts(html)
+    links = 0
+    for post in posts:
+        links += len(post.hrefs)
+        for text in post.pre_texts + post.quote_texts + post.code_texts:
+            links += len(re.findall(r"(https?://[^\s<>]+)", text))
+    return links
+
+
+def _time(func: Callable[[str], int], html: str, repeat: int) -> tuple[float, int]:
+    samples: List[float] = []
+    result = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(html)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples), result
+
+
+def run(pages: List[tuple[str, str]], repeat: int) -> None:
+    for name, html in pages:
+        print(f"\n{name} ({len(html) / 1024:.0f} KiB)")
+        base, base_links = _time(legacy_extract, html, repeat)
+        print(f"  {'legacy html.parser + find_previous':<38} {base * 1000:8.1f} ms  links={base_links}")
+        backends = [html_backend.BACKEND_HTML_PARSER]
+        if html_backend.LXML_AVAILABLE:
+            backends.append(html_backend.BACKEND_LXML)
+        previous = html_backend.get_backend()
+        try:
+            for backend in backends:
+                html_backend.set_backend(backend)
+                elapsed, links = _time(backend_extract, html, repeat)
+                label = f"one-pass ({backend})"
+                print(f"  {label:<38} {elapsed * 1000:8.1f} ms  links={links}  x{base / elapsed:.1f}")
+        finally:
+            html_backend.set_backend(previous)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark forum HTML parsing backends")
+    parser.add_argument("pages", nargs="*", help="saved vBulletin showthread pages")
+    parser.add_argument("--posts", type=int, default=100, help="posts in the synthetic page")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    if args.pages:
+        pages = []
+        for path in args.pages:
+            with open(path, "r", encoding="utf-8", errors="replace") as fh:
+                pages.append((os.path.basename(path), fh.read()))
+    else:
+        pages = [(f"synthetic {args.posts}-post megathread", synthetic_megathread(args.posts))]
+    run(pages, args.repeat)
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    sys.exit(main())
@@ -0,0 +1,231 @@
+"""Streaming ``multipart/form-data`` bodies for large uploads.
+
+``requests_toolbelt.MultipartEncoder`` hands ``http.client`` an object with a
+``read()`` method, so every upload is sent in 8 KB reads and
+``MultipartEncoderMonitor`` runs the Python progress callback on each of
+them.  On 10+ GB batches that is hundreds of thousands of callbacks per
+file, all competing with the Qt UI thread for the GIL.
+
+:class:`StreamingMultipartBody` is an iterable with a known length instead:
+
+* ``requests`` sends it with a ``Content-Length`` and ``http.client`` writes
+  each yielded chunk with one ``sendall``;
+* file parts are read in large, 64 KiB-aligned chunks (1–8 MiB) into one
+  reused buffer, or sliced straight out of an ``mmap`` of the file;
+* the progress callback is rate limited by time *and* bytes, and always
+  fires once at the end.
+
+Typical use::
+
+    body = StreamingMultipartBody(
+        {"file": (name, path), "sess_id": sess_id},
+        progress_callback=lambda sent, total: ...,
+    )
+    requests.post(url, data=body, headers={"Content-Type": body.content_type})
+
+Yielded chunks are ``memoryview`` objects that are only valid until the next
+chunk is requested.
+"""
+
+from __future__ import annotations
+
+import logging
+import mmap
+import os
+import time
+import uuid
+from typing import Any, Callable, Iterator, List, Mapping, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+MIN_CHUNK_SIZE = 1024 * 1024
+MAX_CHUNK_SIZE = 8 * 1024 * 1024
+DEFAULT_CHUNK_SIZE = 4 * 1024 * 1024
+_ALIGNMENT = 64 * 1024
+
+ProgressCallback = Callable[[int, int], Any]
+FileSpec = Union[str, os.PathLike, Any]
+
+
+def _align_chunk_size(size: int) -> int:
+    size = max(MIN_CHUNK_SIZE, min(MAX_CHUNK_SIZE, int(size)))
+    return (size // _ALIGNMENT) * _ALIGNMENT
+
+
+def _quote(value: str) -> str:
+    # Same escaping urllib3 (and therefore MultipartEncoder) uses for HTML5 forms
+    return value.replace('"', "%22").replace("\r", "%0D").replace("\n", "%0A")
+
+
+class _FilePart:
+    __slots__ = ("header", "source", "start", "size")
+
+    def __init__(self, header: bytes, source: FileSpec) -> None:
+        self.header = header
+        self.source = source
+        if isinstance(source, (str, os.PathLike)):
+            self.start = 0
+            self.size = os.path.getsize(source)
+        else:
+            self.start = source.tell()
+            self.size = os.fstat(source.fileno()).st_size - self.start
+
+
+class UploadCancelled(Exception):
+    """Raised from the body iterator when its ``cancelled`` check turns true."""
+
+
+class StreamingMultipartBody:
+    """Iterable ``multipart/form-data`` body with large reads.
+
+    Parameters
+    ----------
+    fields:
+        Mapping of form field name to either a plain value or a
+        ``(filename, path_or_file[, content_type])`` tuple, in the same shape
+        ``MultipartEncoder(fields=...)`` accepted.  File objects must be
+        opened in binary mode and support ``fileno()``.
+    progress_callback:
+        ``callback(bytes_sent, total_bytes)``; called at most every
+        ``progress_interval`` seconds or ``progress_bytes`` bytes.
+    chunk_size:
+        Read size for file parts, clamped to 1–8 MiB and aligned to 64 KiB.
+    use_mmap:
+        Slice file parts out of an ``mmap`` instead of reading into a buffer.
+    cancelled:
+        Optional ``() -> bool`` checked before every chunk; when it returns
+        ``True`` iteration raises :class:`UploadCancelled`, aborting the
+        request that is streaming the body.
+    """
+
+    def __init__(
+        self,
+        fields: Mapping[str, Any],
+        progress_callback: Optional[ProgressCallback] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        use_mmap: bool = False,
+        progress_interval: float = 0.5,
+        progress_bytes: int = 16 * 1024 * 1024,
+        boundary: Optional[str] = None,
+        cancelled: Optional[Callable[[], bool]] = None,
+    ) -> None:
+        self.boundary = boundary or uuid.uuid4().hex
+        self.content_type = f"multipart/form-data; boundary={self.boundary}"
+        self.chunk_size = _align_chunk_size(chunk_size)
+        self.use_mmap = use_mmap
+        self.progress_callback = progress_callback
+        self.cancelled = cancelled
+        self.progress_interval = progress_interval
+        self.progress_bytes = max(1, int(progress_bytes))
+        self.bytes_sent = 0
+
+        self._parts: List[Union[bytes, _FilePart]] = []
+        boundary_line = f"--{self.boundary}\r\n".encode()
+        for name, value in fields.items():
+            if isinstance(value, tuple):
+                filename, source = value[0], value[1]
+                content_type = value[2] if len(value) > 2 else None
+                header = (
+                    f'Content-Disposition: form-data; name="{_quote(name)}"; '
+                    f'filename="{_quote(filename)}"\r\n'
+                )
+                if content_type:
+                    header += f"Content-Type: {content_type}\r\n"
+                self._parts.append(_FilePart(boundary_line + header.encode() + b"\r\n", source))
+                self._parts.append(b"\r\n")
+            else:
+                if isinstance(value, bytes):
+                    data = value
+                else:
+                    data = str(value).encode()
+                header = f'Content-Disposition: form-data; name="{_quote(name)}"\r\n\r\n'.encode()
+                self._parts.append(boundary_line + header + data + b"\r\n")
+        self._parts.append(f"--{self.boundary}--\r\n".encode())
+
+        self.len = sum(
+            len(p.header) + p.size if isinstance(p, _FilePart) else len(p)
+            for p in self._parts
+        )
+
+    def __len__(self) -> int:
+        return self.len
+
+    # ------------------------------------------------------------------
+    def __iter__(self) -> Iterator[Union[bytes, memoryview]]:
+        self.bytes_sent = 0
+        last_time = time.monotonic()
+        last_bytes = 0
+        callback = self.progress_callback
+
+        for part in self._parts:
+            if isinstance(part, _FilePart):
+                chunks = self._iter_file(part)
+                head = part.header
+                self.bytes_sent += len(head)
+                yield head
+            else:
+                chunks = (part,)
+            for chunk in chunks:
+                if self.cancelled is not None and self.cancelled():
+                    raise UploadCancelled("upload cancelled")
+                self.bytes_sent += len(chunk)
+                yield chunk
+                if callback:
+                    now = time.monotonic()
+                    if (now - last_time >= self.progress_interval
+                            or self.bytes_sent - last_bytes >= self.progress_bytes):
+                        last_time, last_bytes = now, self.bytes_sent
+                        self._notify()
+        if callback:
+            self._notify()
+
+    def _notify(self) -> None:
+        try:
+            self.progress_callback(self.bytes_sent, self.len)
+        except Exception as e:
+            logger.debug(f"Upload progress callback failed: {e}")
+
+    def _iter_file(self, part: _FilePart) -> Iterator[memoryview]:
+        own = isinstance(part.source, (str, os.PathLike))
+        fh = open(part.source, "rb") if own else part.source
+        try:
+            if self.use_mmap and part.size:
+                yield from self._iter_mmap(fh, part)
+                return
+            fh.seek(part.start)
+            buf = bytearray(min(self.chunk_size, max(part.size, 1)))
+            view = memoryview(buf)
+            remaining = part.size
+            try:
+                while remaining > 0:
+                    n = fh.readinto(view[:min(len(buf), remaining)])
+                    if not n:
+                        raise IOError(f"file shrank during upload: {getattr(fh, 'name', fh)}")
+                    remaining -= n
+                    yield view[:n]
+            finally:
+                view.release()
+        finally:
+            if own:
+                fh.close()
+
+    def _iter_mmap(self, fh, part: _FilePart) -> Iterator[memoryview]:
+        mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(mm)
+        try:
+            pos = part.start
+            end = part.start + part.size
+            while pos < end:
+                nxt = min(pos + self.chunk_size, end)
+                chunk = view[pos:nxt]
+                try:
+                    yield chunk
+                finally:
+                    chunk.release()
+                pos = nxt
+        finally:
+            view.release()
+            mm.close()
+
+
+__all__ = ["StreamingMultipartBody", "UploadCancelled", "DEFAULT_CHUNK_SIZE"]
@@ -6,19 +6,22 @@ Rapidgator Upload Handler
 """
 
 from __future__ import annotations
-import hashlib
 import json
 import logging
 import os
+import threading
 import time
 from pathlib import Path
-from typing import Optional, Dict, Any
+from concurrent.futures import Future, InvalidStateError
+from typing import Any, Callable, Dict, Optional
 
 from dotenv import load_dotenv
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
-from requests_toolbelt.multipart.encoder import MultipartEncoder, MultipartEncoderMonitor
+from uploaders.multipart_stream import StreamingMultipartBody, UploadCancelled
+from core.hash_cache import get_hash_cache
+from uploaders.rg_upload_poller import get_upload_poller
 
 # Import crash protection utilities
 from utils.crash_protection import (
@@ -324,65 +327,96 @@ class RapidgatorUploadHandler:
         Returns:
             str | None
         """
-        max_retries = 3
-        retry_delay = 5  # ثوانى
+        def attempt() -> str:
+            final_url = self._start_attempt(folder_id, progress_cb).result()
+            if not final_url:
+                raise Exception("Failed to obtain final URL after upload")
+            logging.info(f"Upload completed successfully: {final_url}")
+            return final_url
 
-        for attempt in range(1, max_retries + 1):
+        return self._with_retries(attempt)
+
+    def start_upload(self, folder_id: str | None = None, progress_cb=None,
+                     max_retries: int = 3, retry_delay: int = 5) -> Future:
+        """
+        مثل ``upload`` لكن يعود فور انتهاء نقل الملف.
+
+        The returned future resolves to the final URL (or ``None``) once
+        Rapidgator finishes processing; the shared poller waits for it, so the
+        calling thread can start the next transfer meanwhile.  Like
+        ``upload``, an attempt that ends without a final URL (poll failure or
+        timeout) is run again, up to *max_retries* attempts in total; those
+        re-runs happen on a background thread.
+
+        Cancelling the returned future stops the retries, aborts a running
+        transfer and drops the pending poll.
+        """
+        outcome: Future = Future()
+        polls: list = []
+
+        def finish(final_url: Optional[str]) -> None:
+            if outcome.done():
+                return
             try:
-                if not self.filepath.exists():
-                    raise FileNotFoundError(self.filepath)
+                outcome.set_result(final_url)
+            except InvalidStateError:
+                pass  # cancelled concurrently
+
+        def on_outcome(_f: Future) -> None:
+            if outcome.cancelled():
+                for pending in polls:
+                    pending.cancel()
+
+        outcome.add_done_callback(on_outcome)
+
+        def launch(first: int) -> None:
+            for attempt in range(first, max_retries + 1):
+                if outcome.done():
+                    return
+                try:
+                    pending = self._start_attempt(folder_id, progress_cb, cancelled=outcome.cancelled)
+                except UploadCancelled:
+                    logging.info(f"Upload of {self.filepath.name} cancelled")
+                    return
+                except Exception as e:
+                    if attempt == max_retries:
+                        logging.error(f"Upload failed after {max_retries} attempts: {e}", exc_info=True)
+                        finish(None)
+                        return
+                    wait = retry_delay * attempt
+                    logging.warning(f"Attempt {attempt} failed: {e}. Retrying in {wait}s …")
+                    time.sleep(wait)
+                    continue
+                polls.append(pending)
+                if outcome.cancelled():
+                    pending.cancel()
+                    return
+                pending.add_done_callback(lambda f, attempt=attempt: polled(f, attempt))
+                return
+
+        def polled(pending: Future, attempt: int) -> None:
+            if outcome.done():
+                return
+            final_url = None if pending.cancelled() or pending.exception() else pending.result()
+            if final_url:
+                logging.info(f"Upload completed successfully: {final_url}")
+                finish(final_url)
+            elif attempt == max_retries:
+                logging.error(f"Failed to obtain final URL after {max_retries} attempts")
+                finish(None)
+            else:
+                # Not on the poller's thread: the next attempt may transfer again
+                logging.warning(f"Attempt {attempt}: no final URL from Rapidgator, retrying …")
+                threading.Thread(target=launch, args=(attempt + 1,),
+                                 name="rg-upload-retry", daemon=True).start()
 
-                # 1) تأكّد من صلاحية التوكن
-                if not self.is_token_valid():
-                    raise Exception("Failed to obtain valid Rapidgator token")
-
-                # 2) احسب الـ hash والحجم
-                file_hash = self._hash_md5(self.filepath)
-                file_size = self.filepath.stat().st_size
-
-                # 3) تهيئة الرفع
-                init_info = self._initialize(file_hash, file_size, folder_id)
-                if not init_info:
-                    raise Exception("Upload initialization failed")
-
-                upload_url = init_info.get("url")
-                upload_id = init_info.get("upload_id")
-                state = init_info.get("state", 0)
-
-                # ─── حالة الملف على الخادم ──────────────────────────────
-                # 0 = Uploading (نحتاج رفع)
-                # 1 = Processing (مرفوع ويُعالج)
-                # 2 = Done       (لدينا الرابط فورًا)
-                # 3 = Fail
-                if state == 2:
-                    existing = init_info.get("file", {})
-                    return existing.get("url")
-
-                if state == 3:
-                    raise Exception(f"Server returned FAIL state: "
-                                    f"{init_info.get('state_label', 'Fail')}")
-
-                if state == 1:
-                    logging.info("File already uploaded, waiting for processing …")
-                    final_url = self._poll_for_url(upload_id)
-                    if final_url:
-                        logging.info(f"Upload completed successfully: {final_url}")
-                        return final_url
-                    raise Exception("Processing timed‑out")
-
-                # state == 0 → نرفع المحتوى ثم ننتظر الرابط
-                if not upload_url or not upload_id:
-                    raise Exception("Invalid upload URL or ID from server")
-
-                if not self._upload_content(upload_url, progress_cb):
-                    raise Exception("File upload failed")
-
-                final_url = self._poll_for_url(upload_id)
-                if final_url:
-                    logging.info(f"Upload completed successfully: {final_url}")
-                    return final_url
+        launch(1)
+        return outcome
 
-                raise Exception("Failed to obtain final URL after upload")
+    def _with_retries(self, action: Callable[[], Any], max_retries: int = 3, retry_delay: int = 5):
+        for attempt in range(1, max_retries + 1):
+            try:
+                return action()
 
             # ── أخطاء الشبكة: أعد المحاولة ───────────────────────────
             except requests.exceptions.RequestException as e:
@@ -403,6 +437,59 @@ class RapidgatorUploadHandler:
 
         return None
 
+    def _start_attempt(self, folder_id: str | None, progress_cb,
+                       cancelled: Optional[Callable[[], bool]] = None) -> Future:
+        """Hash, initialise and transfer once; return the URL future.
+
+        *cancelled* aborts the transfer with :class:`UploadCancelled`.
+        """
+        if not self.filepath.exists():
+            raise FileNotFoundError(self.filepath)
+
+        # 1) تأكّد من صلاحية التوكن
+        if not self.is_token_valid():
+            raise Exception("Failed to obtain valid Rapidgator token")
+
+        # 2) احسب الـ hash والحجم
+        file_hash = self._hash_md5(self.filepath)
+        file_size = self.filepath.stat().st_size
+
+        # 3) تهيئة الرفع
+        init_info = self._initialize(file_hash, file_size, folder_id)
+        if not init_info:
+            raise Exception("Upload initialization failed")
+
+        upload_url = init_info.get("url")
+        upload_id = init_info.get("upload_id")
+        state = init_info.get("state", 0)
+
+        # ─── حالة الملف على الخادم ──────────────────────────────
+        # 0 = Uploading (نحتاج رفع)
+        # 1 = Processing (مرفوع ويُعالج)
+        # 2 = Done       (لدينا الرابط فورًا)
+        # 3 = Fail
+        if state == 2:
+            done: Future = Future()
+            done.set_result(init_info.get("file", {}).get("url"))
+            return done
+
+        if state == 3:
+            raise Exception(f"Server returned FAIL state: "
+                            f"{init_info.get('state_label', 'Fail')}")
+
+        if state == 1:
+            logging.info("File already uploaded, waiting for processing …")
+            return self._submit_poll(upload_id)
+
+        # state == 0 → نرفع المحتوى ثم ننتظر الرابط
+        if not upload_url or not upload_id:
+            raise Exception("Invalid upload URL or ID from server")
+
+        if not self._upload_content(upload_url, progress_cb, cancelled):
+            raise Exception("File upload failed")
+
+        return self._submit_poll(upload_id)
+
     # ------------------------------------------------------------------
     #  داخليات
     # ------------------------------------------------------------------
@@ -425,30 +512,29 @@ class RapidgatorUploadHandler:
             return None
         return data["response"]["upload"]
 
-    def _upload_content(self, url: str, progress_cb) -> bool:
-        with open(self.filepath, "rb") as f:
-            fields = {
-                "file": (self.filepath.name, f, "application/octet-stream")
-            }
-            enc = MultipartEncoder(fields=fields)
-            monitor = (
-                MultipartEncoderMonitor(enc, lambda m: progress_cb(m.bytes_read, enc.len))
-                if progress_cb
-                else enc
-            )
-            headers = {
-                "Content-Type": monitor.content_type,
-                "User-Agent": "Mozilla/5.0",
-            }
-            r = requests.post(url, data=monitor, headers=headers, timeout=300)
-            if r.status_code != 200:
-                logging.error(f"RG upload HTTP error: {r.status_code}")
-                return False
-            try:
-                data = r.json()
-                return data.get("status") == 200
-            except json.JSONDecodeError:
-                return True  # ردّ غير JSON لكن 200 OK
+    def _upload_content(self, url: str, progress_cb,
+                        cancelled: Optional[Callable[[], bool]] = None) -> bool:
+        fields = {
+            "file": (self.filepath.name, str(self.filepath), "application/octet-stream")
+        }
+        # قراءات كبيرة + progress محدود بالوقت/البايتات بدل callback كل 8KB
+        body = StreamingMultipartBody(fields, progress_callback=progress_cb, cancelled=cancelled)
+        headers = {
+            "Content-Type": body.content_type,
+            "User-Agent": "Mozilla/5.0",
+        }
+        r = requests.post(url, data=body, headers=headers, timeout=300)
+        if r.status_code != 200:
+            logging.error(f"RG upload HTTP error: {r.status_code}")
+            return False
+        try:
+            data = r.json()
+            return data.get("status") == 200
+        except json.JSONDecodeError:
+            return True  # ردّ غير JSON لكن 200 OK
+
+    def _submit_poll(self, upload_id: str, max_secs: int = 180) -> Future:
+        return get_upload_poller().submit(upload_id, self.token, timeout=max_secs)
 
     def _poll_for_url(self, upload_id: str,
                       max_secs: int = 180, interval: int = 5) -> Optional[str]:
@@ -458,66 +544,17 @@ class RapidgatorUploadHandler:
         Args:
             upload_id : رقم جلسة الرفع
             max_secs  : أقصى زمن انتظار بالثوانى (افتراضى 3 دقائق)
-            interval  : فترة الانتظار بين الاستعلامات
+            interval  : غير مستخدم؛ الـ poller المشترك يحدد الفترات تلقائيًا
 
         Returns:
             رابط التنزيل النهائى أو None عند الفشل.
         """
-        waited = 0
-        while waited < max_secs:
-            try:
-                r = self.session.get(
-                    f"{self.base_url}/file/upload_info",
-                    params={"token": self.token, "upload_id": upload_id},
-                    timeout=15,
-                )
-                if r.status_code != 200:
-                    logging.debug(f"poll http={r.status_code}; retry …")
-                    time.sleep(interval)
-                    waited += interval
-                    continue
-
-                data = r.json()
-                if data.get("status") != 200:
-                    logging.debug(f"poll status={data.get('status')}; retry …")
-                    time.sleep(interval)
-                    waited += interval
-                    continue
-
-                # المسار الصحيح للـ state
-                upload_info = (
-                        data.get("response", {}).get("upload")
-                        or data.get("upload", {})
-                )
-                state = upload_info.get("state")
-                state_lbl = upload_info.get("state_label", state)
-
-                if state in (0, 1):  # Uploading / Processing
-                    logging.debug(f"RG {state_lbl} …")
-                elif state == 2:  # Done  🎉
-                    return upload_info["file"]["url"]
-                elif state == 3:  # Fail
-                    logging.error(f"RG upload failed: {state_lbl}")
-                    return None
-                else:  # غير معروف – استمر
-                    logging.debug(f"Unknown state={state}; retry …")
-
-            except Exception as exc:
-                logging.error(f"poll error: {exc}")
-
-            time.sleep(interval)
-            waited += interval
-
-        logging.error("RG polling timed‑out.")
-        return None
+        return self._submit_poll(upload_id, max_secs).result()
 
     @staticmethod
     def _hash_md5(path: Path) -> str:
-        md5 = hashlib.md5()
-        with open(path, "rb") as f:
-            for chunk in iter(lambda: f.read(8192), b""):
-                md5.update(chunk)
-        return md5.hexdigest()
+        # Shared cache: retries and the other hosts reuse the same digest.
+        return get_hash_cache().md5(str(path))
 
     # تنظيف الجلسة
     def __del__(self):
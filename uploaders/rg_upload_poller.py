@@ -0,0 +1,227 @@
+"""Shared poller for Rapidgator ``/file/upload_info``.
+
+After the file body is POSTed, Rapidgator still has to process the upload
+before ``/file/upload_info`` reports ``state == 2`` with the final URL.  The
+upload paths used to wait for that in their own ``time.sleep`` loops, holding
+a worker thread for up to three minutes per file.
+
+:class:`RapidgatorUploadPoller` keeps every outstanding ``upload_id`` in one
+table serviced by a single background thread:
+
+* each upload gets a :class:`~concurrent.futures.Future` resolving to the
+  download URL, or ``None`` when the upload failed (``state == 3``) or timed
+  out;
+* polling starts fast and backs off per upload (1 s, 1.6 s, 2.6 s ... up to
+  ``max_interval``), so small files resolve quickly and long processing does
+  not hammer the API;
+* all IDs that are due in a tick are queried together over one keep-alive
+  session (the endpoint takes a single ``upload_id`` per request);
+* submitting the same ``upload_id`` twice returns the same future, and a
+  cancelled future simply drops out of the table.
+
+Use :func:`get_upload_poller` for the shared instance.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+API_ROOT = "https://rapidgator.net/api/v2"
+
+# fetch(token, upload_id) -> the ``upload`` dict of the response, or None
+FetchFunc = Callable[[str, str], Optional[Dict[str, Any]]]
+
+
+class _Pending:
+    __slots__ = ("upload_id", "token", "future", "deadline", "interval", "next_at")
+
+    def __init__(self, upload_id: str, token: str, future: Future,
+                 deadline: float, interval: float, next_at: float) -> None:
+        self.upload_id = upload_id
+        self.token = token
+        self.future = future
+        self.deadline = deadline
+        self.interval = interval
+        self.next_at = next_at
+
+
+class RapidgatorUploadPoller:
+    """Resolve Rapidgator upload IDs to download URLs in the background."""
+
+    def __init__(
+        self,
+        fetch: Optional[FetchFunc] = None,
+        initial_interval: float = 1.0,
+        max_interval: float = 10.0,
+        backoff: float = 1.6,
+        timeout: float = 180.0,
+        max_parallel: int = 4,
+        base_url: str = API_ROOT,
+        idle_exit: float = 30.0,
+    ) -> None:
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.timeout = timeout
+        self.base_url = base_url
+        self.idle_exit = idle_exit
+        self._fetch = fetch or self._fetch_upload_info
+        self._session: Optional[requests.Session] = None
+        self._pool = ThreadPoolExecutor(max_workers=max(1, max_parallel), thread_name_prefix="rg-poll")
+
+        self._cond = threading.Condition()
+        self._pending: Dict[str, _Pending] = {}
+        self._thread: Optional[threading.Thread] = None
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    def submit(self, upload_id: str, token: str, timeout: Optional[float] = None,
+               initial_delay: Optional[float] = None) -> Future:
+        """Return a future for *upload_id*'s final URL (``None`` on failure)."""
+        upload_id = str(upload_id)
+        with self._cond:
+            existing = self._pending.get(upload_id)
+            if existing is not None and not existing.future.done():
+                return existing.future
+            now = time.monotonic()
+            delay = self.initial_interval if initial_delay is None else initial_delay
+            future: Future = Future()
+            self._pending[upload_id] = _Pending(
+                upload_id,
+                token,
+                future,
+                deadline=now + (self.timeout if timeout is None else timeout),
+                interval=self.initial_interval,
+                next_at=now + delay,
+            )
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="RGUploadPoller", daemon=True)
+                self._thread.start()
+            self._cond.notify()
+            return future
+
+    def wait(self, upload_id: str, token: str, timeout: Optional[float] = None) -> Optional[str]:
+        """Blocking convenience wrapper around :meth:`submit`."""
+        return self.submit(upload_id, token, timeout=timeout).result()
+
+    @property
+    def pending_count(self) -> int:
+        with self._cond:
+            return len(self._pending)
+
+    # ------------------------------------------------------------------
+    # Polling loop
+    # ------------------------------------------------------------------
+    def _run(self) -> None:
+        idle_since: Optional[float] = None
+        while True:
+            with self._cond:
+                for uid in [u for u, p in self._pending.items() if p.future.done()]:
+                    del self._pending[uid]
+                now = time.monotonic()
+                if not self._pending:
+                    idle_since = idle_since or now
+                    if now - idle_since >= self.idle_exit:
+                        self._thread = None
+                        return
+                    self._cond.wait(self.idle_exit - (now - idle_since))
+                    continue
+                idle_since = None
+                due = [p for p in self._pending.values() if p.next_at <= now]
+                if not due:
+                    wake = min(p.next_at for p in self._pending.values())
+                    self._cond.wait(max(0.0, wake - now))
+                    continue
+
+            results = list(self._pool.map(self._poll_one, due))
+            now = time.monotonic()
+            with self._cond:
+                for item, info in zip(due, results):
+                    self._handle(item, info, now)
+
+    def _poll_one(self, item: _Pending) -> Optional[Dict[str, Any]]:
+        try:
+            return self._fetch(item.token, item.upload_id)
+        except Exception as exc:
+            logger.debug(f"RG upload_info error for {item.upload_id}: {exc}")
+            return None
+
+    def _handle(self, item: _Pending, info: Optional[Dict[str, Any]], now: float) -> None:
+        if item.future.done():
+            self._forget(item)
+            return
+        state = info.get("state") if info else None
+        if state == 2:
+            url = (info.get("file") or {}).get("url")
+            self._resolve(item, url)
+            return
+        if state == 3:
+            logger.error(f"❌ RG upload {item.upload_id} failed: {info.get('state_label', state)}")
+            self._resolve(item, None)
+            return
+        if now >= item.deadline:
+            logger.error(f"❌ RG polling timed-out for upload {item.upload_id}")
+            self._resolve(item, None)
+            return
+        if info is not None:
+            logger.debug(f"RG {info.get('state_label', state)} … ({item.upload_id})")
+        item.interval = min(self.max_interval, item.interval * self.backoff)
+        item.next_at = now + item.interval
+
+    def _forget(self, item: _Pending) -> None:
+        if self._pending.get(item.upload_id) is item:
+            del self._pending[item.upload_id]
+
+    def _resolve(self, item: _Pending, url: Optional[str]) -> None:
+        self._forget(item)
+        if not item.future.done():
+            try:
+                item.future.set_result(url)
+            except Exception:
+                pass  # cancelled concurrently
+
+    # ------------------------------------------------------------------
+    # HTTP
+    # ------------------------------------------------------------------
+    def _fetch_upload_info(self, token: str, upload_id: str) -> Optional[Dict[str, Any]]:
+        if self._session is None:
+            self._session = requests.Session()
+            self._session.headers.update({"User-Agent": "Mozilla/5.0", "Accept": "application/json"})
+        r = self._session.get(
+            f"{self.base_url}/file/upload_info",
+            params={"token": token, "upload_id": upload_id},
+            timeout=15,
+        )
+        if r.status_code != 200:
+            logger.debug(f"poll http={r.status_code} for {upload_id}")
+            return None
+        data = r.json()
+        if data.get("status") != 200:
+            logger.debug(f"poll status={data.get('status')} for {upload_id}")
+            return None
+        return (data.get("response") or {}).get("upload") or data.get("upload") or None
+
+
+_poller: Optional[RapidgatorUploadPoller] = None
+_poller_lock = threading.Lock()
+
+
+def get_upload_poller() -> RapidgatorUploadPoller:
+    """Return the process-wide poller."""
+    global _poller
+    with _poller_lock:
+        if _poller is None:
+            _poller = RapidgatorUploadPoller()
+        return _poller
+
+
+__all__ = ["RapidgatorUploadPoller", "get_upload_poller"]
@@ -5,7 +5,8 @@ from typing import Optional
 
 import requests
 from dotenv import load_dotenv
-from requests_toolbelt.multipart.encoder import MultipartEncoder, MultipartEncoderMonitor
+
+from uploaders.multipart_stream import StreamingMultipartBody
 
 load_dotenv()
 
@@ -59,26 +60,18 @@ class UploadyClient:
         cookies = {"xfss": sess_id} if sess_id else None
         for field in fields:
             try:
-                with Path(file_path).open("rb") as f:
-                    data = {field: (Path(file_path).name, f)}
-                    if sess_id:
-                        data["sess_id"] = sess_id
-                    enc = MultipartEncoder(data)
-                    monitor = (
-                        MultipartEncoderMonitor(
-                            enc, lambda m: progress_callback(m.bytes_read, m.len)
-                        )
-                        if progress_callback
-                        else enc
-                    )
-                    headers = {"Content-Type": monitor.content_type}
-                    r = self.session.post(
-                        upload_url,
-                        data=monitor,
-                        headers=headers,
-                        cookies=cookies,
-                        timeout=3600,
-                    )
+                data = {field: (Path(file_path).name, str(file_path))}
+                if sess_id:
+                    data["sess_id"] = sess_id
+                body = StreamingMultipartBody(data, progress_callback=progress_callback)
+                headers = {"Content-Type": body.content_type}
+                r = self.session.post(
+                    upload_url,
+                    data=body,
+                    headers=headers,
+                    cookies=cookies,
+                    timeout=3600,
+                )
                 try:
                     return r.json()
                 except Exception:
@@ -0,0 +1,207 @@
+"""Shared file-host classifier for URLs and post text.
+
+Several modules used to work out "which file host is this link on" on their
+own: linear substring scans over ``known_file_hosts``, ad-hoc alias tables
+(``rg.to`` -> ``rapidgator.net``) and ``re.findall`` calls compiled inline per
+``<pre>``/``<quote>``/``<code>`` block.  :class:`HostClassifier` does it once:
+
+* one compiled URL regex (:data:`URL_RE`) for pulling links out of text;
+* a dict of registrable domains, looked up by walking the hostname's label
+  suffixes (``cdn.www.rapidgator.net`` -> ``rapidgator.net``) so each lookup
+  is O(labels) instead of O(known hosts);
+* alias domains such as ``rg.to`` mapped to their canonical host;
+* :meth:`HostClassifier.classify_text` to classify every URL in a post in a
+  single pass.
+
+Module-level helpers use :data:`DEFAULT_CLASSIFIER`.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import urlsplit, urlunsplit
+
+# Same character class the forum scraper always used for bare URLs in text.
+URL_RE = re.compile(r"https?://[^\s<>]+", re.I)
+_HOST_RE = re.compile(r"^[a-z][a-z0-9+.-]*://(?:[^@/?#\s]*@)?([^/:?#\s]+)", re.I)
+
+DEFAULT_HOSTS = (
+    "rapidgator.net",
+    "turbobit.net",
+    "nitroflare.com",
+    "ddownload.com",
+    "katfile.com",
+    "mega.nz",
+    "xup.in",
+    "f2h.io",
+    "filepv.com",
+    "filespayouts.com",
+    "uploady.io",
+)
+
+DEFAULT_ALIASES = {
+    "rg.to": "rapidgator.net",
+    "rapidgator": "rapidgator.net",
+    "nitroflare": "nitroflare.com",
+    "nitro.download": "nitroflare.com",
+    "ddownload": "ddownload.com",
+    "ddl.to": "ddownload.com",
+    "turbobit": "turbobit.net",
+    "katfile": "katfile.com",
+    "mega.co.nz": "mega.nz",
+}
+
+CONTAINER_HOSTS = frozenset({
+    "keeplinks.org",
+    "filecrypt.cc",
+    "linksafe.me",
+    "pastehere.xyz",
+})
+
+
+def url_hostname(url: str) -> str:
+    """Return the lower-cased hostname of *url* (``""`` if it has none)."""
+    m = _HOST_RE.match((url or "").strip())
+    return m.group(1).lower().rstrip(".") if m else ""
+
+
+class HostClassifier:
+    """Map hostnames and URLs to canonical file-host domains.
+
+    Parameters
+    ----------
+    hosts:
+        Canonical registrable domains, e.g. ``"rapidgator.net"``.  Entries
+        that are keys of *aliases* (``"rg.to"``) are treated as aliases.
+    aliases:
+        Alias domain -> canonical domain.
+    containers:
+        Link-container domains (Keeplinks & co.).
+    """
+
+    def __init__(
+        self,
+        hosts: Iterable[str] = DEFAULT_HOSTS,
+        aliases: Optional[Dict[str, str]] = None,
+        containers: Iterable[str] = CONTAINER_HOSTS,
+    ) -> None:
+        aliases = dict(DEFAULT_ALIASES if aliases is None else aliases)
+        self._lookup: Dict[str, str] = {}
+        for host in hosts:
+            host = (host or "").strip().lower()
+            if host:
+                self._lookup[host] = aliases.get(host, host)
+        for alias, canonical in aliases.items():
+            canonical = canonical.lower()
+            if canonical in self._lookup.values() or canonical in self._lookup:
+                self._lookup[alias.lower()] = canonical
+        self.containers = frozenset(c.lower() for c in containers)
+        self._cache: Dict[str, Optional[str]] = {}
+
+    @property
+    def hosts(self) -> List[str]:
+        """Canonical hosts known to this classifier."""
+        return sorted(set(self._lookup.values()))
+
+    # ------------------------------------------------------------------
+    def lookup_host(self, hostname: str) -> Optional[str]:
+        """Return the canonical file host for *hostname* or ``None``."""
+        h = (hostname or "").strip().lower().rstrip(".")
+        cached = self._cache.get(h, False)
+        if cached is not False:
+            return cached
+        result = None
+        candidate = h
+        while candidate:
+            result = self._lookup.get(candidate)
+            if result is not None:
+                break
+            _, dot, candidate = candidate.partition(".")
+            if not dot:
+                break
+        if len(self._cache) < 4096:
+            self._cache[h] = result
+        return result
+
+    def canonical_host(self, hostname: str) -> str:
+        """Canonical host for known hosts, otherwise *hostname* minus ``www.``."""
+        known = self.lookup_host(hostname)
+        if known:
+            return known
+        h = (hostname or "").strip().lower()
+        return h[4:] if h.startswith("www.") else h
+
+    def classify(self, url: str) -> Optional[str]:
+        """Return the canonical file host of *url* or ``None`` if unknown."""
+        return self.lookup_host(url_hostname(url))
+
+    def is_container(self, url_or_host: str) -> bool:
+        """``True`` for Keeplinks-style container URLs or hostnames."""
+        s = url_or_host or ""
+        host = url_hostname(s) if "://" in s else s.strip().lower()
+        host = host[4:] if host.startswith("www.") else host
+        return host in self.containers
+
+    def normalize_url(self, url: str) -> str:
+        """Rewrite alias hosts (``rg.to``) in *url* to their canonical host."""
+        host = url_hostname(url)
+        canonical = self.lookup_host(host)
+        if not canonical or host == canonical or host.endswith("." + canonical):
+            return url
+        try:
+            parts = urlsplit(url)
+            netloc = parts.netloc.lower().replace(host, canonical, 1)
+            return urlunsplit((parts.scheme, netloc, parts.path, parts.query, parts.fragment))
+        except ValueError:
+            return url
+
+    # ------------------------------------------------------------------
+    def find_urls(self, text: str) -> List[str]:
+        """Return every ``http(s)://`` URL in *text*."""
+        return URL_RE.findall(text or "")
+
+    def classify_text(self, text: str) -> Iterator[Tuple[str, Optional[str]]]:
+        """Yield ``(url, canonical_host_or_None)`` for every URL in *text*."""
+        lookup = self.lookup_host
+        for m in URL_RE.finditer(text or ""):
+            url = m.group(0)
+            yield url, lookup(url_hostname(url))
+
+    def group(self, urls: Iterable[str]) -> Dict[str, List[str]]:
+        """Group known-host *urls* by canonical host (alias URLs normalised)."""
+        out: Dict[str, List[str]] = {}
+        for url in urls:
+            host = self.classify(url)
+            if host:
+                out.setdefault(host, []).append(self.normalize_url(url))
+        return out
+
+
+DEFAULT_CLASSIFIER = HostClassifier()
+
+
+def classify_url(url: str) -> Optional[str]:
+    return DEFAULT_CLASSIFIER.classify(url)
+
+
+def canonical_host(hostname: str) -> str:
+    return DEFAULT_CLASSIFIER.canonical_host(hostname)
+
+
+def is_container_url(url_or_host: str) -> bool:
+    return DEFAULT_CLASSIFIER.is_container(url_or_host)
+
+
+__all__ = [
+    "URL_RE",
+    "CONTAINER_HOSTS",
+    "DEFAULT_HOSTS",
+    "DEFAULT_ALIASES",
+    "HostClassifier",
+    "DEFAULT_CLASSIFIER",
+    "url_hostname",
+    "classify_url",
+    "canonical_host",
+    "is_container_url",
+]
@@ -2,10 +2,12 @@ from __future__ import annotations
 from typing import Any, Iterable, Optional
 from urllib.parse import urlsplit
 
+from utils.host_classifier import canonical_host
+
 
 def _clean_host(host: str) -> str:
-    host = (host or "").lower().strip()
-    return host[4:] if host.startswith("www.") else host
+    # Alias domains (rg.to) count as their canonical host (rapidgator.net).
+    return canonical_host(host or "")
 
 
 def get_highest_priority_host(settings: Any = None, config: Optional[dict] = None) -> Optional[str]:
@@ -1,7 +1,18 @@
 """Utilities for persisting link replacements and statuses."""
 from __future__ import annotations
 
-from typing import Callable, Dict
+import time
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from core.link_status_cache import LinkStatusCache
+
+# How long a JDownloader link-check result stays valid, per status (seconds).
+# Overridable with ``link_check_ttl_online`` / ``_offline`` / ``_unknown``.
+DEFAULT_LINK_STATUS_TTLS = {
+    "online": 6 * 3600,
+    "offline": 24 * 3600,
+    "unknown": 15 * 60,
+}
 
 
 def persist_link_replacement(
@@ -63,9 +74,64 @@ def persist_link_replacement(
     cache = user_manager.load_user_data(status_filename, {}) or {}
     for url, status in (link_statuses or {}).items():
         if url:
-            cache.setdefault(url, {}).update({"status": status})
+            cache.setdefault(url, {}).update({"status": status, "checked_at": int(time.time())})
     try:
         user_manager.save_user_data(status_filename, cache)
     except Exception:
         pass
-    return cache
\ No newline at end of file
+    return cache
+
+
+def link_status_ttls(config: Optional[Mapping] = None) -> Dict[str, float]:
+    """Per-status TTLs from ``link_check_ttl_<status>`` config keys."""
+    config = config or {}
+    ttls: Dict[str, float] = {}
+    for status, default in DEFAULT_LINK_STATUS_TTLS.items():
+        try:
+            ttls[status] = float(config.get(f"link_check_ttl_{status}", default))
+        except (TypeError, ValueError):
+            ttls[status] = float(default)
+    return ttls
+
+
+def split_fresh_links(
+    urls: Iterable[str],
+    status_cache: Mapping[str, Dict],
+    ttl: Mapping[str, float],
+    keys_of: Optional[Callable[[str], Iterable[str]]] = None,
+    force: bool = False,
+    clock: Callable[[], float] = time.time,
+) -> Tuple[Dict[str, Dict], List[str], Dict[str, int]]:
+    """Split *urls* into those with a fresh entry in *status_cache* and the rest.
+
+    ``status_cache`` is the ``link_status.json`` mapping (``url -> {"status",
+    "checked_at"}``); entries without ``checked_at`` count as stale.  URLs
+    are matched on their raw form and on every alias returned by
+    ``keys_of`` (e.g. canonical URL and host-id), since JDownloader reports
+    links in a different form than the table shows them.
+
+    Returns ``(fresh entries by url, stale urls, {"hits", "misses"})``.
+    """
+    view = LinkStatusCache(ttl=dict(ttl), clock=clock)
+    for key, entry in (status_cache or {}).items():
+        if not isinstance(entry, dict) or not entry.get("status"):
+            continue
+        stamp = entry.get("checked_at") or 0
+        for alias in (key, *(keys_of(key) if keys_of else ())):
+            if not alias:
+                continue
+            known = view.peek(alias)
+            if known is None or known["checked_at"] < stamp:
+                view.put(alias, entry["status"], checked_at=stamp)
+
+    lookup: Dict[str, str] = {}
+    for url in urls:
+        if url in lookup:
+            continue
+        candidates = [url, *(keys_of(url) if keys_of else ())]
+        lookup[url] = next((k for k in candidates if k and view.peek(k) is not None), url)
+
+    fresh_by_key, _ = view.split(set(lookup.values()), force=force)
+    fresh = {url: fresh_by_key[key] for url, key in lookup.items() if key in fresh_by_key}
+    stale = [url for url in lookup if url not in fresh]
+    return fresh, stale, {"hits": len(fresh), "misses": len(stale)}
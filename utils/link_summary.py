@@ -6,6 +6,8 @@ class LinkCheckSummary:
     """Track per-row statuses and format a summary string."""
 
     replaced: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
     row_statuses: dict[int, str] = field(default_factory=dict)
     counts: Counter = field(
         default_factory=lambda: Counter({"ONLINE": 0, "OFFLINE": 0, "UNKNOWN": 0})
@@ -22,12 +24,20 @@ class LinkCheckSummary:
         if replaced:
             self.replaced += 1
 
+    def record_cache(self, hits: int, misses: int) -> None:
+        """Count links answered from the status cache vs. sent to JDownloader."""
+        self.cache_hits += hits
+        self.cache_misses += misses
+
     def message(self, cancelled: bool = False) -> str:
         """Return a formatted summary string."""
         prefix = "Link check cancelled" if cancelled else "Link check finished"
         rows = len(self.row_statuses)
-        return (
+        msg = (
             f"{prefix}: {rows} rows, replaced {self.replaced}, "
             f"ONLINE {self.counts['ONLINE']}, OFFLINE {self.counts['OFFLINE']}, "
             f"UNKNOWN {self.counts['UNKNOWN']}"
-        )
\ No newline at end of file
+        )
+        if self.cache_hits or self.cache_misses:
+            msg += f", cached {self.cache_hits}, checked {self.cache_misses}"
+        return msg
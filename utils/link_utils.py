@@ -16,6 +16,8 @@ from typing import Any, Dict, List
 import logging
 import re
 
+from utils.host_classifier import classify_url, is_container_url
+
 log = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
@@ -83,6 +85,11 @@ def _dedup(seq: List[str]) -> List[str]:
 
 
 def _guess_host_from_url(url: str) -> str:
+    host = classify_url(url)
+    if host:
+        return _CANON_HOSTS.get(host, "")
+    if is_container_url(url):
+        return "keeplinks" if "keeplinks" in url.lower() else ""
     u = url.lower()
     if "rapidgator" in u:
         return "rapidgator"
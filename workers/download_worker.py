@@ -7,7 +7,6 @@ import time
 import uuid
 from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from queue import Queue
 from threading import Lock
 from urllib.parse import urlparse
 
@@ -20,6 +19,8 @@ except ImportError:
 import requests
 from PyQt5.QtCore import QThread, Qt, pyqtSignal
 
+from core.download_scheduler import DownloadScheduler, parse_host_limits
+from core.status_reporter import StatusReporter
 from core.user_manager import get_user_manager
 from downloaders.jdownloader import JDownloaderDownloader
 from downloaders.katfile import KatfileDownloader
@@ -145,10 +146,20 @@ class DownloadWorker(QThread):
         # حد تغذية كبير عند توافر JDownloader (يغذي كل اللينكات)
         self.jd_bulk_limit = 256
 
-        self.download_queue = Queue()
         self.active_link_downloads = {}
         self.thread_info_map = {}
         self.lock = Lock()
+        self.processed_threads = 0
+
+        # جدولة اللينكات: round-robin بين الثريدات + حدود لكل هوست وحد عام
+        self.scheduler = DownloadScheduler(
+            global_limit=self.max_concurrent,
+            host_limits=self._download_host_limits(),
+            on_thread_complete=self._on_thread_links_done,
+        )
+        self.status_reporter = None
+        self._batch_operation_id = None
+        self._last_throughput_report = 0.0
 
         # نخلي الـ executor على الحد الكبير؛ الجدولة هتتحكم بعدد المهام حسب وجود JD
         self.thread_pool = ThreadPoolExecutor(max_workers=self.jd_bulk_limit)
@@ -207,6 +218,91 @@ class DownloadWorker(QThread):
     def _is_cancelled(self):
         return self.is_cancelled or (self.cancel_event and self.cancel_event.is_set())
 
+    def _config_value(self, key, default=None):
+        config = getattr(self.bot, "config", None) or {}
+        try:
+            return config.get(key, default)
+        except AttributeError:
+            return default
+
+    def _download_host_limits(self):
+        """Per-host parallel download caps, e.g. ``rapidgator.net=4,katfile.com=2``."""
+        return parse_host_limits(self._config_value("download_host_limits"))
+
+    def _download_global_limit(self, jd_available: bool) -> int:
+        """Global parallel download cap (``download_global_limit``).
+
+        Without an explicit setting JDownloader gets the bulk feed limit and
+        direct downloads use ``max_concurrent``.
+        """
+        default = self.jd_bulk_limit if jd_available else self.max_concurrent
+        try:
+            configured = int(self._config_value("download_global_limit", 0) or 0)
+        except (TypeError, ValueError):
+            configured = 0
+        if configured <= 0:
+            return default
+        return min(configured, self.jd_bulk_limit)
+
+    def _on_thread_links_done(self, thread_id, state):
+        """Scheduler callback: every link of *thread_id* finished (or failed)."""
+        self.processed_threads += 1
+        if state.get("failed"):
+            logging.warning(
+                f"⚠️ {len(state['failed'])}/{state['total_links']} link(s) failed for thread {thread_id}"
+            )
+        self.process_thread_files(thread_id)
+
+    def _start_batch_report(self):
+        total_links = self.scheduler.pending_count
+        if not total_links:
+            return
+        try:
+            self.status_reporter = StatusReporter(self.worker_session_id)
+            self._batch_operation_id = self.status_reporter.start_download(
+                "Downloads",
+                f"{len(self.thread_info_map)} threads / {total_links} links",
+                "",
+                details="Queued...",
+            )
+        except Exception as e:
+            logging.debug(f"Batch status reporter unavailable: {e}")
+            self.status_reporter = None
+
+    def _report_throughput(self, force=False):
+        """Push aggregate bytes/speed of all active links to the status reporter."""
+        if not self.status_reporter or not self._batch_operation_id:
+            return
+        now = time.monotonic()
+        if not force and now - self._last_throughput_report < 1.0:
+            return
+        self._last_throughput_report = now
+        done, total, speed = self.scheduler.throughput(now)
+        if total <= 0:
+            return
+        hosts = ", ".join(f"{h}×{n}" for h, n in sorted(self.scheduler.active_per_host().items()))
+        pct = int(done * 100 / total)
+        details = f"{pct}% – {speed / (1024 * 1024):.1f} MB/s"
+        if hosts:
+            details += f" – {hosts}"
+        self.status_reporter.update_transfer_progress(
+            done, total, speed, details=details, operation_id=self._batch_operation_id
+        )
+
+    def _finish_batch_report(self, success, message):
+        if not self.status_reporter or not self._batch_operation_id:
+            return
+        self._report_throughput(force=True)
+        if success:
+            self.status_reporter.complete_operation(
+                details=message, operation_id=self._batch_operation_id
+            )
+        else:
+            self.status_reporter.fail_operation(
+                message, operation_id=self._batch_operation_id
+            )
+        self._batch_operation_id = None
+
     def get_download_hosts_priority(self):
         """Get download hosts priority from user settings with fallback to defaults"""
         default_priority = [
@@ -290,7 +386,7 @@ class DownloadWorker(QThread):
                 logging.warning("⚠️ pre-start cleanup failed: %s", e)
 
             total_threads = len(self.selected_rows)
-            processed_threads = 0
+            self._start_batch_report()
 
             while not self._is_cancelled():
                 # سلامة الووركر
@@ -314,45 +410,43 @@ class DownloadWorker(QThread):
                 except Exception:
                     jd_available = False
 
-                limit = self.jd_bulk_limit if jd_available else self.max_concurrent
+                self.scheduler.set_limits(self._download_global_limit(jd_available))
 
-                while (
-                        len(self.active_link_downloads) < limit
-                        and not self.download_queue.empty()
-                        and not self.cancel_event.is_set()
-                ):
-                    item = self.download_queue.get()
+                # الـ scheduler بيختار اللينكات حسب حدود الهوستات وبالتناوب بين الثريدات
+                while not self.cancel_event.is_set():
+                    item = self.scheduler.next_ready()
+                    if item is None:
+                        break
                     self.start_link_download(item)
 
                 # لمّ المنتهى منهم (thread-safe)
                 with self.lock:
-                    finished = [lid for lid, info in self.active_link_downloads.items() if info.get("completed")]
-                    for lid in finished:
-                        try:
-                            info = self.active_link_downloads.pop(lid)
-                            tid = info["thread_id"]
-                            if tid in self.thread_info_map:
-                                self.thread_info_map[tid]["done_count"] += 1
+                    finished = [info for info in self.active_link_downloads.values() if info.get("completed")]
+                    for info in finished:
+                        self.active_link_downloads.pop(info["link_id"], None)
+                for info in finished:
+                    try:
+                        tid = info["thread_id"]
+                        if tid in self.thread_info_map:
                             for f in info["new_files"]:
                                 if f not in self.thread_info_map[tid]["downloaded_files"]:
                                     self.thread_info_map[tid]["downloaded_files"].append(f)
-                            if self.thread_info_map[tid]["done_count"] == self.thread_info_map[tid]["total_links"]:
-                                processed_threads += 1
-                                self.process_thread_files(tid)
-                        except (KeyError, TypeError) as e:
-                            logging.warning(f"⚠️ Error processing finished download {lid}: {e}")
+                        # فشل + فيه fallback => يرجع للطابور باللينك البديل
+                        # نجح / مفيش بديل => ممكن يقفل الثريد ويشغّل process_thread_files
+                        self.scheduler.complete(info, info.get("success", False))
+                    except (KeyError, TypeError) as e:
+                        logging.warning(f"⚠️ Error processing finished download {info.get('link_id')}: {e}")
+
+                self._report_throughput()
 
                 # تحديث التقدم العام
+                processed_threads = self.processed_threads
                 if total_threads:
                     pct = int((processed_threads / total_threads) * 100)
                     self.status_update.emit(f"Overall Progress: {pct}% ({processed_threads}/{total_threads})")
 
                 # خلّصنا؟
-                if (
-                        processed_threads == total_threads
-                        and self.download_queue.empty()
-                        and not self.active_link_downloads
-                ):
+                if self.scheduler.is_idle() and not self.active_link_downloads:
                     break
 
                 while self.is_paused and not self._is_cancelled():
@@ -365,11 +459,15 @@ class DownloadWorker(QThread):
 
             # finish up
             if self._is_cancelled() or self.cancel_event.is_set():
+                self._finish_batch_report(False, "Operation cancelled.")
                 self.operation_complete.emit(False, "Operation cancelled.")
             else:
-                self.operation_complete.emit(True, f"Completed {processed_threads}/{total_threads} threads")
+                message = f"Completed {self.processed_threads}/{total_threads} threads"
+                self._finish_batch_report(True, message)
+                self.operation_complete.emit(True, message)
         except Exception as e:
             logging.error("DownloadWorker crashed: %s", e, exc_info=True)
+            self._finish_batch_report(False, str(e))
             self.operation_complete.emit(False, str(e))
         finally:
             self.thread_pool.shutdown(wait=False)
@@ -445,15 +543,11 @@ class DownloadWorker(QThread):
                         # Ignore if already cleared or invalid
                         pass
 
-                # Drain the download queue safely
-                queue_obj = getattr(self, "download_queue", None)
-                if queue_obj:
+                # Drop every queued link from the scheduler
+                scheduler = getattr(self, "scheduler", None)
+                if scheduler is not None:
                     try:
-                        while not queue_obj.empty():
-                            try:
-                                queue_obj.get_nowait()
-                            except Exception:
-                                break
+                        scheduler.cancel()
                     except Exception:
                         pass
         except Exception as e:
@@ -546,10 +640,10 @@ class DownloadWorker(QThread):
                 "thread_title": thread_title,
                 "downloaded_files": [],
                 "total_links": len(primary),
-                "done_count": 0,
             }
             thread_dir = Path(self._save_to_for(category_name, thread_id))
 
+            items = []
             for link in primary:
                 link_id = str(uuid.uuid4())
                 item = {
@@ -565,7 +659,8 @@ class DownloadWorker(QThread):
                     "new_files": [],
                 }
                 logging.debug("Queueing link: %s", link)
-                self.download_queue.put(item)
+                items.append(item)
+            self.scheduler.add_thread(thread_id, items)
 
     def _snapshot_selected_thread_jobs(self):
         """Capture selected thread metadata while on the GUI thread."""
@@ -625,10 +720,12 @@ class DownloadWorker(QThread):
             filename = filename[:77] + "..."
 
         # 🆔 Session-aware signal emission to prevent cross-talk
-        logging.debug(
-            f"📶 Emitting file_created signal (Session: {self.worker_session_id}, File: {filename})"
-        )
-        self.file_created.emit(link_id, filename)
+        # (promoted fallback links reuse the widget of the failed link)
+        if not info.get("failed_links"):
+            logging.debug(
+                f"📶 Emitting file_created signal (Session: {self.worker_session_id}, File: {filename})"
+            )
+            self.file_created.emit(link_id, filename)
 
         def download_job():
             logging.debug("Download job started for link_id=%s", link_id)
@@ -645,6 +742,7 @@ class DownloadWorker(QThread):
                     # 🛡️ Validate inputs
                     if not hasattr(self, "file_progress") or cur is None or tot is None:
                         return
+                    self.scheduler.record_progress(link_id, cur, tot)
 
                     # Handle enhanced callback format from improved downloaders
                     if len(args) > 0 and isinstance(args[0], (int, float)):
@@ -717,6 +815,7 @@ class DownloadWorker(QThread):
                 except Exception as e:
                     logging.debug(f"Error signal emission failed: {e}")
 
+                info["success"] = False
                 info["completed"] = True
                 return
 
@@ -759,58 +858,23 @@ class DownloadWorker(QThread):
                     download_dir=str(info["thread_dir"]),
                 )
 
-            # fallback attempts
-            if not success:
-                for alt in info.get("fallback_links", []):
-                    self.status_update.emit(f"Fallback attempt: {alt}")
-                    alt_dl = get_downloader_for(alt, self.bot)
-                    if alt_dl:
-                        try:
-                            sig = inspect.signature(alt_dl.download)
-                            if "download_info" in sig.parameters:
-                                fallback_success = alt_dl.download(
-                                    alt,
-                                    info["category_name"],
-                                    info["thread_id"],
-                                    info["thread_title"],
-                                    progress_callback=progress_cb,
-                                    download_dir=str(info["thread_dir"]),
-                                    download_info=info,
-                                )
-                            else:
-                                fallback_success = alt_dl.download(
-                                    alt,
-                                    info["category_name"],
-                                    info["thread_id"],
-                                    info["thread_title"],
-                                    progress_callback=progress_cb,
-                                    download_dir=str(info["thread_dir"]),
-                                )
-                        except Exception:
-                            # Basic fallback call
-                            fallback_success = alt_dl.download(
-                                alt,
-                                info["category_name"],
-                                info["thread_id"],
-                                info["thread_title"],
-                                progress_callback=progress_cb,
-                                download_dir=str(info["thread_dir"]),
-                            )
-
-                        if fallback_success:
-                            success = True
-                            break
-
             if not success:
-                err = f"Download failed => {url}"
-                logging.error(err)
+                info["success"] = False
+                fallback_links = info.get("fallback_links") or []
+                if fallback_links:
+                    # الـ scheduler هيرجّع اللينك البديل للطابور تحت حدود الهوست بتاعه
+                    logging.warning(f"⚠️ Download failed => {url}; queueing fallback")
+                    self.status_update.emit(f"Fallback attempt: {fallback_links[0]}")
+                else:
+                    err = f"Download failed => {url}"
+                    logging.error(err)
 
-                # 🛡️ Protected error signal
-                try:
-                    if hasattr(self, "download_error"):
-                        self.download_error.emit(info["row"], err)
-                except Exception as e:
-                    logging.debug(f"Error signal emission failed: {e}")
+                    # 🛡️ Protected error signal
+                    try:
+                        if hasattr(self, "download_error"):
+                            self.download_error.emit(info["row"], err)
+                    except Exception as e:
+                        logging.debug(f"Error signal emission failed: {e}")
 
                 info["completed"] = True
                 return
@@ -829,6 +893,7 @@ class DownloadWorker(QThread):
                     f"📁 Using {files_before_scan} files from downloader (JDownloader)"
                 )
 
+            info["success"] = True
             info["completed"] = True
 
             # 🛡️ Protected completion signals
@@ -1001,7 +1066,9 @@ class DownloadWorker(QThread):
                             "file_name": os.path.basename(main_file_str),
                             "file_path": main_file_str
                         })
-                        self.gui.save_process_threads_data()
+                        self.gui.save_process_threads_data(
+                            changed=[(info["category_name"], info["thread_title"])]
+                        )
 
             except Exception as update_e:
                 logging.warning(f"Failed to update GUI data: {update_e}")
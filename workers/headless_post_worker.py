@@ -2,19 +2,21 @@ import logging
 import time
 from typing import List, Dict, Any
 
-from PyQt5.QtCore import QThread, pyqtSignal, QMutexLocker
+from PyQt5.QtCore import QThread, pyqtSignal
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, WebDriverException
 
+from core.driver_pool import lease_bot
 from models.operation_status import OperationStatus, OpStage, OpType
 
 
 class HeadlessPostWorker(QThread):
     """Post replies using Selenium in a background thread.
 
-    The worker reuses a shared SeleniumBot instance and emits ``OperationStatus``
+    Each post runs on a browser session leased from the driver pool (or the
+    shared SeleniumBot behind a plain lock) and emits ``OperationStatus``
     updates so that the UI can reflect progress without blocking.  A hard
     minimum gap between posts is enforced to respect forum rate limits.
     """
@@ -70,7 +72,7 @@ class HeadlessPostWorker(QThread):
         if not thread_url and tid:
             thread_url = f"{self.bot.forum_url.rstrip('/')}/showthread.php?t={tid}"
         try:
-            with QMutexLocker(self.bot_lock):
+            with lease_bot(self.bot, self.bot_lock) as bot:
                 # START ---------------------------------------------------
                 self.progress_update.emit(
                     OperationStatus(
@@ -84,14 +86,14 @@ class HeadlessPostWorker(QThread):
                         host="forum",
                     )
                 )
-                if not self.bot.safe_navigate(thread_url):
+                if not bot.safe_navigate(thread_url):
                     result["error"] = "navigation failed"
                     return result
-                if hasattr(self.bot, "check_login_status") and not self.bot.check_login_status():
+                if hasattr(bot, "check_login_status") and not bot.check_login_status():
                     result["error"] = "not logged in"
                     return result
 
-                driver = self.bot.driver
+                driver = bot.driver
                 # Gather existing post ids for verification
                 existing_ids = {
                     e.get_attribute("id").split("_")[-1]
@@ -126,7 +128,7 @@ class HeadlessPostWorker(QThread):
                     EC.element_to_be_clickable((By.NAME, "sbutton"))
                 )
                 try:
-                    self.bot._remove_overlays()
+                    bot._remove_overlays()
                 except Exception:
                     pass
                 submit.click()
@@ -155,7 +157,7 @@ class HeadlessPostWorker(QThread):
 
                 try:
                     post_id = WebDriverWait(driver, 20).until(new_post_present)
-                    final_url = f"{self.bot.forum_url.rstrip('/')}/showthread.php?p={post_id}#post{post_id}"
+                    final_url = f"{bot.forum_url.rstrip('/')}/showthread.php?p={post_id}#post{post_id}"
                     result.update({"ok": True, "final_url": final_url})
                 except TimeoutException:
                     result["error"] = "verification timeout"
@@ -3,33 +3,19 @@ import logging
 import re
 import time
 import uuid
-from collections import defaultdict
+from collections import defaultdict, deque
 from typing import Dict, List, Optional, Tuple
 from urllib.parse import urlsplit, urlunsplit
 
 from PyQt5 import QtCore
 
 from integrations.jd_client import JDClient
+from utils.host_classifier import CONTAINER_HOSTS, canonical_host
 
 
 log = logging.getLogger(__name__)
 
 # ======= ثوابت وأدوات =======
-CONTAINER_HOSTS = {
-    "keeplinks.org",
-    "filecrypt.cc",
-    "linksafe.me",
-    "pastehere.xyz",
-}
-
-_HOST_ALIASES = {
-    "rg.to": "rapidgator.net",
-    "rapidgator": "rapidgator.net",
-    "nitroflare": "nitroflare.com",
-    "ddownload": "ddownload.com",
-    "turbobit": "turbobit.net",
-}
-
 RG_RE = re.compile(r"^/file/([A-Za-z0-9]+)")
 NF_RE = re.compile(r"^/view/([A-Za-z0-9]+)")
 DD_RE = re.compile(r"^/(?:f|file)/([A-Za-z0-9]+)")
@@ -38,10 +24,8 @@ KLP_RE = re.compile(r"/p(?:10)?/([a-fA-F0-9]+)")
 ROW_KEY_RE = re.compile(r"^row:(\d+)$", re.I)
 
 def _clean_host(host: Optional[str]) -> str:
-    h = (host or "").strip().lower()
-    if h.startswith("www."):
-        h = h[4:]
-    return _HOST_ALIASES.get(h, h)
+    # rg.to -> rapidgator.net, dl3.rapidgator.net -> rapidgator.net, www. stripped
+    return canonical_host(host or "")
 
 def is_container_host(host: str) -> bool:
     return _clean_host(host) in CONTAINER_HOSTS
@@ -112,6 +96,7 @@ class LinkCheckWorker(QtCore.QThread):
         single_host_mode: bool = True,
         auto_replace: bool = True,
         enable_jd_online_check: bool = False,
+        pipeline_size: int = 1,
     ):
         super().__init__()
         self.jd = jd_client
@@ -127,6 +112,8 @@ class LinkCheckWorker(QtCore.QThread):
         self.single_host_mode = bool(single_host_mode)
         self.auto_replace = bool(auto_replace)
         self.enable_jd_online_check = bool(enable_jd_online_check)
+        # كام كونتينر يتفك في JD في نفس الوقت (1 = بالتتابع زي الأول)
+        self.pipeline_size = max(1, int(pipeline_size or 1))
 
         self.host_priority: List[str] = []
         self.chosen_host: Optional[str] = None
@@ -297,6 +284,8 @@ class LinkCheckWorker(QtCore.QThread):
             row = self._url_to_row.get(canonical_url(item_url), -1)
             row_map[row].append(it)
 
+        # اختار لكل صف، وبعدين طلب واحد لكل خطوة (online check / query / remove) للدفعة كلها
+        picks: List[Tuple[int, List[dict], List[str]]] = []
         for row, row_items in row_map.items():
             host_map: Dict[str, List[dict]] = defaultdict(list)
             for it in row_items:
@@ -325,11 +314,15 @@ class LinkCheckWorker(QtCore.QThread):
                 self.session_id, row, sorted(host_map.keys()), picked, len(ids), len(row_items)
             )
 
-            self._safe_start_online_check(ids)
+            picks.append((row, selected, ids))
+
+        all_ids = [uid for _, _, ids in picks for uid in ids]
+        self._safe_start_online_check(all_ids)
 
-            # أبلغ الـGUI بالحالة (لأول عنصر مختار على الأقل)
-            now = self.jd.query_links() or []
-            imap = {it.get("uuid"): it for it in now}
+        # أبلغ الـGUI بالحالة (لأول عنصر مختار على الأقل)
+        now = (self.jd.query_links() or []) if picks else []
+        imap = {it.get("uuid"): it for it in now}
+        for row, selected, ids in picks:
             for uid in ids:
                 it = imap.get(uid) or next((x for x in selected if x.get("uuid") == uid), None)
                 if not it:
@@ -347,12 +340,214 @@ class LinkCheckWorker(QtCore.QThread):
                 log.debug("AVAIL RESULT | session=%s | row=%s | url=%s | status=%s | dur=%.3f",
                           self.session_id, row, canonical_url(item_url), status, time.monotonic() - self._start_time)
 
-            # نظّف المختارين
-            if ids:
+        # نظّف المختارين
+        if all_ids:
+            try:
+                self.jd.remove_links(all_ids)
+            except Exception as e:
+                log.warning("remove direct links failed: %s", e)
+
+    # ======= CONTAINER: اختيار الهوست وإبلاغ الـGUI =======
+    def _process_container(self, idx: int, container_url: str, items: List[dict]) -> List[str]:
+        """Pick a host among the *items* decrypted from *container_url* and report it.
+
+        Returns the JD link ids of all the container's items.
+        """
+        row_idx = self._url_to_row.get(canonical_url(container_url), -1)
+        row_prio, row_chosen, allowed_hosts = self._get_row_pref(row_idx)
+
+        # بِنَى خريطة هوست -> عناصر
+        host_map: Dict[str, List[dict]] = defaultdict(list)
+        for it in (items or []):
+            host_map[self._host_of(it)].append(it)
+
+        if not host_map:
+            log.debug(
+                "DECRYPT SUMMARY | session=%s | row=%s | host_map=EMPTY (likely cancel/empty container)",
+                self.session_id, row_idx
+            )
+            return []
+
+        # اختَر هوست — نستخدم allowed_hosts كتفضيل فقط
+        picked = self._pick_best_host(host_map, row_prio=row_prio, row_chosen=row_chosen)
+        if allowed_hosts and picked not in allowed_hosts:
+            for h in allowed_hosts:
+                if h in host_map:
+                    picked = h
+                    break
+
+        selected = host_map.get(picked, []) or []
+        selected_ids = [it.get("uuid") for it in selected if it.get("uuid")]
+        all_ids = [it.get("uuid") for its in host_map.values() for it in its if it.get("uuid")]
+
+        log.debug(
+            "DECRYPT SUMMARY | session=%s | row=%s | chosen=%s | hosts=%s | kept=%d",
+            self.session_id, row_idx, picked, sorted(host_map.keys()), len(selected_ids),
+        )
+
+        # أرسل حالة أول اختيار + الأشقاء
+        chosen_url = ""
+        chosen_status = "UNKNOWN"
+        siblings: List[dict] = []
+        if selected:
+            first = selected[0]
+            chosen_url = first.get("url") or first.get("contentURL") or first.get("pluginURL") or ""
+            chosen_status = self._availability(first)
+            for it in selected[1:]:
+                siblings.append({
+                    "url": it.get("url") or it.get("contentURL") or it.get("pluginURL") or "",
+                    "status": self._availability(it),
+                })
+
+            # ابعت ستاتس لأول اختيار
+            self.progress.emit({
+                "type": "status",
+                "session_id": self.session_id,
+                "row": row_idx,
+                "url": chosen_url,
+                "status": chosen_status,
+                "dur": time.monotonic() - self._start_time,
+            })
+            log.debug("AVAIL RESULT | session=%s | row=%s | url=%s | status=%s | dur=%.3f",
+                      self.session_id, row_idx, canonical_url(chosen_url), chosen_status,
+                      time.monotonic() - self._start_time)
+
+            # (الجديد) ابعت ستاتس برضه لكل الأشقاء، عشان يبان في اللوج ويتحفظوا في الكاش
+            for s in siblings:
+                su = (s.get("url") or "").strip()
+                ss = (s.get("status") or "UNKNOWN").upper()
+                if su:
+                    self.progress.emit({
+                        "type": "status",
+                        "session_id": self.session_id,
+                        "row": row_idx,
+                        "url": su,
+                        "status": ss,
+                        "dur": time.monotonic() - self._start_time,
+                    })
+
+        # تحضير الاستبدال التلقائي (يحترم الـACK)
+        group_id = ""
+        do_replace = self.auto_replace and bool(selected_ids)
+        if do_replace:
+            group_id = uuid.uuid4().hex
+            self.awaiting_ack[(self.session_id, group_id)] = {
+                "container_url": container_url,
+                "remove_ids": all_ids,  # هنمسح الكل بعد ما الـGUI تأكد
+                "row": row_idx,
+            }
+
+        # باكدج للـGUI (نوع=container)
+        self.progress.emit({
+            "type": "container",
+            "container_url": container_url,
+            "final_url": chosen_url,
+            "chosen": {"url": chosen_url, "status": chosen_status, "host": picked or ""},
+            "siblings": siblings,  # ← فيه كل الأجزاء
+            "replace": do_replace,  # ← لازم تبقى True علشان يحصل الاستبدال
+            "session_id": self.session_id,
+            "group_id": group_id,
+            "idx": idx,
+            "total_groups": len(self.container_urls),
+            "row": row_idx,
+        })
+
+        # Optional: شغل فحص للأUNKNOWN
+        unknown_ids = [it.get("uuid") for it in selected if self._availability(it) == "UNKNOWN" and it.get("uuid")]
+        self._safe_start_online_check(unknown_ids)
+
+        return all_ids
+
+    # ======= CONTAINERS: وضع الـpipeline =======
+    def _attribute_items(self, items: List[dict], packages: List[dict], jobs: Dict[str, dict]) -> Dict[str, List[dict]]:
+        """Group LinkGrabber *items* by the container job (package tag) they came from.
+
+        Items are matched through their ``packageUUID`` and the package name
+        the job was added with; items whose package was renamed fall back to
+        their ``containerURL``.
+        """
+        tag_of_pkg = {str(p.get("uuid")): p.get("name") for p in packages if p.get("name") in jobs}
+        tag_of_url = {job["canon"]: tag for tag, job in jobs.items()}
+        groups: Dict[str, List[dict]] = defaultdict(list)
+        for it in items:
+            tag = tag_of_pkg.get(str(it.get("packageUUID")))
+            if tag is None:
+                tag = tag_of_url.get(canonical_url(it.get("containerURL") or ""))
+            if tag is not None:
+                groups[tag].append(it)
+        return groups
+
+    def _run_containers_pipelined(self) -> bool:
+        """Decrypt up to ``pipeline_size`` containers at once; False if cancelled.
+
+        Each container is added as its own tagged package, one
+        ``query_links`` per tick serves all of them, and a container is
+        processed (and its links removed) as soon as its item count is stable,
+        while the next one takes its slot.
+        """
+        pending = deque(enumerate(self.container_urls, start=1))
+        jobs: Dict[str, dict] = {}
+        tag_prefix = f"lc-{self.session_id[:8]}-"
+        while pending or jobs:
+            if self.cancel_event.is_set():
+                log.debug("CANCEL REQUEST | session=%s", self.session_id)
                 try:
-                    self.jd.remove_links(ids)
-                except Exception as e:
-                    log.warning("remove direct links failed: %s", e)
+                    self.jd.stop_and_clear()
+                except Exception:
+                    pass
+                return False
+
+            added = 0
+            while pending and len(jobs) < self.pipeline_size:
+                idx, container_url = pending.popleft()
+                tag = f"{tag_prefix}{idx}"
+                # checkAvailability في الـaddLinks كفاية — من غير startOnlineCheck منفصل لكل كونتينر
+                if not self.jd.add_links_to_linkgrabber([container_url], start_check=False, package_name=tag):
+                    self.error.emit(f"Failed to add container to LinkGrabber: {container_url}")
+                    pending.clear()
+                    break
+                jobs[tag] = {
+                    "idx": idx,
+                    "url": container_url,
+                    "canon": canonical_url(container_url),
+                    "added": time.monotonic(),
+                    "count": None,
+                    "stable": 0,
+                    "items": [],
+                }
+                added += 1
+            if added:
+                log.debug("JD.ADD | direct=%d | containers=%d | in_flight=%d", 0, added, len(jobs))
+                time.sleep(1.5)
+            if not jobs:
+                break
+
+            groups = self._attribute_items(self.jd.query_links() or [], self.jd.query_link_packages() or [], jobs)
+            now = time.monotonic()
+            ready = []
+            for tag, job in jobs.items():
+                items = groups.get(tag, [])
+                job["stable"] = job["stable"] + 1 if len(items) == job["count"] else 0
+                job["count"] = len(items)
+                job["items"] = items
+                if (job["stable"] >= 2 and items) or now - job["added"] >= self.poll_timeout:
+                    ready.append(tag)
+
+            done_ids: List[str] = []
+            for tag in ready:
+                job = jobs.pop(tag)
+                log.debug("LinkCheckWorker: poll count=%d (stable=%d) | idx=%d", job["count"], job["stable"], job["idx"])
+                done_ids.extend(self._process_container(job["idx"], job["url"], job["items"]))
+            # نظّف الكونتينرات اللي خلصت بس (طلب واحد) — الباقيين لسه بيتفكّوا
+            if done_ids:
+                try:
+                    self.jd.remove_links(done_ids)
+                    log.debug("SESSION STEP CLEAR | session=%s | containers=%d", self.session_id, len(ready))
+                except Exception:
+                    pass
+            if jobs:
+                time.sleep(self.poll_interval)
+        return True
 
     # ======= RUN =======
     def run(self):
@@ -479,8 +674,13 @@ class LinkCheckWorker(QtCore.QThread):
             except Exception:
                 pass
 
-        # ======= (2) CONTAINERS — بالتتابع بدون تضارب =======
-        for idx, container_url in enumerate(self.container_urls, start=1):
+        # ======= (2) CONTAINERS — pipeline لو مفعّل، وإلا بالتتابع بدون تضارب =======
+        pipelined = self.pipeline_size > 1 and len(self.container_urls) > 1
+        if pipelined and not self._run_containers_pipelined():
+            self.finished.emit({"session_id": self.session_id})
+            return
+
+        for idx, container_url in enumerate([] if pipelined else self.container_urls, start=1):
             if self.cancel_event.is_set():
                 log.debug("CANCEL REQUEST | session=%s", self.session_id)
                 try:
@@ -507,115 +707,7 @@ class LinkCheckWorker(QtCore.QThread):
             items = poll_until_ready(expected_min_items=1)
 
             # في التتابع، كل العناصر اللي رجعت دلوقتي تخص الكونتينر ده
-            row_idx = self._url_to_row.get(canonical_url(container_url), -1)
-            row_prio, row_chosen, allowed_hosts = self._get_row_pref(row_idx)
-
-            # بِنَى خريطة هوست -> عناصر
-            host_map: Dict[str, List[dict]] = defaultdict(list)
-            for it in (items or []):
-                host_map[self._host_of(it)].append(it)
-
-            if not host_map:
-                log.debug(
-                    "DECRYPT SUMMARY | session=%s | row=%s | host_map=EMPTY (likely cancel/empty container)",
-                    self.session_id, row_idx
-                )
-                try:
-                    self.jd.remove_all_from_linkgrabber()
-                except Exception:
-                    pass
-                continue
-
-            # اختَر هوست — نستخدم allowed_hosts كتفضيل فقط
-            picked = self._pick_best_host(host_map, row_prio=row_prio, row_chosen=row_chosen)
-            if allowed_hosts and picked not in allowed_hosts:
-                for h in allowed_hosts:
-                    if h in host_map:
-                        picked = h
-                        break
-
-            selected = host_map.get(picked, []) or []
-            selected_ids = [it.get("uuid") for it in selected if it.get("uuid")]
-            all_ids = [it.get("uuid") for its in host_map.values() for it in its if it.get("uuid")]
-
-            log.debug(
-                "DECRYPT SUMMARY | session=%s | row=%s | chosen=%s | hosts=%s | kept=%d",
-                self.session_id, row_idx, picked, sorted(host_map.keys()), len(selected_ids),
-            )
-
-            # أرسل حالة أول اختيار + الأشقاء
-            chosen_url = ""
-            chosen_status = "UNKNOWN"
-            # أرسل حالة أول اختيار + الأشقاء
-            chosen_url = ""
-            chosen_status = "UNKNOWN"
-            siblings: List[dict] = []
-            if selected:
-                first = selected[0]
-                chosen_url = first.get("url") or first.get("contentURL") or first.get("pluginURL") or ""
-                chosen_status = self._availability(first)
-                for it in selected[1:]:
-                    siblings.append({
-                        "url": it.get("url") or it.get("contentURL") or it.get("pluginURL") or "",
-                        "status": self._availability(it),
-                    })
-
-                # ابعت ستاتس لأول اختيار
-                self.progress.emit({
-                    "type": "status",
-                    "session_id": self.session_id,
-                    "row": row_idx,
-                    "url": chosen_url,
-                    "status": chosen_status,
-                    "dur": time.monotonic() - self._start_time,
-                })
-                log.debug("AVAIL RESULT | session=%s | row=%s | url=%s | status=%s | dur=%.3f",
-                          self.session_id, row_idx, canonical_url(chosen_url), chosen_status,
-                          time.monotonic() - self._start_time)
-
-                # (الجديد) ابعت ستاتس برضه لكل الأشقاء، عشان يبان في اللوج ويتحفظوا في الكاش
-                for s in siblings:
-                    su = (s.get("url") or "").strip()
-                    ss = (s.get("status") or "UNKNOWN").upper()
-                    if su:
-                        self.progress.emit({
-                            "type": "status",
-                            "session_id": self.session_id,
-                            "row": row_idx,
-                            "url": su,
-                            "status": ss,
-                            "dur": time.monotonic() - self._start_time,
-                        })
-
-            # تحضير الاستبدال التلقائي (يحترم الـACK)
-            group_id = ""
-            do_replace = self.auto_replace and bool(selected_ids)
-            if do_replace:
-                group_id = uuid.uuid4().hex
-                self.awaiting_ack[(self.session_id, group_id)] = {
-                    "container_url": container_url,
-                    "remove_ids": all_ids,  # هنمسح الكل بعد ما الـGUI تأكد
-                    "row": row_idx,
-                }
-
-            # باكدج للـGUI (نوع=container)
-            self.progress.emit({
-                "type": "container",
-                "container_url": container_url,
-                "final_url": chosen_url,
-                "chosen": {"url": chosen_url, "status": chosen_status, "host": picked or ""},
-                "siblings": siblings,  # ← فيه كل الأجزاء
-                "replace": do_replace,  # ← لازم تبقى True علشان يحصل الاستبدال
-                "session_id": self.session_id,
-                "group_id": group_id,
-                "idx": idx,
-                "total_groups": len(self.container_urls),
-                "row": row_idx,
-            })
-
-            # Optional: شغل فحص للأUNKNOWN
-            unknown_ids = [it.get("uuid") for it in selected if self._availability(it) == "UNKNOWN" and it.get("uuid")]
-            self._safe_start_online_check(unknown_ids)
+            self._process_container(idx, container_url, items)
 
             # في نهاية الكونتينر ده: نظّف كل حاجة قبل ما تنتقل للي بعده
             try:
@@ -624,17 +716,15 @@ class LinkCheckWorker(QtCore.QThread):
             except Exception:
                 pass
 
-        # Auto cleanup لأي pending ACKs (لو الـGUI ما بعتتش ACK لأي سبب)
-        for key, info in list(self.awaiting_ack.items()):
-            ids = info.get("remove_ids") or []
-            if not ids:
-                continue
+        # Auto cleanup لأي pending ACKs (لو الـGUI ما بعتتش ACK لأي سبب) — طلب remove واحد للكل
+        pending_ids = [uid for info in self.awaiting_ack.values() for uid in (info.get("remove_ids") or [])]
+        if pending_ids:
             try:
-                rc = self.jd.remove_links(ids)
-                log.debug("AUTO CLEANUP | session=%s | row=%s | removed=%d | rc=%s",
-                          self.session_id, info.get("row"), len(ids), rc if rc is not None else 200)
+                rc = self.jd.remove_links(pending_ids)
+                log.debug("AUTO CLEANUP | session=%s | groups=%d | removed=%d | rc=%s",
+                          self.session_id, len(self.awaiting_ack), len(pending_ids), rc if rc is not None else 200)
             except Exception as e:
-                log.warning("AUTO CLEANUP failed for container=%s: %s", info.get("container_url"), e)
+                log.warning("AUTO CLEANUP failed for %d containers: %s", len(self.awaiting_ack), e)
         self.awaiting_ack.clear()
 
         # Final clear
@@ -1,5 +1,6 @@
 import logging
-from PyQt5.QtCore import QMutexLocker, pyqtSignal
+from PyQt5.QtCore import pyqtSignal
+from core.driver_pool import lease_bot
 from .worker_thread import WorkerThread
 from datetime import date, timedelta
 
@@ -84,7 +85,7 @@ class MegaThreadsWorkerThread(WorkerThread):
             logging.info(f"❌ Tracking cancelled for '{self.category_name}', skipping track_once")
             return
             
-        with QMutexLocker(self.bot_lock):
+        with lease_bot(self.bot, self.bot_lock) as bot:
             url = self.category_manager.get_category_url(self.category_name)
             if not url:
                 logging.warning(f"⚠️ No URL found for category '{self.category_name}'")
@@ -104,7 +105,7 @@ class MegaThreadsWorkerThread(WorkerThread):
             logging.info(f"🌐 Navigating to megathread category: {url} with filters: {df_list}, pages: {self.page_from}-{self.page_to}")
             
             # ننادي مباشرة على دالة الميجاثريدز اللي بتعمل pagination
-            new_versions = self.bot.navigate_to_megathread_category(
+            new_versions = bot.navigate_to_megathread_category(
                 url,
                 df_list,
                 self.page_from,
@@ -1,6 +1,7 @@
 import logging
-from PyQt5.QtCore import QThread, pyqtSignal, QMutexLocker
+from PyQt5.QtCore import QThread, pyqtSignal
 
+from core.driver_pool import lease_bot
 from models.operation_status import OperationStatus, OpStage, OpType
 import templab_manager
 
@@ -94,8 +95,8 @@ class ProceedTemplateWorker(QThread):
             status.progress = 50
             self.progress_update.emit(status)
             if self.bot:
-                with QMutexLocker(self.bot_lock):
-                    processed = self.bot.process_images_in_content(bbcode_filled)
+                with lease_bot(self.bot, self.bot_lock) as bot:
+                    processed = bot.process_images_in_content(bbcode_filled)
                 bbcode_filled = processed
             else:
                 logging.warning("⚠️ bot is not available.")
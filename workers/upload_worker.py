@@ -2,12 +2,14 @@ import logging
 import os
 import queue
 import time
+from concurrent.futures import Future, TimeoutError as FutureTimeout
 from enum import Enum
 from pathlib import Path
 from threading import Lock
-from typing import Any, List, Optional, Tuple
+from typing import Any, List, Optional, Tuple, Union
 
 from PyQt5.QtCore import QThread, QThreadPool, QRunnable, pyqtSignal, pyqtSlot
+from core.hash_cache import get_hash_cache
 from integrations.jd_client import hard_cancel
 from models.operation_status import OperationStatus, OpStage, OpType
 from uploaders.ddownload_upload_handler import DDownloadUploadHandler
@@ -302,6 +304,11 @@ class UploadWorker(QThread):
 
             self._check_control()
 
+            # Rapidgator needs each file's MD5; hash once in the background so
+            # the main and backup accounts (and retries) share the digest.
+            if any(h.startswith("rapidgator") for h in self.hosts):
+                get_hash_cache().prefetch(self.files)
+
             # إطلاق رفع كل مستضيف بالتوازي بدون إنشاء صف "Batch" في جدول الحالة.
             # سيتم تحديث جدول الحالة فقط لكل مستضيف على حدة أثناء رفع الملفات.
             host_indices = list(range(len(self.hosts)))
@@ -357,20 +364,45 @@ class UploadWorker(QThread):
                 self.upload_complete.emit(self.row, {"error": msg})
 
     def _upload_host_all(self, host_idx: int) -> str:
-        urls = []
-        for f in self.files:
-            self._check_control()
-            u = self._upload_single(host_idx, f)
-            if u is None:
-                return "failed"
-            urls.append(u)
+        urls: List[Any] = []
+        try:
+            for f in self.files:
+                self._check_control()
+                u = self._upload_single(host_idx, f)
+                if u is None:
+                    return "failed"
+                urls.append(u)
+            # Rapidgator returns a future while the server processes the
+            # file; collect those URLs after every transfer has started.
+            for pos, (f, u) in enumerate(zip(self.files, urls)):
+                if isinstance(u, Future):
+                    u = self._await_processing(host_idx, f, u)
+                    if u is None:
+                        return "failed"
+                    urls[pos] = u
+        except BaseException:
+            for u in urls:
+                if isinstance(u, Future):
+                    u.cancel()
+            raise
         self.upload_results[host_idx]["urls"] = urls
         return "success"
 
+    def _await_processing(self, host_idx: int, file_path: Path, future: Future) -> Optional[str]:
+        """Wait for a Rapidgator URL future while honouring pause/cancel."""
+        while True:
+            self._check_control()
+            try:
+                url = future.result(timeout=0.5)
+                break
+            except FutureTimeout:
+                continue
+        return self._report_file_result(host_idx, file_path, url)
+
     # ---------------------------------------------------------------
     # 2) method  _upload_single
     # ---------------------------------------------------------------
-    def _upload_single(self, host_idx: int, file_path: Path) -> Optional[str]:
+    def _upload_single(self, host_idx: int, file_path: Path) -> Union[str, Future, None]:
         host = self.hosts[host_idx]
 
         # ─── Handler لكل مستضيف ─────────────────────────────────────
@@ -402,7 +434,7 @@ class UploadWorker(QThread):
                     password=password,
                     token=token,
                 )
-                upload_func = lambda: handler.upload(progress_cb=cb)
+                upload_func = lambda: handler.start_upload(progress_cb=cb)
             except Exception as e:
                 logging.error(
                     f"Failed to initialize Rapidgator handler: {e}", exc_info=True
@@ -453,28 +485,16 @@ class UploadWorker(QThread):
             url = upload_func()
             self._check_control()
 
-            if not url:
-                status = OperationStatus(
-                    section=self.section,
-                    item=name,
-                    op_type=OpType.UPLOAD,
-                    stage=OpStage.ERROR,
-                    message=f"Failed {name}",
-                    host=host,
-                    thread_id=self.thread_id,
-                )
-                self.progress_update.emit(status)
-                self.host_progress.emit(
-                    self.row, host_idx, 0, f"Failed {name}", 0, size
-                )
-                # Don't emit FINISHED status here - this is just one file failing
-                # The overall upload operation should continue
-                return None
+            if isinstance(url, Future):
+                if not url.done():
+                    # Transfer finished; Rapidgator is still processing.
+                    self.host_progress.emit(
+                        self.row, host_idx, 100, f"Processing {name}", size, size
+                    )
+                    return url
+                url = url.result()
 
-            self.host_progress.emit(
-                self.row, host_idx, 100, f"Complete {name}", size, size
-            )
-            return url
+            return self._report_file_result(host_idx, file_path, url)
 
         except Exception as e:
             msg = str(e)
@@ -494,6 +514,33 @@ class UploadWorker(QThread):
             logging.error("UploadWorker: خطأ في رفع %s: %s", host, msg, exc_info=True)
             return None
 
+    def _report_file_result(self, host_idx: int, file_path: Path, url: Optional[str]) -> Optional[str]:
+        host = self.hosts[host_idx]
+        name = file_path.name
+        size = file_path.stat().st_size
+        if not url:
+            status = OperationStatus(
+                section=self.section,
+                item=name,
+                op_type=OpType.UPLOAD,
+                stage=OpStage.ERROR,
+                message=f"Failed {name}",
+                host=host,
+                thread_id=self.thread_id,
+            )
+            self.progress_update.emit(status)
+            self.host_progress.emit(
+                self.row, host_idx, 0, f"Failed {name}", 0, size
+            )
+            # Don't emit FINISHED status here - this is just one file failing
+            # The overall upload operation should continue
+            return None
+
+        self.host_progress.emit(
+            self.row, host_idx, 100, f"Complete {name}", size, size
+        )
+        return url
+
     def _prepare_final_urls(self) -> dict:
         """Combine per-host URLs into one dict and optionally add Keeplinks."""
         self._check_control()
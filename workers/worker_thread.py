@@ -5,6 +5,7 @@ import logging
 from PyQt5.QtCore import QThread, pyqtSignal
 from threading import Lock
 
+from core.driver_pool import DriverPoolTimeout, lease_bot
 from models.operation_status import OperationStatus, OpStage, OpType
 
 class WorkerThread(QThread):
@@ -153,105 +154,92 @@ class WorkerThread(QThread):
                 logging.info(f"🛑 WorkerThread for '{self.category_name}' stopping, aborting navigation")
                 return []
 
-        lock_acquired = False
         threads = {}
 
         try:
-            logging.info(f"🔒 Attempting to acquire bot_lock for '{self.category_name}'")
-            lock_acquired = self.bot_lock.tryLock(10000)
-            if not lock_acquired:
-                logging.error(
-                    f"❌ Failed to acquire bot_lock within 10 seconds for '{self.category_name}' - aborting"
-                )
-                self.progress_update.emit(
-                    OperationStatus(
-                        section=self.section,
-                        item=self.category_name,
-                        op_type=OpType.POST,
-                        stage=OpStage.ERROR,
-                        message="driver busy",
-                    )
-                )
-                return {}
+            logging.info(f"🔒 Waiting for a browser session for '{self.category_name}'")
+            with lease_bot(self.bot, self.bot_lock) as bot:
+                logging.info(f"✅ Leased a browser session for '{self.category_name}'")
 
-            logging.info(f"✅ Successfully acquired bot_lock for '{self.category_name}'")
+                total_pages = page_to - page_from + 1
+                for idx, page in enumerate(range(page_from, page_to + 1), 1):
+                    with self.control_lock:
+                        if not self._is_running or self.is_cancelled:
+                            logging.info(
+                                f"🛑 WorkerThread for '{self.category_name}' stopping after leasing a browser session"
+                            )
+                            break
+                    try:
+                        # Keep track of discovered threads for progress updates
+                        discovered_count = [0]  # Use list to allow modification in nested function
+
+                        # Create live discovery callback for instant process threads display
+                        def live_discovery_callback(thread_id, thread_data):
+                            # Only emit for live UI updates, don't count here to avoid double counting
+                            self.thread_discovered.emit(self.category_name, thread_id, thread_data)
+
+                            # Track discovered count for progress updates
+                            discovered_count[0] += 1
+
+                            # Update progress every few threads
+                            if discovered_count[0] % 3 == 0 or discovered_count[0] == 1:
+                                progress_percent = min(20 + int(discovered_count[0] * 60 / 100), 85)
+                                self.progress_update.emit(
+                                    OperationStatus(
+                                        section=self.section,
+                                        item=self.category_name,
+                                        op_type=OpType.POST,
+                                        stage=OpStage.RUNNING,
+                                        message=f"Found {discovered_count[0]} threads...",
+                                        progress=progress_percent,
+                                    )
+                                )
 
-            total_pages = page_to - page_from + 1
-            for idx, page in enumerate(range(page_from, page_to + 1), 1):
-                with self.control_lock:
-                    if not self._is_running or self.is_cancelled:
-                        logging.info(
-                            f"🛑 WorkerThread for '{self.category_name}' stopping after acquiring bot lock"
+                        success = bot.navigate_to_url(
+                            base_url,
+                            df_param,
+                            page,
+                            page,
+                            thread_discovery_callback=live_discovery_callback
                         )
-                        break
-                try:
-                    # Keep track of discovered threads for progress updates
-                    discovered_count = [0]  # Use list to allow modification in nested function
-
-                    # Create live discovery callback for instant process threads display
-                    def live_discovery_callback(thread_id, thread_data):
-                        # Only emit for live UI updates, don't count here to avoid double counting
-                        self.thread_discovered.emit(self.category_name, thread_id, thread_data)
-
-                        # Track discovered count for progress updates
-                        discovered_count[0] += 1
-
-                        # Update progress every few threads
-                        if discovered_count[0] % 3 == 0 or discovered_count[0] == 1:
-                            progress_percent = min(20 + int(discovered_count[0] * 60 / 100), 85)
-                            self.progress_update.emit(
-                                OperationStatus(
-                                    section=self.section,
-                                    item=self.category_name,
-                                    op_type=OpType.POST,
-                                    stage=OpStage.RUNNING,
-                                    message=f"Found {discovered_count[0]} threads...",
-                                    progress=progress_percent,
-                                )
+                        if success:
+                            threads.update(bot.extracted_threads.copy())
+                    except Exception as e:
+                        logging.error(
+                            f"Exception during navigating to URL: {e}", exc_info=True
+                        )
+                        self.progress_update.emit(
+                            OperationStatus(
+                                section=self.section,
+                                item=self.category_name,
+                                op_type=OpType.POST,
+                                stage=OpStage.ERROR,
+                                message=str(e)[:80],
                             )
-
-                    success = self.bot.navigate_to_url(
-                        base_url,
-                        df_param,
-                        page,
-                        page,
-                        thread_discovery_callback=live_discovery_callback
-                    )
-                    if success:
-                        threads.update(self.bot.extracted_threads.copy())
-                except Exception as e:
-                    logging.error(
-                        f"Exception during navigating to URL: {e}", exc_info=True
-                    )
+                        )
+                        return {}
                     self.progress_update.emit(
                         OperationStatus(
                             section=self.section,
                             item=self.category_name,
                             op_type=OpType.POST,
-                            stage=OpStage.ERROR,
-                            message=str(e)[:80],
+                            stage=OpStage.RUNNING,
+                            message=f"Scanning p {idx}/{total_pages}",
+                            progress=int(idx * 100 / total_pages),
                         )
                     )
-                    return {}
-                self.progress_update.emit(
-                    OperationStatus(
-                        section=self.section,
-                        item=self.category_name,
-                        op_type=OpType.POST,
-                        stage=OpStage.RUNNING,
-                        message=f"Scanning p {idx}/{total_pages}",
-                        progress=int(idx * 100 / total_pages),
-                    )
+        except DriverPoolTimeout as e:
+            logging.error(f"❌ No browser session for '{self.category_name}' - aborting: {e}")
+            self.progress_update.emit(
+                OperationStatus(
+                    section=self.section,
+                    item=self.category_name,
+                    op_type=OpType.POST,
+                    stage=OpStage.ERROR,
+                    message="driver busy",
                 )
-        finally:
-            if lock_acquired:
-                try:
-                    self.bot_lock.unlock()
-                    logging.info(f"🔓 Released bot_lock for '{self.category_name}'")
-                except Exception as unlock_error:
-                    logging.warning(
-                        f"⚠️ Failed to release bot_lock for '{self.category_name}': {unlock_error}"
-                    )
+            )
+            return {}
 
         return threads
 
@@ -266,44 +254,9 @@ class WorkerThread(QThread):
             logging.info(f"❌ Tracking cancelled for '{self.category_name}', skipping track_once")
             return
         
-        # 🆘 PRE-TRACKING WEBDRIVER CHECK: Verify WebDriver is responsive
-        logging.info(f"🆘 Checking WebDriver responsiveness for '{self.category_name}'")
-        
-        # ⏱️ TIMEOUT PROTECTION: Set max time for WebDriver check
-        import signal
-        
-        def timeout_handler(signum, frame):
-            raise TimeoutError(f"WebDriver check timed out for '{self.category_name}'")
-        
-        try:
-            # Set 30-second timeout for WebDriver operations
-            signal.signal(signal.SIGALRM, timeout_handler) if hasattr(signal, 'SIGALRM') else None
-            signal.alarm(30) if hasattr(signal, 'alarm') else None
-            
-            if hasattr(self.bot, 'driver') and self.bot.driver:
-                # Quick responsiveness test
-                current_url = self.bot.driver.current_url
-                if current_url:
-                    logging.info(f"✅ WebDriver responsive for '{self.category_name}' (at: {current_url[:50]}...)")
-                else:
-                    logging.warning(f"⚠️ WebDriver returned empty URL for '{self.category_name}' - may be stuck")
-            else:
-                logging.error(f"❌ WebDriver not available for '{self.category_name}' - cannot proceed")
-                return
-                
-        except TimeoutError as timeout_error:
-            logging.error(f"⏱️ WebDriver check timed out for '{self.category_name}': {timeout_error}")
-            logging.warning(f"⚠️ Skipping tracking cycle due to WebDriver timeout for '{self.category_name}'")
-            return
-        except Exception as driver_error:
-            logging.error(f"❌ WebDriver health check failed for '{self.category_name}': {driver_error}")
-            logging.warning(f"⚠️ Skipping tracking cycle due to WebDriver issues for '{self.category_name}'")
-            return
-        finally:
-            # Always clear the alarm
-            if hasattr(signal, 'alarm'):
-                signal.alarm(0)
-        
+        # The browser session is health-checked (and recycled if it crashed)
+        # when navigate_to_category leases it from the driver pool
+
         logging.info(
             f"🌐 Navigating to category '{self.category_name}' with filters: {self.date_filters}, pages: {self.page_from}-{self.page_to}"
         )
@@ -544,20 +497,56 @@ class MegaThreadsWorkerThread(QThread):
             )
             self.finished.emit(self.category_name)
 
+    def _with_session(self, task):
+        """Run ``task(bot)`` on a leased browser session ("driver busy" if none frees up)."""
+        try:
+            logging.info(
+                f"🔒 Waiting for a browser session for megathreads '{self.category_name}'"
+            )
+            with lease_bot(self.bot, self.bot_lock) as bot:
+                task(bot)
+        except DriverPoolTimeout as e:
+            logging.error(
+                f"❌ No browser session for megathreads '{self.category_name}': {e}"
+            )
+            self.progress_update.emit(
+                OperationStatus(
+                    section=self.section,
+                    item=self.category_name,
+                    op_type=OpType.POST,
+                    stage=OpStage.ERROR,
+                    message="driver busy",
+                )
+            )
+
     def track_once(self):
         logging.info(
             f"MegaThreadsWorkerThread: Tracking once for '{self.category_name}'."
         )
+        self._with_session(self._track_once)
 
-        lock_acquired = False
-        try:
-            logging.info(
-                f"🔒 Attempting to acquire bot_lock for megathreads '{self.category_name}'"
+    def _track_once(self, bot):
+        url = self.category_manager.get_category_url(self.category_name)
+        if not url:
+            logging.warning(
+                f"No URL for megathreads '{self.category_name}'"
             )
-            lock_acquired = self.bot_lock.tryLock(10000)
-            if not lock_acquired:
+            return
+        total_pages = self.page_to - self.page_from + 1
+        all_versions = {}
+        for idx, page in enumerate(
+            range(self.page_from, self.page_to + 1), 1
+        ):
+            try:
+                new_versions = bot.navigate_to_megathread_category(
+                    url, self.date_filters, page, page
+                )
+                if isinstance(new_versions, dict):
+                    all_versions.update(new_versions)
+            except Exception as e:
                 logging.error(
-                    f"❌ Failed to acquire bot_lock for megathreads '{self.category_name}'"
+                    f"Error in navigate_to_megathread_category: {e}",
+                    exc_info=True,
                 )
                 self.progress_update.emit(
                     OperationStatus(
@@ -565,224 +554,127 @@ class MegaThreadsWorkerThread(QThread):
                         item=self.category_name,
                         op_type=OpType.POST,
                         stage=OpStage.ERROR,
-                        message="driver busy",
+                        message=str(e)[:80],
                     )
                 )
                 return
-
-            # 🔍 HEALTH CHECK: Verify WebDriver is responsive before navigation
-            logging.info(
-                f"🔍 Checking WebDriver health before megathreads tracking '{self.category_name}'"
-            )
-            try:
-                current_url = (
-                    self.bot.driver.current_url
-                    if hasattr(self.bot, 'driver') and self.bot.driver
-                    else None
-                )
-                if current_url:
-                    logging.info(
-                        f"✅ WebDriver is responsive for megathreads '{self.category_name}' (current URL: {current_url[:50]}...)"
-                    )
-                else:
-                    logging.warning(
-                        f"⚠️ WebDriver may not be initialized for megathreads '{self.category_name}'"
-                    )
-            except Exception as driver_check_error:
-                logging.error(
-                    f"❌ WebDriver health check failed for megathreads '{self.category_name}': {driver_check_error}"
-                )
-
-            url = self.category_manager.get_category_url(self.category_name)
-            if not url:
-                logging.warning(
-                    f"No URL for megathreads '{self.category_name}'"
+            self.progress_update.emit(
+                OperationStatus(
+                    section=self.section,
+                    item=self.category_name,
+                    op_type=OpType.POST,
+                    stage=OpStage.RUNNING,
+                    message=f"Scanning p {idx}/{total_pages}",
+                    progress=int(idx * 100 / total_pages),
                 )
-                return
-            total_pages = self.page_to - self.page_from + 1
-            all_versions = {}
-            for idx, page in enumerate(
-                range(self.page_from, self.page_to + 1), 1
-            ):
-                try:
-                    new_versions = self.bot.navigate_to_megathread_category(
-                        url, self.date_filters, page, page
-                    )
-                    if isinstance(new_versions, dict):
-                        all_versions.update(new_versions)
-                except Exception as e:
-                    logging.error(
-                        f"Error in navigate_to_megathread_category: {e}",
-                        exc_info=True,
-                    )
-                    self.progress_update.emit(
-                        OperationStatus(
-                            section=self.section,
-                            item=self.category_name,
-                            op_type=OpType.POST,
-                            stage=OpStage.ERROR,
-                            message=str(e)[:80],
-                        )
-                    )
-                    return
+            )
+        if all_versions:
+            for title, info in all_versions.items():
+                label = f"{self.category_name} — {info.get('version_title', title)}"
+                url = info.get("thread_url", "")
                 self.progress_update.emit(
                     OperationStatus(
                         section=self.section,
-                        item=self.category_name,
+                        item=label,
                         op_type=OpType.POST,
                         stage=OpStage.RUNNING,
-                        message=f"Scanning p {idx}/{total_pages}",
-                        progress=int(idx * 100 / total_pages),
+                        message="Found",
+                        progress=0,
                     )
                 )
-            if all_versions:
-                for title, info in all_versions.items():
-                    label = f"{self.category_name} — {info.get('version_title', title)}"
-                    url = info.get("thread_url", "")
-                    self.progress_update.emit(
-                        OperationStatus(
-                            section=self.section,
-                            item=label,
-                            op_type=OpType.POST,
-                            stage=OpStage.RUNNING,
-                            message="Found",
-                            progress=0,
-                        )
-                    )
-                    self.progress_update.emit(
-                        OperationStatus(
-                            section=self.section,
-                            item=label,
-                            op_type=OpType.POST,
-                            stage=OpStage.FINISHED,
-                            message="Done",
-                            progress=100,
-                            final_url=url,
-                        )
+                self.progress_update.emit(
+                    OperationStatus(
+                        section=self.section,
+                        item=label,
+                        op_type=OpType.POST,
+                        stage=OpStage.FINISHED,
+                        message="Done",
+                        progress=100,
+                        final_url=url,
                     )
-                self.update_megathreads.emit(self.category_name, all_versions)
-                summary = f"{len(all_versions)} new / 0 updated / 0 skipped"
-            else:
-                summary = "0 new / 0 updated / 0 skipped"
-            self.progress_update.emit(
-                OperationStatus(
-                    section=self.section,
-                    item=self.category_name,
-                    op_type=OpType.POST,
-                    stage=OpStage.FINISHED,
-                    message=summary,
-                    progress=100,
                 )
+            self.update_megathreads.emit(self.category_name, all_versions)
+            summary = f"{len(all_versions)} new / 0 updated / 0 skipped"
+        else:
+            summary = "0 new / 0 updated / 0 skipped"
+        self.progress_update.emit(
+            OperationStatus(
+                section=self.section,
+                item=self.category_name,
+                op_type=OpType.POST,
+                stage=OpStage.FINISHED,
+                message=summary,
+                progress=100,
             )
-        finally:
-            if lock_acquired:
-                try:
-                    self.bot_lock.unlock()
-                    logging.info(
-                        f"🔓 Released bot_lock for megathreads '{self.category_name}'"
-                    )
-                except Exception as unlock_error:
-                    logging.warning(
-                        f"⚠️ Failed to release bot_lock for megathreads '{self.category_name}': {unlock_error}"
-                    )
+        )
 
     def keep_tracking(self):
         logging.info(
             f"MegaThreadsWorkerThread: Keep tracking '{self.category_name}'."
         )
+        self._with_session(self._keep_tracking)
 
-        lock_acquired = False
+    def _keep_tracking(self, bot):
+        key = f"Megathreads_{self.category_name}"
+        existing = self.gui.megathreads_process_threads.get(key, {})
+        if not isinstance(existing, dict):
+            existing = {}
         try:
-            logging.info(
-                f"🔒 Attempting to acquire bot_lock for megathreads '{self.category_name}'"
+            updates = bot.check_megathreads_for_updates(existing)
+        except Exception as e:
+            logging.error(
+                f"Error in check_megathreads_for_updates: {e}",
+                exc_info=True,
             )
-            lock_acquired = self.bot_lock.tryLock(10000)
-            if not lock_acquired:
-                logging.error(
-                    f"❌ Failed to acquire bot_lock for megathreads '{self.category_name}'"
+            self.progress_update.emit(
+                OperationStatus(
+                    section=self.section,
+                    item=self.category_name,
+                    op_type=OpType.POST,
+                    stage=OpStage.ERROR,
+                    message=str(e)[:80],
                 )
+            )
+            return
+        if isinstance(updates, dict) and updates:
+            for title, info in updates.items():
+                label = f"{self.category_name} — {info.get('version_title', title)}"
+                url = info.get("thread_url", "")
                 self.progress_update.emit(
                     OperationStatus(
                         section=self.section,
-                        item=self.category_name,
+                        item=label,
                         op_type=OpType.POST,
-                        stage=OpStage.ERROR,
-                        message="driver busy",
+                        stage=OpStage.RUNNING,
+                        message="Found",
+                        progress=0,
                     )
                 )
-                return
-
-            key = f"Megathreads_{self.category_name}"
-            existing = self.gui.megathreads_process_threads.get(key, {})
-            if not isinstance(existing, dict):
-                existing = {}
-            try:
-                updates = self.bot.check_megathreads_for_updates(existing)
-            except Exception as e:
-                logging.error(
-                    f"Error in check_megathreads_for_updates: {e}",
-                    exc_info=True,
-                )
                 self.progress_update.emit(
                     OperationStatus(
                         section=self.section,
-                        item=self.category_name,
+                        item=label,
                         op_type=OpType.POST,
-                        stage=OpStage.ERROR,
-                        message=str(e)[:80],
-                    )
-                )
-                return
-            if isinstance(updates, dict) and updates:
-                for title, info in updates.items():
-                    label = f"{self.category_name} — {info.get('version_title', title)}"
-                    url = info.get("thread_url", "")
-                    self.progress_update.emit(
-                        OperationStatus(
-                            section=self.section,
-                            item=label,
-                            op_type=OpType.POST,
-                            stage=OpStage.RUNNING,
-                            message="Found",
-                            progress=0,
-                        )
-                    )
-                    self.progress_update.emit(
-                        OperationStatus(
-                            section=self.section,
-                            item=label,
-                            op_type=OpType.POST,
-                            stage=OpStage.FINISHED,
-                            message="Done",
-                            progress=100,
-                            final_url=url,
-                        )
+                        stage=OpStage.FINISHED,
+                        message="Done",
+                        progress=100,
+                        final_url=url,
                     )
-                self.update_megathreads.emit(self.category_name, updates)
-                summary = f"{len(updates)} new / 0 updated / 0 skipped"
-            else:
-                summary = "0 new / 0 updated / 0 skipped"
-            self.progress_update.emit(
-                OperationStatus(
-                    section=self.section,
-                    item=self.category_name,
-                    op_type=OpType.POST,
-                    stage=OpStage.FINISHED,
-                    message=summary,
-                    progress=100,
                 )
+            self.update_megathreads.emit(self.category_name, updates)
+            summary = f"{len(updates)} new / 0 updated / 0 skipped"
+        else:
+            summary = "0 new / 0 updated / 0 skipped"
+        self.progress_update.emit(
+            OperationStatus(
+                section=self.section,
+                item=self.category_name,
+                op_type=OpType.POST,
+                stage=OpStage.FINISHED,
+                message=summary,
+                progress=100,
             )
-        finally:
-            if lock_acquired:
-                try:
-                    self.bot_lock.unlock()
-                    logging.info(
-                        f"🔓 Released bot_lock for megathreads '{self.category_name}'"
-                    )
-                except Exception as unlock_error:
-                    logging.warning(
-                        f"⚠️ Failed to release bot_lock for megathreads '{self.category_name}': {unlock_error}"
-                    )
+        )
 
     def stop(self):
         """لإيقاف الحلقة في وضع Keep Tracking."""
@@ -802,14 +694,6 @@ class MegaThreadsWorkerThread(QThread):
             self.terminate()
             self.wait(1000)
 
-        try:
-            self.bot_lock.unlock()
-            logging.info(
-                f"🔓 Released bot_lock for megathreads '{self.category_name}' during stop"
-            )
-        except Exception:
-            pass
-
         logging.info(
             f"🏁 Stop procedure completed for MegaThreadsWorkerThread '{self.category_name}'"
         )